@@ -0,0 +1,85 @@
+"""Add persisted normalized columns for contact/organization matching
+
+Revision ID: 007_normalized_columns
+Revises: 006_parsed_email_ai
+Create Date: 2026-02-10
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.normalization import normalize_organization_name, normalize_person_name
+
+
+# revision identifiers, used by Alembic.
+revision = '007_normalized_columns'
+down_revision = '006_parsed_email_ai'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade():
+    # Add normalized columns
+    op.add_column('contacts', sa.Column('email_normalized', sa.String(255), nullable=True))
+    op.add_column('contacts', sa.Column('name_normalized', sa.String(255), nullable=True))
+    op.add_column('organizations', sa.Column('name_normalized', sa.String(255), nullable=True))
+
+    conn = op.get_bind()
+
+    # Backfill emails in a single set-based statement
+    conn.execute(sa.text("UPDATE contacts SET email_normalized = NULLIF(LOWER(BTRIM(email)), '')"))
+
+    # Backfill names in batches (nameparser runs in Python)
+    _backfill(
+        conn,
+        table='contacts',
+        columns='full_name, first_name, last_name',
+        normalize=lambda row: normalize_person_name(row[1], row[2], row[3]),
+    )
+    _backfill(
+        conn,
+        table='organizations',
+        columns='name',
+        normalize=lambda row: normalize_organization_name(row[1]),
+    )
+
+    # Indexes on the persisted columns
+    op.create_index('ix_contacts_email_normalized', 'contacts', ['email_normalized'])
+    op.create_index('ix_contacts_name_normalized', 'contacts', ['name_normalized'])
+    op.create_index('ix_organizations_name_normalized', 'organizations', ['name_normalized'])
+
+    # Functional indexes for case-insensitive lookups on the raw columns
+    op.execute("CREATE INDEX IF NOT EXISTS ix_contacts_email_lower ON contacts (LOWER(email))")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_organizations_name_lower ON organizations (LOWER(name))")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_organizations_name_lower")
+    op.execute("DROP INDEX IF EXISTS ix_contacts_email_lower")
+    op.drop_index('ix_organizations_name_normalized', 'organizations')
+    op.drop_index('ix_contacts_name_normalized', 'contacts')
+    op.drop_index('ix_contacts_email_normalized', 'contacts')
+    op.drop_column('organizations', 'name_normalized')
+    op.drop_column('contacts', 'name_normalized')
+    op.drop_column('contacts', 'email_normalized')
+
+
+def _backfill(conn, table, columns, normalize):
+    """
+    Compute name_normalized in Python and write it back batch by batch.
+
+    Rows are read by keyset pagination on id, so only one batch is held in
+    memory at a time.
+    """
+    first_sql = sa.text(f"SELECT id, {columns} FROM {table} ORDER BY id LIMIT :limit")
+    next_sql = sa.text(f"SELECT id, {columns} FROM {table} WHERE id > :last_id ORDER BY id LIMIT :limit")
+    update_sql = sa.text(f"UPDATE {table} SET name_normalized = :value WHERE id = :id")
+
+    batch = conn.execute(first_sql, {'limit': BACKFILL_BATCH_SIZE}).fetchall()
+    while batch:
+        conn.execute(update_sql, [{'id': row[0], 'value': normalize(row) or None} for row in batch])
+        if len(batch) < BACKFILL_BATCH_SIZE:
+            break
+        batch = conn.execute(next_sql, {'last_id': batch[-1][0], 'limit': BACKFILL_BATCH_SIZE}).fetchall()
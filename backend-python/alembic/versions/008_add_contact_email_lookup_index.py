@@ -0,0 +1,47 @@
+"""Add GIN-indexed all_emails_normalized array for unified email lookup
+
+Revision ID: 008_contact_email_lookup
+Revises: 007_normalized_columns
+Create Date: 2026-02-10
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+# revision identifiers, used by Alembic.
+revision = '008_contact_email_lookup'
+down_revision = '007_normalized_columns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Primary + alternate emails, normalized, in one array
+    op.add_column('contacts', sa.Column('all_emails_normalized', ARRAY(sa.String(255)), nullable=True))
+
+    # Backfill: primary email first, then alternates, lowercased, trimmed and de-duplicated
+    op.execute("""
+        UPDATE contacts c
+        SET all_emails_normalized = (
+            SELECT ARRAY_AGG(e.value ORDER BY e.first_position)
+            FROM (
+                SELECT LOWER(BTRIM(raw.value)) AS value, MIN(raw.position) AS first_position
+                FROM UNNEST(ARRAY_PREPEND(c.email, COALESCE(c.alternate_emails, '{}'::varchar[])))
+                     WITH ORDINALITY AS raw(value, position)
+                WHERE raw.value IS NOT NULL AND BTRIM(raw.value) <> ''
+                GROUP BY LOWER(BTRIM(raw.value))
+            ) e
+        )
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_contacts_all_emails_normalized
+        ON contacts USING GIN (all_emails_normalized)
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_contacts_all_emails_normalized")
+    op.drop_column('contacts', 'all_emails_normalized')
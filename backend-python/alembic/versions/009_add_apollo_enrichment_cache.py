@@ -0,0 +1,41 @@
+"""Add apollo_enrichment_cache table
+
+Revision ID: 009_apollo_cache
+Revises: 008_contact_email_lookup
+Create Date: 2026-02-11
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = '009_apollo_cache'
+down_revision = '008_contact_email_lookup'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'apollo_enrichment_cache',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('cache_key', sa.String(600), nullable=False),
+        sa.Column('lookup_type', sa.String(20), nullable=False),
+        sa.Column('found', sa.Boolean(), nullable=False, server_default=sa.text('true')),
+        sa.Column('response', JSONB(), nullable=True),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_hit_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+    )
+
+    op.create_index('ix_apollo_enrichment_cache_cache_key', 'apollo_enrichment_cache', ['cache_key'], unique=True)
+    op.create_index('ix_apollo_enrichment_cache_expires_at', 'apollo_enrichment_cache', ['expires_at'])
+
+
+def downgrade():
+    op.drop_index('ix_apollo_enrichment_cache_expires_at', 'apollo_enrichment_cache')
+    op.drop_index('ix_apollo_enrichment_cache_cache_key', 'apollo_enrichment_cache')
+    op.drop_table('apollo_enrichment_cache')
@@ -0,0 +1,69 @@
+"""Add background_jobs and background_job_items tables
+
+Revision ID: 010_background_jobs
+Revises: 009_apollo_cache
+Create Date: 2026-02-12
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = '010_background_jobs'
+down_revision = '009_apollo_cache'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'background_jobs',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('job_type', sa.String(100), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='queued'),
+        sa.Column('params', JSONB(), nullable=True),
+        sa.Column('chunk_size', sa.Integer(), nullable=False, server_default='50'),
+        sa.Column('total_items', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('processed_items', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('succeeded_items', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('failed_items', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('summary', JSONB(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False, server_default=sa.text('false')),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('worker_id', sa.String(100), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_background_jobs_job_type', 'background_jobs', ['job_type'])
+    op.create_index('ix_background_jobs_status', 'background_jobs', ['status'])
+
+    op.create_table(
+        'background_job_items',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('job_id', UUID(as_uuid=True), sa.ForeignKey('background_jobs.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('item_key', sa.String(500), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('result', JSONB(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        'ix_background_job_items_job_status_position',
+        'background_job_items',
+        ['job_id', 'status', 'position'],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_background_job_items_job_status_position', 'background_job_items')
+    op.drop_table('background_job_items')
+    op.drop_index('ix_background_jobs_status', 'background_jobs')
+    op.drop_index('ix_background_jobs_job_type', 'background_jobs')
+    op.drop_table('background_jobs')
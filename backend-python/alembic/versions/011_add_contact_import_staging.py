@@ -0,0 +1,61 @@
+"""Add unlogged contact_import_rows staging table for bulk imports
+
+Revision ID: 011_contact_import_staging
+Revises: 010_background_jobs
+Create Date: 2026-02-13
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+
+
+# revision identifiers, used by Alembic.
+revision = '011_contact_import_staging'
+down_revision = '010_background_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'contact_import_rows',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('import_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('row_number', sa.Integer(), nullable=False),
+        sa.Column('email', sa.Text(), nullable=True),
+        sa.Column('email_normalized', sa.Text(), nullable=True),
+        sa.Column('alternate_emails', sa.Text(), nullable=True),
+        sa.Column('first_name', sa.Text(), nullable=True),
+        sa.Column('last_name', sa.Text(), nullable=True),
+        sa.Column('full_name', sa.Text(), nullable=True),
+        sa.Column('name_normalized', sa.Text(), nullable=True),
+        sa.Column('organization_name', sa.Text(), nullable=True),
+        sa.Column('organization_normalized', sa.Text(), nullable=True),
+        sa.Column('title', sa.Text(), nullable=True),
+        sa.Column('role', sa.Text(), nullable=True),
+        sa.Column('phone', sa.Text(), nullable=True),
+        sa.Column('country', sa.Text(), nullable=True),
+        sa.Column('state_province', sa.Text(), nullable=True),
+        sa.Column('city', sa.Text(), nullable=True),
+        sa.Column('tags', sa.Text(), nullable=True),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.Column('alternate_list', ARRAY(sa.String(255)), nullable=True),
+        sa.Column('tag_list', ARRAY(sa.Text()), nullable=True),
+        sa.Column('organization_id', UUID(as_uuid=True), nullable=True),
+        sa.Column('contact_id', UUID(as_uuid=True), nullable=True),
+        sa.Column('action', sa.String(20), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        prefixes=['UNLOGGED'],
+    )
+    op.create_index('ix_contact_import_rows_import_row', 'contact_import_rows', ['import_id', 'row_number'])
+    op.create_index('ix_contact_import_rows_import_email', 'contact_import_rows', ['import_id', 'email_normalized'])
+    op.create_index('ix_contact_import_rows_created_at', 'contact_import_rows', ['created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_contact_import_rows_created_at', 'contact_import_rows')
+    op.drop_index('ix_contact_import_rows_import_email', 'contact_import_rows')
+    op.drop_index('ix_contact_import_rows_import_row', 'contact_import_rows')
+    op.drop_table('contact_import_rows')
@@ -0,0 +1,43 @@
+"""Add contacts.email_status with a partial index for the contact list
+
+Revision ID: 012_contact_email_status
+Revises: 011_contact_import_staging
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_contact_email_status'
+down_revision = '011_contact_import_staging'
+branch_labels = None
+depends_on = None
+
+# Keep in sync with app.utils.normalization.EMAIL_PATTERN
+EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+
+def upgrade():
+    op.add_column('contacts', sa.Column('email_status', sa.String(20), nullable=True))
+
+    # Backfill with the same check the ORM listener applies on write
+    op.execute(sa.text("""
+        UPDATE contacts
+        SET email_status = CASE
+            WHEN LOWER(BTRIM(email)) ~ :pattern THEN 'valid'
+            ELSE 'invalid'
+        END
+    """).bindparams(pattern=EMAIL_PATTERN))
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_contacts_valid_email_name
+        ON contacts (last_name, first_name)
+        WHERE email_status = 'valid'
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_contacts_valid_email_name")
+    op.drop_column('contacts', 'email_status')
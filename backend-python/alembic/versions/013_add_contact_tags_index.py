@@ -0,0 +1,26 @@
+"""Add GIN index on contacts.tags for tag filters and facets
+
+Revision ID: 013_contact_tags_index
+Revises: 012_contact_email_status
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013_contact_tags_index'
+down_revision = '012_contact_email_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_contacts_tags
+        ON contacts USING GIN (tags)
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_contacts_tags")
@@ -0,0 +1,72 @@
+"""Index contact activity sources for the contact timeline
+
+Adds parsed_emails.participant_emails (normalized from/to/cc, GIN-indexed)
+and indexes the contact foreign keys the timeline filters on.
+
+Revision ID: 014_contact_timeline
+Revises: 013_contact_tags_index
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+
+
+# revision identifiers, used by Alembic.
+revision = '014_contact_timeline'
+down_revision = '013_contact_tags_index'
+branch_labels = None
+depends_on = None
+
+FOREIGN_KEY_INDEXES = [
+    ('ix_conference_registrations_contact_id', 'conference_registrations', 'contact_id'),
+    ('ix_conference_abstracts_submitter_id', 'conference_abstracts', 'submitter_id'),
+    ('ix_conference_sponsors_contact_person_id', 'conference_sponsors', 'contact_person_id'),
+    ('ix_funding_prospects_contact_id', 'funding_prospects', 'contact_id'),
+]
+
+
+def upgrade():
+    op.add_column('parsed_emails', sa.Column('participant_emails', ARRAY(sa.String(255)), nullable=True))
+
+    # Backfill: sender first, then to/cc, lowercased, trimmed and de-duplicated.
+    # to_emails/cc_emails may be json or jsonb depending on how the table was created.
+    op.execute("""
+        UPDATE parsed_emails p
+        SET participant_emails = (
+            SELECT ARRAY_AGG(e.value ORDER BY e.first_position)
+            FROM (
+                SELECT LOWER(BTRIM(raw.value)) AS value, MIN(raw.position) AS first_position
+                FROM (
+                    SELECT p.from_email AS value, 0 AS position
+                    UNION ALL
+                    SELECT value, position
+                    FROM JSONB_ARRAY_ELEMENTS_TEXT(
+                        CASE WHEN JSONB_TYPEOF(p.to_emails::jsonb) = 'array' THEN p.to_emails::jsonb ELSE '[]'::jsonb END
+                        || CASE WHEN JSONB_TYPEOF(p.cc_emails::jsonb) = 'array' THEN p.cc_emails::jsonb ELSE '[]'::jsonb END
+                    ) WITH ORDINALITY AS t(value, position)
+                ) raw
+                WHERE raw.value IS NOT NULL AND BTRIM(raw.value) <> ''
+                GROUP BY LOWER(BTRIM(raw.value))
+            ) e
+        )
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_participant_emails
+        ON parsed_emails USING GIN (participant_emails)
+    """)
+
+    for index_name, table, column in FOREIGN_KEY_INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({column})")
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_record ON audit_log (record_id, created_at)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_audit_log_record")
+    for index_name, _, _ in FOREIGN_KEY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_participant_emails")
+    op.drop_column('parsed_emails', 'participant_emails')
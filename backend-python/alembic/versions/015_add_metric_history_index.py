@@ -0,0 +1,26 @@
+"""Index data_quality_metrics for dashboard snapshot reads and history
+
+Revision ID: 015_metric_history_index
+Revises: 014_contact_timeline
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015_metric_history_index'
+down_revision = '014_contact_timeline'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_data_quality_metrics_name_measured_at
+        ON data_quality_metrics (metric_name, measured_at)
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_data_quality_metrics_name_measured_at")
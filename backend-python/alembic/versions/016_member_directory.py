@@ -0,0 +1,56 @@
+"""Member directory projection with search indexes
+
+Revision ID: 016_member_directory
+Revises: 015_metric_history_index
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '016_member_directory'
+down_revision = '015_metric_history_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS member_directory (
+            profile_id UUID PRIMARY KEY REFERENCES attendee_profiles(id) ON DELETE CASCADE,
+            sort_key VARCHAR(520) NOT NULL,
+            country VARCHAR(100),
+            expertise TEXT[],
+            card JSONB NOT NULL,
+            search_text TEXT,
+            search_vector TSVECTOR,
+            updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_member_directory_sort ON member_directory (sort_key, profile_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_member_directory_country ON member_directory (country)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_member_directory_expertise ON member_directory USING gin (expertise)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_member_directory_search ON member_directory USING gin (search_vector)")
+
+    # Substring search on name/organization; pg_trgm isn't installable
+    # everywhere, and without it the ILIKE falls back to a scan of this
+    # (narrow, opted-in only) table
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+                CREATE EXTENSION IF NOT EXISTS pg_trgm;
+                CREATE INDEX IF NOT EXISTS ix_member_directory_search_text_trgm
+                    ON member_directory USING gin (search_text gin_trgm_ops);
+            END IF;
+        END
+        $$
+    """)
+
+    # Rows for existing profiles are built by the app on startup
+    # (ensure_member_directory) using the same projection SQL as the listeners
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS member_directory")
@@ -0,0 +1,29 @@
+"""Index user_roles for per-user role lookups
+
+Revision ID: 017_user_roles_lookup_index
+Revises: 016_member_directory
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '017_user_roles_lookup_index'
+down_revision = '016_member_directory'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Covers the admin user list's role aggregation and role filter, the
+    # /me role lookup and permission checks: all select a user's
+    # unrevoked (and usually active) assignments
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_user_roles_user_revoked_active
+        ON user_roles (user_id, revoked_at, is_active, role_id)
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_user_roles_user_revoked_active")
@@ -0,0 +1,104 @@
+"""Partition audit_log by month on created_at
+
+Revision ID: 018_partition_audit_log
+Revises: 017_user_roles_lookup_index
+Create Date: 2026-10-18
+
+Rebuilds audit_log as a range-partitioned table (audit_log_pYYYYMM per
+month plus audit_log_default) and copies the existing rows across. The
+copy holds an exclusive lock on audit_log for its duration, so run it in a
+quiet window. Extra columns added outside the ORM (user_email, details)
+are carried over by CREATE TABLE ... LIKE.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '018_partition_audit_log'
+down_revision = '017_user_roles_lookup_index'
+branch_labels = None
+depends_on = None
+
+# Partitions created ahead of the current month; the maintenance job keeps
+# this horizon rolling
+MONTHS_AHEAD = 3
+
+
+def upgrade():
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month date;
+            last_month date := date_trunc('month', NOW())::date + INTERVAL '{MONTHS_AHEAD} months';
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'audit_log'::regclass) THEN
+                RETURN;
+            END IF;
+
+            LOCK TABLE audit_log IN ACCESS EXCLUSIVE MODE;
+            ALTER TABLE audit_log RENAME TO audit_log_unpartitioned;
+
+            CREATE TABLE audit_log (LIKE audit_log_unpartitioned INCLUDING DEFAULTS)
+                PARTITION BY RANGE (created_at);
+            ALTER TABLE audit_log ALTER COLUMN created_at SET DEFAULT NOW();
+            CREATE TABLE audit_log_default PARTITION OF audit_log DEFAULT;
+
+            SELECT COALESCE(date_trunc('month', MIN(created_at))::date, date_trunc('month', NOW())::date)
+            INTO month FROM audit_log_unpartitioned;
+            WHILE month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF audit_log FOR VALUES FROM (%L) TO (%L)',
+                    'audit_log_p' || to_char(month, 'YYYYMM'), month, month + INTERVAL '1 month'
+                );
+                month := month + INTERVAL '1 month';
+            END LOOP;
+
+            -- Undated legacy rows land in the default partition and are archived first
+            UPDATE audit_log_unpartitioned SET created_at = '1970-01-01' WHERE created_at IS NULL;
+            INSERT INTO audit_log SELECT * FROM audit_log_unpartitioned;
+            DROP TABLE audit_log_unpartitioned;
+
+            ALTER TABLE audit_log ALTER COLUMN created_at SET NOT NULL;
+            ALTER TABLE audit_log ADD PRIMARY KEY (id, created_at);
+        END
+        $$
+    """)
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_record ON audit_log (record_id, created_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_table_created ON audit_log (table_name, created_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_action_created ON audit_log (action, created_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_created_at_brin ON audit_log USING brin (created_at)")
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 'audit_log' AND column_name = 'user_email'
+            ) THEN
+                CREATE INDEX IF NOT EXISTS idx_audit_log_user_email ON audit_log (user_email);
+            END IF;
+        END
+        $$
+    """)
+
+
+def downgrade():
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'audit_log'::regclass) THEN
+                RETURN;
+            END IF;
+
+            LOCK TABLE audit_log IN ACCESS EXCLUSIVE MODE;
+            ALTER TABLE audit_log RENAME TO audit_log_partitioned;
+            CREATE TABLE audit_log (LIKE audit_log_partitioned INCLUDING DEFAULTS);
+            INSERT INTO audit_log SELECT * FROM audit_log_partitioned;
+            DROP TABLE audit_log_partitioned;
+            ALTER TABLE audit_log ADD PRIMARY KEY (id);
+        END
+        $$
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_log_record ON audit_log (record_id, created_at)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_action ON audit_log (action)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_created_at ON audit_log (created_at)")
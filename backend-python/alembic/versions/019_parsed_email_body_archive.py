@@ -0,0 +1,32 @@
+"""Track parsed email bodies moved to object storage
+
+Revision ID: 019_parsed_email_body_archive
+Revises: 018_partition_audit_log
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '019_parsed_email_body_archive'
+down_revision = '018_partition_audit_log'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE parsed_emails ADD COLUMN IF NOT EXISTS body_archive_key VARCHAR(500)")
+    op.execute("ALTER TABLE parsed_emails ADD COLUMN IF NOT EXISTS body_archived_at TIMESTAMP WITH TIME ZONE")
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_unarchived_created
+        ON parsed_emails (created_at)
+        WHERE body_archive_key IS NULL
+    """)
+
+
+def downgrade():
+    # Archived bodies stay in object storage; restore them before downgrading
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_unarchived_created")
+    op.execute("ALTER TABLE parsed_emails DROP COLUMN IF EXISTS body_archived_at")
+    op.execute("ALTER TABLE parsed_emails DROP COLUMN IF EXISTS body_archive_key")
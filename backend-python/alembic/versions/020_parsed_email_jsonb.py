@@ -0,0 +1,87 @@
+"""Parsed email JSON columns to JSONB, with indexed filter columns
+
+Revision ID: 020_parsed_email_jsonb
+Revises: 019_parsed_email_body_archive
+Create Date: 2026-10-18
+
+Converts the parsed_emails JSON columns to JSONB (databases created from
+migrations/add_parsed_emails.sql already have JSONB; the conversion is
+skipped there), adds stored generated email_type / primary_contact_email
+columns and the indexes behind the GET /api/parsed-emails filters.
+Participant addresses are already indexed by participant_emails (014).
+
+The type change and generated columns rewrite the table under an exclusive
+lock.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '020_parsed_email_jsonb'
+down_revision = '019_parsed_email_body_archive'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = (
+    'to_emails', 'cc_emails', 'attachments',
+    'extracted_contacts', 'action_items', 'topics', 'email_metadata',
+)
+
+
+def _set_column_types(type_name):
+    op.execute(f"""
+        DO $$
+        DECLARE
+            col text;
+        BEGIN
+            FOREACH col IN ARRAY ARRAY['{"','".join(JSON_COLUMNS)}'] LOOP
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = 'parsed_emails' AND column_name = col AND data_type <> '{type_name}'
+                ) THEN
+                    EXECUTE format('ALTER TABLE parsed_emails ALTER COLUMN %I TYPE {type_name} USING %I::{type_name}', col, col);
+                END IF;
+            END LOOP;
+        END
+        $$
+    """)
+
+
+def upgrade():
+    _set_column_types('jsonb')
+
+    op.execute("""
+        ALTER TABLE parsed_emails
+            ADD COLUMN IF NOT EXISTS email_type TEXT
+                GENERATED ALWAYS AS (email_metadata->>'email_type') STORED,
+            ADD COLUMN IF NOT EXISTS primary_contact_email TEXT
+                GENERATED ALWAYS AS (lower(email_metadata->'primary_contact'->>'email')) STORED
+    """)
+
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_email_type_created
+        ON parsed_emails (email_type, created_at)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_primary_contact_email
+        ON parsed_emails (primary_contact_email)
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_review_queue
+        ON parsed_emails (created_at)
+        WHERE requires_review IS true
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_extracted_contacts
+        ON parsed_emails USING GIN (extracted_contacts jsonb_path_ops)
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_extracted_contacts")
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_review_queue")
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_primary_contact_email")
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_email_type_created")
+    op.execute("ALTER TABLE parsed_emails DROP COLUMN IF EXISTS primary_contact_email")
+    op.execute("ALTER TABLE parsed_emails DROP COLUMN IF EXISTS email_type")
+    _set_column_types('json')
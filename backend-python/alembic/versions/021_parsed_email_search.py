@@ -0,0 +1,39 @@
+"""Full-text search vector on parsed_emails
+
+Revision ID: 021_parsed_email_search
+Revises: 020_parsed_email_jsonb
+Create Date: 2026-10-18
+
+Adds parsed_emails.search_vector (subject A, sender B, body C) with a GIN
+index and backfills it. Rows whose bodies were already archived (019) are
+indexed on subject and sender only.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '021_parsed_email_search'
+down_revision = '020_parsed_email_jsonb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE parsed_emails ADD COLUMN IF NOT EXISTS search_vector TSVECTOR")
+    op.execute("""
+        UPDATE parsed_emails
+        SET search_vector =
+            setweight(to_tsvector('english', COALESCE(subject, '')), 'A')
+            || setweight(to_tsvector('english', COALESCE(from_email, '')), 'B')
+            || setweight(to_tsvector('english', COALESCE(LEFT(body_text, 100000), '')), 'C')
+        WHERE search_vector IS NULL
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_parsed_emails_search_vector
+        ON parsed_emails USING GIN (search_vector)
+    """)
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_parsed_emails_search_vector")
+    op.execute("ALTER TABLE parsed_emails DROP COLUMN IF EXISTS search_vector")
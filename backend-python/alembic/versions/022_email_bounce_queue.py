@@ -0,0 +1,50 @@
+"""Bounce queue and email suppression list
+
+Revision ID: 022_email_bounce_queue
+Revises: 021_parsed_email_search
+Create Date: 2026-10-18
+
+Existing bounce outcomes stored in parsed_emails.email_metadata are not
+backfilled; addresses that bounced before this revision are not suppressed
+until they bounce again.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '022_email_bounce_queue'
+down_revision = '021_parsed_email_search'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS email_bounces (
+            id BIGSERIAL PRIMARY KEY,
+            email VARCHAR(255) NOT NULL,
+            parsed_email_id INTEGER REFERENCES parsed_emails(id) ON DELETE SET NULL,
+            received_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+            processed_at TIMESTAMP WITHOUT TIME ZONE,
+            action VARCHAR(30),
+            contact_id UUID
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_email_bounces_pending ON email_bounces (id) WHERE processed_at IS NULL")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_email_bounces_email ON email_bounces (email)")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS email_suppressions (
+            email VARCHAR(255) PRIMARY KEY,
+            reason VARCHAR(30) NOT NULL DEFAULT 'hard_bounce',
+            bounce_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+            last_bounced_at TIMESTAMP WITHOUT TIME ZONE,
+            created_by VARCHAR(255)
+        )
+    """)
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS email_suppressions")
+    op.execute("DROP TABLE IF EXISTS email_bounces")
@@ -0,0 +1,42 @@
+"""Email campaigns
+
+Revision ID: 023_email_campaigns
+Revises: 022_email_bounce_queue
+Create Date: 2026-10-18
+
+Per-recipient send state lives in background_job_items of the campaign's
+send job; this revision only adds the campaign definitions.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '023_email_campaigns'
+down_revision = '022_email_bounce_queue'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS email_campaigns (
+            id UUID PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            subject VARCHAR(500) NOT NULL,
+            html_template TEXT NOT NULL,
+            text_template TEXT,
+            preheader VARCHAR(255),
+            segment JSONB NOT NULL DEFAULT '{}'::jsonb,
+            default_data JSONB,
+            job_id UUID REFERENCES background_jobs(id) ON DELETE SET NULL,
+            sent_at TIMESTAMP WITHOUT TIME ZONE,
+            created_by VARCHAR(255),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW()
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_email_campaigns_job_id ON email_campaigns (job_id)")
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS email_campaigns")
@@ -0,0 +1,38 @@
+"""Transactional email outbox
+
+Revision ID: 024_email_outbox
+Revises: 023_email_campaigns
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '024_email_outbox'
+down_revision = '023_email_campaigns'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS email_outbox (
+            id BIGSERIAL PRIMARY KEY,
+            to_email VARCHAR(255) NOT NULL,
+            subject VARCHAR(998) NOT NULL,
+            html_content TEXT NOT NULL,
+            text_content TEXT,
+            status VARCHAR(20) NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+            last_error TEXT,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT NOW(),
+            sent_at TIMESTAMP WITHOUT TIME ZONE
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_email_outbox_due ON email_outbox (next_attempt_at) WHERE status = 'pending'")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_email_outbox_to_email ON email_outbox (to_email)")
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS email_outbox")
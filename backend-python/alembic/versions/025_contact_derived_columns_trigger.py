@@ -0,0 +1,84 @@
+"""Derive contacts' normalized email columns in the database
+
+The ORM listener only runs for ORM writes; raw INSERT/UPDATE statements
+(import scripts, SQL files run by hand) left email_normalized, email_status
+and all_emails_normalized empty, which hid those contacts from the contact
+list, find_contact_by_email and the bounce queue. A BEFORE trigger now
+derives them for every writer.
+
+name_normalized needs nameparser, so the trigger only fills it in (with a
+plain lowercase of the name) when a writer leaves it empty; the next ORM
+write replaces it with the parsed form.
+
+Revision ID: 025_contact_derived_columns
+Revises: 024_email_outbox
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '025_contact_derived_columns'
+down_revision = '024_email_outbox'
+branch_labels = None
+depends_on = None
+
+# Keep in sync with app.utils.normalization.EMAIL_PATTERN
+EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+
+
+def upgrade():
+    # Same rules as normalize_email, email_status and normalize_email_list
+    op.execute(sa.text("""
+        CREATE OR REPLACE FUNCTION contacts_derive_columns() RETURNS trigger AS $$
+        DECLARE
+            raw_name TEXT;
+        BEGIN
+            NEW.email_normalized := NULLIF(LOWER(BTRIM(NEW.email, E' \\t\\n\\r\\f\\v')), '');
+            NEW.email_status := CASE WHEN NEW.email_normalized ~ :pattern THEN 'valid' ELSE 'invalid' END;
+            NEW.all_emails_normalized := ARRAY(
+                SELECT address FROM (
+                    SELECT LOWER(BTRIM(value, E' \\t\\n\\r\\f\\v')) AS address, MIN(position) AS position
+                    FROM unnest(ARRAY[NEW.email] || COALESCE(NEW.alternate_emails, CAST('{}' AS varchar[])))
+                         WITH ORDINALITY AS u(value, position)
+                    WHERE BTRIM(COALESCE(value, ''), E' \\t\\n\\r\\f\\v') <> ''
+                    GROUP BY 1
+                ) normalized
+                ORDER BY position
+            );
+
+            IF NEW.name_normalized IS NULL THEN
+                raw_name := COALESCE(
+                    NULLIF(BTRIM(NEW.full_name), ''),
+                    CONCAT_WS(' ', NEW.first_name, NEW.last_name)
+                );
+                NEW.name_normalized := NULLIF(BTRIM(REGEXP_REPLACE(
+                    REGEXP_REPLACE(LOWER(raw_name), '[^\\w\\s''-]', '', 'g'), '\\s+', ' ', 'g'
+                )), '');
+            END IF;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """).bindparams(pattern=EMAIL_PATTERN))
+
+    op.execute("""
+        CREATE TRIGGER contacts_derive_columns
+        BEFORE INSERT OR UPDATE OF email, alternate_emails, full_name, first_name, last_name, name_normalized
+        ON contacts
+        FOR EACH ROW EXECUTE FUNCTION contacts_derive_columns()
+    """)
+
+    # Fill in rows written by raw SQL since the columns were added
+    op.execute("""
+        UPDATE contacts SET email = email
+        WHERE email_normalized IS NULL OR email_status IS NULL
+           OR all_emails_normalized IS NULL OR name_normalized IS NULL
+    """)
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS contacts_derive_columns ON contacts")
+    op.execute("DROP FUNCTION IF EXISTS contacts_derive_columns()")
@@ -45,6 +45,9 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = Field(..., env="SMTP_PASSWORD")
     SMTP_FROM_EMAIL: str = Field(..., env="SMTP_FROM_EMAIL")
     SMTP_FROM_NAME: str = Field(default="International Shellfish Restoration Society", env="SMTP_FROM_NAME")
+    SMTP_POOL_SIZE: int = Field(default=4, env="SMTP_POOL_SIZE")  # Open authenticated sessions per process
+    SMTP_POOL_MAX_MESSAGES_PER_CONNECTION: int = Field(default=100, env="SMTP_POOL_MAX_MESSAGES_PER_CONNECTION")
+    SMTP_POOL_HEALTHCHECK_SECONDS: int = Field(default=30, env="SMTP_POOL_HEALTHCHECK_SECONDS")  # NOOP idle sessions older than this before reuse
 
     # Magic Links
     MAGIC_LINK_EXPIRY_MINUTES: int = 15
@@ -52,6 +55,10 @@ class Settings(BaseSettings):
 
     # External APIs
     APOLLO_API_KEY: Optional[str] = Field(default=None, env="APOLLO_API_KEY")
+    APOLLO_MAX_CONCURRENCY: int = Field(default=5, env="APOLLO_MAX_CONCURRENCY")  # Parallel in-flight Apollo requests
+    APOLLO_RATE_LIMIT_PER_MINUTE: int = Field(default=100, env="APOLLO_RATE_LIMIT_PER_MINUTE")  # Token bucket refill rate
+    APOLLO_CACHE_TTL_DAYS: int = Field(default=90, env="APOLLO_CACHE_TTL_DAYS")  # Cached matches
+    APOLLO_CACHE_NEGATIVE_TTL_DAYS: int = Field(default=14, env="APOLLO_CACHE_NEGATIVE_TTL_DAYS")  # Cached "not found"
     ANTHROPIC_API_KEY: Optional[str] = Field(default=None, env="ANTHROPIC_API_KEY")
 
     # Stripe Payment Processing
@@ -67,9 +74,60 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: Optional[str] = Field(default=None, env="AWS_SECRET_ACCESS_KEY")
     INBOUND_EMAIL_BUCKET: str = Field(default="isrs-inbound-emails", env="INBOUND_EMAIL_BUCKET")
     SES_FROM_EMAIL: Optional[str] = Field(default=None, env="SES_FROM_EMAIL")
+    SES_MAX_CONCURRENCY: int = Field(default=8, env="SES_MAX_CONCURRENCY")  # SES calls in flight (thread pool + HTTP connections)
+    EMAIL_SEND_RATE_PER_SECOND: float = Field(default=14.0, env="EMAIL_SEND_RATE_PER_SECOND")  # Provider send rate shared by all outbound mail (0 = unlimited)
+
+    # Background Jobs
+    JOB_RUNNER_ENABLED: bool = Field(default=True, env="JOB_RUNNER_ENABLED")  # Run the job worker inside the API process
+    JOB_RUNNER_POLL_SECONDS: float = Field(default=5.0, env="JOB_RUNNER_POLL_SECONDS")
+    JOB_RUNNER_STALE_SECONDS: int = Field(default=300, env="JOB_RUNNER_STALE_SECONDS")  # Requeue running jobs with no heartbeat
+    JOB_RUNNER_HEARTBEAT_SECONDS: float = Field(default=15.0, env="JOB_RUNNER_HEARTBEAT_SECONDS")  # Heartbeat interval while a chunk runs
+    JOB_DEFAULT_CHUNK_SIZE: int = Field(default=50, env="JOB_DEFAULT_CHUNK_SIZE")  # Items per committed chunk
+
+    # Email Outbox
+    OUTBOX_DISPATCHER_ENABLED: bool = Field(default=True, env="OUTBOX_DISPATCHER_ENABLED")  # Deliver queued email from this process
+    OUTBOX_POLL_SECONDS: float = Field(default=5.0, env="OUTBOX_POLL_SECONDS")  # Commits that queue mail wake the dispatcher sooner
+    OUTBOX_BATCH_SIZE: int = Field(default=20, env="OUTBOX_BATCH_SIZE")
+    OUTBOX_MAX_ATTEMPTS: int = Field(default=8, env="OUTBOX_MAX_ATTEMPTS")
+    OUTBOX_RETRY_BASE_SECONDS: int = Field(default=30, env="OUTBOX_RETRY_BASE_SECONDS")  # Doubles per attempt, capped at an hour
+    OUTBOX_LEASE_SECONDS: int = Field(default=300, env="OUTBOX_LEASE_SECONDS")  # A claimed message is retried after this if its sender dies
+
+    # Email Campaigns
+    CAMPAIGN_CHUNK_SIZE: int = Field(default=50, env="CAMPAIGN_CHUNK_SIZE")  # Recipients per committed chunk (at most this many resent after a crash)
+
+    # Dashboard Snapshots
+    DASHBOARD_SNAPSHOTS_ENABLED: bool = Field(default=True, env="DASHBOARD_SNAPSHOTS_ENABLED")  # Run the refresh scheduler in this process
+    DASHBOARD_SNAPSHOT_INTERVAL_MINUTES: int = Field(default=15, env="DASHBOARD_SNAPSHOT_INTERVAL_MINUTES")
+    DASHBOARD_SNAPSHOT_MIN_INTERVAL_SECONDS: int = Field(default=60, env="DASHBOARD_SNAPSHOT_MIN_INTERVAL_SECONDS")  # Debounce for on-change refreshes
+    DASHBOARD_SNAPSHOT_PAYLOAD_RETENTION_DAYS: int = Field(default=7, env="DASHBOARD_SNAPSHOT_PAYLOAD_RETENTION_DAYS")  # Full payload rows; metric series are kept
+
+    # Audit Log Retention
+    AUDIT_LOG_MAINTENANCE_ENABLED: bool = Field(default=True, env="AUDIT_LOG_MAINTENANCE_ENABLED")  # Run the daily partition/archive job in this process
+    AUDIT_LOG_RETENTION_MONTHS: int = Field(default=24, env="AUDIT_LOG_RETENTION_MONTHS")  # Older months are archived, then dropped
+    AUDIT_LOG_ARCHIVE_BUCKET: Optional[str] = Field(default=None, env="AUDIT_LOG_ARCHIVE_BUCKET")  # S3 bucket; local directory when unset
+    AUDIT_LOG_ARCHIVE_PREFIX: str = Field(default="", env="AUDIT_LOG_ARCHIVE_PREFIX")
+    AUDIT_LOG_ARCHIVE_DIR: str = Field(default="./archives", env="AUDIT_LOG_ARCHIVE_DIR")
+    AUDIT_LOG_LOOKUP_CACHE_TTL_SECONDS: int = Field(default=300, env="AUDIT_LOG_LOOKUP_CACHE_TTL_SECONDS")  # Table/action filter dropdowns
+
+    # Parsed Email Body Archive
+    PARSED_EMAIL_ARCHIVE_ENABLED: bool = Field(default=True, env="PARSED_EMAIL_ARCHIVE_ENABLED")  # Run the daily body archival job in this process
+    PARSED_EMAIL_BODY_RETENTION_DAYS: int = Field(default=180, env="PARSED_EMAIL_BODY_RETENTION_DAYS")  # Older bodies move to object storage
+    PARSED_EMAIL_ARCHIVE_BUCKET: Optional[str] = Field(default=None, env="PARSED_EMAIL_ARCHIVE_BUCKET")  # S3 bucket; local directory when unset
+    PARSED_EMAIL_ARCHIVE_PREFIX: str = Field(default="", env="PARSED_EMAIL_ARCHIVE_PREFIX")
+    PARSED_EMAIL_ARCHIVE_DIR: str = Field(default="./archives", env="PARSED_EMAIL_ARCHIVE_DIR")
+
+    # Bounce Queue
+    BOUNCE_QUEUE_ENABLED: bool = Field(default=True, env="BOUNCE_QUEUE_ENABLED")  # Apply queued bounces in this process
+    BOUNCE_QUEUE_INTERVAL_SECONDS: int = Field(default=60, env="BOUNCE_QUEUE_INTERVAL_SECONDS")
+    BOUNCE_QUEUE_BATCH_SIZE: int = Field(default=500, env="BOUNCE_QUEUE_BATCH_SIZE")  # Bounces per committed batch
+
+    # Caching
+    FACET_CACHE_TTL_SECONDS: int = Field(default=60, env="FACET_CACHE_TTL_SECONDS")  # Unfiltered facet counts
 
     # File Uploads
     MAX_UPLOAD_SIZE_MB: int = 10
+    MAX_IMPORT_SIZE_MB: int = Field(default=200, env="MAX_IMPORT_SIZE_MB")  # Bulk contact import files
+    CONTACT_IMPORT_RETENTION_DAYS: int = Field(default=7, env="CONTACT_IMPORT_RETENTION_DAYS")  # Staged rows / error reports
     UPLOAD_DIR: str = "./uploads"
 
     # Logging
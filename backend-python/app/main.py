@@ -83,7 +83,9 @@ async def startup_event():
         Base, Contact, Organization, BoardVote, BoardVoteDetail,
         Conference, ConferenceRegistration, ConferenceSponsor, ConferenceAbstract,
         AttendeeProfile, FundingProspect, UserSession, AuditLog, DataQualityMetric,
-        UserFeedback, Asset, AssetZone, AssetZoneAsset, Photo, ParsedEmail
+        UserFeedback, Asset, AssetZone, AssetZoneAsset, Photo, ParsedEmail,
+        ApolloCacheEntry, BackgroundJob, BackgroundJobItem, ContactImportRow,
+        MemberDirectoryEntry, EmailBounce, EmailSuppression, EmailCampaign, EmailOutboxMessage
     )
 
     # Initialize database (create tables if they don't exist)
@@ -95,6 +97,49 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Error initializing database tables: {e}")
 
+    # Audit log inserts need a partition for the current month
+    from app.services.audit_log_maintenance import ensure_audit_log_partitions
+    ensure_audit_log_partitions()
+
+    # Populate the member directory projection if it's new or empty
+    from app.services.member_directory import ensure_member_directory
+    ensure_member_directory()
+
+    # Start the background job worker (bulk enrichment, imports, reprocessing)
+    if settings.JOB_RUNNER_ENABLED:
+        from app.services.job_runner import job_runner
+        await job_runner.start()
+
+    # Periodic maintenance jobs share one background scheduler
+    from app.services.scheduler import scheduler
+
+    # Refresh dashboard snapshots on a schedule and after relevant writes
+    if settings.DASHBOARD_SNAPSHOTS_ENABLED:
+        from app.services.dashboard_snapshots import schedule_dashboard_snapshots
+        schedule_dashboard_snapshots()
+
+    # Create upcoming audit log partitions and archive old months daily
+    if settings.AUDIT_LOG_MAINTENANCE_ENABLED:
+        from app.services.audit_log_maintenance import schedule_audit_log_maintenance
+        schedule_audit_log_maintenance()
+
+    # Move old parsed email bodies to object storage daily
+    if settings.PARSED_EMAIL_ARCHIVE_ENABLED:
+        from app.services.parsed_email_archive import schedule_email_body_archive
+        schedule_email_body_archive()
+
+    # Apply queued bounces to contacts and the suppression list
+    if settings.BOUNCE_QUEUE_ENABLED:
+        from app.services.bounce_queue import schedule_bounce_queue
+        schedule_bounce_queue()
+
+    scheduler.start()
+
+    # Deliver email queued by request handlers (transactional outbox)
+    if settings.OUTBOX_DISPATCHER_ENABLED:
+        from app.services.email_outbox import outbox_dispatcher
+        await outbox_dispatcher.start()
+
 
 # Shutdown event
 @app.on_event("shutdown")
@@ -102,21 +147,42 @@ async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info(f"Shutting down {settings.APP_NAME}")
 
+    from app.services.job_runner import job_runner
+    await job_runner.stop()
+
+    from app.services.scheduler import scheduler
+    scheduler.stop()
+
+    from app.services.email_outbox import outbox_dispatcher
+    await outbox_dispatcher.stop()
+
+    from app.services.apollo_service import close_shared_client
+    await close_shared_client()
+
+    from app.services.email_service import email_service
+    await email_service.close()
+
+    from app.services import ses_client
+    ses_client.shutdown()
+
 
 # Import and include routers
-from app.routers import auth, contacts, votes, conferences, events, funding, documents, enrichment, assets, asset_zones, admin, feedback, photos, ai, stats, email_parsing, parsed_emails, test_emails, stripe_payment, apollo_enrichment
+from app.routers import auth, contacts, votes, conferences, events, funding, documents, enrichment, assets, asset_zones, admin, feedback, photos, ai, stats, email_parsing, parsed_emails, test_emails, stripe_payment, apollo_enrichment, jobs, exports, campaigns
 
 app.include_router(email_parsing.router, prefix="/api/email-parsing", tags=["Email Parsing"])  # Public webhook - must be before auth
 app.include_router(stripe_payment.router, prefix="/api/stripe", tags=["Stripe Payments"])  # Public payment endpoints
 app.include_router(test_emails.router, prefix="/api/test", tags=["Testing"])  # Public test endpoint
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+app.include_router(jobs.router, prefix="/api/admin/jobs", tags=["Background Jobs"])
+app.include_router(campaigns.router, prefix="/api/admin/campaigns", tags=["Email Campaigns"])
 app.include_router(stats.router, tags=["Stats"])  # Stats router with /api/stats prefix built-in
 app.include_router(feedback.router, prefix="/api/feedback", tags=["Feedback"])
 app.include_router(ai.router, tags=["AI Assistant"])  # AI router with /api/ai prefix built-in
 app.include_router(parsed_emails.router, prefix="/api", tags=["Parsed Emails"])  # Exposes /api/parsed-emails routes
 app.include_router(apollo_enrichment.router, prefix="/api/apollo", tags=["Apollo.io"])  # Apollo enrichment and prospecting
 app.include_router(contacts.router, prefix="/api/contacts", tags=["Contacts"])
+app.include_router(exports.router, prefix="/api/exports", tags=["Exports"])
 app.include_router(votes.router, prefix="/api/votes", tags=["Board Votes"])
 app.include_router(photos.router, prefix="/api/photos", tags=["Photos"])  # Must be before /api catch-all
 app.include_router(conferences.router, prefix="/api/conferences", tags=["Conferences"])
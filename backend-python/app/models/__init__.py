@@ -19,6 +19,13 @@ from app.models.asset import Asset
 from app.models.asset_zone import AssetZone, AssetZoneAsset
 from app.models.photo import Photo
 from app.models.parsed_email import ParsedEmail
+from app.models.apollo_cache import ApolloCacheEntry
+from app.models.background_job import BackgroundJob, BackgroundJobItem
+from app.models.contact_import import ContactImportRow
+from app.models.member_directory import MemberDirectoryEntry
+from app.models.email_bounce import EmailBounce, EmailSuppression
+from app.models.email_campaign import EmailCampaign
+from app.models.email_outbox import EmailOutboxMessage
 
 __all__ = [
     "Base",
@@ -42,4 +49,13 @@ __all__ = [
     "AssetZoneAsset",
     "Photo",
     "ParsedEmail",
+    "ApolloCacheEntry",
+    "BackgroundJob",
+    "BackgroundJobItem",
+    "ContactImportRow",
+    "MemberDirectoryEntry",
+    "EmailBounce",
+    "EmailSuppression",
+    "EmailCampaign",
+    "EmailOutboxMessage",
 ]
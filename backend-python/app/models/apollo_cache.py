@@ -0,0 +1,28 @@
+"""
+Apollo.io enrichment response cache.
+Stores person/organization lookups so repeat enrichments don't spend paid credits.
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.models.base import Base
+
+
+class ApolloCacheEntry(Base):
+    """Cached Apollo API response keyed by normalized email, name+org or domain."""
+
+    __tablename__ = "apollo_enrichment_cache"
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(600), nullable=False, unique=True, index=True)  # e.g. person:email:jane@noaa.gov
+    lookup_type = Column(String(20), nullable=False)  # person, organization
+    found = Column(Boolean, nullable=False, default=True)  # False = negative ("not found") entry
+    response = Column(JSONB)  # Structured enrichment data returned to callers
+    hit_count = Column(Integer, nullable=False, default=0)
+    last_hit_at = Column(DateTime)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<ApolloCacheEntry(key='{self.cache_key}', found={self.found}, expires_at={self.expires_at})>"
@@ -0,0 +1,82 @@
+"""
+Background job models.
+Durable, resumable bulk work (enrichment, imports, reprocessing) with per-item checkpoints.
+"""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+
+from app.models.base import Base
+
+
+class BackgroundJob(Base):
+    """
+    A unit of bulk work processed by the job runner.
+
+    Progress counters are denormalized onto the job row so the admin UI can
+    poll a single row; per-item state lives in background_job_items.
+    """
+
+    __tablename__ = "background_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_type = Column(String(100), nullable=False, index=True)  # apollo_bulk_enrich, parsed_email_reprocess, ...
+    status = Column(String(20), nullable=False, default="queued", index=True)  # queued, running, completed, failed, cancelled
+    params = Column(JSONB)  # Handler options, e.g. {"force_refresh": true}
+    chunk_size = Column(Integer, nullable=False, default=50)
+
+    # Progress
+    total_items = Column(Integer, nullable=False, default=0)
+    processed_items = Column(Integer, nullable=False, default=0)
+    succeeded_items = Column(Integer, nullable=False, default=0)
+    failed_items = Column(Integer, nullable=False, default=0)
+    summary = Column(JSONB)  # Handler-reported aggregates, e.g. {"enriched_fields": {"phone": 12}}
+
+    # Control
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    attempts = Column(Integer, nullable=False, default=0)  # Times the job has been claimed
+    worker_id = Column(String(100))
+    error = Column(Text)
+
+    created_by = Column(String(255))
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime)
+    heartbeat_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    items = relationship("BackgroundJobItem", back_populates="job", cascade="all, delete-orphan", lazy="noload")
+
+    @property
+    def progress_percent(self) -> float:
+        if not self.total_items:
+            return 100.0 if self.status == "completed" else 0.0
+        return round(self.processed_items / self.total_items * 100, 1)
+
+    def __repr__(self):
+        return f"<BackgroundJob(id={self.id}, type='{self.job_type}', status='{self.status}', {self.processed_items}/{self.total_items})>"
+
+
+class BackgroundJobItem(Base):
+    """One input of a background job; its status is the resume checkpoint."""
+
+    __tablename__ = "background_job_items"
+
+    id = Column(BigInteger, primary_key=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("background_jobs.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)  # Processing order within the job
+    item_key = Column(String(500), nullable=False)  # Contact ID, parsed email ID, staging row, ...
+    status = Column(String(20), nullable=False, default="pending")  # pending, succeeded, failed, skipped
+    result = Column(JSONB)
+    error = Column(Text)
+    processed_at = Column(DateTime)
+
+    job = relationship("BackgroundJob", back_populates="items")
+
+    __table_args__ = (
+        Index("ix_background_job_items_job_status_position", "job_id", "status", "position"),
+    )
+
+    def __repr__(self):
+        return f"<BackgroundJobItem(job_id={self.job_id}, key='{self.item_key}', status='{self.status}')>"
@@ -183,7 +183,7 @@ class ConferenceRegistration(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     conference_id = Column(UUID(as_uuid=True), ForeignKey("conferences.id", ondelete="CASCADE"), nullable=False, index=True)
-    contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False)
+    contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False, index=True)
     attendee_id = Column(UUID(as_uuid=True), ForeignKey("attendee_profiles.id"))
     registration_type = Column(String(50))  # early_bird, regular, student
     registration_date = Column(Date)
@@ -214,7 +214,7 @@ class ConferenceSponsor(Base, TimestampMixin):
     amount_committed = Column(DECIMAL(10, 2))
     amount_paid = Column(DECIMAL(10, 2))
     status = Column(String(50))  # potential, committed, paid
-    contact_person_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"))
+    contact_person_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"), index=True)
     notes = Column(Text)
 
     # Relationships
@@ -233,7 +233,7 @@ class ConferenceAbstract(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     conference_id = Column(UUID(as_uuid=True), ForeignKey("conferences.id", ondelete="CASCADE"), nullable=False, index=True)
-    submitter_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"))
+    submitter_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"), index=True)
     title = Column(String(500), nullable=False)
     abstract_text = Column(Text)
     authors = Column(ARRAY(Text))
@@ -3,11 +3,19 @@ Contact and Organization models.
 Handles individuals and organizations in the ISRS database.
 """
 import uuid
-from sqlalchemy import Column, String, Text, ForeignKey, ARRAY
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, ForeignKey, Index, event, func
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin
+from app.utils.normalization import (
+    EMAIL_STATUS_VALID,
+    email_status,
+    normalize_email,
+    normalize_email_list,
+    normalize_organization_name,
+    normalize_person_name,
+)
 
 
 class Organization(Base, TimestampMixin):
@@ -17,6 +25,7 @@ class Organization(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, unique=True, index=True)
+    name_normalized = Column(String(255), index=True)  # Maintained on write, see normalize_organization_name
     type = Column(String(100))  # University, NGO, Government, Private, etc.
     website = Column(String(500))
     country = Column(String(100))
@@ -39,10 +48,14 @@ class Contact(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)  # Primary email
+    email_normalized = Column(String(255), index=True)  # Lowercased/trimmed email, derived by trigger
+    email_status = Column(String(20))  # 'valid' or 'invalid' (shape check), derived by trigger
     alternate_emails = Column(ARRAY(String(255)))  # Additional email addresses
+    all_emails_normalized = Column(ARRAY(String(255)))  # Primary + alternates, normalized (derived by trigger); GIN-indexed for lookups
     first_name = Column(String(100))
     last_name = Column(String(100))
     full_name = Column(String(255))
+    name_normalized = Column(String(255), index=True)  # Parsed "first middle last", maintained on write
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="SET NULL"), index=True)
     primary_contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"), index=True)  # Owner/primary contact for this contact
     role = Column(String(255), index=True)  # Board Chair, Board Member, Steering Committee, etc.
@@ -67,3 +80,45 @@ class Contact(Base, TimestampMixin):
 
     def __repr__(self):
         return f"<Contact(id={self.id}, email='{self.email}', name='{self.full_name}')>"
+
+
+# Functional indexes so case-insensitive lookups on the raw columns stay index scans
+Index("ix_contacts_email_lower", func.lower(Contact.email))
+Index("ix_organizations_name_lower", func.lower(Organization.name))
+Index("ix_contacts_all_emails_normalized", Contact.all_emails_normalized, postgresql_using="gin")
+Index("ix_contacts_tags", Contact.tags, postgresql_using="gin")
+# Contact list order, restricted to rows the list endpoint can return
+Index(
+    "ix_contacts_valid_email_name",
+    Contact.last_name, Contact.first_name,
+    postgresql_where=Contact.email_status == EMAIL_STATUS_VALID,
+)
+
+
+# ============================================
+# NORMALIZED COLUMN MAINTENANCE
+# ============================================
+
+@event.listens_for(Organization, "before_insert")
+@event.listens_for(Organization, "before_update")
+def _set_organization_normalized_columns(mapper, connection, target):
+    """Keep name_normalized in sync with name on every ORM write."""
+    target.name_normalized = normalize_organization_name(target.name) or None
+
+
+@event.listens_for(Contact, "before_insert")
+@event.listens_for(Contact, "before_update")
+def _set_contact_normalized_columns(mapper, connection, target):
+    """
+    Keep email_normalized, email_status, all_emails_normalized and name_normalized in sync on every ORM write.
+
+    The contacts_derive_columns trigger (migration 025) derives the email
+    columns the same way for raw SQL writers; name_normalized needs
+    nameparser, so only ORM writes store its parsed form.
+    """
+    target.email_normalized = normalize_email(target.email)
+    target.email_status = email_status(target.email)
+    target.all_emails_normalized = normalize_email_list(target.email, target.alternate_emails)
+    target.name_normalized = normalize_person_name(
+        target.full_name, target.first_name, target.last_name
+    ) or None
@@ -0,0 +1,62 @@
+"""
+Contact import staging model.
+Bulk imports are COPY'd here first, then validated and merged into contacts with set-based SQL.
+"""
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
+
+from app.models.base import Base
+
+
+class ContactImportRow(Base):
+    """
+    One row of an uploaded contact file.
+
+    Unlogged: rows are scratch data that can be re-staged from the source
+    file, and the per-row report only needs to outlive the import briefly.
+    """
+
+    __tablename__ = "contact_import_rows"
+
+    id = Column(BigInteger, primary_key=True)
+    import_id = Column(UUID(as_uuid=True), nullable=False)  # Background job ID
+    row_number = Column(Integer, nullable=False)  # Spreadsheet row, header = 1
+
+    # Values from the file (untyped, validated in SQL after COPY)
+    email = Column(Text)
+    email_normalized = Column(Text)
+    alternate_emails = Column(Text)  # Separated by ; or ,
+    first_name = Column(Text)
+    last_name = Column(Text)
+    full_name = Column(Text)
+    name_normalized = Column(Text)
+    organization_name = Column(Text)
+    organization_normalized = Column(Text)
+    title = Column(Text)
+    role = Column(Text)
+    phone = Column(Text)
+    country = Column(Text)
+    state_province = Column(Text)
+    city = Column(Text)
+    tags = Column(Text)  # Separated by ; or ,
+    notes = Column(Text)
+
+    # Derived during the merge
+    alternate_list = Column(ARRAY(String(255)))
+    tag_list = Column(ARRAY(Text))
+    organization_id = Column(UUID(as_uuid=True))
+    contact_id = Column(UUID(as_uuid=True))
+    action = Column(String(20))  # created, updated, unchanged, duplicate, error
+    error = Column(Text)
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)  # Set by the database; rows arrive via COPY
+
+    __table_args__ = (
+        Index("ix_contact_import_rows_import_row", "import_id", "row_number"),
+        Index("ix_contact_import_rows_import_email", "import_id", "email_normalized"),
+        Index("ix_contact_import_rows_created_at", "created_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    def __repr__(self):
+        return f"<ContactImportRow(import_id={self.import_id}, row={self.row_number}, action='{self.action}')>"
@@ -0,0 +1,51 @@
+"""
+Email bounce queue and suppression list.
+Bounce notifications are queued as they arrive and applied to contacts in batches;
+every bounced address lands on the suppression list that outbound sends check.
+"""
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.base import Base
+
+
+class EmailBounce(Base):
+    """One bounced address from an inbound bounce notification; processed_at marks it applied."""
+
+    __tablename__ = "email_bounces"
+
+    id = Column(BigInteger, primary_key=True)
+    email = Column(String(255), nullable=False)  # Normalized bounced address
+    parsed_email_id = Column(Integer, ForeignKey("parsed_emails.id", ondelete="SET NULL"))  # The bounce notification
+    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Outcome, set when the batch containing this bounce is applied
+    processed_at = Column(DateTime)
+    action = Column(String(30))  # deleted_contact, promoted_alternate, removed_alternate, not_found
+    contact_id = Column(UUID(as_uuid=True))  # Contact that was changed (not a FK: it may have been deleted)
+
+    __table_args__ = (
+        # The queue: unprocessed bounces in arrival order
+        Index("ix_email_bounces_pending", "id", postgresql_where=processed_at.is_(None)),
+        Index("ix_email_bounces_email", "email"),
+    )
+
+    def __repr__(self):
+        return f"<EmailBounce(id={self.id}, email='{self.email}', action='{self.action}')>"
+
+
+class EmailSuppression(Base):
+    """An address no outbound email is sent to."""
+
+    __tablename__ = "email_suppressions"
+
+    email = Column(String(255), primary_key=True)  # Normalized address
+    reason = Column(String(30), nullable=False, default="hard_bounce")  # hard_bounce, complaint, manual
+    bounce_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_bounced_at = Column(DateTime)
+    created_by = Column(String(255))  # Admin email for manual entries
+
+    def __repr__(self):
+        return f"<EmailSuppression(email='{self.email}', reason='{self.reason}')>"
@@ -0,0 +1,47 @@
+"""
+Email campaign model.
+A campaign is a template plus a recipient segment; sending it runs as a
+background job whose items are the per-recipient send log.
+"""
+import uuid
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import relationship
+
+from app.models.base import Base, TimestampMixin
+
+
+class EmailCampaign(Base, TimestampMixin):
+    """
+    A bulk email to a segment of contacts and members.
+
+    Templates use {{placeholder}} fields (first_name, last_name, full_name,
+    email plus anything in default_data). The HTML template is the body only;
+    it is wrapped in the branded base template when sent.
+    """
+
+    __tablename__ = "email_campaigns"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String(255), nullable=False)
+    subject = Column(String(500), nullable=False)
+    html_template = Column(Text, nullable=False)
+    text_template = Column(Text)
+    preheader = Column(String(255))
+    segment = Column(JSONB, nullable=False, default=dict)  # See app.services.campaigns.segment_query
+    default_data = Column(JSONB)  # Fallback placeholder values, e.g. {"first_name": "colleague"}
+
+    # Set when the campaign is sent; progress and the send log live on the job
+    job_id = Column(UUID(as_uuid=True), ForeignKey("background_jobs.id", ondelete="SET NULL"), index=True)
+    sent_at = Column(DateTime)
+    created_by = Column(String(255))
+
+    job = relationship("BackgroundJob")
+
+    @property
+    def status(self) -> str:
+        """draft until sent, then the send job's status."""
+        return self.job.status if self.job else "draft"
+
+    def __repr__(self):
+        return f"<EmailCampaign(id={self.id}, name='{self.name}', status='{self.status}')>"
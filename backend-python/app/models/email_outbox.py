@@ -0,0 +1,38 @@
+"""
+Transactional email outbox.
+Request handlers write the rendered message here in the same transaction as
+the change it announces; the outbox dispatcher delivers it after commit.
+"""
+from datetime import datetime
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Index
+
+from app.models.base import Base
+
+
+class EmailOutboxMessage(Base):
+    """One queued outbound email and its delivery state."""
+
+    __tablename__ = "email_outbox"
+
+    id = Column(BigInteger, primary_key=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(998), nullable=False)
+    html_content = Column(Text, nullable=False)
+    text_content = Column(Text)
+
+    # Delivery
+    status = Column(String(20), nullable=False, default="pending")  # pending, sent, failed, suppressed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # Also the lease while a send is in flight
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        # The dispatcher's queue: undelivered messages by due time
+        Index("ix_email_outbox_due", "next_attempt_at", postgresql_where=status == "pending"),
+        Index("ix_email_outbox_to_email", "to_email"),
+    )
+
+    def __repr__(self):
+        return f"<EmailOutboxMessage(id={self.id}, to='{self.to_email}', status='{self.status}')>"
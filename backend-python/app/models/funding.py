@@ -16,7 +16,7 @@ class FundingProspect(Base, TimestampMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="SET NULL"))
-    contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"))
+    contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id", ondelete="SET NULL"), index=True)
     prospect_type = Column(String(50))  # Grant, Sponsorship, Donation, Partnership
     amount_target = Column(DECIMAL(10, 2))
     amount_committed = Column(DECIMAL(10, 2))
@@ -0,0 +1,144 @@
+"""
+Member directory projection.
+
+One row per attendee profile that has opted into the directory, holding the
+member card exactly as GET /api/auth/directory returns it. Visibility
+preferences are applied when the row is written, so reads never see hidden
+fields and filters/search only ever match what the member chose to show.
+Rows are kept in sync from AttendeeProfile insert/update events.
+"""
+from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text, event, func, inspect, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID
+
+from app.models.base import Base
+from app.models.conference import AttendeeProfile
+
+
+class MemberDirectoryEntry(Base):
+    """Precomputed, visibility-filtered directory card for one member."""
+
+    __tablename__ = "member_directory"
+
+    profile_id = Column(UUID(as_uuid=True), ForeignKey("attendee_profiles.id", ondelete="CASCADE"), primary_key=True)
+    sort_key = Column(String(520), nullable=False)  # lower("last first"), keyset pagination order
+    country = Column(String(100))  # Only set when the member shows their country
+    expertise = Column(ARRAY(Text))  # Lowercased research areas + expertise keywords, when visible
+    card = Column(JSONB, nullable=False)  # Directory response item, visibility already applied
+    search_text = Column(Text)  # Lowercased visible name/organization for substring search
+    search_vector = Column(TSVECTOR)  # Name (A), organization/expertise (B), bio (C)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_member_directory_sort", "sort_key", "profile_id"),
+        Index("ix_member_directory_country", "country"),
+        Index("ix_member_directory_expertise", "expertise", postgresql_using="gin"),
+        Index("ix_member_directory_search", "search_vector", postgresql_using="gin"),
+    )
+
+    def __repr__(self):
+        return f"<MemberDirectoryEntry(profile_id={self.profile_id}, sort_key='{self.sort_key}')>"
+
+
+# Profile columns that feed the projection; other updates (logins, notification
+# settings) don't touch the directory row.
+DIRECTORY_SOURCE_FIELDS = (
+    "first_name", "last_name", "organization_name", "position", "country", "city",
+    "bio", "research_areas", "expertise_keywords", "contact_email",
+    "directory_opt_in", "directory_visible_fields",
+)
+
+# Visible unless explicitly turned off, except contact_email which is opt-in
+_VISIBLE = "COALESCE(p.directory_visible_fields->>'{field}', 'true') <> 'false'"
+_EXPERTISE = (
+    "ARRAY(SELECT DISTINCT LOWER(BTRIM(area)) "
+    "FROM UNNEST(COALESCE(p.research_areas, '{}') || COALESCE(p.expertise_keywords, '{}')) AS area "
+    "WHERE BTRIM(COALESCE(area, '')) <> '')"
+)
+
+UPSERT_DIRECTORY_SQL = text(f"""
+    INSERT INTO member_directory (profile_id, sort_key, country, expertise, card, search_text, search_vector, updated_at)
+    SELECT
+        p.id,
+        LOWER(COALESCE(p.last_name, '') || ' ' || COALESCE(p.first_name, '')),
+        CASE WHEN vis.country THEN p.country END,
+        CASE WHEN vis.research_areas THEN {_EXPERTISE} ELSE '{{}}' END,
+        jsonb_build_object(
+            'id', p.id::text,
+            'first_name', p.first_name,
+            'last_name', p.last_name,
+            'full_name', BTRIM(COALESCE(p.first_name, '') || ' ' || COALESCE(p.last_name, ''))
+        )
+        || CASE WHEN vis.organization THEN jsonb_build_object(
+               'organization_name', p.organization_name, 'organization', p.organization_name) ELSE '{{}}' END
+        || CASE WHEN vis.position THEN jsonb_build_object('position', p.position) ELSE '{{}}' END
+        || CASE WHEN vis.country THEN jsonb_build_object('country', p.country) ELSE '{{}}' END
+        || CASE WHEN vis.city THEN jsonb_build_object('city', p.city) ELSE '{{}}' END
+        || CASE WHEN vis.bio THEN jsonb_build_object('bio', p.bio) ELSE '{{}}' END
+        || CASE WHEN vis.research_areas THEN jsonb_build_object(
+               'research_areas', COALESCE(array_to_string(p.research_areas, ', '), '')) ELSE '{{}}' END
+        || CASE WHEN vis.contact_email THEN jsonb_build_object('contact_email', p.contact_email) ELSE '{{}}' END,
+        LOWER(CONCAT_WS(' ', p.first_name, p.last_name, CASE WHEN vis.organization THEN p.organization_name END)),
+        setweight(to_tsvector('simple', CONCAT_WS(' ', p.first_name, p.last_name)), 'A')
+        || setweight(to_tsvector('simple', CONCAT_WS(' ',
+               CASE WHEN vis.organization THEN p.organization_name END,
+               CASE WHEN vis.research_areas THEN array_to_string({_EXPERTISE}, ' ') END)), 'B')
+        || setweight(to_tsvector('simple', CASE WHEN vis.bio THEN COALESCE(p.bio, '') ELSE '' END), 'C'),
+        NOW()
+    FROM attendee_profiles p
+    CROSS JOIN LATERAL (
+        SELECT
+            {_VISIBLE.format(field='organization')} AS organization,
+            {_VISIBLE.format(field='position')} AS position,
+            {_VISIBLE.format(field='country')} AS country,
+            {_VISIBLE.format(field='city')} AS city,
+            {_VISIBLE.format(field='bio')} AS bio,
+            {_VISIBLE.format(field='research_areas')} AS research_areas,
+            COALESCE(p.directory_visible_fields->>'contact_email', 'false') = 'true' AS contact_email
+    ) AS vis
+    WHERE p.directory_opt_in
+      AND (CAST(:all_profiles AS boolean) OR p.id = ANY(CAST(:profile_ids AS uuid[])))
+    ON CONFLICT (profile_id) DO UPDATE SET
+        sort_key = EXCLUDED.sort_key,
+        country = EXCLUDED.country,
+        expertise = EXCLUDED.expertise,
+        card = EXCLUDED.card,
+        search_text = EXCLUDED.search_text,
+        search_vector = EXCLUDED.search_vector,
+        updated_at = EXCLUDED.updated_at
+""")
+
+# Opted-out (or deleted) profiles leave the directory
+PRUNE_DIRECTORY_SQL = text("""
+    DELETE FROM member_directory d
+    WHERE (CAST(:all_profiles AS boolean) OR d.profile_id = ANY(CAST(:profile_ids AS uuid[])))
+      AND NOT EXISTS (
+          SELECT 1 FROM attendee_profiles p
+          WHERE p.id = d.profile_id AND p.directory_opt_in
+      )
+""")
+
+
+def refresh_member_directory(connection, profile_ids=None):
+    """
+    Rewrite directory rows for `profile_ids`, or for every profile when None.
+
+    `connection` may be a Session or Connection; the caller commits.
+    """
+    params = {
+        "all_profiles": profile_ids is None,
+        "profile_ids": [str(profile_id) for profile_id in (profile_ids or [])],
+    }
+    connection.execute(PRUNE_DIRECTORY_SQL, params)
+    connection.execute(UPSERT_DIRECTORY_SQL, params)
+
+
+@event.listens_for(AttendeeProfile, "after_insert")
+def _add_directory_entry(mapper, connection, target):
+    refresh_member_directory(connection, [target.id])
+
+
+@event.listens_for(AttendeeProfile, "after_update")
+def _update_directory_entry(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in DIRECTORY_SOURCE_FIELDS):
+        refresh_member_directory(connection, [target.id])
@@ -2,13 +2,30 @@
 Parsed Email Model
 Stores emails received through admin@shellfish-society.org with AI-extracted data
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, Float
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, Boolean, Float, Index, event, inspect
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from app.models import Base
+from app.utils.normalization import normalize_email_list
 
 
 class ParsedEmail(Base):
-    """Model for storing parsed emails from SES inbound"""
+    """
+    Model for storing parsed emails from SES inbound
+
+    Bodies and AI extraction blobs are deferred: list/status paths load a
+    dozen small columns, and the detail view undefers the "body" and
+    "extraction" groups. Bodies older than the retention window live in
+    object storage (body_archive_key); see app.services.parsed_email_archive.
+
+    JSON columns are JSONB. email_type and primary_contact_email are
+    generated from email_metadata so the list filters hit plain btree
+    indexes instead of parsing every row's metadata.
+
+    search_vector (subject A, sender B, body C) is written on insert and
+    kept when the body is archived, so archived emails stay searchable.
+    """
     __tablename__ = "parsed_emails"
 
     id = Column(Integer, primary_key=True, index=True)
@@ -17,20 +34,24 @@ class ParsedEmail(Base):
     message_id = Column(String(500), unique=True, index=True)
     s3_key = Column(String(500), index=True)
     from_email = Column(String(255), index=True)
-    to_emails = Column(JSON)  # Array of recipient emails
-    cc_emails = Column(JSON)  # Array of CC emails
+    to_emails = Column(JSONB)  # Array of recipient emails
+    cc_emails = Column(JSONB)  # Array of CC emails
+    participant_emails = Column(ARRAY(String(255)))  # From + to + cc, normalized; GIN-indexed, maintained on write
     subject = Column(String(500))
     date = Column(DateTime(timezone=True))
 
-    # Email content
-    body_text = Column(Text)
-    body_html = Column(Text)
-    attachments = Column(JSON)  # Array of attachment metadata
+    # Email content (NULL once archived to body_archive_key)
+    body_text = deferred(Column(Text), group="body")
+    body_html = deferred(Column(Text), group="body")
+    attachments = deferred(Column(JSONB), group="body")  # Array of attachment metadata
+    body_archive_key = Column(String(500))  # Object storage key of the archived body, if archived
+    body_archived_at = Column(DateTime(timezone=True))
+    search_vector = deferred(Column(TSVECTOR))  # Full-text search; see search_vector_expression()
 
     # AI-extracted data
-    extracted_contacts = Column(JSON)  # Array of {name, email, org, confidence}
-    action_items = Column(JSON)  # Array of {task, owner, deadline, priority}
-    topics = Column(JSON)  # Array of keywords/topics
+    extracted_contacts = deferred(Column(JSONB), group="extraction")  # Array of {name, email, org, confidence}
+    action_items = deferred(Column(JSONB), group="extraction")  # Array of {task, owner, deadline, priority}
+    topics = deferred(Column(JSONB), group="extraction")  # Array of keywords/topics
     overall_confidence = Column(Float)  # 0-100 confidence score
 
     # Processing status
@@ -40,7 +61,11 @@ class ParsedEmail(Base):
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
 
     # Metadata
-    email_metadata = Column(JSON)  # Additional metadata
+    email_metadata = Column(JSONB)  # Additional metadata
+    email_type = Column(Text, Computed("email_metadata->>'email_type'", persisted=True))
+    primary_contact_email = Column(
+        Text, Computed("lower(email_metadata->'primary_contact'->>'email')", persisted=True)
+    )
     error_message = Column(Text, nullable=True)
 
     # Timestamps
@@ -49,3 +74,72 @@ class ParsedEmail(Base):
 
     def __repr__(self):
         return f"<ParsedEmail(id={self.id}, subject='{self.subject}', from='{self.from_email}')>"
+
+
+Index("ix_parsed_emails_participant_emails", ParsedEmail.participant_emails, postgresql_using="gin")
+Index("ix_parsed_emails_email_type_created", ParsedEmail.email_type, ParsedEmail.created_at)
+Index("ix_parsed_emails_primary_contact_email", ParsedEmail.primary_contact_email)
+# Review queue, newest first
+Index(
+    "ix_parsed_emails_review_queue",
+    ParsedEmail.created_at,
+    postgresql_where=ParsedEmail.requires_review.is_(True),
+)
+# Per-contact lookups: extracted_contacts @> '[{"email": ...}]'
+Index(
+    "ix_parsed_emails_extracted_contacts",
+    ParsedEmail.extracted_contacts,
+    postgresql_using="gin",
+    postgresql_ops={"extracted_contacts": "jsonb_path_ops"},
+)
+Index("ix_parsed_emails_search_vector", ParsedEmail.search_vector, postgresql_using="gin")
+# Bodies still inline, oldest first (body archival)
+Index(
+    "ix_parsed_emails_unarchived_created",
+    ParsedEmail.created_at,
+    postgresql_where=ParsedEmail.body_archive_key.is_(None),
+)
+
+PARTICIPANT_SOURCE_FIELDS = ("from_email", "to_emails", "cc_emails")
+SEARCH_SOURCE_FIELDS = ("subject", "from_email", "body_text")
+
+# Text search configuration for search_vector and the queries against it
+SEARCH_CONFIG = "english"
+
+# Body prefix that is indexed (tsvector values are capped at 1MB)
+SEARCH_BODY_CHARS = 100_000
+
+
+def search_vector_expression(subject, from_email, body_text):
+    """SQL expression for search_vector: subject weighted A, sender B, body C."""
+    def weighted(value, weight):
+        return func.setweight(func.to_tsvector(SEARCH_CONFIG, func.coalesce(value, "")), weight)
+
+    body = body_text[:SEARCH_BODY_CHARS] if body_text else None
+    return weighted(subject, "A").op("||")(weighted(from_email, "B")).op("||")(weighted(body, "C"))
+
+
+@event.listens_for(ParsedEmail, "before_insert")
+@event.listens_for(ParsedEmail, "before_update")
+def _set_participant_emails(mapper, connection, target):
+    """Keep participant_emails in sync with from/to/cc so contact lookups can use the GIN index."""
+    state = inspect(target)
+    if state.persistent and not any(state.attrs[field].history.has_changes() for field in PARTICIPANT_SOURCE_FIELDS):
+        # Status/archive updates don't touch recipients (and may not have them loaded)
+        return
+    target.participant_emails = normalize_email_list(
+        target.from_email, [*(target.to_emails or []), *(target.cc_emails or [])]
+    )
+
+
+@event.listens_for(ParsedEmail, "before_insert")
+@event.listens_for(ParsedEmail, "before_update")
+def _set_search_vector(mapper, connection, target):
+    """Index subject/sender/body for full-text search when they are written."""
+    state = inspect(target)
+    if state.persistent and not any(state.attrs[field].history.has_changes() for field in SEARCH_SOURCE_FIELDS):
+        return
+    if target.body_archive_key:
+        # Body moved to object storage; the existing vector still covers it
+        return
+    target.search_vector = search_vector_expression(target.subject, target.from_email, target.body_text)
@@ -3,16 +3,23 @@ System models for audit logging and data quality tracking.
 """
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DECIMAL, DateTime
+from sqlalchemy import Column, String, DECIMAL, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from app.models.base import Base
 
 
 class AuditLog(Base):
-    """Audit log for tracking changes to data."""
+    """
+    Audit log for tracking changes to data.
+
+    Range-partitioned by month on created_at (audit_log_pYYYYMM plus a
+    default partition); app.services.audit_log_maintenance creates upcoming
+    partitions and archives old ones.
+    """
 
     __tablename__ = "audit_log"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     table_name = Column(String(100))
@@ -20,12 +27,22 @@ class AuditLog(Base):
     action = Column(String(50))  # INSERT, UPDATE, DELETE
     changed_by = Column(String(255))
     changes = Column(JSONB)  # Store old and new values
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, primary_key=True)  # Partition key, so part of the primary key
 
     def __repr__(self):
         return f"<AuditLog(id={self.id}, table='{self.table_name}', action='{self.action}')>"
 
 
+# History of one record, newest first (contact timeline)
+Index("ix_audit_log_record", AuditLog.record_id, AuditLog.created_at)
+# Admin audit log filters, newest first
+Index("ix_audit_log_table_created", AuditLog.table_name, AuditLog.created_at)
+Index("ix_audit_log_action_created", AuditLog.action, AuditLog.created_at)
+# Date ranges and newest-first paging: rows arrive in created_at order, so a
+# BRIN summary plus partition pruning replaces a full btree
+Index("ix_audit_log_created_at_brin", AuditLog.created_at, postgresql_using="brin")
+
+
 class DataQualityMetric(Base):
     """Data quality metrics for monitoring database health."""
 
@@ -41,6 +58,10 @@ class DataQualityMetric(Base):
         return f"<DataQualityMetric(id={self.id}, name='{self.metric_name}', value={self.metric_value})>"
 
 
+# Latest value / time series per metric (dashboard snapshots)
+Index("ix_data_quality_metrics_name_measured_at", DataQualityMetric.metric_name, DataQualityMetric.measured_at)
+
+
 class UserFeedback(Base):
     """User feedback submissions from the frontend feedback widget."""
 
@@ -13,7 +13,11 @@ import logging
 from app.database import get_db
 from app.models.conference import AttendeeProfile
 from app.models.system import AuditLog
+from app.models.email_bounce import EmailSuppression
+from app.models.email_outbox import EmailOutboxMessage
 from app.dependencies.permissions import get_current_admin
+from app.services.audit_log_maintenance import cached_distinct_values
+from app.utils.normalization import normalize_email
 
 logger = logging.getLogger(__name__)
 
@@ -108,10 +112,79 @@ class AuditLogsResponse(BaseModel):
     page_size: int
 
 
+class SuppressionEntry(BaseModel):
+    """Suppressed email address."""
+    email: str
+    reason: str
+    bounce_count: int
+    created_at: Optional[datetime] = None
+    last_bounced_at: Optional[datetime] = None
+    created_by: Optional[str] = None
+
+
+class SuppressionsResponse(BaseModel):
+    """Response for the suppression list."""
+    success: bool
+    data: List[SuppressionEntry]
+    total: int
+    page: int
+    page_size: int
+
+
+class SuppressionRequest(BaseModel):
+    """Request to suppress an address by hand."""
+    email: str
+    reason: str = "manual"
+
+
+class OutboxEntry(BaseModel):
+    """Queued outbound email."""
+    id: int
+    to_email: str
+    subject: str
+    status: str
+    attempts: int
+    next_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+
+class OutboxResponse(BaseModel):
+    """Response for the email outbox."""
+    success: bool
+    data: List[OutboxEntry]
+    total: int
+    page: int
+    page_size: int
+
+
 # ============================================================================
 # User Management Endpoints
 # ============================================================================
 
+# Each user's unrevoked role assignments as a JSON array, built in the same
+# statement as the page of users (served by ix_user_roles_user_revoked_active).
+# Correlated on page.id so it runs only for the rows on the page.
+USER_ROLES_JSON = """
+    COALESCE((
+        SELECT json_agg(json_build_object(
+            'role_id', r.id,
+            'role_name', r.name,
+            'role_display_name', r.display_name,
+            'assigned_at', ur.created_at,
+            'is_active', ur.is_active,
+            'active_from', ur.active_from,
+            'active_until', ur.active_until
+        ) ORDER BY r.name)
+        FROM user_roles ur
+        JOIN roles r ON ur.role_id = r.id
+        WHERE ur.user_id = page.id
+          AND ur.revoked_at IS NULL
+    ), '[]'::json)
+"""
+
+
 @router.get("/users", response_model=UsersListResponse)
 async def list_users(
     page: int = Query(1, ge=1),
@@ -124,59 +197,40 @@ async def list_users(
     """
     List all users with their roles.
 
+    One statement returns the page, each user's roles (json_agg) and the
+    total match count (window count over the filtered users).
+
     Requires admin privileges.
     """
     offset = (page - 1) * page_size
 
-    # Build base query
-    base_query = """
-        SELECT DISTINCT
-            ap.id,
-            ap.email,
-            ap.first_name,
-            ap.last_name,
-            ap.organization_name,
-            ap.country,
-            ap.created_at,
-            ap.last_activity as last_login
-        FROM attendee_profiles ap
-    """
-
-    count_query = "SELECT COUNT(DISTINCT ap.id) FROM attendee_profiles ap"
+    filters = ""
 
-    # Add role filter if specified
+    # Role filter as a semi-join, so users with several roles aren't duplicated
     if role:
-        base_query += """
-            JOIN user_roles ur ON ap.id = ur.user_id
-            JOIN roles r ON ur.role_id = r.id
-            WHERE r.name = :role AND ur.is_active = true AND ur.revoked_at IS NULL
-        """
-        count_query += """
-            JOIN user_roles ur ON ap.id = ur.user_id
-            JOIN roles r ON ur.role_id = r.id
-            WHERE r.name = :role AND ur.is_active = true AND ur.revoked_at IS NULL
+        filters += """
+            AND EXISTS (
+                SELECT 1
+                FROM user_roles ur
+                JOIN roles r ON ur.role_id = r.id
+                WHERE ur.user_id = ap.id
+                  AND r.name = :role
+                  AND ur.is_active = true
+                  AND ur.revoked_at IS NULL
+            )
         """
-    else:
-        base_query += " WHERE 1=1"
-        count_query += " WHERE 1=1"
 
     # Add search filter
     if search:
-        search_filter = """
+        filters += """
             AND (
-                ap.email ILIKE :search
+                ap.user_email ILIKE :search
                 OR ap.first_name ILIKE :search
                 OR ap.last_name ILIKE :search
                 OR ap.organization_name ILIKE :search
             )
         """
-        base_query += search_filter
-        count_query += search_filter
-
-    # Add ordering and pagination
-    base_query += " ORDER BY ap.created_at DESC LIMIT :limit OFFSET :offset"
 
-    # Execute queries
     params = {
         "limit": page_size,
         "offset": offset,
@@ -184,45 +238,38 @@ async def list_users(
         "role": role
     }
 
-    # Get total count
-    total_result = db.execute(text(count_query), params).scalar()
-    total = total_result or 0
-
-    # Get users
-    users_result = db.execute(text(base_query), params).fetchall()
-
-    users = []
-    for row in users_result:
-        # Get roles for this user
-        roles_query = """
+    users_result = db.execute(text(f"""
+        WITH page AS (
             SELECT
-                r.id, r.name, r.display_name,
-                ur.created_at as assigned_at,
-                ur.is_active,
-                ur.active_from,
-                ur.active_until
-            FROM user_roles ur
-            JOIN roles r ON ur.role_id = r.id
-            WHERE ur.user_id = :user_id
-              AND ur.revoked_at IS NULL
-            ORDER BY r.name
-        """
-        roles_result = db.execute(text(roles_query), {"user_id": row.id}).fetchall()
-
-        user_roles = [
-            UserRoleInfo(
-                role_id=str(r.id),
-                role_name=r.name,
-                role_display_name=r.display_name,
-                assigned_at=r.assigned_at,
-                is_active=r.is_active,
-                active_from=r.active_from,
-                active_until=r.active_until
-            )
-            for r in roles_result
-        ]
+                ap.id,
+                ap.user_email AS email,
+                ap.first_name,
+                ap.last_name,
+                ap.organization_name,
+                ap.country,
+                ap.created_at,
+                ap.last_login_at AS last_login,
+                COUNT(*) OVER () AS total
+            FROM attendee_profiles ap
+            WHERE true {filters}
+            ORDER BY ap.created_at DESC, ap.id
+            LIMIT :limit OFFSET :offset
+        )
+        SELECT page.*, {USER_ROLES_JSON} AS roles
+        FROM page
+        ORDER BY page.created_at DESC, page.id
+    """), params).fetchall()
+
+    if users_result:
+        total = users_result[0].total
+    elif offset:
+        # Past the last page: the window count had no row to ride on
+        total = db.execute(text(f"SELECT COUNT(*) FROM attendee_profiles ap WHERE true {filters}"), params).scalar()
+    else:
+        total = 0
 
-        users.append(UserInfo(
+    users = [
+        UserInfo(
             id=str(row.id),
             email=row.email or "",
             first_name=row.first_name,
@@ -233,8 +280,10 @@ async def list_users(
             created_at=row.created_at,
             last_login=row.last_login,
             is_active=True,
-            roles=user_roles
-        ))
+            roles=[UserRoleInfo(**user_role) for user_role in row.roles]
+        )
+        for row in users_result
+    ]
 
     return UsersListResponse(
         success=True,
@@ -547,15 +596,12 @@ async def get_audit_tables(
     """
     Get list of tables that have audit entries.
 
+    Cached for a few minutes per process.
     Requires admin privileges.
     """
-    result = db.execute(
-        text("SELECT DISTINCT table_name FROM audit_log WHERE table_name IS NOT NULL ORDER BY table_name")
-    ).fetchall()
-
     return {
         "success": True,
-        "data": [row.table_name for row in result]
+        "data": cached_distinct_values(db, "table_name")
     }
 
 
@@ -567,18 +613,181 @@ async def get_audit_actions(
     """
     Get list of action types in audit log.
 
+    Cached for a few minutes per process.
     Requires admin privileges.
     """
-    result = db.execute(
-        text("SELECT DISTINCT action FROM audit_log WHERE action IS NOT NULL ORDER BY action")
-    ).fetchall()
-
     return {
         "success": True,
-        "data": [row.action for row in result]
+        "data": cached_distinct_values(db, "action")
     }
 
 
+# ============================================================================
+# Email Suppression List
+# ============================================================================
+
+@router.get("/email-suppressions", response_model=SuppressionsResponse)
+async def list_email_suppressions(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=100),
+    search: Optional[str] = Query(None, description="Filter by address"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    List suppressed addresses (bounced or suppressed by hand), newest first.
+
+    Requires admin privileges.
+    """
+    query = db.query(EmailSuppression)
+    if search:
+        query = query.filter(EmailSuppression.email.ilike(f"%{search.strip().lower()}%"))
+
+    total = query.count()
+    entries = query.order_by(desc(EmailSuppression.created_at)).offset((page - 1) * page_size).limit(page_size).all()
+
+    return SuppressionsResponse(
+        success=True,
+        data=[
+            SuppressionEntry(
+                email=entry.email,
+                reason=entry.reason,
+                bounce_count=entry.bounce_count,
+                created_at=entry.created_at,
+                last_bounced_at=entry.last_bounced_at,
+                created_by=entry.created_by
+            )
+            for entry in entries
+        ],
+        total=total,
+        page=page,
+        page_size=page_size
+    )
+
+
+@router.post("/email-suppressions")
+async def add_email_suppression(
+    request: SuppressionRequest,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Stop all outbound email to an address.
+
+    Requires admin privileges.
+    """
+    email = normalize_email(request.email)
+    if not email:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Email is required")
+
+    if not db.get(EmailSuppression, email):
+        db.add(EmailSuppression(email=email, reason=request.reason, created_by=current_admin.user_email))
+        db.commit()
+        logger.info(f"Admin {current_admin.user_email} suppressed {email}")
+
+    return {"success": True, "message": f"{email} is suppressed"}
+
+
+@router.delete("/email-suppressions/{email}")
+async def remove_email_suppression(
+    email: str,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Allow sending to an address again (e.g. a mailbox that was fixed).
+
+    Requires admin privileges.
+    """
+    entry = db.get(EmailSuppression, normalize_email(email) or "")
+    if not entry:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Address is not suppressed")
+
+    db.delete(entry)
+    db.commit()
+    logger.info(f"Admin {current_admin.user_email} removed suppression for {entry.email}")
+
+    return {"success": True, "message": f"{entry.email} is no longer suppressed"}
+
+
+# ============================================================================
+# Email Outbox
+# ============================================================================
+
+@router.get("/email-outbox", response_model=OutboxResponse)
+async def list_email_outbox(
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=100),
+    status_filter: Optional[str] = Query(None, alias="status", description="pending, sent, failed, suppressed"),
+    to_email: Optional[str] = Query(None, description="Filter by recipient"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    List queued transactional email, newest first (e.g. status=failed).
+
+    Requires admin privileges.
+    """
+    query = db.query(EmailOutboxMessage)
+    if status_filter:
+        query = query.filter(EmailOutboxMessage.status == status_filter)
+    if to_email:
+        query = query.filter(EmailOutboxMessage.to_email == to_email.strip())
+
+    total = query.count()
+    messages = query.order_by(desc(EmailOutboxMessage.id)).offset((page - 1) * page_size).limit(page_size).all()
+
+    return OutboxResponse(
+        success=True,
+        data=[
+            OutboxEntry(
+                id=message.id,
+                to_email=message.to_email,
+                subject=message.subject,
+                status=message.status,
+                attempts=message.attempts,
+                next_attempt_at=message.next_attempt_at,
+                last_error=message.last_error,
+                created_at=message.created_at,
+                sent_at=message.sent_at
+            )
+            for message in messages
+        ],
+        total=total,
+        page=page,
+        page_size=page_size
+    )
+
+
+@router.post("/email-outbox/{message_id}/retry")
+async def retry_email_outbox_message(
+    message_id: int,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Queue a failed message for delivery again.
+
+    Requires admin privileges.
+    """
+    message = db.get(EmailOutboxMessage, message_id)
+    if not message:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
+    if message.status != "failed":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Message is {message.status}")
+
+    message.status = "pending"
+    message.attempts = 0
+    message.next_attempt_at = datetime.utcnow()
+    db.commit()
+
+    from app.services.email_outbox import outbox_dispatcher
+    outbox_dispatcher.notify()
+    logger.info(f"Admin {current_admin.user_email} requeued outbox message {message_id}")
+
+    return {"success": True, "message": f"Message {message_id} queued for delivery"}
+
+
 # ============================================================================
 # EMAIL TEMPLATE TESTING
 # ============================================================================
@@ -594,7 +803,6 @@ async def send_test_emails(
     Requires admin privileges.
     """
     from app.services.email_service import email_service
-    import asyncio
     
     results = {}
     
@@ -604,7 +812,6 @@ async def send_test_emails(
         magic_link="https://www.shellfish-society.org/member/verify.html?token=TEST_TOKEN_123",
         first_name="Aaron"
     )
-    await asyncio.sleep(1)
     
     # 2. Welcome Email
     results["welcome"] = await email_service.send_welcome_email(
@@ -612,7 +819,6 @@ async def send_test_emails(
         first_name="Aaron",
         magic_link="https://www.shellfish-society.org/member/verify.html?token=TEST_WELCOME_123"
     )
-    await asyncio.sleep(1)
     
     # 3. Abstract Review Assignment
     results["review_assignment"] = await email_service.send_review_assignment_email(
@@ -622,14 +828,12 @@ async def send_test_emails(
         due_date="March 15, 2026",
         review_link="https://www.shellfish-society.org/admin/abstracts.html?review=12345"
     )
-    await asyncio.sleep(1)
     
     # 4. Review Confirmation
     results["review_confirmation"] = await email_service.send_review_confirmation_email(
         reviewer_email=test_email,
         abstract_title="Oyster Reef Restoration in Chesapeake Bay"
     )
-    await asyncio.sleep(1)
     
     # 5. Abstract Acceptance
     results["acceptance"] = await email_service.send_acceptance_email(
@@ -640,7 +844,6 @@ async def send_test_emails(
         conference_name="ICSR2026",
         conference_dates="October 5-8, 2026"
     )
-    await asyncio.sleep(1)
     
     # 6. Abstract Rejection
     results["rejection"] = await email_service.send_rejection_email(
@@ -649,7 +852,6 @@ async def send_test_emails(
         abstract_title="Test Abstract for Rejection Email",
         conference_name="ICSR2026"
     )
-    await asyncio.sleep(1)
     
     # 7. Event Signup
     results["event_signup"] = await email_service.send_event_signup_email(
@@ -660,7 +862,6 @@ async def send_test_emails(
         event_time="9:00 AM - 4:00 PM",
         event_location="Little Creek Casino Resort, Shelton, WA"
     )
-    await asyncio.sleep(1)
     
     # 8. Event Waitlist Promotion
     results["waitlist_promotion"] = await email_service.send_event_waitlist_promotion_email(
@@ -670,7 +871,6 @@ async def send_test_emails(
         event_date="October 6, 2026",
         rsvp_link="https://www.shellfish-society.org/icsr2026.html#events"
     )
-    await asyncio.sleep(1)
     
     # 9. Conference Registration
     results["conference_registration"] = await email_service.send_conference_registration_email(
@@ -13,7 +13,9 @@ from app.database import get_db
 from app.models.contact import Contact
 from app.dependencies.permissions import get_current_user
 from app.models.conference import AttendeeProfile
+from app.services.apollo_cache import ApolloCache
 from app.services.apollo_service import ApolloService, ApolloAPIError
+from app.services.job_runner import job_runner
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ class EnrichContactRequest(BaseModel):
 class EnrichOrganizationRequest(BaseModel):
     """Request to enrich an organization by domain"""
     domain: str
+    force_refresh: bool = False  # Bypass the enrichment cache
 
 
 class SearchPeopleRequest(BaseModel):
@@ -60,6 +63,7 @@ class EnrichmentResponse(BaseModel):
 async def enrich_contact(
     contact_id: UUID,
     background_tasks: BackgroundTasks,
+    force_refresh: bool = Query(False, description="Bypass the enrichment cache"),
     current_user: AttendeeProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -75,7 +79,7 @@ async def enrich_contact(
             raise HTTPException(status_code=404, detail="Contact not found")
 
         # Initialize Apollo service
-        apollo = ApolloService()
+        apollo = ApolloService(cache=ApolloCache())
 
         # Enrich contact
         logger.info(f"[Enrichment] Enriching contact {contact.id}: {contact.email}")
@@ -84,7 +88,8 @@ async def enrich_contact(
             email=contact.email,
             first_name=contact.first_name,
             last_name=contact.last_name,
-            organization_name=contact.organization_name
+            organization_name=contact.organization_name,
+            force_refresh=force_refresh,
         )
 
         if not result.get('success'):
@@ -137,42 +142,47 @@ async def enrich_contact(
 
 @router.post("/contacts/bulk-enrich")
 async def bulk_enrich_contacts(
-    background_tasks: BackgroundTasks,
     limit: int = Query(100, le=1000),
+    force_refresh: bool = Query(False, description="Bypass the enrichment cache"),
     current_user: AttendeeProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Bulk enrich contacts that are missing data
 
-    Runs in background to avoid timeout
+    Queues a background job; poll /api/admin/jobs/{job_id} for progress
     """
     try:
         # Find contacts missing phone or title
-        contacts = db.query(Contact).filter(
-            (Contact.phone == None) | (Contact.title == None)
-        ).filter(
-            Contact.email != None
-        ).limit(limit).all()
-
-        if not contacts:
+        contact_ids = [
+            row.id for row in db.query(Contact.id).filter(
+                (Contact.phone == None) | (Contact.title == None)
+            ).filter(
+                Contact.email != None
+            ).order_by(Contact.id).limit(limit)
+        ]
+
+        if not contact_ids:
             return {
                 "success": True,
                 "message": "No contacts need enrichment",
                 "total": 0
             }
 
-        # Queue background enrichment
-        background_tasks.add_task(
-            _bulk_enrich_task,
-            [c.id for c in contacts],
-            db
+        job = job_runner.enqueue(
+            db,
+            "apollo_bulk_enrich",
+            contact_ids,
+            params={"force_refresh": force_refresh},
+            created_by=current_user.user_email,
         )
 
         return {
             "success": True,
-            "message": f"Queued {len(contacts)} contacts for enrichment",
-            "total": len(contacts)
+            "message": f"Queued {len(contact_ids)} contacts for enrichment",
+            "total": len(contact_ids),
+            "job_id": str(job.id),
+            "status_url": f"/api/admin/jobs/{job.id}"
         }
 
     except Exception as e:
@@ -180,39 +190,6 @@ async def bulk_enrich_contacts(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def _bulk_enrich_task(contact_ids: List[UUID], db: Session):
-    """Background task for bulk enrichment"""
-    apollo = ApolloService()
-
-    for contact_id in contact_ids:
-        try:
-            contact = db.query(Contact).filter(Contact.id == contact_id).first()
-            if not contact:
-                continue
-
-            result = await apollo.enrich_person(
-                email=contact.email,
-                first_name=contact.first_name,
-                last_name=contact.last_name
-            )
-
-            if result.get('success'):
-                # Update contact
-                if result.get('phone') and not contact.phone:
-                    contact.phone = result['phone']
-                if result.get('title') and not contact.title:
-                    contact.title = result['title']
-                if result.get('linkedin_url') and not contact.linkedin:
-                    contact.linkedin = result['linkedin_url']
-
-                db.commit()
-                logger.info(f"[Bulk Enrichment] Enriched contact {contact.id}")
-
-        except Exception as e:
-            logger.error(f"[Bulk Enrichment] Failed for contact {contact_id}: {str(e)}")
-            continue
-
-
 # ============================================================================
 # Organization Enrichment Endpoints
 # ============================================================================
@@ -233,10 +210,10 @@ async def enrich_organization(
         domain = request.domain.replace('http://', '').replace('https://', '').replace('www.', '').split('/')[0]
 
         # Initialize Apollo service
-        apollo = ApolloService()
+        apollo = ApolloService(cache=ApolloCache())
 
         # Enrich organization
-        result = await apollo.enrich_organization(domain)
+        result = await apollo.enrich_organization(domain, force_refresh=request.force_refresh)
 
         if not result.get('success'):
             raise HTTPException(status_code=400, detail=result.get('error', 'Enrichment failed'))
@@ -385,10 +362,11 @@ async def get_apollo_credits(
     """
     Get remaining Apollo.io API credits
 
-    Shows: email credits, export credits, daily request limit
+    Shows: email credits, export credits, daily request limit,
+    and enrichment cache hit/miss counters
     """
     try:
-        apollo = ApolloService()
+        apollo = ApolloService(cache=ApolloCache())
         result = await apollo.get_account_credits()
 
         if not result.get('success'):
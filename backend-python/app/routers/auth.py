@@ -1,7 +1,7 @@
 """
 Authentication router for magic link login.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
@@ -16,6 +16,16 @@ from app.database import get_db
 from app.models.conference import AttendeeProfile
 from app.services.auth_service import auth_service
 from app.services.email_service import email_service
+from app.services.facets import directory_facets
+from app.services.member_directory import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursor,
+    directory_count,
+    directory_etag,
+    directory_page,
+    directory_query,
+)
 from app.rate_limiter import limiter
 
 logger = logging.getLogger(__name__)
@@ -213,10 +223,7 @@ async def register(register_data: RegisterRequest, request: Request, db: Session
         )
 
         db.add(new_attendee)
-        db.commit()
-        db.refresh(new_attendee)
-
-        logger.info(f"New member registered: {email} (ID: {new_attendee.id})")
+        db.flush()
 
         # Get client IP and user agent
         client_ip = get_client_ip(request)
@@ -227,21 +234,15 @@ async def register(register_data: RegisterRequest, request: Request, db: Session
             db, email, str(new_attendee.id), client_ip, user_agent
         )
 
-        # Send welcome email with magic link for new registrations
-        email_sent = await email_service.send_welcome_email(
+        # Queue welcome email with magic link; profile, session and email commit together
+        await email_service.queued(db).send_welcome_email(
             email,
             register_data.first_name,
             magic_link
         )
+        db.commit()
 
-        if not email_sent:
-            logger.error(f"Failed to send verification email to {email}")
-            # Still return success since account was created
-            return RegisterResponse(
-                success=True,
-                message="Account created successfully. Please contact support if you don't receive a verification email.",
-                user_id=str(new_attendee.id)
-            )
+        logger.info(f"New member registered: {email} (ID: {new_attendee.id})")
 
         return RegisterResponse(
             success=True,
@@ -383,18 +384,12 @@ async def request_login(login_data: LoginRequest, request: Request, db: Session
             db, email, str(attendee.id), client_ip, user_agent
         )
 
-        # Send magic link email (include first name for personalization if available)
+        # Queue magic link email (include first name for personalization if available)
         first_name = attendee.first_name if attendee and attendee.first_name else None
-        email_sent = await email_service.send_magic_link(email, magic_link, first_name)
-
-        if not email_sent:
-            logger.error(f"Failed to send magic link email to {email}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to send login email. Please try again later.",
-            )
+        await email_service.queued(db).send_magic_link(email, magic_link, first_name)
+        db.commit()
 
-        logger.info(f"Magic link sent to {email}")
+        logger.info(f"Magic link queued for {email}")
         return LoginResponse(success=True, message="Login link sent to your email. Please check your inbox.")
 
     except HTTPException:
@@ -724,88 +719,62 @@ async def get_current_user_info(
 @limiter.limit("30/hour")
 async def get_member_directory(
     request: Request,
+    response: Response,
     search: Optional[str] = None,
     country: Optional[str] = None,
     expertise: Optional[str] = None,
     conference: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    facets: bool = False,
     current_user: AttendeeProfile = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Get the member directory with optional filters.
+    Get one page of the member directory with optional filters.
 
     Rate limited to 30 requests per hour to prevent email harvesting.
-    Only returns members who have opted into the directory.
+    Filters are applied here, so clients request further pages on demand
+    rather than downloading the whole directory.
+    Only returns members who have opted into the directory, showing only the
+    fields each member made visible. Pass `next_cursor` back as `cursor` for
+    the next page. Responses carry an ETag; a matching If-None-Match gets an
+    empty 304.
+    With facets=true, also returns counts per country, organization and
+    expertise (visible fields only) for the filter sidebar.
     Requires authentication.
     """
-    # Query all members who have opted into the directory
-    query = db.query(AttendeeProfile).filter(
-        AttendeeProfile.directory_opt_in == True
-    )
-
-    # Apply search filter (searches name, organization, bio, research areas)
-    if search:
-        # Limit search term length to prevent ReDoS and performance issues
-        if len(search) > 100:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Search term too long (max 100 characters)"
-            )
-        search_term = f"%{search.lower()}%"
-        query = query.filter(
-            (AttendeeProfile.first_name.ilike(search_term)) |
-            (AttendeeProfile.last_name.ilike(search_term)) |
-            (AttendeeProfile.organization_name.ilike(search_term)) |
-            (AttendeeProfile.bio.ilike(search_term))
+    # Limit search term length to prevent ReDoS and performance issues
+    if search and len(search) > 100:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search term too long (max 100 characters)"
         )
 
-    # Apply country filter
-    if country:
-        query = query.filter(AttendeeProfile.country == country)
-
-    # Get all matching members
-    members = query.order_by(AttendeeProfile.last_name, AttendeeProfile.first_name).all()
-
-    # Format response based on each member's visibility preferences
-    directory_data = []
-    for member in members:
-        visible_fields = member.directory_visible_fields or {}
-
-        # Build full_name for frontend compatibility
-        full_name = f"{member.first_name} {member.last_name}".strip()
+    etag = directory_etag(db, search, country, expertise, cursor, limit, facets)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
 
-        member_data = {
-            "id": str(member.id),
-            "first_name": member.first_name,
-            "last_name": member.last_name,
-            "full_name": full_name,  # Frontend expects this field
-        }
-
-        # Add optional fields based on visibility settings
-        # Use both old and new field names for frontend compatibility
-        if visible_fields.get("organization", True):
-            member_data["organization_name"] = member.organization_name
-            member_data["organization"] = member.organization_name  # Frontend expects this
-        if visible_fields.get("position", True):
-            member_data["position"] = member.position
-        if visible_fields.get("country", True):
-            member_data["country"] = member.country
-        if visible_fields.get("city", True):
-            member_data["city"] = member.city
-        if visible_fields.get("bio", True):
-            member_data["bio"] = member.bio
-        if visible_fields.get("research_areas", True):
-            member_data["research_areas"] = array_to_string(member.research_areas)
-        if visible_fields.get("contact_email", False):
-            member_data["contact_email"] = member.contact_email
-
-        directory_data.append(member_data)
+    query = directory_query(search=search, country=country, expertise=expertise)
+    try:
+        members, next_cursor = directory_page(db, query, cursor, limit)
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
 
-    return {
+    result = {
         "success": True,
-        "data": directory_data,
-        "total": len(directory_data)
+        "data": members,
+        "total": directory_count(db, query),
+        "next_cursor": next_cursor,
     }
+    if facets:
+        result["facets"] = directory_facets(db, query, filtered=bool(search or country or expertise))
+    return result
 
 
 @router.put("/me")
@@ -0,0 +1,278 @@
+"""
+Email Campaigns Router - Admin API for segmented bulk email
+
+Sending a campaign queues a background job; cancel, resume and the
+per-recipient send log are served by /api/admin/jobs/{job_id}.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, EmailStr, Field
+from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+import logging
+
+from app.database import get_db
+from app.models.conference import AttendeeProfile
+from app.models.email_campaign import EmailCampaign
+from app.dependencies.permissions import get_current_admin
+from app.services.campaigns import (
+    CampaignAlreadySent,
+    campaign_progress,
+    preview_segment,
+    render_campaign,
+    start_campaign,
+)
+from app.services.email_service import email_service
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+# ============================================================================
+# Pydantic Models
+# ============================================================================
+
+class CampaignSegment(BaseModel):
+    """Recipient filters; see app.services.campaigns.segment_query."""
+    audience: str = "all"
+    preference: str = "conference_announcements"
+    tags: Optional[List[str]] = None
+    roles: Optional[List[str]] = None
+    countries: Optional[List[str]] = None
+    conference_id: Optional[UUID] = None
+    verified_only: bool = False
+
+
+class CampaignCreate(BaseModel):
+    """A new campaign (saved as a draft)."""
+    name: str = Field(..., min_length=1, max_length=255)
+    subject: str = Field(..., min_length=1, max_length=500)
+    html_template: str = Field(..., min_length=1)
+    text_template: Optional[str] = None
+    preheader: Optional[str] = Field(None, max_length=255)
+    segment: CampaignSegment = Field(default_factory=CampaignSegment)
+    default_data: Optional[Dict[str, str]] = None
+
+
+class CampaignUpdate(BaseModel):
+    """Changes to a draft campaign."""
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    subject: Optional[str] = Field(None, min_length=1, max_length=500)
+    html_template: Optional[str] = Field(None, min_length=1)
+    text_template: Optional[str] = None
+    preheader: Optional[str] = Field(None, max_length=255)
+    segment: Optional[CampaignSegment] = None
+    default_data: Optional[Dict[str, str]] = None
+
+
+class CampaignTestRequest(BaseModel):
+    """Send one rendered copy of a campaign."""
+    to_email: EmailStr
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+
+class CampaignPreviewRequest(BaseModel):
+    """Sample recipient to render a campaign for."""
+    email: str = "recipient@example.org"
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _segment_dict(segment: CampaignSegment) -> Dict[str, Any]:
+    return segment.model_dump(mode="json", exclude_none=True)
+
+
+def _serialize_campaign(campaign: EmailCampaign, include_content: bool = False) -> dict:
+    data = {
+        "id": str(campaign.id),
+        "name": campaign.name,
+        "subject": campaign.subject,
+        "status": campaign.status,
+        "segment": campaign.segment,
+        "created_by": campaign.created_by,
+        "created_at": campaign.created_at.isoformat() if campaign.created_at else None,
+        "sent_at": campaign.sent_at.isoformat() if campaign.sent_at else None,
+        "progress": campaign_progress(campaign.job),
+    }
+    if include_content:
+        data.update({
+            "html_template": campaign.html_template,
+            "text_template": campaign.text_template,
+            "preheader": campaign.preheader,
+            "default_data": campaign.default_data,
+        })
+    return data
+
+
+def _get_campaign_or_404(db: Session, campaign_id: UUID) -> EmailCampaign:
+    campaign = db.query(EmailCampaign).options(
+        joinedload(EmailCampaign.job)
+    ).filter(EmailCampaign.id == campaign_id).first()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return campaign
+
+
+def _preview_or_400(db: Session, segment: Dict[str, Any], sample_size: int) -> Dict[str, Any]:
+    try:
+        return preview_segment(db, segment, sample_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+@router.get("")
+async def list_campaigns(
+    limit: int = Query(50, ge=1, le=200),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List campaigns, newest first, with send progress."""
+    campaigns = db.query(EmailCampaign).options(
+        joinedload(EmailCampaign.job)
+    ).order_by(EmailCampaign.created_at.desc()).limit(limit).all()
+    return {"campaigns": [_serialize_campaign(campaign) for campaign in campaigns]}
+
+
+@router.post("/segment-preview")
+async def preview_campaign_segment(
+    segment: CampaignSegment,
+    sample_size: int = Query(20, ge=0, le=100),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Count the recipients a segment would reach, with a sample."""
+    return _preview_or_400(db, _segment_dict(segment), sample_size)
+
+
+@router.post("")
+async def create_campaign(
+    request: CampaignCreate,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Save a draft campaign and report how many recipients its segment reaches."""
+    segment = _segment_dict(request.segment)
+    preview = _preview_or_400(db, segment, 0)
+
+    campaign = EmailCampaign(
+        name=request.name,
+        subject=request.subject,
+        html_template=request.html_template,
+        text_template=request.text_template,
+        preheader=request.preheader,
+        segment=segment,
+        default_data=request.default_data,
+        created_by=current_admin.user_email,
+    )
+    db.add(campaign)
+    db.commit()
+    db.refresh(campaign)
+    return {**_serialize_campaign(campaign, include_content=True), "recipient_count": preview["total"]}
+
+
+@router.get("/{campaign_id}")
+async def get_campaign(
+    campaign_id: UUID,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get a campaign with its content and send progress (cheap enough to poll)."""
+    return _serialize_campaign(_get_campaign_or_404(db, campaign_id), include_content=True)
+
+
+@router.patch("/{campaign_id}")
+async def update_campaign(
+    campaign_id: UUID,
+    request: CampaignUpdate,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Edit a draft campaign."""
+    campaign = _get_campaign_or_404(db, campaign_id)
+    if campaign.job_id:
+        raise HTTPException(status_code=400, detail="Campaign has already been sent")
+
+    changes = request.model_dump(exclude_unset=True)
+    if "segment" in changes:
+        changes["segment"] = _segment_dict(request.segment) if request.segment else {}
+        _preview_or_400(db, changes["segment"], 0)
+    for field, value in changes.items():
+        setattr(campaign, field, value)
+
+    db.commit()
+    db.refresh(campaign)
+    return _serialize_campaign(campaign, include_content=True)
+
+
+@router.post("/{campaign_id}/preview")
+async def preview_campaign(
+    campaign_id: UUID,
+    request: CampaignPreviewRequest = CampaignPreviewRequest(),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Render a campaign as a sample recipient would receive it.
+
+    Uses the same compiled templates as sending, so repeated previews of an
+    unchanged campaign only fill in the merge fields.
+    """
+    campaign = _get_campaign_or_404(db, campaign_id)
+    subject, html, text = render_campaign(campaign, request.first_name, request.last_name, request.email)
+    return {"subject": subject, "html": html, "text": text}
+
+
+@router.post("/{campaign_id}/test")
+async def send_campaign_test(
+    campaign_id: UUID,
+    request: CampaignTestRequest,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Send one copy of the campaign, rendered with the given name, to a single address."""
+    campaign = _get_campaign_or_404(db, campaign_id)
+    subject, html, text = render_campaign(campaign, request.first_name, request.last_name, request.to_email)
+
+    sent = await email_service.send_email(
+        to_email=request.to_email,
+        subject=f"[TEST] {subject}",
+        html_content=html,
+        text_content=text,
+    )
+    if not sent:
+        raise HTTPException(status_code=502, detail="Test email could not be sent")
+    return {"success": True, "to_email": request.to_email}
+
+
+@router.post("/{campaign_id}/send")
+async def send_campaign(
+    campaign_id: UUID,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Snapshot the segment and start sending.
+
+    Returns immediately; poll GET /{campaign_id} for progress.
+    """
+    campaign = _get_campaign_or_404(db, campaign_id)
+    try:
+        start_campaign(db, campaign, created_by=current_admin.user_email)
+    except CampaignAlreadySent as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info(f"[Campaigns] '{campaign.name}' started by {current_admin.user_email}")
+    db.refresh(campaign)
+    return _serialize_campaign(campaign)
@@ -3,7 +3,7 @@ Conferences CRUD router for ICSR events and registrations.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, desc
+from sqlalchemy import or_, func, desc, select
 from typing import Optional, List
 from datetime import datetime, timedelta, date
 import logging
@@ -164,24 +164,27 @@ async def get_conference_statistics(
     """
     today = date.today()
 
-    # Total conferences
-    total_conferences = db.query(func.count(Conference.id)).scalar() or 0
-
-    # Total attendees across all conferences
-    total_attendees = db.query(func.sum(Conference.total_attendees)).scalar() or 0
-
-    # Total unique countries
-    total_countries = db.query(func.sum(Conference.countries_represented)).scalar() or 0
-
-    # Average attendance
-    average_attendance = db.query(func.avg(Conference.total_attendees)).filter(Conference.total_attendees > 0).scalar() or 0.0
-
-    # Upcoming conferences
-    upcoming_conferences = db.query(func.count(Conference.id)).filter(Conference.start_date >= today).scalar() or 0
-
     # Recent conferences (last 2 years)
     two_years_ago = today.year - 2
-    recent_conferences = db.query(func.count(Conference.id)).filter(Conference.year >= two_years_ago).scalar() or 0
+
+    # All figures in one pass over conferences
+    stats = db.query(
+        func.count(Conference.id).label("total_conferences"),
+        # Total attendees across all conferences
+        func.sum(Conference.total_attendees).label("total_attendees"),
+        # Total unique countries
+        func.sum(Conference.countries_represented).label("total_countries"),
+        func.avg(Conference.total_attendees).filter(Conference.total_attendees > 0).label("average_attendance"),
+        func.count(Conference.id).filter(Conference.start_date >= today).label("upcoming_conferences"),
+        func.count(Conference.id).filter(Conference.year >= two_years_ago).label("recent_conferences"),
+    ).one()
+
+    total_conferences = stats.total_conferences or 0
+    total_attendees = stats.total_attendees or 0
+    total_countries = stats.total_countries or 0
+    average_attendance = stats.average_attendance or 0.0
+    upcoming_conferences = stats.upcoming_conferences or 0
+    recent_conferences = stats.recent_conferences or 0
 
     return ConferenceStatistics(
         total_conferences=total_conferences,
@@ -674,22 +677,21 @@ async def assign_reviewer(
     if abstract.status == "submitted":
         abstract.status = "under_review"
 
-    db.commit()
-    db.refresh(assignment)
-
-    # Send email notification to reviewer
+    # Queue the reviewer notification; it is delivered after the commit
     try:
-        await email_service.send_review_assignment_email(
+        await email_service.queued(db).send_review_assignment_email(
             reviewer_email=reviewer.user_email,
             abstract_title=abstract.title,
             due_date=abstract.conference.end_date  # TODO: Add review_deadline field to Conference
         )
         assignment.notified_at = datetime.utcnow()
-        db.commit()
     except Exception as e:
-        logger.error(f"Failed to send review assignment email: {e}")
+        logger.error(f"Failed to queue review assignment email: {e}")
         # Don't fail the request if email fails
 
+    db.commit()
+    db.refresh(assignment)
+
     logger.info(f"Reviewer assigned: {reviewer.user_email} to abstract {abstract.title}")
 
     return assignment
@@ -864,17 +866,17 @@ async def submit_review(
     if completed_reviews >= total_reviewers:
         abstract.status = "reviewed"
 
-    db.commit()
-    db.refresh(review)
-
-    # Send confirmation email to reviewer
+    # Queue confirmation email to reviewer
     try:
-        await email_service.send_review_confirmation_email(
+        await email_service.queued(db).send_review_confirmation_email(
             reviewer_email=current_user.user_email,
             abstract_title=abstract.title
         )
     except Exception as e:
-        logger.error(f"Failed to send review confirmation email: {e}")
+        logger.error(f"Failed to queue review confirmation email: {e}")
+
+    db.commit()
+    db.refresh(review)
 
     logger.info(f"Review submitted by {current_user.user_email} for abstract {abstract.title}")
 
@@ -1045,18 +1047,16 @@ async def make_decision(
     # Update abstract status
     abstract.status = decision_data.decision
 
-    db.commit()
-    db.refresh(decision)
-
-    # Send notification email to submitter
+    # Queue notification email to submitter; it is delivered after the commit
     try:
         submitter = db.query(AttendeeProfile).filter(
             AttendeeProfile.contact_id == abstract.submitter_id
         ).first()
 
         if submitter:
+            outbox = email_service.queued(db)
             if decision_data.decision == "accepted":
-                await email_service.send_acceptance_email(
+                await outbox.send_acceptance_email(
                     submitter_email=submitter.user_email,
                     abstract_title=abstract.title,
                     presentation_type=abstract.presentation_type or "Presentation",
@@ -1068,16 +1068,18 @@ async def make_decision(
                     f"{review.comments}" for review in reviews if review.comments
                 ][:3])  # Limit to first 3 review comments
 
-                await email_service.send_rejection_email(
+                await outbox.send_rejection_email(
                     submitter_email=submitter.user_email,
                     abstract_title=abstract.title,
                     feedback_summary=feedback_summary
                 )
 
         decision.notified_at = datetime.utcnow()
-        db.commit()
     except Exception as e:
-        logger.error(f"Failed to send decision notification email: {e}")
+        logger.error(f"Failed to queue decision notification email: {e}")
+
+    db.commit()
+    db.refresh(decision)
 
     logger.info(f"Decision made on abstract {abstract.title}: {decision_data.decision}")
 
@@ -1095,25 +1097,34 @@ async def get_abstract_statistics(
 
     Requires admin privileges.
     """
-    query = db.query(ConferenceAbstract)
+    statuses = ["submitted", "under_review", "reviewed", "accepted", "rejected", "withdrawn"]
+    has_review = select(AbstractReview.id).where(AbstractReview.abstract_id == ConferenceAbstract.id).exists()
+
+    # Average review score (for the same abstracts)
+    review_scores = select(func.avg(AbstractReview.weighted_score)).join(
+        ConferenceAbstract, ConferenceAbstract.id == AbstractReview.abstract_id
+    )
+    if conference_id:
+        review_scores = review_scores.where(ConferenceAbstract.conference_id == conference_id)
+
+    # Counts by status and review coverage in one pass over the abstracts
+    query = db.query(
+        func.count(ConferenceAbstract.id).label("total_abstracts"),
+        *[
+            func.count(ConferenceAbstract.id).filter(ConferenceAbstract.status == status).label(status)
+            for status in statuses
+        ],
+        func.count(ConferenceAbstract.id).filter(has_review).label("abstracts_with_reviews"),
+        review_scores.scalar_subquery().label("average_review_score"),
+    )
     if conference_id:
         query = query.filter(ConferenceAbstract.conference_id == conference_id)
+    stats = query.one()
 
-    total_abstracts = query.count()
-
-    # Count by status
-    status_counts = {}
-    for status in ["submitted", "under_review", "reviewed", "accepted", "rejected", "withdrawn"]:
-        count = query.filter(ConferenceAbstract.status == status).count()
-        status_counts[status] = count
-
-    # Review completion rate
-    abstracts_with_reviews = db.query(ConferenceAbstract.id).join(
-        AbstractReview
-    ).distinct().count()
-
-    # Average review score
-    avg_score = db.query(func.avg(AbstractReview.weighted_score)).scalar() or 0.0
+    total_abstracts = stats.total_abstracts
+    status_counts = {status: getattr(stats, status) for status in statuses}
+    abstracts_with_reviews = stats.abstracts_with_reviews
+    avg_score = stats.average_review_score or 0.0
 
     return {
         "total_abstracts": total_abstracts,
@@ -1,11 +1,14 @@
 """
 Contacts and Organizations CRUD router.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy import or_, func, select, update, delete, text, not_
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, List
+from pathlib import Path
 import logging
+import uuid
 from uuid import UUID
 
 from app.database import get_db
@@ -18,10 +21,23 @@ from app.schemas.contact import (
     ContactUpdate,
     ContactResponse,
     ContactListResponse,
+    ContactFacetsResponse,
     OrganizationCreate,
     OrganizationUpdate,
     OrganizationResponse,
+    ContactBulkOperation,
+    ContactBulkResult,
 )
+from app.config import settings
+from app.models.background_job import BackgroundJob
+from app.services.contact_import_service import ContactImportService, SUPPORTED_EXTENSIONS, import_upload_dir
+from app.services.contact_filters import apply_contact_filters
+from app.services.contact_lookup import find_contact_by_email
+from app.services.contact_timeline import InvalidCursor, contact_timeline, decode_cursor
+from app.services.dashboard_snapshots import get_dashboard_snapshot
+from app.services.facets import DEFAULT_FACET_LIMIT, contact_facets
+from app.services.job_runner import job_runner
+from app.utils.normalization import EMAIL_STATUS_VALID, normalize_email
 
 logger = logging.getLogger(__name__)
 
@@ -48,58 +64,64 @@ async def get_contacts(
     Get all contacts with pagination, filtering, and search.
     Requires authentication.
     """
-    # Build query
-    query = db.query(Contact)
+    query = _contact_list_query(db, search, role, country, organization_id, tags)
+    return _contact_page(query, page, page_size)
 
-    # Apply search filter
-    if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Contact.first_name.ilike(search_term),
-                Contact.last_name.ilike(search_term),
-                Contact.full_name.ilike(search_term),
-                Contact.email.ilike(search_term),
-            )
-        )
 
-    # Apply filters
-    if role:
-        query = query.filter(Contact.role.ilike(f"%{role}%"))
+@router.get("/facets", response_model=ContactFacetsResponse)
+async def get_contacts_with_facets(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    search: Optional[str] = Query(None, description="Search in name, email, organization"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    country: Optional[str] = Query(None, description="Filter by country"),
+    organization_id: Optional[UUID] = Query(None, description="Filter by organization"),
+    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
+    facet_limit: int = Query(DEFAULT_FACET_LIMIT, ge=1, le=200, description="Values returned per facet"),
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin),
+):
+    """
+    Same as GET /api/contacts/, plus counts per country, role, organization
+    and tag over the filtered contacts for rendering filter sidebars.
+    """
+    query = _contact_list_query(db, search, role, country, organization_id, tags)
+    contact_page = _contact_page(query, page, page_size)
+    filtered = any(value for value in (search, role, country, organization_id, tags))
+
+    return ContactFacetsResponse(
+        **contact_page.model_dump(exclude={"contacts"}),
+        contacts=contact_page.contacts,
+        facets=contact_facets(db, query, filtered=filtered, limit=facet_limit),
+    )
 
-    if country:
-        query = query.filter(Contact.country == country)
 
-    if organization_id:
-        query = query.filter(Contact.organization_id == organization_id)
+def _contact_list_query(db: Session, search, role, country, organization_id, tags):
+    # Contacts whose stored email isn't a valid address can't be serialized,
+    # so they are excluded in SQL rather than dropped from the page.
+    return apply_contact_filters(
+        db.query(Contact).filter(Contact.email_status == EMAIL_STATUS_VALID),
+        search=search,
+        role=role,
+        country=country,
+        organization_id=organization_id,
+        tags=tags,
+    )
 
-    # Apply tags filter
-    if tags:
-        tag_list = [tag.strip() for tag in tags.split(",")]
-        query = query.filter(Contact.tags.overlap(tag_list))
 
-    # Get total count (before filtering invalid emails)
+def _contact_page(query, page: int, page_size: int) -> ContactListResponse:
+    # Get total count
     total = query.count()
 
     # Apply pagination
     offset = (page - 1) * page_size
-    contacts_raw = query.order_by(Contact.last_name, Contact.first_name).offset(offset).limit(page_size).all()
-
-    # Filter out contacts with invalid emails to prevent Pydantic validation errors
-    # This is a workaround for legacy data with bad email formats
-    valid_contacts = []
-    for contact in contacts_raw:
-        # Check if email is valid (basic check: must contain @ sign)
-        if contact.email and '@' in contact.email:
-            valid_contacts.append(contact)
-        else:
-            logger.warning(f"Skipping contact {contact.id} with invalid email: {contact.email}")
+    contacts = query.order_by(Contact.last_name, Contact.first_name).offset(offset).limit(page_size).all()
 
     # Calculate total pages
     total_pages = (total + page_size - 1) // page_size
 
     return ContactListResponse(
-        contacts=valid_contacts,
+        contacts=contacts,
         total=total,
         page=page,
         page_size=page_size,
@@ -107,6 +129,28 @@ async def get_contacts(
     )
 
 
+# ============================================
+# STATS ENDPOINTS
+# ============================================
+
+# Declared before /{contact_id} so the literal path isn't parsed as an ID
+@router.get("/stats")
+async def get_contact_stats(
+    db: Session = Depends(get_db),
+    current_admin = Depends(get_current_admin),
+):
+    """
+    Get aggregate statistics about contacts in the database.
+    Useful for dashboards and enrichment tracking.
+    Served from the latest dashboard snapshot (see as_of).
+    """
+    snapshot = get_dashboard_snapshot(db)
+    return {
+        **snapshot.details["contact_enrichment"],
+        "as_of": snapshot.measured_at.isoformat(),
+    }
+
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: UUID,
@@ -138,8 +182,8 @@ async def create_contact(
     Create a new contact.
     Requires authentication.
     """
-    # Check if email already exists
-    existing_contact = db.query(Contact).filter(Contact.email == contact_data.email).first()
+    # Check if email already exists (as a primary or alternate address)
+    existing_contact = find_contact_by_email(db, contact_data.email)
 
     if existing_contact:
         raise HTTPException(
@@ -190,8 +234,8 @@ async def update_contact(
     update_data = contact_data.model_dump(exclude_unset=True)
 
     # If email is being updated, check for duplicates
-    if "email" in update_data and update_data["email"] != contact.email:
-        existing_contact = db.query(Contact).filter(Contact.email == update_data["email"]).first()
+    if "email" in update_data and normalize_email(update_data["email"]) != contact.email_normalized:
+        existing_contact = find_contact_by_email(db, update_data["email"], exclude_contact_id=contact.id)
         if existing_contact:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -243,6 +287,44 @@ async def delete_contact(
     logger.info(f"Contact deleted: {contact.email} (ID: {contact_id})")
 
 
+@router.get("/{contact_id}/timeline")
+async def get_contact_timeline(
+    contact_id: UUID,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """
+    A contact's activity, newest first: registrations, abstracts, funding
+    prospects, sponsorships, emails they sent or received, and audit log
+    entries. Pass next_cursor back as cursor for the next page.
+    """
+    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+
+    if not contact:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Contact with ID {contact_id} not found",
+        )
+
+    try:
+        before = decode_cursor(cursor) if cursor else None
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    items, next_cursor = contact_timeline(db, contact, before=before, limit=limit)
+
+    return {
+        "contact_id": str(contact.id),
+        "items": [
+            {**item, "occurred_at": item["occurred_at"].isoformat() if item["occurred_at"] else None}
+            for item in items
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
 # ============================================
 # ORGANIZATIONS ENDPOINTS
 # ============================================
@@ -409,48 +491,250 @@ async def delete_organization(
 
 
 # ============================================
-# STATS ENDPOINTS
+# BULK IMPORT ENDPOINTS
 # ============================================
 
-@router.get("/stats")
-async def get_contact_stats(
+@router.post("/import", status_code=status.HTTP_202_ACCEPTED)
+async def import_contacts(
+    file: UploadFile = File(...),
+    tags: Optional[str] = Form(None, description="Comma-separated tags added to every imported contact"),
+    update_existing: bool = Form(True, description="Fill in fields on contacts that already exist"),
     db: Session = Depends(get_db),
-    current_admin = Depends(get_current_admin),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
 ):
     """
-    Get aggregate statistics about contacts in the database.
-    Useful for dashboards and enrichment tracking.
+    Bulk import contacts from a CSV or XLSX file.
+
+    The upload is streamed to disk and imported by a background job:
+    rows are COPY'd into a staging table, then de-duplicated and merged
+    into contacts/organizations with set-based SQL. Poll
+    GET /api/contacts/import/{job_id} for the summary and per-row report.
     """
-    # Total contacts
-    total_contacts = db.query(func.count(Contact.id)).scalar()
+    extension = Path(file.filename or "").suffix.lower()
+    if extension not in SUPPORTED_EXTENSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file type. Upload one of: {', '.join(SUPPORTED_EXTENSIONS)}",
+        )
 
-    # Contacts with email
-    contacts_with_email = db.query(func.count(Contact.id)).filter(Contact.email != None).scalar()
+    path = import_upload_dir() / f"{uuid.uuid4()}{extension}"
+    max_bytes = settings.MAX_IMPORT_SIZE_MB * 1024 * 1024
+    written = 0
+    with open(path, "wb") as out:
+        while chunk := await file.read(1024 * 1024):
+            written += len(chunk)
+            if written > max_bytes:
+                out.close()
+                path.unlink(missing_ok=True)
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File exceeds {settings.MAX_IMPORT_SIZE_MB} MB",
+                )
+            out.write(chunk)
+
+    job = job_runner.enqueue(
+        db,
+        "contact_import",
+        [str(path)],
+        params={
+            "filename": file.filename,
+            "tags": [tag.strip() for tag in (tags or "").split(",") if tag.strip()],
+            "update_existing": update_existing,
+        },
+        created_by=current_admin.user_email,
+        chunk_size=1,
+    )
 
-    # Contacts with phone
-    contacts_with_phone = db.query(func.count(Contact.id)).filter(Contact.phone != None).scalar()
+    logger.info(f"Contact import queued: {file.filename} ({written} bytes, job {job.id})")
 
-    # Contacts with title
-    contacts_with_title = db.query(func.count(Contact.id)).filter(Contact.title != None).scalar()
+    return {
+        "job_id": str(job.id),
+        "status": job.status,
+        "filename": file.filename,
+        "status_url": f"/api/contacts/import/{job.id}",
+    }
 
-    # Contacts with both phone and title
-    contacts_with_phone_and_title = db.query(func.count(Contact.id)).filter(
-        Contact.phone != None,
-        Contact.title != None
-    ).scalar()
 
-    # Contacts needing enrichment (have email but missing phone or title)
-    contacts_needing_enrichment = db.query(func.count(Contact.id)).filter(
-        Contact.email != None,
-        or_(Contact.phone == None, Contact.title == None)
-    ).scalar()
+@router.get("/import/{job_id}")
+async def get_contact_import(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """Import status and per-action row counts (available once the job has run)."""
+    job = db.query(BackgroundJob).filter(
+        BackgroundJob.id == job_id,
+        BackgroundJob.job_type == "contact_import",
+    ).first()
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Import not found")
 
     return {
-        "total_contacts": total_contacts,
-        "contacts_with_email": contacts_with_email,
-        "contacts_with_phone": contacts_with_phone,
-        "contacts_with_title": contacts_with_title,
-        "contacts_with_phone_and_title": contacts_with_phone_and_title,
-        "contacts_needing_enrichment": contacts_needing_enrichment,
-        "enrichment_completion_rate": round((contacts_with_phone_and_title / contacts_with_email * 100), 1) if contacts_with_email > 0 else 0
+        "job_id": str(job.id),
+        "status": job.status,
+        "filename": (job.params or {}).get("filename"),
+        "summary": job.summary,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
     }
+
+
+@router.get("/import/{job_id}/rows")
+async def get_contact_import_rows(
+    job_id: UUID,
+    action: Optional[List[str]] = Query(None, description="created, updated, unchanged, duplicate, error"),
+    after_row: int = Query(0, ge=0, description="Return rows after this spreadsheet row"),
+    limit: int = Query(500, ge=1, le=5000),
+    db: Session = Depends(get_db),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """Per-row import report, e.g. ?action=error&action=duplicate for rows that were not imported."""
+    rows = ContactImportService(db).get_rows(job_id, actions=action, after_row=after_row, limit=limit)
+    return {
+        "rows": [
+            {
+                "row_number": row.row_number,
+                "email": row.email,
+                "action": row.action,
+                "error": row.error,
+                "contact_id": str(row.contact_id) if row.contact_id else None,
+            }
+            for row in rows
+        ],
+        "next_after_row": rows[-1].row_number if len(rows) == limit else None,
+    }
+
+
+# ============================================
+# BULK OPERATIONS
+# ============================================
+
+# New tags not already on the row, in request order (array_append per tag
+# would need a CASE per tag and re-evaluate the array each time)
+ADD_TAGS_SQL = text(
+    "COALESCE(contacts.tags, ARRAY[]::text[]) || ARRAY("
+    "SELECT new_tag FROM unnest(CAST(:add_tags AS text[])) WITH ORDINALITY AS t(new_tag, position) "
+    "WHERE NOT (new_tag = ANY(COALESCE(contacts.tags, ARRAY[]::text[]))) ORDER BY position)"
+)
+
+
+def _unique(values: Optional[List[str]]) -> List[str]:
+    return list(dict.fromkeys(value.strip() for value in values or [] if value and value.strip()))
+
+
+@router.post("/bulk", response_model=ContactBulkResult)
+async def bulk_contact_operation(
+    operation: ContactBulkOperation,
+    db: Session = Depends(get_db),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """
+    Tag, untag, reassign, update or delete many contacts at once.
+
+    The selection is explicit contact_ids and/or the GET /api/contacts/
+    filters. Each operation is a single UPDATE/DELETE over that selection
+    and only touches rows it would actually change; all of them run in
+    one transaction.
+    """
+    filters = operation.filters.model_dump(exclude_none=True) if operation.filters else {}
+    if not operation.contact_ids and not filters:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide contact_ids or at least one filter",
+        )
+
+    add_tags = _unique(operation.add_tags)
+    remove_tags = _unique(operation.remove_tags)
+    reassign = "organization_id" in operation.model_fields_set
+    fields = operation.fields.model_dump(exclude_unset=True) if operation.fields else {}
+
+    if operation.delete and (add_tags or remove_tags or reassign or fields):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="delete cannot be combined with other operations",
+        )
+    if not (operation.delete or add_tags or remove_tags or reassign or fields):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No operation requested",
+        )
+    if set(add_tags) & set(remove_tags):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The same tag cannot be added and removed",
+        )
+
+    if reassign and operation.organization_id:
+        org = db.query(Organization).filter(Organization.id == operation.organization_id).first()
+        if not org:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Organization with ID {operation.organization_id} not found",
+            )
+
+    selection = apply_contact_filters(select(Contact.id), **filters)
+    if operation.contact_ids:
+        selection = selection.where(Contact.id.in_(operation.contact_ids))
+    in_selection = Contact.id.in_(selection.scalar_subquery())
+
+    result = ContactBulkResult(
+        matched=db.execute(select(func.count()).select_from(selection.subquery())).scalar(),
+    )
+
+    def run(statement) -> int:
+        return db.execute(statement, execution_options={"synchronize_session": False}).rowcount
+
+    if operation.delete:
+        try:
+            result.deleted = run(delete(Contact).where(in_selection))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Some selected contacts are linked to attendee profiles and cannot be deleted",
+            )
+        logger.info(f"Bulk delete by {current_admin.user_email}: {result.deleted} contacts")
+        return result
+
+    if add_tags:
+        result.tags_added = run(
+            update(Contact)
+            .where(in_selection, not_(func.coalesce(Contact.tags, []).contains(add_tags)))
+            .values(tags=ADD_TAGS_SQL.bindparams(add_tags=add_tags))
+        )
+
+    if remove_tags:
+        tags_expr = Contact.tags
+        for tag in remove_tags:
+            tags_expr = func.array_remove(tags_expr, tag)
+        result.tags_removed = run(
+            update(Contact)
+            .where(in_selection, Contact.tags.overlap(remove_tags))
+            .values(tags=tags_expr)
+        )
+
+    if reassign:
+        result.reassigned = run(
+            update(Contact)
+            .where(in_selection, Contact.organization_id.is_distinct_from(operation.organization_id))
+            .values(organization_id=operation.organization_id)
+        )
+
+    if fields:
+        result.fields_updated = run(
+            update(Contact)
+            .where(in_selection, or_(*[getattr(Contact, field).is_distinct_from(value) for field, value in fields.items()]))
+            .values(**fields)
+        )
+
+    db.commit()
+
+    logger.info(
+        f"Bulk update by {current_admin.user_email}: matched {result.matched}, "
+        f"tags +{result.tags_added}/-{result.tags_removed}, reassigned {result.reassigned}, "
+        f"fields {result.fields_updated}"
+    )
+
+    return result
@@ -11,6 +11,7 @@ from typing import Dict, Any
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.services.email_processing_service import EmailProcessingService
+from app.services.job_runner import job_runner
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,7 @@ async def verify_sns_signature(message: Dict[str, Any]) -> bool:
 
 
 @router.post("/inbound-webhook")
-async def handle_inbound_webhook(request: Request):
+async def handle_inbound_webhook(request: Request, db: Session = Depends(get_db)):
     """
     Handle SNS webhook for inbound emails from AWS SES.
     This endpoint receives notifications when emails are sent to admin@shellfish-society.org
@@ -145,15 +146,19 @@ async def handle_inbound_webhook(request: Request):
             logger.info(f"  - To: {mail.get('destination')}")
             logger.info(f"  - Subject: {mail.get('commonHeaders', {}).get('subject', '(No Subject)')}")
 
-            # Process email asynchronously
-            # Note: In production, this should be queued for background processing
-            # For now, we'll process it synchronously
-            logger.info("[Inbound Webhook] Starting email processing")
+            # Queue processing on the job runner and return to SNS immediately
+            job = job_runner.enqueue(
+                db,
+                "inbound_email_process",
+                [s3_key],
+                params={"message_ids": {s3_key: message_id}},
+                created_by="ses_inbound",
+                chunk_size=1,
+            )
+            logger.info(f"[Inbound Webhook] Queued email processing job {job.id}")
 
-            # Return success immediately to SNS, process email in background would be ideal
-            # For simplicity, we'll process synchronously for now
             return JSONResponse(
-                content={"message": "Email received and queued for processing"},
+                content={"message": "Email received and queued for processing", "job_id": str(job.id)},
                 status_code=200
             )
 
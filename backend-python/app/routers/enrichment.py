@@ -10,6 +10,7 @@ import logging
 from app.database import get_db
 from app.models.conference import AttendeeProfile
 from app.routers.auth import get_current_user
+from app.services.apollo_cache import ApolloCache
 from app.services.apollo_service import ApolloService, ApolloAPIError
 
 logger = logging.getLogger(__name__)
@@ -25,17 +26,20 @@ class EnrichPersonRequest(BaseModel):
     last_name: Optional[str] = None
     organization_name: Optional[str] = None
     domain: Optional[str] = None
+    force_refresh: bool = Field(False, description="Bypass the enrichment cache")
 
 
 class EnrichOrganizationRequest(BaseModel):
     """Request schema for organization enrichment."""
     domain: Optional[str] = None
     organization_name: Optional[str] = None
+    force_refresh: bool = Field(False, description="Bypass the enrichment cache")
 
 
 class BulkEnrichRequest(BaseModel):
     """Request schema for bulk person enrichment."""
     contacts: List[EnrichPersonRequest] = Field(..., max_items=50, description="Max 50 contacts per request")
+    force_refresh: bool = Field(False, description="Bypass the enrichment cache")
 
 
 @router.post("/enrich-person")
@@ -58,13 +62,14 @@ async def enrich_person(
                 detail="At least one search parameter required (email, first_name, or organization_name)"
             )
 
-        apollo_service = ApolloService()
+        apollo_service = ApolloService(cache=ApolloCache())
         enriched_data = await apollo_service.enrich_person(
             email=request.email,
             first_name=request.first_name,
             last_name=request.last_name,
             organization_name=request.organization_name,
             domain=request.domain,
+            force_refresh=request.force_refresh,
         )
 
         logger.info(f"Person enriched: {request.email or f'{request.first_name} {request.last_name}'}")
@@ -104,10 +109,11 @@ async def enrich_organization(
                 detail="Either domain or organization_name required"
             )
 
-        apollo_service = ApolloService()
+        apollo_service = ApolloService(cache=ApolloCache())
         enriched_data = await apollo_service.enrich_organization(
             domain=request.domain,
             organization_name=request.organization_name,
+            force_refresh=request.force_refresh,
         )
 
         logger.info(f"Organization enriched: {request.domain or request.organization_name}")
@@ -148,10 +154,13 @@ async def bulk_enrich_contacts(
             )
 
         # Convert Pydantic models to dicts
-        contacts_data = [contact.model_dump() for contact in request.contacts]
+        contacts_data = [contact.model_dump(exclude={'force_refresh'}) for contact in request.contacts]
 
-        apollo_service = ApolloService()
-        results = await apollo_service.bulk_enrich_people(contacts_data)
+        apollo_service = ApolloService(cache=ApolloCache())
+        results = await apollo_service.bulk_enrich_people(
+            contacts_data,
+            force_refresh=request.force_refresh or any(c.force_refresh for c in request.contacts),
+        )
 
         successful = sum(1 for r in results if r['enriched'].get('success'))
         failed = len(results) - successful
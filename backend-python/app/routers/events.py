@@ -404,12 +404,9 @@ async def signup_for_event(
     if event.capacity and event.current_signups >= event.capacity:
         event.status = "full"
 
-    db.commit()
-    db.refresh(signup)
-
-    # Send confirmation email
+    # Queue confirmation email; it is delivered after the commit
     try:
-        await email_service.send_event_signup_email(
+        await email_service.queued(db).send_event_signup_email(
             user_email=current_user.user_email,
             event_name=event.name,
             event_date=event.event_date,
@@ -418,7 +415,10 @@ async def signup_for_event(
             status=signup_status
         )
     except Exception as e:
-        logger.error(f"Failed to send event signup email: {e}")
+        logger.error(f"Failed to queue event signup email: {e}")
+
+    db.commit()
+    db.refresh(signup)
 
     logger.info(f"Event signup: {current_user.user_email} for {event.name} (status: {signup_status})")
 
@@ -759,11 +759,11 @@ async def _promote_waitlist_users(event: ConferenceEvent, db: Session):
             spots_available -= total_attendees
             promoted_count += 1
 
-            # Send promotion email
+            # Queue promotion email (committed by the caller with the promotion)
             try:
                 user = db.query(AttendeeProfile).filter(AttendeeProfile.id == signup.user_id).first()
                 if user:
-                    await email_service.send_event_waitlist_promotion_email(
+                    await email_service.queued(db).send_event_waitlist_promotion_email(
                         user_email=user.user_email,
                         event_name=event.name,
                         event_date=event.event_date,
@@ -771,7 +771,7 @@ async def _promote_waitlist_users(event: ConferenceEvent, db: Session):
                         total_fee=signup.total_fee
                     )
             except Exception as e:
-                logger.error(f"Failed to send waitlist promotion email: {e}")
+                logger.error(f"Failed to queue waitlist promotion email: {e}")
 
     if promoted_count > 0:
         logger.info(f"Promoted {promoted_count} users from waitlist for event {event.name}")
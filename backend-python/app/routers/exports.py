@@ -0,0 +1,221 @@
+"""
+Exports router - streaming CSV/XLSX/NDJSON downloads for admins.
+"""
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, func
+from sqlalchemy.orm import aliased
+from typing import Optional
+from uuid import UUID
+import logging
+
+from app.models.contact import Contact, Organization
+from app.models.conference import Conference, ConferenceRegistration, AttendeeProfile
+from app.models.funding import FundingProspect
+from app.dependencies.permissions import get_current_admin
+from app.services.contact_filters import apply_contact_filters
+from app.services.export_service import stream_export, export_media_type, export_filename
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+FORMAT_PATTERN = "^(csv|xlsx|ndjson)$"
+
+
+def _export_response(statement, name: str, export_format: str, current_admin: AttendeeProfile) -> StreamingResponse:
+    logger.info(f"[Export] {name} as {export_format} requested by {current_admin.user_email}")
+    return StreamingResponse(
+        stream_export(statement, export_format),
+        media_type=export_media_type(export_format),
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(name, export_format)}"'},
+    )
+
+
+# ============================================
+# CONTACTS
+# ============================================
+
+@router.get("/contacts")
+async def export_contacts(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv, xlsx or ndjson"),
+    search: Optional[str] = Query(None, description="Search in name, email"),
+    role: Optional[str] = Query(None, description="Filter by role"),
+    country: Optional[str] = Query(None, description="Filter by country"),
+    organization_id: Optional[UUID] = Query(None, description="Filter by organization"),
+    tags: Optional[str] = Query(None, description="Filter by tags (comma-separated)"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """Export contacts matching the same filters as GET /api/contacts/."""
+    statement = select(
+        Contact.id,
+        Contact.email,
+        Contact.first_name,
+        Contact.last_name,
+        Contact.full_name,
+        Organization.name.label("organization"),
+        Contact.title,
+        Contact.role,
+        Contact.phone,
+        Contact.country,
+        Contact.state_province,
+        Contact.city,
+        Contact.alternate_emails,
+        Contact.expertise,
+        Contact.interests,
+        Contact.tags,
+        Contact.notes,
+        Contact.created_at,
+        Contact.updated_at,
+    ).outerjoin(
+        Organization, Organization.id == Contact.organization_id
+    )
+
+    statement = apply_contact_filters(
+        statement,
+        search=search,
+        role=role,
+        country=country,
+        organization_id=organization_id,
+        tags=tags,
+    ).order_by(Contact.last_name, Contact.first_name, Contact.id)
+
+    return _export_response(statement, "contacts", format, current_admin)
+
+
+# ============================================
+# ORGANIZATIONS
+# ============================================
+
+@router.get("/organizations")
+async def export_organizations(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv, xlsx or ndjson"),
+    search: Optional[str] = Query(None, description="Search in organization name"),
+    type: Optional[str] = Query(None, description="Filter by organization type"),
+    country: Optional[str] = Query(None, description="Filter by country"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """Export organizations with their contact counts."""
+    contact_counts = select(
+        Contact.organization_id,
+        func.count().label("contact_count"),
+    ).where(
+        Contact.organization_id.isnot(None)
+    ).group_by(Contact.organization_id).subquery()
+
+    statement = select(
+        Organization.id,
+        Organization.name,
+        Organization.type,
+        Organization.website,
+        Organization.country,
+        func.coalesce(contact_counts.c.contact_count, 0).label("contact_count"),
+        Organization.notes,
+        Organization.created_at,
+        Organization.updated_at,
+    ).outerjoin(
+        contact_counts, contact_counts.c.organization_id == Organization.id
+    )
+
+    if search:
+        statement = statement.where(Organization.name.ilike(f"%{search}%"))
+    if type:
+        statement = statement.where(Organization.type == type)
+    if country:
+        statement = statement.where(Organization.country == country)
+
+    return _export_response(statement.order_by(Organization.name), "organizations", format, current_admin)
+
+
+# ============================================
+# CONFERENCE REGISTRATIONS
+# ============================================
+
+@router.get("/registrations")
+async def export_registrations(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv, xlsx or ndjson"),
+    conference_id: Optional[UUID] = Query(None, description="Filter by conference"),
+    payment_status: Optional[str] = Query(None, description="Filter by payment status"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """Export conference registrations with attendee contact details."""
+    statement = select(
+        ConferenceRegistration.id,
+        Conference.name.label("conference"),
+        Conference.year.label("conference_year"),
+        Contact.email,
+        Contact.first_name,
+        Contact.last_name,
+        Organization.name.label("organization"),
+        Contact.country,
+        ConferenceRegistration.registration_type,
+        ConferenceRegistration.registration_date,
+        ConferenceRegistration.payment_status,
+        ConferenceRegistration.amount_paid,
+        ConferenceRegistration.attendance_confirmed,
+        ConferenceRegistration.interested_in_abstract_submission,
+        ConferenceRegistration.notes,
+        ConferenceRegistration.created_at,
+    ).join(
+        Conference, Conference.id == ConferenceRegistration.conference_id
+    ).join(
+        Contact, Contact.id == ConferenceRegistration.contact_id
+    ).outerjoin(
+        Organization, Organization.id == Contact.organization_id
+    )
+
+    if conference_id:
+        statement = statement.where(ConferenceRegistration.conference_id == conference_id)
+    if payment_status:
+        statement = statement.where(ConferenceRegistration.payment_status == payment_status)
+
+    statement = statement.order_by(Conference.year.desc(), Contact.last_name, Contact.first_name, ConferenceRegistration.id)
+    return _export_response(statement, "registrations", format, current_admin)
+
+
+# ============================================
+# FUNDING PROSPECTS
+# ============================================
+
+@router.get("/funding-prospects")
+async def export_funding_prospects(
+    format: str = Query("csv", pattern=FORMAT_PATTERN, description="csv, xlsx or ndjson"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    priority: Optional[str] = Query(None, description="Filter by priority"),
+    prospect_type: Optional[str] = Query(None, description="Filter by prospect type"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+):
+    """Export funding prospects with organization and contact names."""
+    contact = aliased(Contact)
+    statement = select(
+        FundingProspect.id,
+        FundingProspect.prospect_type,
+        Organization.name.label("organization"),
+        contact.email.label("contact_email"),
+        contact.full_name.label("contact_name"),
+        FundingProspect.amount_target,
+        FundingProspect.amount_committed,
+        FundingProspect.amount_received,
+        FundingProspect.status,
+        FundingProspect.priority,
+        FundingProspect.deadline,
+        FundingProspect.proposal_submitted_date,
+        FundingProspect.decision_date,
+        FundingProspect.notes,
+        FundingProspect.created_at,
+        FundingProspect.updated_at,
+    ).outerjoin(
+        Organization, Organization.id == FundingProspect.organization_id
+    ).outerjoin(
+        contact, contact.id == FundingProspect.contact_id
+    )
+
+    if status:
+        statement = statement.where(FundingProspect.status == status)
+    if priority:
+        statement = statement.where(FundingProspect.priority == priority)
+    if prospect_type:
+        statement = statement.where(FundingProspect.prospect_type == prospect_type)
+
+    statement = statement.order_by(FundingProspect.deadline.asc().nulls_last(), FundingProspect.id)
+    return _export_response(statement, "funding-prospects", format, current_admin)
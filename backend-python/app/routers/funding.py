@@ -21,6 +21,7 @@ from app.schemas.funding import (
     FundingProspectListResponse,
     FundingStatistics,
 )
+from app.utils.aggregates import counts_by
 
 logger = logging.getLogger(__name__)
 
@@ -114,45 +115,34 @@ async def get_funding_statistics(
     """
     today = date.today()
 
-    # Total prospects
-    total_prospects = db.query(func.count(FundingProspect.id)).scalar() or 0
-
-    # Prospects by status
-    status_counts = db.query(
-        FundingProspect.status,
-        func.count(FundingProspect.id)
-    ).group_by(FundingProspect.status).all()
-    prospects_by_status = {status: count for status, count in status_counts if status}
-
-    # Prospects by priority
-    priority_counts = db.query(
-        FundingProspect.priority,
-        func.count(FundingProspect.id)
-    ).group_by(FundingProspect.priority).all()
-    prospects_by_priority = {priority: count for priority, count in priority_counts if priority}
-
-    # Total amounts
-    total_target = db.query(func.sum(FundingProspect.amount_target)).scalar() or Decimal('0')
-    total_committed = db.query(func.sum(FundingProspect.amount_committed)).scalar() or Decimal('0')
-    total_received = db.query(func.sum(FundingProspect.amount_received)).scalar() or Decimal('0')
-
-    # Success rate (prospects with received funding / total prospects)
-    prospects_with_funding = db.query(func.count(FundingProspect.id)).filter(
-        FundingProspect.amount_received > 0
-    ).scalar() or 0
-    success_rate = (prospects_with_funding / total_prospects * 100) if total_prospects > 0 else 0.0
-
-    # Average prospect value
-    average_prospect_value = db.query(func.avg(FundingProspect.amount_target)).filter(
-        FundingProspect.amount_target > 0
-    ).scalar() or Decimal('0')
-
-    # Upcoming deadlines (next 30 days)
     thirty_days = today + timedelta(days=30)
-    upcoming_deadlines = db.query(func.count(FundingProspect.id)).filter(
-        FundingProspect.deadline.isnot(None),
-        FundingProspect.deadline.between(today, thirty_days)
-    ).scalar() or 0
+
+    # All figures in one pass over funding_prospects
+    stats = db.query(
+        func.count(FundingProspect.id).label("total_prospects"),
+        counts_by(FundingProspect.status).label("prospects_by_status"),
+        counts_by(FundingProspect.priority).label("prospects_by_priority"),
+        func.sum(FundingProspect.amount_target).label("total_target"),
+        func.sum(FundingProspect.amount_committed).label("total_committed"),
+        func.sum(FundingProspect.amount_received).label("total_received"),
+        # Prospects with received funding (for the success rate)
+        func.count(FundingProspect.id).filter(FundingProspect.amount_received > 0).label("prospects_with_funding"),
+        func.avg(FundingProspect.amount_target).filter(FundingProspect.amount_target > 0).label("average_prospect_value"),
+        # Upcoming deadlines (next 30 days)
+        func.count(FundingProspect.id).filter(
+            FundingProspect.deadline.between(today, thirty_days)
+        ).label("upcoming_deadlines"),
+    ).one()
+
+    total_prospects = stats.total_prospects or 0
+    prospects_by_status = stats.prospects_by_status
+    prospects_by_priority = stats.prospects_by_priority
+    total_target = stats.total_target or Decimal('0')
+    total_committed = stats.total_committed or Decimal('0')
+    total_received = stats.total_received or Decimal('0')
+    success_rate = (stats.prospects_with_funding / total_prospects * 100) if total_prospects > 0 else 0.0
+    average_prospect_value = stats.average_prospect_value or Decimal('0')
+    upcoming_deadlines = stats.upcoming_deadlines or 0
 
     return FundingStatistics(
         total_prospects=total_prospects,
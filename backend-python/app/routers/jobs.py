@@ -0,0 +1,149 @@
+"""
+Background Jobs Router - Admin API for monitoring and controlling bulk jobs
+"""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+import logging
+
+from app.database import get_db
+from app.models.background_job import BackgroundJob, BackgroundJobItem
+from app.models.conference import AttendeeProfile
+from app.dependencies.permissions import get_current_admin
+from app.services.job_runner import job_runner, ACTIVE_STATUSES
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _serialize_job(job: BackgroundJob) -> dict:
+    return {
+        "id": str(job.id),
+        "job_type": job.job_type,
+        "status": job.status,
+        "params": job.params,
+        "total_items": job.total_items,
+        "processed_items": job.processed_items,
+        "succeeded_items": job.succeeded_items,
+        "failed_items": job.failed_items,
+        "progress_percent": job.progress_percent,
+        "summary": job.summary,
+        "cancel_requested": job.cancel_requested,
+        "attempts": job.attempts,
+        "error": job.error,
+        "created_by": job.created_by,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "heartbeat_at": job.heartbeat_at.isoformat() if job.heartbeat_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def _get_job_or_404(db: Session, job_id: UUID) -> BackgroundJob:
+    job = db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("")
+async def list_jobs(
+    status: Optional[str] = Query(None, description="queued, running, completed, failed, cancelled"),
+    job_type: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List recent background jobs, newest first."""
+    query = db.query(BackgroundJob)
+    if status:
+        query = query.filter(BackgroundJob.status == status)
+    if job_type:
+        query = query.filter(BackgroundJob.job_type == job_type)
+
+    jobs = query.order_by(BackgroundJob.created_at.desc()).limit(limit).all()
+    return {"jobs": [_serialize_job(job) for job in jobs]}
+
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: UUID,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """
+    Get job progress.
+
+    Reads only the job row (counters are maintained per chunk), so it is
+    cheap enough for the admin UI to poll every few seconds.
+    """
+    return _serialize_job(_get_job_or_404(db, job_id))
+
+
+@router.get("/{job_id}/items")
+async def list_job_items(
+    job_id: UUID,
+    status: Optional[str] = Query(None, description="pending, succeeded, failed, skipped"),
+    after_position: int = Query(-1, description="Return items after this position (keyset pagination)"),
+    limit: int = Query(100, ge=1, le=1000),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List a job's items, e.g. status=failed for the per-item error report."""
+    _get_job_or_404(db, job_id)
+
+    query = db.query(BackgroundJobItem).filter(
+        BackgroundJobItem.job_id == job_id,
+        BackgroundJobItem.position > after_position,
+    )
+    if status:
+        query = query.filter(BackgroundJobItem.status == status)
+
+    items = query.order_by(BackgroundJobItem.position).limit(limit).all()
+    return {
+        "items": [
+            {
+                "position": item.position,
+                "item_key": item.item_key,
+                "status": item.status,
+                "result": item.result,
+                "error": item.error,
+                "processed_at": item.processed_at.isoformat() if item.processed_at else None,
+            }
+            for item in items
+        ],
+        "next_after_position": items[-1].position if len(items) == limit else None,
+    }
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(
+    job_id: UUID,
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Cancel a job. Running jobs stop after the chunk in progress."""
+    job = _get_job_or_404(db, job_id)
+    if job.status not in ACTIVE_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Job is already {job.status}")
+
+    logger.info(f"[Jobs] Cancel requested for job {job.id} by {current_admin.user_email}")
+    return _serialize_job(job_runner.cancel(db, job))
+
+
+@router.post("/{job_id}/resume")
+async def resume_job(
+    job_id: UUID,
+    retry_failed: bool = Query(False, description="Also retry items that failed"),
+    current_admin: AttendeeProfile = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Requeue a cancelled, failed or completed job from its last checkpoint."""
+    job = _get_job_or_404(db, job_id)
+    if job.status in ACTIVE_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Job is already {job.status}")
+
+    logger.info(f"[Jobs] Resume requested for job {job.id} by {current_admin.user_email}")
+    return _serialize_job(job_runner.resume(db, job, retry_failed=retry_failed))
@@ -3,8 +3,8 @@ Parsed Emails Router - Admin API for managing parsed emails
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc
+from sqlalchemy.orm import Session, load_only, undefer_group
+from sqlalchemy import or_, desc, func
 from typing import List, Optional
 from pydantic import BaseModel
 import logging
@@ -14,11 +14,30 @@ from app.database import get_db
 from app.models.parsed_email import ParsedEmail
 from app.models.contact import Contact, Organization
 from app.routers.auth import get_current_user
+from app.services.contact_lookup import find_contact_by_email
+from app.services.job_runner import job_runner
+from app.services.parsed_email_archive import load_email_body
+from app.services.parsed_email_search import apply_search, search_snippets
+from app.utils.normalization import normalize_email
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Columns the list view shows; bodies and extraction blobs stay in the database
+LIST_COLUMNS = (
+    ParsedEmail.id,
+    ParsedEmail.message_id,
+    ParsedEmail.from_email,
+    ParsedEmail.subject,
+    ParsedEmail.date,
+    ParsedEmail.overall_confidence,
+    ParsedEmail.status,
+    ParsedEmail.requires_review,
+    ParsedEmail.email_type,
+    ParsedEmail.created_at,
+)
+
 
 # Pydantic models
 class EmailStatusUpdate(BaseModel):
@@ -34,6 +53,11 @@ class BulkDelete(BaseModel):
     email_ids: List[int]
 
 
+class ReprocessRequest(BaseModel):
+    email_ids: Optional[List[int]] = None  # Explicit emails, or
+    status: Optional[str] = None  # every email with this status (e.g. "failed")
+
+
 @router.get("/parsed-emails")
 async def get_parsed_emails(
     page: int = Query(1, ge=1),
@@ -41,16 +65,26 @@ async def get_parsed_emails(
     search: Optional[str] = None,
     status: Optional[str] = None,
     requires_review: Optional[bool] = None,
+    email_type: Optional[str] = None,
+    primary_contact: Optional[str] = Query(None, description="Primary contact email"),
+    participant: Optional[str] = Query(None, description="Address in from/to/cc"),
+    extracted_contact: Optional[str] = Query(None, description="Address among the AI-extracted contacts"),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """
     Get paginated list of parsed emails with filtering
+
+    search is full-text (ranked, with highlighted snippet_html per item);
+    see app.services.parsed_email_search.
+    email_type, primary_contact, participant and extracted_contact are each
+    served by an index (generated columns, participant_emails GIN and the
+    extracted_contacts jsonb_path_ops GIN).
     """
     try:
         # Check if table exists by attempting a simple query
         try:
-            query = db.query(ParsedEmail)
+            query = db.query(ParsedEmail).options(load_only(*LIST_COLUMNS))
         except Exception as table_error:
             logger.error(f"ParsedEmail table may not exist: {str(table_error)}", exc_info=True)
             # Return empty result if table doesn't exist
@@ -63,27 +97,41 @@ async def get_parsed_emails(
             }
 
         # Apply filters
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                or_(
-                    ParsedEmail.from_email.ilike(search_term),
-                    ParsedEmail.subject.ilike(search_term),
-                    ParsedEmail.body_text.ilike(search_term)
-                )
-            )
-
         if status:
             query = query.filter(ParsedEmail.status == status)
 
         if requires_review is not None:
             query = query.filter(ParsedEmail.requires_review == requires_review)
 
-        # Get total count
-        total = query.count()
+        if email_type:
+            query = query.filter(ParsedEmail.email_type == email_type)
+
+        if primary_contact:
+            query = query.filter(ParsedEmail.primary_contact_email == normalize_email(primary_contact))
 
-        # Apply pagination and ordering
-        emails = query.order_by(desc(ParsedEmail.created_at)).offset((page - 1) * page_size).limit(page_size).all()
+        if participant:
+            query = query.filter(ParsedEmail.participant_emails.contains([normalize_email(participant)]))
+
+        if extracted_contact:
+            # Extracted addresses are stored as the model returned them
+            addresses = {extracted_contact.strip(), normalize_email(extracted_contact)}
+            query = query.filter(or_(*[
+                ParsedEmail.extracted_contacts.contains([{"email": address}]) for address in addresses
+            ]))
+
+        # Full-text search ranks by relevance; everything else is newest first
+        tsquery = None
+        if search:
+            query, tsquery = apply_search(db, query, search)
+        else:
+            query = query.order_by(desc(ParsedEmail.created_at))
+
+        # Get total count (count(id), not a count over a subquery of every column)
+        total = query.with_entities(func.count(ParsedEmail.id)).order_by(None).scalar()
+
+        # Apply pagination
+        emails = query.offset((page - 1) * page_size).limit(page_size).all()
+        snippets = search_snippets(db, [email.id for email in emails], tsquery) if tsquery is not None else {}
 
         # Format response
         items = []
@@ -97,6 +145,8 @@ async def get_parsed_emails(
                 "overall_confidence": email.overall_confidence,
                 "status": email.status,
                 "requires_review": email.requires_review,
+                "email_type": email.email_type,
+                "snippet_html": snippets.get(email.id),
                 "created_at": email.created_at.isoformat() if email.created_at else None
             })
 
@@ -130,11 +180,16 @@ async def get_parsed_email(
     Get detailed information for a specific parsed email
     """
     try:
-        email = db.query(ParsedEmail).filter(ParsedEmail.id == email_id).first()
+        email = db.query(ParsedEmail).options(
+            undefer_group("body"), undefer_group("extraction")
+        ).filter(ParsedEmail.id == email_id).first()
 
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
 
+        # Inline, or fetched from object storage for archived emails
+        body = load_email_body(email)
+
         return {
             "id": email.id,
             "message_id": email.message_id,
@@ -144,9 +199,10 @@ async def get_parsed_email(
             "cc_emails": email.cc_emails,
             "subject": email.subject,
             "date": email.date.isoformat() if email.date else None,
-            "body_text": email.body_text,
-            "body_html": email.body_html,
-            "attachments": email.attachments,
+            "body_text": body["body_text"],
+            "body_html": body["body_html"],
+            "attachments": body["attachments"],
+            "body_archived_at": email.body_archived_at.isoformat() if email.body_archived_at else None,
             "extracted_contacts": email.extracted_contacts,
             "action_items": email.action_items,
             "topics": email.topics,
@@ -179,7 +235,9 @@ async def update_email_status(
     Update the status of a parsed email
     """
     try:
-        email = db.query(ParsedEmail).filter(ParsedEmail.id == email_id).first()
+        email = db.query(ParsedEmail).options(
+            load_only(ParsedEmail.id, ParsedEmail.status)
+        ).filter(ParsedEmail.id == email_id).first()
 
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
@@ -227,6 +285,51 @@ async def bulk_update_status(
         raise HTTPException(status_code=500, detail="Failed to update emails")
 
 
+@router.post("/parsed-emails/reprocess")
+async def reprocess_emails(
+    request: ReprocessRequest,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Re-run AI extraction for emails as a background job.
+    Poll /api/admin/jobs/{job_id} for progress.
+    """
+    if not request.email_ids and not request.status:
+        raise HTTPException(status_code=400, detail="Provide email_ids or status")
+
+    try:
+        query = db.query(ParsedEmail.id)
+        if request.email_ids:
+            query = query.filter(ParsedEmail.id.in_(request.email_ids))
+        if request.status:
+            query = query.filter(ParsedEmail.status == request.status)
+        email_ids = [row.id for row in query.order_by(ParsedEmail.id)]
+
+        if not email_ids:
+            return {"message": "No emails to reprocess", "count": 0}
+
+        job = job_runner.enqueue(
+            db,
+            "parsed_email_reprocess",
+            email_ids,
+            created_by=getattr(current_user, "user_email", None),
+            chunk_size=10,
+        )
+
+        return {
+            "message": f"Queued {len(email_ids)} emails for reprocessing",
+            "count": len(email_ids),
+            "job_id": str(job.id),
+            "status_url": f"/api/admin/jobs/{job.id}"
+        }
+
+    except Exception as e:
+        logger.error(f"Error queueing reprocessing: {str(e)}", exc_info=True)
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Failed to queue reprocessing")
+
+
 @router.delete("/parsed-emails/{email_id}")
 async def delete_email(
     email_id: int,
@@ -237,7 +340,9 @@ async def delete_email(
     Delete a parsed email
     """
     try:
-        email = db.query(ParsedEmail).filter(ParsedEmail.id == email_id).first()
+        email = db.query(ParsedEmail).options(
+            load_only(ParsedEmail.id)
+        ).filter(ParsedEmail.id == email_id).first()
 
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
@@ -295,7 +400,9 @@ async def approve_contact(
     Approve an extracted contact and add to contacts database
     """
     try:
-        email = db.query(ParsedEmail).filter(ParsedEmail.id == email_id).first()
+        email = db.query(ParsedEmail).options(
+            load_only(ParsedEmail.id, ParsedEmail.extracted_contacts)
+        ).filter(ParsedEmail.id == email_id).first()
 
         if not email:
             raise HTTPException(status_code=404, detail="Email not found")
@@ -305,14 +412,12 @@ async def approve_contact(
 
         contact_data = email.extracted_contacts[contact_index]
 
-        # Check if contact already exists
-        existing_contact = db.query(Contact).filter(
-            Contact.email == contact_data.get('email')
-        ).first()
+        # Check if contact already exists (primary or alternate email)
+        existing_contact = find_contact_by_email(db, contact_data.get('email'))
 
         if existing_contact:
             return JSONResponse(
-                content={"message": "Contact already exists in database", "contact_id": existing_contact.id},
+                content={"message": "Contact already exists in database", "contact_id": str(existing_contact.id)},
                 status_code=200
             )
 
@@ -355,7 +460,7 @@ async def approve_contact(
         db.refresh(new_contact)
 
         return JSONResponse(
-            content={"message": "Contact added to database", "contact_id": new_contact.id},
+            content={"message": "Contact added to database", "contact_id": str(new_contact.id)},
             status_code=200
         )
 
@@ -3,7 +3,6 @@ Test email router - public endpoint for sending test emails
 """
 from fastapi import APIRouter
 from pydantic import BaseModel, EmailStr
-import asyncio
 import logging
 from datetime import datetime, timedelta
 
@@ -43,7 +42,6 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             magic_link="https://www.shellfish-society.org/member/verify.html?token=TEST_TOKEN_123",
             first_name="Test User"
         )
-        await asyncio.sleep(1)
         
         # 2. Welcome Email
         results["welcome"] = await email_service.send_welcome_email(
@@ -51,7 +49,6 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             first_name="Test User",
             magic_link="https://www.shellfish-society.org/member/verify.html?token=TEST_WELCOME_123"
         )
-        await asyncio.sleep(1)
         
         # 3. Abstract Review Assignment
         results["review_assignment"] = await email_service.send_review_assignment_email(
@@ -59,14 +56,12 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             abstract_title="Oyster Reef Restoration in Chesapeake Bay",
             due_date=datetime(2026, 3, 15)
         )
-        await asyncio.sleep(1)
         
         # 4. Review Confirmation
         results["review_confirmation"] = await email_service.send_review_confirmation_email(
             reviewer_email=test_email,
             abstract_title="Oyster Reef Restoration in Chesapeake Bay"
         )
-        await asyncio.sleep(1)
         
         # 5. Abstract Acceptance
         results["acceptance"] = await email_service.send_acceptance_email(
@@ -75,7 +70,6 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             presentation_type="Oral Presentation",
             average_score=4.2
         )
-        await asyncio.sleep(1)
         
         # 6. Abstract Rejection
         results["rejection"] = await email_service.send_rejection_email(
@@ -83,7 +77,6 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             abstract_title="Test Abstract for Rejection Email",
             feedback_summary="Thank you for your submission. Unfortunately, we are unable to accept your abstract at this time."
         )
-        await asyncio.sleep(1)
         
         # 7. Event Signup
         results["event_signup"] = await email_service.send_event_signup_email(
@@ -94,7 +87,6 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             total_fee=50.00,
             status="confirmed"
         )
-        await asyncio.sleep(1)
         
         # 8. Event Waitlist Promotion
         results["waitlist_promotion"] = await email_service.send_event_waitlist_promotion_email(
@@ -104,7 +96,6 @@ async def send_all_test_emails(request: SendTestEmailsRequest):
             guest_count=2,
             total_fee=50.00
         )
-        await asyncio.sleep(1)
         
         # 9. Conference Registration
         results["conference_registration"] = await email_service.send_conference_registration_email(
@@ -193,7 +184,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     magic_link="https://www.shellfish-society.org/member/verify.html?token=TEST_TOKEN_123",
                     first_name="Test User"
                 )
-                await asyncio.sleep(0.5)
 
                 # 2. Welcome Email
                 results["welcome"] = await email_service.send_welcome_email(
@@ -201,7 +191,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     first_name="Test User",
                     magic_link="https://www.shellfish-society.org/member/verify.html?token=TEST_WELCOME_123"
                 )
-                await asyncio.sleep(0.5)
 
                 # 3. Abstract Review Assignment
                 results["review_assignment"] = await email_service.send_review_assignment_email(
@@ -209,14 +198,12 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     abstract_title="Oyster Reef Restoration in Chesapeake Bay",
                     due_date=datetime(2026, 3, 15)
                 )
-                await asyncio.sleep(0.5)
 
                 # 4. Review Confirmation
                 results["review_confirmation"] = await email_service.send_review_confirmation_email(
                     reviewer_email=email,
                     abstract_title="Oyster Reef Restoration in Chesapeake Bay"
                 )
-                await asyncio.sleep(0.5)
 
                 # 5. Abstract Acceptance
                 results["acceptance"] = await email_service.send_acceptance_email(
@@ -225,7 +212,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     presentation_type="Oral Presentation",
                     average_score=4.2
                 )
-                await asyncio.sleep(0.5)
 
                 # 6. Abstract Rejection
                 results["rejection"] = await email_service.send_rejection_email(
@@ -233,7 +219,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     abstract_title="Test Abstract for Rejection Email",
                     feedback_summary="Thank you for your submission. Unfortunately, we are unable to accept your abstract at this time."
                 )
-                await asyncio.sleep(0.5)
 
                 # 7. Event Signup
                 results["event_signup"] = await email_service.send_event_signup_email(
@@ -244,7 +229,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     total_fee=50.00,
                     status="confirmed"
                 )
-                await asyncio.sleep(0.5)
 
                 # 8. Event Waitlist Promotion
                 results["waitlist_promotion"] = await email_service.send_event_waitlist_promotion_email(
@@ -254,7 +238,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                     guest_count=2,
                     total_fee=50.00
                 )
-                await asyncio.sleep(0.5)
 
                 # 9. Conference Registration
                 results["conference_registration"] = await email_service.send_conference_registration_email(
@@ -268,7 +251,6 @@ async def send_committee_test_emails(request: SendCommitteeTestEmailsRequest):
                 )
 
                 all_results[email] = {"success": True, "results": results}
-                await asyncio.sleep(1)  # Brief pause between recipients
 
             except Exception as e:
                 logger.error(f"Error sending test emails to {email}: {str(e)}")
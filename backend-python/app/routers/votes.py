@@ -3,7 +3,7 @@ Board Votes CRUD router for governance tracking.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func, desc
+from sqlalchemy import or_, func, desc, select
 from typing import Optional
 from datetime import datetime, timedelta, date
 import logging
@@ -105,48 +105,50 @@ async def get_vote_statistics(
     cutoff_date = datetime.now().date() - timedelta(days=days)
     recent_cutoff = datetime.now().date() - timedelta(days=30)
 
-    # Total votes
-    total_votes = db.query(func.count(BoardVote.id)).filter(BoardVote.vote_date >= cutoff_date).scalar()
+    in_range = BoardVote.vote_date >= cutoff_date
+    counted = in_range & (BoardVote.total_votes > 0)
 
-    # Votes by result
-    votes_carried = (
-        db.query(func.count(BoardVote.id)).filter(BoardVote.result == "Carried", BoardVote.vote_date >= cutoff_date).scalar()
-    )
-
-    votes_failed = (
-        db.query(func.count(BoardVote.id)).filter(BoardVote.result == "Failed", BoardVote.vote_date >= cutoff_date).scalar()
+    # Most active member
+    most_active_member = (
+        select(BoardVoteDetail.board_member_name)
+        .join(BoardVote)
+        .where(in_range)
+        .group_by(BoardVoteDetail.board_member_name)
+        .order_by(func.count(BoardVoteDetail.id).desc())
+        .limit(1)
+        .scalar_subquery()
     )
 
-    votes_no_decision = (
-        db.query(func.count(BoardVote.id))
-        .filter(BoardVote.result == "No Decision", BoardVote.vote_date >= cutoff_date)
-        .scalar()
-    )
+    # All figures in one pass over board_votes
+    stats = db.query(
+        func.count(BoardVote.id).filter(in_range).label("total_votes"),
+        # Votes by result
+        func.count(BoardVote.id).filter(in_range, BoardVote.result == "Carried").label("votes_carried"),
+        func.count(BoardVote.id).filter(in_range, BoardVote.result == "Failed").label("votes_failed"),
+        func.count(BoardVote.id).filter(in_range, BoardVote.result == "No Decision").label("votes_no_decision"),
+        func.avg(BoardVote.yes_count).filter(counted).label("avg_yes"),
+        func.avg(BoardVote.total_votes).filter(counted).label("avg_total"),
+        # Recent votes count (last 30 days)
+        func.count(BoardVote.id).filter(BoardVote.vote_date >= recent_cutoff).label("recent_votes_count"),
+        most_active_member.label("most_active_member"),
+    ).filter(
+        BoardVote.vote_date >= min(cutoff_date, recent_cutoff)
+    ).one()
+
+    total_votes = stats.total_votes
+    votes_carried = stats.votes_carried
+    votes_failed = stats.votes_failed
+    votes_no_decision = stats.votes_no_decision
+    avg_yes, avg_total = stats.avg_yes, stats.avg_total
 
     # Average yes percentage
-    avg_yes = db.query(func.avg(BoardVote.yes_count)).filter(BoardVote.vote_date >= cutoff_date, BoardVote.total_votes > 0).scalar()
-
-    avg_total = db.query(func.avg(BoardVote.total_votes)).filter(BoardVote.vote_date >= cutoff_date, BoardVote.total_votes > 0).scalar()
-
     average_yes_percentage = (avg_yes / avg_total * 100) if avg_yes and avg_total else 0.0
 
     # Average participation
-    avg_participation = avg_total if avg_total else 0.0
-
-    # Most active member
-    most_active = (
-        db.query(BoardVoteDetail.board_member_name, func.count(BoardVoteDetail.id).label("vote_count"))
-        .join(BoardVote)
-        .filter(BoardVote.vote_date >= cutoff_date)
-        .group_by(BoardVoteDetail.board_member_name)
-        .order_by(desc("vote_count"))
-        .first()
-    )
-
-    most_active_member = most_active[0] if most_active else None
+    average_participation = avg_total if avg_total else 0.0
 
-    # Recent votes count (last 30 days)
-    recent_votes_count = db.query(func.count(BoardVote.id)).filter(BoardVote.vote_date >= recent_cutoff).scalar()
+    most_active_member = stats.most_active_member
+    recent_votes_count = stats.recent_votes_count
 
     return VoteStatistics(
         total_votes=total_votes or 0,
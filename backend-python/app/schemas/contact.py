@@ -1,7 +1,7 @@
 """
 Pydantic schemas for Contact and Organization models.
 """
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
 from uuid import UUID
@@ -99,3 +99,60 @@ class ContactListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+
+
+class FacetValue(BaseModel):
+    """One filter value and how many results have it."""
+    value: str
+    label: Optional[str] = None
+    count: int
+
+
+class ContactFacetsResponse(ContactListResponse):
+    """Contact list page plus counts per country, role, organization and tag."""
+    facets: Dict[str, List[FacetValue]]
+
+
+# Bulk Operation Schemas
+class ContactBulkFilters(BaseModel):
+    """Same filters as GET /api/contacts/."""
+    search: Optional[str] = None
+    role: Optional[str] = None
+    country: Optional[str] = None
+    organization_id: Optional[UUID] = None
+    tags: Optional[str] = Field(None, description="Comma-separated; matches contacts with any of the tags")
+
+
+class ContactBulkFieldUpdate(BaseModel):
+    """Fields that can be set on many contacts at once."""
+    role: Optional[str] = Field(None, max_length=255)
+    title: Optional[str] = Field(None, max_length=255)
+    country: Optional[str] = Field(None, max_length=100)
+    state_province: Optional[str] = Field(None, max_length=100)
+    city: Optional[str] = Field(None, max_length=100)
+
+
+class ContactBulkOperation(BaseModel):
+    """
+    Schema for a bulk contact operation.
+
+    Targets either explicit contact_ids, filters, or both (intersected).
+    Set organization_id to null explicitly to clear the organization.
+    """
+    contact_ids: Optional[List[UUID]] = Field(None, max_length=10000)
+    filters: Optional[ContactBulkFilters] = None
+    add_tags: Optional[List[str]] = None
+    remove_tags: Optional[List[str]] = None
+    organization_id: Optional[UUID] = None
+    fields: Optional[ContactBulkFieldUpdate] = None
+    delete: bool = False
+
+
+class ContactBulkResult(BaseModel):
+    """Rows matched by the selection and rows changed by each operation."""
+    matched: int
+    tags_added: int = 0
+    tags_removed: int = 0
+    reassigned: int = 0
+    fields_updated: int = 0
+    deleted: int = 0
@@ -0,0 +1,229 @@
+"""
+Database-backed cache for Apollo.io enrichment responses.
+Repeat lookups of the same person or organization are served from the
+apollo_enrichment_cache table instead of spending another paid credit.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.apollo_cache import ApolloCacheEntry
+from app.utils.normalization import normalize_email, normalize_organization_name, normalize_person_name
+
+logger = logging.getLogger(__name__)
+
+
+class ApolloCache:
+    """
+    Read-through cache for Apollo person and organization lookups.
+
+    Successful matches live for APOLLO_CACHE_TTL_DAYS; "not found" results
+    are cached for APOLLO_CACHE_NEGATIVE_TTL_DAYS so misses are retried
+    sooner. Hit/miss counters are kept per process for the credits endpoint.
+
+    Each read and write runs in its own short session, so a cache failure
+    never touches the caller's transaction, and cached responses (credits
+    already spent) are kept even if the caller's work is rolled back.
+    """
+
+    stats = {
+        'hits': 0,
+        'negative_hits': 0,
+        'misses': 0,
+        'writes': 0,
+    }
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def person_key(
+        email: Optional[str] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        organization_name: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> Optional[str]:
+        """Key a person lookup by email, falling back to name + organization/domain."""
+        normalized_email = normalize_email(email)
+        if normalized_email:
+            return f"person:email:{normalized_email}"
+
+        name = normalize_person_name(first_name=first_name, last_name=last_name)
+        org = ApolloCache._normalize_domain(domain) or normalize_organization_name(organization_name)
+        if name and org:
+            return f"person:name:{name}|{org}"
+
+        return None
+
+    @staticmethod
+    def organization_key(domain: Optional[str] = None, organization_name: Optional[str] = None) -> Optional[str]:
+        """Key an organization lookup by domain, falling back to normalized name."""
+        normalized_domain = ApolloCache._normalize_domain(domain)
+        if normalized_domain:
+            return f"organization:domain:{normalized_domain}"
+
+        name = normalize_organization_name(organization_name)
+        if name:
+            return f"organization:name:{name}"
+
+        return None
+
+    @staticmethod
+    def _normalize_domain(domain: Optional[str]) -> str:
+        if not domain:
+            return ""
+        domain = domain.strip().lower()
+        domain = domain.replace('http://', '').replace('https://', '').replace('www.', '')
+        return domain.split('/')[0]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for `key`, or None on a miss."""
+        if not key:
+            return None
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up several keys with one query.
+
+        Returns:
+            Dict of key -> cached response for every unexpired hit
+        """
+        keys = [key for key in set(keys) if key]
+        if not keys:
+            return {}
+
+        try:
+            now = datetime.utcnow()
+            with self.session_factory() as db:
+                entries = db.query(ApolloCacheEntry).filter(
+                    ApolloCacheEntry.cache_key.in_(keys),
+                    ApolloCacheEntry.expires_at > now,
+                ).all()
+
+                hits = {}
+                negative_hits = 0
+                for entry in entries:
+                    response = dict(entry.response or {})
+                    response['cached'] = True
+                    hits[entry.cache_key] = response
+                    negative_hits += not entry.found
+
+                if entries:
+                    db.query(ApolloCacheEntry).filter(
+                        ApolloCacheEntry.id.in_([entry.id for entry in entries])
+                    ).update(
+                        {
+                            ApolloCacheEntry.hit_count: ApolloCacheEntry.hit_count + 1,
+                            ApolloCacheEntry.last_hit_at: now,
+                        },
+                        synchronize_session=False,
+                    )
+                    db.commit()
+
+        except Exception as e:
+            logger.warning(f"[Apollo Cache] Lookup failed, treating as miss: {e}")
+            self.stats['misses'] += len(keys)
+            return {}
+
+        self.stats['hits'] += len(hits) - negative_hits
+        self.stats['negative_hits'] += negative_hits
+        self.stats['misses'] += len(keys) - len(hits)
+        return hits
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def set(self, key: Optional[str], lookup_type: str, response: Dict[str, Any]):
+        """Store a response; `response['success']` decides positive vs negative TTL."""
+        if key:
+            self.set_many(lookup_type, {key: response})
+
+    def set_many(self, lookup_type: str, responses: Dict[str, Dict[str, Any]]):
+        """Upsert several responses with one statement."""
+        rows = []
+        now = datetime.utcnow()
+        for key, response in responses.items():
+            if not key:
+                continue
+            found = bool(response.get('success'))
+            ttl_days = settings.APOLLO_CACHE_TTL_DAYS if found else settings.APOLLO_CACHE_NEGATIVE_TTL_DAYS
+            rows.append({
+                'cache_key': key,
+                'lookup_type': lookup_type,
+                'found': found,
+                'response': {k: v for k, v in response.items() if k != 'cached'},
+                'hit_count': 0,
+                'created_at': now,
+                'expires_at': now + timedelta(days=ttl_days),
+            })
+
+        if not rows:
+            return
+
+        try:
+            statement = insert(ApolloCacheEntry).values(rows)
+            statement = statement.on_conflict_do_update(
+                index_elements=[ApolloCacheEntry.cache_key],
+                set_={
+                    'found': statement.excluded.found,
+                    'response': statement.excluded.response,
+                    'created_at': statement.excluded.created_at,
+                    'expires_at': statement.excluded.expires_at,
+                },
+            )
+            with self.session_factory() as db:
+                db.execute(statement)
+                db.commit()
+            self.stats['writes'] += len(rows)
+
+        except Exception as e:
+            logger.warning(f"[Apollo Cache] Failed to store {len(rows)} entries: {e}")
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Process counters plus table-level totals for the credits endpoint."""
+        lookups = self.stats['hits'] + self.stats['negative_hits'] + self.stats['misses']
+        result = {
+            **self.stats,
+            'hit_rate': round((self.stats['hits'] + self.stats['negative_hits']) / lookups * 100, 1) if lookups else 0,
+        }
+
+        try:
+            now = datetime.utcnow()
+            with self.session_factory() as db:
+                totals = db.query(
+                    func.count(ApolloCacheEntry.id),
+                    func.count(ApolloCacheEntry.id).filter(ApolloCacheEntry.expires_at > now),
+                    func.count(ApolloCacheEntry.id).filter(ApolloCacheEntry.found.is_(False)),
+                    func.coalesce(func.sum(ApolloCacheEntry.hit_count), 0),
+                ).one()
+            result.update({
+                'entries': totals[0],
+                'live_entries': totals[1],
+                'negative_entries': totals[2],
+                'lifetime_hits': int(totals[3]),
+            })
+        except Exception as e:
+            logger.warning(f"[Apollo Cache] Failed to read cache totals: {e}")
+
+        return result
@@ -2,10 +2,14 @@
 Apollo.io API integration service for contact enrichment.
 Enriches contact data with professional information, social profiles, and more.
 """
+import asyncio
 import logging
+import random
+import time
 from typing import Dict, List, Optional, Any
 import httpx
 from app.config import settings
+from app.services.apollo_cache import ApolloCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,21 +19,160 @@ class ApolloAPIError(Exception):
     pass
 
 
+class ApolloRateLimiter:
+    """
+    Token bucket shared by all Apollo requests in this process.
+
+    Tokens refill at the configured per-minute rate. Apollo's rate limit
+    headers and 429 responses pause the bucket until the window resets.
+    """
+
+    def __init__(self, rate_per_minute: int, capacity: int):
+        self.rate_per_second = max(rate_per_minute, 1) / 60.0
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate_per_second)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (e.g. after a 429)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+    def update_from_headers(self, headers: httpx.Headers):
+        """Pause when Apollo reports the current minute's quota is used up."""
+        remaining = headers.get('x-minute-requests-left')
+        if remaining is not None and remaining.isdigit() and int(remaining) == 0:
+            logger.info("[Apollo] Minute quota exhausted, pausing requests")
+            self.pause(60 - (time.time() % 60))
+
+
+_rate_limiter = ApolloRateLimiter(
+    rate_per_minute=settings.APOLLO_RATE_LIMIT_PER_MINUTE,
+    capacity=settings.APOLLO_MAX_CONCURRENCY,
+)
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=settings.APOLLO_MAX_CONCURRENCY * 2,
+                max_keepalive_connections=settings.APOLLO_MAX_CONCURRENCY,
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the pooled HTTP client (called on application shutdown)."""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
 class ApolloService:
     """Service for interacting with Apollo.io API."""
 
     BASE_URL = "https://api.apollo.io/v1"
+    BULK_MATCH_BATCH_SIZE = 10  # Apollo's maximum for /people/bulk_match
+    MAX_RETRIES = 4
+    BACKOFF_BASE_SECONDS = 1.0
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[ApolloRateLimiter] = None,
+        cache: Optional[ApolloCache] = None,
+    ):
         """
         Initialize Apollo service.
 
         Args:
             api_key: Apollo API key (defaults to settings.APOLLO_API_KEY)
+            base_url: API base URL (defaults to BASE_URL; overridden for local mocks)
+            max_concurrency: Parallel bulk requests (defaults to settings.APOLLO_MAX_CONCURRENCY)
+            client: HTTP client to use instead of the shared pooled client
+            rate_limiter: Rate limiter to use instead of the process-wide one
+            cache: Response cache; when set, repeat lookups skip the API
         """
         self.api_key = api_key or settings.APOLLO_API_KEY
         if not self.api_key:
             logger.warning("Apollo API key not configured")
+        self.base_url = base_url or self.BASE_URL
+        self.max_concurrency = max_concurrency or settings.APOLLO_MAX_CONCURRENCY
+        self._client = client
+        self._rate_limiter = rate_limiter or _rate_limiter
+        self.cache = cache
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client; connections are reused across requests."""
+        return self._client or get_shared_client()
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> httpx.Response:
+        """
+        POST to Apollo through the rate limiter, retrying 429s with backoff.
+
+        Honors Retry-After when present, otherwise backs off exponentially
+        with jitter. The final 429 is returned to the caller.
+        """
+        headers = {
+            'Content-Type': 'application/json',
+            'Cache-Control': 'no-cache',
+        }
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._rate_limiter.acquire()
+            response = await self.client.post(
+                f"{self.base_url}{path}",
+                json=payload,
+                headers=headers,
+                params={'api_key': self.api_key},
+                timeout=30.0
+            )
+            self._rate_limiter.update_from_headers(response.headers)
+
+            if response.status_code != 429 or attempt == self.MAX_RETRIES:
+                return response
+
+            retry_after = response.headers.get('retry-after')
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = self.BACKOFF_BASE_SECONDS * (2 ** attempt) + random.uniform(0, 0.5)
+
+            logger.warning(f"[Apollo] Rate limited on {path}, retrying in {delay:.1f}s (attempt {attempt + 1})")
+            self._rate_limiter.pause(delay)
+
+        return response
 
     async def enrich_person(
         self,
@@ -38,6 +181,7 @@ class ApolloService:
         last_name: Optional[str] = None,
         organization_name: Optional[str] = None,
         domain: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Enrich a person's contact information using Apollo API.
@@ -48,92 +192,56 @@ class ApolloService:
             last_name: Person's last name
             organization_name: Person's organization
             domain: Organization's website domain
+            force_refresh: Skip the response cache and call Apollo
 
         Returns:
             Dict with enriched contact data
         """
+        cache_key = ApolloCache.person_key(email, first_name, last_name, organization_name, domain)
+        if self.cache and not force_refresh:
+            cached = self.cache.get(cache_key)
+            if cached:
+                return cached
+
         if not self.api_key:
             raise ApolloAPIError("Apollo API key not configured")
 
         try:
-            url = f"{self.BASE_URL}/people/match"
-
-            # Build request payload
-            payload = {}
-            if email:
-                payload['email'] = email
-            if first_name:
-                payload['first_name'] = first_name
-            if last_name:
-                payload['last_name'] = last_name
-            if organization_name:
-                payload['organization_name'] = organization_name
-            if domain:
-                payload['domain'] = domain
+            payload = self._build_person_payload(
+                email=email,
+                first_name=first_name,
+                last_name=last_name,
+                organization_name=organization_name,
+                domain=domain,
+            )
 
             if not payload:
                 raise ApolloAPIError("At least one search parameter required")
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Cache-Control': 'no-cache',
-            }
+            response = await self._post("/people/match", payload)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    params={'api_key': self.api_key},
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    person = data.get('person', {})
-
-                    # Extract and structure the enriched data
-                    enriched_data = {
-                        'success': True,
-                        'email': person.get('email'),
-                        'first_name': person.get('first_name'),
-                        'last_name': person.get('last_name'),
-                        'name': person.get('name'),
-                        'title': person.get('title'),
-                        'organization_name': person.get('organization_name'),
-                        'linkedin_url': person.get('linkedin_url'),
-                        'twitter_url': person.get('twitter_url'),
-                        'facebook_url': person.get('facebook_url'),
-                        'phone_numbers': person.get('phone_numbers', []),
-                        'city': person.get('city'),
-                        'state': person.get('state'),
-                        'country': person.get('country'),
-                        'headline': person.get('headline'),
-                        'photo_url': person.get('photo_url'),
-                        'employment_history': person.get('employment_history', []),
-                        'organization': self._extract_organization_data(person.get('organization', {})),
-                        'source': 'apollo.io',
-                    }
-
-                    logger.info(f"Successfully enriched contact: {email or f'{first_name} {last_name}'}")
-                    return enriched_data
-
-                elif response.status_code == 404:
-                    return {
-                        'success': False,
-                        'error': 'Contact not found in Apollo database',
-                        'source': 'apollo.io',
-                    }
+            if response.status_code == 200:
+                data = response.json()
+                enriched_data = self._format_person(data.get('person') or {})
+                self._cache_set(cache_key, 'person', enriched_data)
+
+                logger.info(f"Successfully enriched contact: {email or f'{first_name} {last_name}'}")
+                return enriched_data
+
+            elif response.status_code == 404:
+                not_found = self._person_not_found()
+                self._cache_set(cache_key, 'person', not_found)
+                return not_found
 
-                elif response.status_code == 401:
-                    raise ApolloAPIError("Invalid API key")
+            elif response.status_code == 401:
+                raise ApolloAPIError("Invalid API key")
 
-                elif response.status_code == 429:
-                    raise ApolloAPIError("Apollo API rate limit exceeded")
+            elif response.status_code == 429:
+                raise ApolloAPIError("Apollo API rate limit exceeded")
 
-                else:
-                    error_msg = response.json().get('error', response.text)
-                    raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
+            else:
+                error_msg = response.json().get('error', response.text)
+                raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
 
         except httpx.TimeoutException:
             logger.error("Apollo API request timed out")
@@ -142,6 +250,60 @@ class ApolloService:
             logger.error(f"Error enriching contact with Apollo: {e}")
             raise ApolloAPIError(f"Failed to enrich contact: {str(e)}")
 
+    @staticmethod
+    def _build_person_payload(
+        email: Optional[str] = None,
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        organization_name: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build a /people/match payload (also used as a bulk_match detail)."""
+        payload = {}
+        if email:
+            payload['email'] = email
+        if first_name:
+            payload['first_name'] = first_name
+        if last_name:
+            payload['last_name'] = last_name
+        if organization_name:
+            payload['organization_name'] = organization_name
+        if domain:
+            payload['domain'] = domain
+        return payload
+
+    def _format_person(self, person: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract and structure the enriched data from an Apollo person record."""
+        return {
+            'success': True,
+            'email': person.get('email'),
+            'first_name': person.get('first_name'),
+            'last_name': person.get('last_name'),
+            'name': person.get('name'),
+            'title': person.get('title'),
+            'organization_name': person.get('organization_name'),
+            'linkedin_url': person.get('linkedin_url'),
+            'twitter_url': person.get('twitter_url'),
+            'facebook_url': person.get('facebook_url'),
+            'phone_numbers': person.get('phone_numbers', []),
+            'city': person.get('city'),
+            'state': person.get('state'),
+            'country': person.get('country'),
+            'headline': person.get('headline'),
+            'photo_url': person.get('photo_url'),
+            'employment_history': person.get('employment_history', []),
+            'organization': self._extract_organization_data(person.get('organization', {})),
+            'source': 'apollo.io',
+        }
+
+    @staticmethod
+    def _person_not_found() -> Dict[str, Any]:
+        return {
+            'success': False,
+            'error': 'Contact not found in Apollo database',
+            'source': 'apollo.io',
+        }
+
     def _extract_organization_data(self, org_data: Dict) -> Dict[str, Any]:
         """Extract and structure organization data from Apollo response."""
         if not org_data:
@@ -192,8 +354,6 @@ class ApolloService:
             raise ApolloAPIError("Apollo API key not configured")
 
         try:
-            url = f"{self.BASE_URL}/mixed_people/search"
-
             payload = {
                 'page': page,
                 'per_page': min(per_page, 100),
@@ -208,31 +368,19 @@ class ApolloService:
             if organization_names:
                 payload['q_organization_name'] = ' OR '.join(organization_names)
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Cache-Control': 'no-cache',
-            }
+            response = await self._post("/mixed_people/search", payload)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    params={'api_key': self.api_key},
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return {
-                        'success': True,
-                        'people': data.get('people', []),
-                        'pagination': data.get('pagination', {}),
-                        'total_entries': data.get('pagination', {}).get('total_entries', 0),
-                    }
-                else:
-                    error_msg = response.json().get('error', response.text)
-                    raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
+            if response.status_code == 200:
+                data = response.json()
+                return {
+                    'success': True,
+                    'people': data.get('people', []),
+                    'pagination': data.get('pagination', {}),
+                    'total_entries': data.get('pagination', {}).get('total_entries', 0),
+                }
+            else:
+                error_msg = response.json().get('error', response.text)
+                raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
 
         except Exception as e:
             logger.error(f"Error searching people with Apollo: {e}")
@@ -242,6 +390,7 @@ class ApolloService:
         self,
         domain: Optional[str] = None,
         organization_name: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Enrich organization information using Apollo API.
@@ -249,126 +398,220 @@ class ApolloService:
         Args:
             domain: Organization's website domain
             organization_name: Organization's name
+            force_refresh: Skip the response cache and call Apollo
 
         Returns:
             Dict with enriched organization data
         """
-        if not self.api_key:
-            raise ApolloAPIError("Apollo API key not configured")
-
         if not domain and not organization_name:
             raise ApolloAPIError("Either domain or organization_name required")
 
-        try:
-            url = f"{self.BASE_URL}/organizations/enrich"
+        cache_key = ApolloCache.organization_key(domain, organization_name)
+        if self.cache and not force_refresh:
+            cached = self.cache.get(cache_key)
+            if cached:
+                return cached
+
+        if not self.api_key:
+            raise ApolloAPIError("Apollo API key not configured")
 
+        try:
             payload = {}
             if domain:
                 payload['domain'] = domain
             if organization_name:
                 payload['name'] = organization_name
 
-            headers = {
-                'Content-Type': 'application/json',
-                'Cache-Control': 'no-cache',
-            }
+            response = await self._post("/organizations/enrich", payload)
+
+            if response.status_code == 200:
+                data = response.json()
+                org = data.get('organization', {})
+
+                enriched_data = {
+                    'success': True,
+                    'name': org.get('name'),
+                    'website_url': org.get('website_url'),
+                    'domain': org.get('primary_domain'),
+                    'linkedin_url': org.get('linkedin_url'),
+                    'twitter_url': org.get('twitter_url'),
+                    'facebook_url': org.get('facebook_url'),
+                    'industry': org.get('industry'),
+                    'keywords': org.get('keywords', []),
+                    'estimated_num_employees': org.get('estimated_num_employees'),
+                    'retail_location_count': org.get('retail_location_count'),
+                    'city': org.get('city'),
+                    'state': org.get('state'),
+                    'country': org.get('country'),
+                    'street_address': org.get('street_address'),
+                    'postal_code': org.get('postal_code'),
+                    'founded_year': org.get('founded_year'),
+                    'phone': org.get('phone'),
+                    'publicly_traded_symbol': org.get('publicly_traded_symbol'),
+                    'publicly_traded_exchange': org.get('publicly_traded_exchange'),
+                    'logo_url': org.get('logo_url'),
+                    'short_description': org.get('short_description'),
+                    'annual_revenue': org.get('annual_revenue'),
+                    'total_funding': org.get('total_funding'),
+                    'technologies': org.get('technologies', []),
+                    'source': 'apollo.io',
+                }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    headers=headers,
-                    params={'api_key': self.api_key},
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    org = data.get('organization', {})
-
-                    enriched_data = {
-                        'success': True,
-                        'name': org.get('name'),
-                        'website_url': org.get('website_url'),
-                        'domain': org.get('primary_domain'),
-                        'linkedin_url': org.get('linkedin_url'),
-                        'twitter_url': org.get('twitter_url'),
-                        'facebook_url': org.get('facebook_url'),
-                        'industry': org.get('industry'),
-                        'keywords': org.get('keywords', []),
-                        'estimated_num_employees': org.get('estimated_num_employees'),
-                        'retail_location_count': org.get('retail_location_count'),
-                        'city': org.get('city'),
-                        'state': org.get('state'),
-                        'country': org.get('country'),
-                        'street_address': org.get('street_address'),
-                        'postal_code': org.get('postal_code'),
-                        'founded_year': org.get('founded_year'),
-                        'phone': org.get('phone'),
-                        'publicly_traded_symbol': org.get('publicly_traded_symbol'),
-                        'publicly_traded_exchange': org.get('publicly_traded_exchange'),
-                        'logo_url': org.get('logo_url'),
-                        'short_description': org.get('short_description'),
-                        'annual_revenue': org.get('annual_revenue'),
-                        'total_funding': org.get('total_funding'),
-                        'technologies': org.get('technologies', []),
-                        'source': 'apollo.io',
-                    }
-
-                    logger.info(f"Successfully enriched organization: {domain or organization_name}")
-                    return enriched_data
-
-                elif response.status_code == 404:
-                    return {
-                        'success': False,
-                        'error': 'Organization not found in Apollo database',
-                        'source': 'apollo.io',
-                    }
-                else:
-                    error_msg = response.json().get('error', response.text)
-                    raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
+                self._cache_set(cache_key, 'organization', enriched_data)
+
+                logger.info(f"Successfully enriched organization: {domain or organization_name}")
+                return enriched_data
+
+            elif response.status_code == 404:
+                not_found = {
+                    'success': False,
+                    'error': 'Organization not found in Apollo database',
+                    'source': 'apollo.io',
+                }
+                self._cache_set(cache_key, 'organization', not_found)
+                return not_found
+            else:
+                error_msg = response.json().get('error', response.text)
+                raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
 
         except Exception as e:
             logger.error(f"Error enriching organization with Apollo: {e}")
             raise ApolloAPIError(f"Failed to enrich organization: {str(e)}")
 
-    async def bulk_enrich_people(self, contacts: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    async def bulk_enrich_people(
+        self,
+        contacts: List[Dict[str, str]],
+        force_refresh: bool = False,
+    ) -> List[Dict[str, Any]]:
         """
         Enrich multiple contacts in bulk.
 
+        Cached contacts are answered from the response cache with one query.
+        The rest are sent to Apollo's /people/bulk_match endpoint in groups of
+        BULK_MATCH_BATCH_SIZE, with up to max_concurrency groups in flight at
+        once over the pooled client. All requests go through the shared rate
+        limiter, so 429s back off instead of failing the whole batch.
+
         Args:
             contacts: List of contact dicts with 'email' or 'first_name'/'last_name'
+            force_refresh: Skip the response cache and call Apollo for every contact
 
         Returns:
-            List of enriched contact data
+            List of enriched contact data, in the same order as `contacts`
         """
-        results = []
-
-        for contact in contacts:
-            try:
-                enriched = await self.enrich_person(
-                    email=contact.get('email'),
-                    first_name=contact.get('first_name'),
-                    last_name=contact.get('last_name'),
-                    organization_name=contact.get('organization_name'),
-                    domain=contact.get('domain'),
-                )
-                results.append({
-                    'original': contact,
-                    'enriched': enriched,
-                })
-            except Exception as e:
-                logger.warning(f"Failed to enrich contact {contact.get('email')}: {e}")
-                results.append({
-                    'original': contact,
+        keys = [
+            ApolloCache.person_key(
+                contact.get('email'),
+                contact.get('first_name'),
+                contact.get('last_name'),
+                contact.get('organization_name'),
+                contact.get('domain'),
+            )
+            for contact in contacts
+        ]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contacts)
+        if self.cache and not force_refresh:
+            cached = self.cache.get_many(keys)
+            for i, key in enumerate(keys):
+                if key in cached:
+                    results[i] = {'original': contacts[i], 'enriched': cached[key]}
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        if not self.api_key:
+            raise ApolloAPIError("Apollo API key not configured")
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = [
+            pending[i:i + self.BULK_MATCH_BATCH_SIZE]
+            for i in range(0, len(pending), self.BULK_MATCH_BATCH_SIZE)
+        ]
+
+        async def run_batch(indexes: List[int]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._bulk_match_batch([contacts[i] for i in indexes])
+
+        batch_results = await asyncio.gather(*(run_batch(indexes) for indexes in batches))
+
+        to_cache = {}
+        for indexes, batch in zip(batches, batch_results):
+            for i, result in zip(indexes, batch):
+                results[i] = result
+                # Only cache definitive answers (match / not found), never transport errors
+                if result['enriched'].get('source') == 'apollo.io':
+                    to_cache[keys[i]] = result['enriched']
+
+        if self.cache and to_cache:
+            self.cache.set_many('person', to_cache)
+
+        return results
+
+    async def _bulk_match_batch(self, batch: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Enrich one group of contacts with a single /people/bulk_match call."""
+        details = [
+            self._build_person_payload(
+                email=contact.get('email'),
+                first_name=contact.get('first_name'),
+                last_name=contact.get('last_name'),
+                organization_name=contact.get('organization_name'),
+                domain=contact.get('domain'),
+            )
+            for contact in batch
+        ]
+
+        results = [None] * len(batch)
+        request_indexes = []
+        for i, detail in enumerate(details):
+            if detail:
+                request_indexes.append(i)
+            else:
+                results[i] = {
+                    'original': batch[i],
+                    'enriched': {'success': False, 'error': 'At least one search parameter required'},
+                }
+
+        if not request_indexes:
+            return results
+
+        try:
+            response = await self._post(
+                "/people/bulk_match",
+                {'details': [details[i] for i in request_indexes]},
+            )
+
+            if response.status_code != 200:
+                error_msg = response.json().get('error', response.text)
+                raise ApolloAPIError(f"Apollo API error ({response.status_code}): {error_msg}")
+
+            matches = response.json().get('matches') or []
+
+            for position, i in enumerate(request_indexes):
+                person = matches[position] if position < len(matches) else None
+                results[i] = {
+                    'original': batch[i],
+                    'enriched': self._format_person(person) if person else self._person_not_found(),
+                }
+
+        except Exception as e:
+            logger.warning(f"Failed to bulk enrich {len(request_indexes)} contacts: {e}")
+            for i in request_indexes:
+                results[i] = {
+                    'original': batch[i],
                     'enriched': {
                         'success': False,
                         'error': str(e),
                     },
-                })
+                }
 
         return results
 
+    def _cache_set(self, key: Optional[str], lookup_type: str, response: Dict[str, Any]):
+        if self.cache:
+            self.cache.set(key, lookup_type, response)
+
     async def get_account_credits(self) -> Dict[str, Any]:
         """
         Get remaining Apollo.io API credits.
@@ -379,14 +622,18 @@ class ApolloService:
         try:
             # Apollo doesn't have a dedicated credits endpoint
             # Return placeholder data directing users to check their dashboard
+            credits = {
+                'email_credits': 'Check Apollo dashboard',
+                'export_credits': 'Check Apollo dashboard',
+                'daily_request_limit': 100,
+                'requests_made_today': 0,
+            }
+            if self.cache:
+                credits['cache'] = self.cache.get_stats()
+
             return {
                 'success': True,
-                'credits': {
-                    'email_credits': 'Check Apollo dashboard',
-                    'export_credits': 'Check Apollo dashboard',
-                    'daily_request_limit': 100,
-                    'requests_made_today': 0,
-                }
+                'credits': credits,
             }
 
         except Exception as e:
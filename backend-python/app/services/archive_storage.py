@@ -0,0 +1,74 @@
+"""
+Object storage for archived data (audit log months, parsed email bodies).
+
+S3 in production; a local directory stands in when no bucket is
+configured (development, tests, or a mounted volume).
+"""
+import os
+import shutil
+from typing import Optional
+
+from app.config import settings
+
+
+class LocalArchiveStore:
+    """Archives written under a local directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def put(self, key: str, path: str) -> str:
+        destination = self._path(key)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copyfile(path, destination)
+        return os.path.abspath(destination)
+
+    def put_bytes(self, key: str, data: bytes) -> str:
+        destination = self._path(key)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        with open(destination, "wb") as archive:
+            archive.write(data)
+        return os.path.abspath(destination)
+
+    def get_bytes(self, key: str) -> bytes:
+        with open(self._path(key), "rb") as archive:
+            return archive.read()
+
+
+class S3ArchiveStore:
+    """Archives stored in an S3 bucket under an optional key prefix."""
+
+    def __init__(self, bucket: str, prefix: str = ""):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = boto3.client(
+            's3',
+            region_name=settings.AWS_REGION,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        )
+
+    def put(self, key: str, path: str) -> str:
+        object_key = f"{self.prefix}{key}"
+        self.client.upload_file(path, self.bucket, object_key, ExtraArgs={"ContentEncoding": "gzip"})
+        return f"s3://{self.bucket}/{object_key}"
+
+    def put_bytes(self, key: str, data: bytes) -> str:
+        object_key = f"{self.prefix}{key}"
+        self.client.put_object(Bucket=self.bucket, Key=object_key, Body=data, ContentEncoding="gzip")
+        return f"s3://{self.bucket}/{object_key}"
+
+    def get_bytes(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=f"{self.prefix}{key}")["Body"].read()
+
+
+def get_archive_store(bucket: Optional[str], prefix: str, directory: str):
+    """S3 store when `bucket` is set, otherwise a local store rooted at `directory`."""
+    if bucket:
+        return S3ArchiveStore(bucket, prefix)
+    return LocalArchiveStore(directory)
@@ -0,0 +1,325 @@
+"""
+Audit Log Maintenance
+
+audit_log is append-only and range-partitioned by month on created_at
+(audit_log_pYYYYMM, plus audit_log_default for anything outside them).
+This module:
+
+- keeps partitions created a few months ahead of the current one
+- archives months older than the retention window as gzipped JSONL to S3
+  (or a local directory when no bucket is configured), then drops the
+  month's partition, or deletes the rows when they sit in the default
+  partition / an unpartitioned table
+- serves the admin filter dropdowns (distinct table names and actions)
+  from an in-process cache fed by a loose index scan
+
+Maintenance runs daily on the shared background scheduler and can be run by hand
+with scripts/archive_audit_log.py.
+"""
+import gzip
+import logging
+import os
+import re
+import tempfile
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, sync_engine
+from app.services.archive_storage import get_archive_store
+from app.services.export_service import stream_export
+from app.services.scheduler import scheduler
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PREFIX = "audit_log_p"
+DEFAULT_PARTITION = "audit_log_default"
+PARTITION_NAME = re.compile(r"^audit_log_p(\d{4})(\d{2})$")
+
+# Partitions kept ready ahead of the current month
+MONTHS_AHEAD = 3
+
+# pg advisory lock so only one process runs maintenance at a time
+MAINTENANCE_LOCK_KEY = 0x15A5_0041
+
+# Columns with a (column, created_at) index, so DISTINCT can skip-scan them
+LOOKUP_COLUMNS = ("table_name", "action")
+
+lookup_cache = TTLCache(ttl_seconds=settings.AUDIT_LOG_LOOKUP_CACHE_TTL_SECONDS)
+
+
+class AuditArchiveError(Exception):
+    """Raised when an archived month doesn't match what is about to be removed."""
+
+
+def _month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+# ============================================
+# DISTINCT VALUE LOOKUPS
+# ============================================
+
+def distinct_values(db: Session, column: str) -> List[str]:
+    """
+    Distinct non-null values of `column`, sorted.
+
+    Walks the (column, created_at) index one value at a time (recursive
+    CTE), so the cost grows with the number of distinct values rather than
+    the number of audit rows.
+    """
+    if column not in LOOKUP_COLUMNS:
+        raise ValueError(f"Unsupported audit log lookup column: {column}")
+
+    rows = db.execute(text(f"""
+        WITH RECURSIVE walk AS (
+            (SELECT {column} AS value FROM audit_log WHERE {column} IS NOT NULL ORDER BY {column} LIMIT 1)
+            UNION ALL
+            SELECT (
+                SELECT {column} FROM audit_log WHERE {column} > walk.value ORDER BY {column} LIMIT 1
+            )
+            FROM walk
+            WHERE walk.value IS NOT NULL
+        )
+        SELECT value FROM walk WHERE value IS NOT NULL
+    """)).fetchall()
+    return [row.value for row in rows]
+
+
+def cached_distinct_values(db: Session, column: str) -> List[str]:
+    return lookup_cache.get_or_set(column, lambda: distinct_values(db, column))
+
+
+# ============================================
+# PARTITIONS
+# ============================================
+
+def is_partitioned(db: Session) -> bool:
+    return bool(db.execute(text("""
+        SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass('audit_log'))
+    """)).scalar())
+
+
+def attached_partitions(db: Session) -> Dict[date, str]:
+    """Monthly partitions currently attached to audit_log, keyed by month."""
+    rows = db.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = to_regclass('audit_log')
+    """)).fetchall()
+
+    partitions = {}
+    for row in rows:
+        match = PARTITION_NAME.match(row.relname)
+        if match:
+            partitions[date(int(match.group(1)), int(match.group(2)), 1)] = row.relname
+    return partitions
+
+
+def ensure_partitions(db: Session, months_ahead: int = MONTHS_AHEAD) -> List[str]:
+    """
+    Create the default partition and monthly partitions from the current
+    month through `months_ahead` months out. Returns the names created.
+    No-op when audit_log isn't partitioned. The caller commits.
+    """
+    if not is_partitioned(db):
+        return []
+
+    db.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF audit_log DEFAULT"))
+
+    existing = attached_partitions(db)
+    created = []
+    current = _month_start(datetime.utcnow())
+    for offset in range(months_ahead + 1):
+        month = _add_months(current, offset)
+        if month in existing:
+            continue
+        name = partition_name(month)
+        db.execute(text(
+            f"CREATE TABLE {name} PARTITION OF audit_log "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        ))
+        created.append(name)
+    return created
+
+
+def ensure_audit_log_partitions() -> None:
+    """Startup hook: make sure inserts have a partition to land in."""
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db)
+        db.commit()
+        if created:
+            logger.info(f"[AuditLog] Created partitions: {', '.join(created)}")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[AuditLog] Failed to create partitions: {str(e)}")
+    finally:
+        db.close()
+
+
+# ============================================
+# ARCHIVAL
+# ============================================
+
+def months_to_archive(db: Session, cutoff: date) -> List[date]:
+    """Months before `cutoff` that still have audit rows (or an empty partition to drop)."""
+    if not is_partitioned(db):
+        oldest = db.execute(text("SELECT MIN(created_at) FROM audit_log")).scalar()
+        months = []
+        month = _month_start(oldest) if oldest else cutoff
+        while month < cutoff:
+            months.append(month)
+            month = _add_months(month, 1)
+        return months
+
+    months = {month for month in attached_partitions(db) if month < cutoff}
+    stragglers = db.execute(text(f"""
+        SELECT DISTINCT date_trunc('month', created_at)::date AS month
+        FROM {DEFAULT_PARTITION}
+        WHERE created_at < :cutoff
+    """), {"cutoff": cutoff}).fetchall()
+    months.update(row.month for row in stragglers)
+    return sorted(months)
+
+
+def _export_month(month: date, path: str) -> int:
+    """Write the month's rows to `path` as gzipped JSONL; returns the row count."""
+    statement = text(
+        "SELECT * FROM audit_log WHERE created_at >= :start AND created_at < :end ORDER BY created_at, id"
+    ).bindparams(start=month, end=_add_months(month, 1))
+
+    rows = 0
+    with gzip.open(path, "wb") as archive:
+        for chunk in stream_export(statement, "ndjson"):
+            rows += chunk.count(b"\n")
+            archive.write(chunk)
+    return rows
+
+
+def archive_month(db: Session, store, month: date) -> dict:
+    """
+    Export one month to the archive store, then remove it from audit_log.
+
+    The row count is re-checked inside the removal transaction; if rows
+    arrived after the export, nothing is removed and AuditArchiveError is
+    raised (the next run exports the month again).
+    """
+    start, end = month, _add_months(month, 1)
+    partition = attached_partitions(db).get(month)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "archive.jsonl.gz")
+        exported = _export_month(month, path)
+        location = None
+        if exported:
+            key = f"audit_log/{month:%Y}/audit_log_{month:%Y-%m}_{datetime.utcnow():%Y%m%dT%H%M%S}.jsonl.gz"
+            location = store.put(key, path)
+
+    if partition:
+        db.execute(text(f"LOCK TABLE {partition} IN ACCESS EXCLUSIVE MODE"))
+        remaining = db.execute(text(f"SELECT COUNT(*) FROM {partition}")).scalar()
+        if remaining != exported:
+            db.rollback()
+            raise AuditArchiveError(f"{partition}: exported {exported} rows but {remaining} are present")
+        db.execute(text(f"ALTER TABLE audit_log DETACH PARTITION {partition}"))
+        db.execute(text(f"DROP TABLE {partition}"))
+    else:
+        removed = db.execute(
+            text("DELETE FROM audit_log WHERE created_at >= :start AND created_at < :end"),
+            {"start": start, "end": end},
+        ).rowcount
+        if removed != exported:
+            db.rollback()
+            raise AuditArchiveError(f"{month:%Y-%m}: exported {exported} rows but {removed} were present")
+    db.commit()
+
+    logger.info(f"[AuditLog] Archived {exported} rows for {month:%Y-%m} to {location or '(nothing to archive)'}")
+    return {"month": f"{month:%Y-%m}", "rows": exported, "location": location, "dropped_partition": partition}
+
+
+def run_audit_log_maintenance(retention_months: Optional[int] = None, dry_run: bool = False) -> dict:
+    """
+    Create upcoming partitions and archive months older than the retention window.
+
+    Returns a summary; `skipped` is True when another process holds the
+    maintenance lock.
+    """
+    retention_months = retention_months if retention_months is not None else settings.AUDIT_LOG_RETENTION_MONTHS
+    cutoff = _add_months(_month_start(datetime.utcnow()), -retention_months)
+
+    # Session-level lock on a dedicated connection, held across the
+    # per-month commits below
+    with sync_engine.connect() as connection:
+        if not connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}).scalar():
+            connection.rollback()
+            return {"skipped": True}
+        connection.commit()
+
+        db = Session(bind=connection)
+        try:
+            created = [] if dry_run else ensure_partitions(db)
+            db.commit()
+
+            months = months_to_archive(db, cutoff)
+            db.commit()
+            summary = {
+                "skipped": False,
+                "cutoff": cutoff.isoformat(),
+                "created_partitions": created,
+                "months": [f"{month:%Y-%m}" for month in months],
+                "archived": [],
+            }
+            if dry_run:
+                return summary
+
+            store = get_archive_store(
+                settings.AUDIT_LOG_ARCHIVE_BUCKET, settings.AUDIT_LOG_ARCHIVE_PREFIX, settings.AUDIT_LOG_ARCHIVE_DIR
+            )
+            for month in months:
+                summary["archived"].append(archive_month(db, store, month))
+            if summary["archived"]:
+                lookup_cache.invalidate()
+            return summary
+        finally:
+            db.close()
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY})
+            connection.commit()
+
+
+def _run_maintenance():
+    try:
+        summary = run_audit_log_maintenance()
+        if summary.get("archived") or summary.get("created_partitions"):
+            logger.info(f"[AuditLog] Maintenance: {summary}")
+    except Exception as e:
+        logger.error(f"[AuditLog] Maintenance failed: {str(e)}", exc_info=True)
+
+
+def schedule_audit_log_maintenance():
+    """Register daily audit log maintenance with the shared scheduler."""
+    scheduler.add_job(
+        _run_maintenance,
+        "interval",
+        job_id="audit_log_maintenance",
+        hours=24,
+        next_run_time=datetime.now(),
+    )
+    logger.info(
+        f"[AuditLog] Maintenance scheduled "
+        f"(daily, retention {settings.AUDIT_LOG_RETENTION_MONTHS} months)"
+    )
@@ -83,7 +83,8 @@ class AuthService:
         db: Session, email: str, attendee_id: str, ip_address: Optional[str] = None, user_agent: Optional[str] = None
     ) -> tuple[UserSession, str]:
         """
-        Create a new magic link session for a user.
+        Create a new magic link session for a user. The caller commits
+        (typically together with the queued login email).
 
         Args:
             db: Database session
@@ -110,8 +111,7 @@ class AuthService:
         )
 
         db.add(user_session)
-        db.commit()
-        db.refresh(user_session)
+        db.flush()
 
         # Build magic link URL
         magic_link_url = f"{settings.MAGIC_LINK_BASE_URL}/member/verify.html?token={magic_link_token}"
@@ -0,0 +1,289 @@
+"""
+Bounce Queue and Suppression List
+
+Inbound bounce notifications only enqueue the bounced address
+(email_bounces). A scheduler drains the queue in batches; each batch is a
+handful of set-based statements regardless of its size:
+
+- every bounced address is upserted into email_suppressions
+- contacts holding a bounced address (GIN lookup on all_emails_normalized)
+  are fixed in one statement: bounced/blank alternates are dropped, a
+  bounced primary is replaced by the first remaining alternate (unless
+  another contact has or is about to get that address, recorded as a
+  promotion_conflict), and a contact with no deliverable address left is
+  deleted
+- the outcome is recorded on each bounce row
+
+EmailService.send_email checks is_suppressed() (in a worker thread) before
+every send; bulk senders should filter recipients with
+suppressed_addresses().
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, sync_engine
+from app.models.email_bounce import EmailBounce
+from app.services.scheduler import scheduler
+from app.utils.normalization import EMAIL_PATTERN, normalize_email
+
+logger = logging.getLogger(__name__)
+
+CLAIM_BATCH_SQL = text("""
+    SELECT id, email
+    FROM email_bounces
+    WHERE processed_at IS NULL
+    ORDER BY id
+    LIMIT :batch_size
+    FOR UPDATE SKIP LOCKED
+""")
+
+UPSERT_SUPPRESSIONS_SQL = text("""
+    INSERT INTO email_suppressions (email, reason, bounce_count, created_at, last_bounced_at)
+    SELECT email, 'hard_bounce', COUNT(*), NOW(), MAX(received_at)
+    FROM email_bounces
+    WHERE id = ANY(:ids)
+    GROUP BY email
+    ON CONFLICT (email) DO UPDATE SET
+        bounce_count = email_suppressions.bounce_count + EXCLUDED.bounce_count,
+        last_bounced_at = GREATEST(email_suppressions.last_bounced_at, EXCLUDED.last_bounced_at)
+""")
+
+# Normalized, de-duplicated address list in original order (SQL twin of
+# normalize_email_list)
+_NORMALIZED_LIST = """
+    ARRAY(
+        SELECT address FROM (
+            SELECT LOWER(BTRIM(value)) AS address, MIN(position) AS position
+            FROM unnest({addresses}) WITH ORDINALITY AS u(value, position)
+            GROUP BY 1
+        ) normalized
+        ORDER BY position
+    )
+"""
+
+APPLY_BOUNCES_SQL = text(f"""
+    WITH locked AS (
+        SELECT c.id, c.email, c.email_normalized, c.all_emails_normalized,
+               c.email_normalized = ANY(:emails) AS primary_bounced,
+               r.remaining,
+               EXISTS (
+                   SELECT 1 FROM contacts other
+                   WHERE other.email = r.remaining[1] AND other.id <> c.id
+               ) AS address_taken
+        FROM contacts c
+        CROSS JOIN LATERAL (
+            -- Alternates that are still deliverable, in their original order
+            SELECT ARRAY(
+                SELECT BTRIM(alt)
+                FROM unnest(c.alternate_emails) WITH ORDINALITY AS u(alt, position)
+                WHERE BTRIM(COALESCE(alt, '')) <> '' AND LOWER(BTRIM(alt)) <> ALL(:emails)
+                ORDER BY position
+            )::varchar[] AS remaining
+        ) r
+        WHERE c.all_emails_normalized && CAST(:emails AS varchar[])
+        FOR UPDATE OF c
+    ),
+    affected AS (
+        -- A promotion conflicts when another contact already has the address,
+        -- or when several contacts in this batch would promote the same one
+        -- (the lowest id wins)
+        SELECT l.*,
+               l.address_taken OR (
+                   l.primary_bounced AND cardinality(l.remaining) > 0
+                   AND ROW_NUMBER() OVER (
+                       PARTITION BY CASE WHEN l.primary_bounced THEN l.remaining[1] END
+                       ORDER BY l.id
+                   ) > 1
+               ) AS promotion_conflict
+        FROM locked l
+    ),
+    deleted AS (
+        DELETE FROM contacts c
+        USING affected a
+        WHERE c.id = a.id AND a.primary_bounced AND cardinality(a.remaining) = 0
+        RETURNING c.id
+    ),
+    promoted AS (
+        UPDATE contacts c
+        SET email = a.remaining[1],
+            email_normalized = LOWER(a.remaining[1]),
+            email_status = CASE WHEN a.remaining[1] ~ :email_pattern THEN 'valid' ELSE 'invalid' END,
+            alternate_emails = a.remaining[2:],
+            all_emails_normalized = {_NORMALIZED_LIST.format(addresses="a.remaining")},
+            updated_at = NOW()
+        FROM affected a
+        WHERE c.id = a.id AND a.primary_bounced AND cardinality(a.remaining) > 0 AND NOT a.promotion_conflict
+        RETURNING c.id
+    ),
+    pruned AS (
+        UPDATE contacts c
+        SET alternate_emails = a.remaining,
+            all_emails_normalized = {_NORMALIZED_LIST.format(addresses="ARRAY[a.email] || a.remaining")},
+            updated_at = NOW()
+        FROM affected a
+        WHERE c.id = a.id AND NOT a.primary_bounced
+        RETURNING c.id
+    )
+    SELECT bounced.email, a.id AS contact_id,
+           CASE
+               WHEN bounced.email <> a.email_normalized OR NOT a.primary_bounced THEN 'removed_alternate'
+               WHEN cardinality(a.remaining) = 0 THEN 'deleted_contact'
+               WHEN a.promotion_conflict THEN 'promotion_conflict'
+               ELSE 'promoted_alternate'
+           END AS action
+    FROM affected a
+    JOIN unnest(CAST(:emails AS varchar[])) AS bounced(email) ON bounced.email = ANY(a.all_emails_normalized)
+""")
+
+RECORD_OUTCOMES_SQL = text("""
+    UPDATE email_bounces b
+    SET processed_at = NOW(), action = o.action, contact_id = o.contact_id
+    FROM unnest(CAST(:emails AS varchar[]), CAST(:actions AS varchar[]), CAST(:contact_ids AS uuid[]))
+        AS o(email, action, contact_id)
+    WHERE b.id = ANY(:ids) AND b.email = o.email
+""")
+
+
+# ============================================
+# QUEUE
+# ============================================
+
+def enqueue_bounce(db: Session, email: str, parsed_email_id: Optional[int] = None) -> Optional[EmailBounce]:
+    """Queue a bounced address for the next batch. The caller commits."""
+    address = normalize_email(email)
+    if not address:
+        return None
+    bounce = EmailBounce(email=address, parsed_email_id=parsed_email_id)
+    db.add(bounce)
+    return bounce
+
+
+def process_bounce_batch(db: Session, batch_size: int) -> Dict[str, int]:
+    """
+    Apply up to `batch_size` queued bounces and commit.
+
+    Returns counts per action (empty when the queue is empty).
+    """
+    claimed = db.execute(CLAIM_BATCH_SQL, {"batch_size": batch_size}).fetchall()
+    if not claimed:
+        db.rollback()
+        return {}
+
+    ids = [row.id for row in claimed]
+    emails = sorted({row.email for row in claimed})
+
+    db.execute(UPSERT_SUPPRESSIONS_SQL, {"ids": ids})
+
+    outcomes = {email: ("not_found", None) for email in emails}
+    for row in db.execute(APPLY_BOUNCES_SQL, {"emails": emails, "email_pattern": EMAIL_PATTERN}):
+        # An address on several contacts keeps the most significant outcome
+        if outcomes[row.email][0] in ("not_found", "removed_alternate"):
+            outcomes[row.email] = (row.action, row.contact_id)
+
+    db.execute(RECORD_OUTCOMES_SQL, {
+        "ids": ids,
+        "emails": emails,
+        "actions": [outcomes[email][0] for email in emails],
+        "contact_ids": [str(outcomes[email][1]) if outcomes[email][1] else None for email in emails],
+    })
+    db.commit()
+
+    counts: Dict[str, int] = {}
+    for row in claimed:
+        action = outcomes[row.email][0]
+        counts[action] = counts.get(action, 0) + 1
+    return counts
+
+
+def process_bounce_queue(batch_size: Optional[int] = None, max_batches: Optional[int] = None) -> Dict[str, int]:
+    """Drain the bounce queue batch by batch; returns totals per action."""
+    batch_size = batch_size or settings.BOUNCE_QUEUE_BATCH_SIZE
+    totals: Dict[str, int] = {}
+    batches = 0
+
+    db = SessionLocal()
+    try:
+        while max_batches is None or batches < max_batches:
+            counts = process_bounce_batch(db, batch_size)
+            if not counts:
+                break
+            batches += 1
+            for action, count in counts.items():
+                totals[action] = totals.get(action, 0) + count
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if totals:
+        logger.info(f"[Bounces] Applied {sum(totals.values())} bounces in {batches} batches: {totals}")
+    return totals
+
+
+# ============================================
+# SUPPRESSION LIST
+# ============================================
+
+def is_suppressed(email: str) -> bool:
+    """
+    Whether `email` is on the suppression list.
+
+    Runs a blocking query on its own connection, so async callers should
+    call it in a worker thread (asyncio.to_thread). Fails open (logs and
+    returns False) if the lookup itself fails, so a database hiccup doesn't
+    block transactional mail such as login links.
+    """
+    address = normalize_email(email)
+    if not address:
+        return False
+    try:
+        with sync_engine.connect() as connection:
+            return connection.execute(
+                text("SELECT 1 FROM email_suppressions WHERE email = :email"), {"email": address}
+            ).first() is not None
+    except Exception as e:
+        logger.warning(f"[Bounces] Suppression lookup failed for {address}: {str(e)}")
+        return False
+
+
+def suppressed_addresses(db: Session, emails: Iterable[str]) -> Set[str]:
+    """The normalized addresses among `emails` that are suppressed (one query)."""
+    addresses = sorted({address for address in (normalize_email(email) for email in emails) if address})
+    if not addresses:
+        return set()
+    rows = db.execute(
+        text("SELECT email FROM email_suppressions WHERE email = ANY(:emails)"), {"emails": addresses}
+    ).fetchall()
+    return {row.email for row in rows}
+
+
+# ============================================
+# SCHEDULER
+# ============================================
+
+def _run_bounce_queue():
+    try:
+        process_bounce_queue()
+    except Exception as e:
+        logger.error(f"[Bounces] Bounce processing failed: {str(e)}", exc_info=True)
+
+
+def schedule_bounce_queue():
+    """Register the bounce queue drain with the shared scheduler."""
+    scheduler.add_job(
+        _run_bounce_queue,
+        "interval",
+        job_id="bounce_queue",
+        seconds=settings.BOUNCE_QUEUE_INTERVAL_SECONDS,
+        next_run_time=datetime.now(),
+    )
+    logger.info(
+        f"[Bounces] Bounce queue scheduled "
+        f"(every {settings.BOUNCE_QUEUE_INTERVAL_SECONDS}s, batches of {settings.BOUNCE_QUEUE_BATCH_SIZE})"
+    )
@@ -1,12 +1,14 @@
 """
 Bounceback handler service for managing email delivery failures.
-Detects bounce notifications and removes invalid email addresses from contacts.
+Detects bounce notifications and queues the failed address; contacts and the
+suppression list are updated in batches by app.services.bounce_queue.
 """
 import logging
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+
+from app.services.bounce_queue import enqueue_bounce
 
 logger = logging.getLogger(__name__)
 
@@ -115,139 +117,21 @@ class BouncebackHandler:
         return None
 
     @staticmethod
-    def remove_email_from_contact(db: Session, email_address: str) -> Dict[str, Any]:
-        """
-        Remove an email address from contact records.
-
-        If the email is a primary email, delete the entire contact.
-        If it's an alternate email, remove it from the alternate_emails array.
-
-        Args:
-            db: Database session
-            email_address: Email address to remove
-
-        Returns:
-            Dict with success status and action taken
+    def process_bounceback(
+        db: Session,
+        email_data: Dict[str, Any],
+        parsed_email_id: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
-        try:
-            email_lower = email_address.lower()
-
-            # Check if it's a primary email
-            result = db.execute(text('''
-                SELECT id, email, first_name, last_name, alternate_emails
-                FROM contacts
-                WHERE LOWER(email) = :email
-            '''), {'email': email_lower})
-
-            contact = result.fetchone()
-
-            if contact:
-                contact_id, primary_email, first_name, last_name, alternate_emails = contact
-
-                # If there are alternate emails, promote the first one to primary
-                if alternate_emails and len(alternate_emails) > 0:
-                    new_primary = alternate_emails[0]
-                    remaining_alternates = alternate_emails[1:]
-
-                    db.execute(text('''
-                        UPDATE contacts
-                        SET email = :new_primary,
-                            alternate_emails = :remaining
-                        WHERE id = :contact_id
-                    '''), {
-                        'new_primary': new_primary,
-                        'remaining': remaining_alternates,
-                        'contact_id': contact_id
-                    })
-                    db.commit()
-
-                    logger.info(f"Promoted {new_primary} to primary for contact {contact_id}, removed bounced {email_lower}")
-                    return {
-                        'success': True,
-                        'action': 'promoted_alternate',
-                        'contact_id': str(contact_id),
-                        'removed_email': email_lower,
-                        'new_primary': new_primary,
-                        'name': f"{first_name} {last_name}".strip()
-                    }
-                else:
-                    # No alternates, delete the contact entirely
-                    db.execute(text('''
-                        DELETE FROM contacts
-                        WHERE id = :contact_id
-                    '''), {'contact_id': contact_id})
-                    db.commit()
-
-                    logger.warning(f"Deleted contact {contact_id} ({first_name} {last_name}) - no valid email addresses")
-                    return {
-                        'success': True,
-                        'action': 'deleted_contact',
-                        'contact_id': str(contact_id),
-                        'removed_email': email_lower,
-                        'name': f"{first_name} {last_name}".strip()
-                    }
-
-            # Check if it's an alternate email
-            result = db.execute(text('''
-                SELECT id, email, first_name, last_name, alternate_emails
-                FROM contacts
-                WHERE :email = ANY(alternate_emails)
-            '''), {'email': email_lower})
+        Process a bounceback email by queueing the failed address.
 
-            contact = result.fetchone()
-
-            if contact:
-                contact_id, primary_email, first_name, last_name, alternate_emails = contact
-
-                # Remove from alternates array
-                updated_alternates = [e for e in alternate_emails if e.lower() != email_lower]
-
-                db.execute(text('''
-                    UPDATE contacts
-                    SET alternate_emails = :updated
-                    WHERE id = :contact_id
-                '''), {
-                    'updated': updated_alternates,
-                    'contact_id': contact_id
-                })
-                db.commit()
-
-                logger.info(f"Removed {email_lower} from alternate emails for contact {contact_id}")
-                return {
-                    'success': True,
-                    'action': 'removed_alternate',
-                    'contact_id': str(contact_id),
-                    'removed_email': email_lower,
-                    'primary_email': primary_email,
-                    'name': f"{first_name} {last_name}".strip()
-                }
-
-            # Email not found in any contact
-            logger.info(f"Email {email_lower} not found in any contact")
-            return {
-                'success': False,
-                'action': 'not_found',
-                'removed_email': email_lower
-            }
-
-        except Exception as e:
-            logger.error(f"Error removing email {email_address}: {e}")
-            db.rollback()
-            return {
-                'success': False,
-                'action': 'error',
-                'error': str(e),
-                'removed_email': email_address
-            }
-
-    @staticmethod
-    def process_bounceback(db: Session, email_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Process a bounceback email and handle the failed address.
+        The caller commits; the bounce queue applies it to contacts and the
+        suppression list shortly after.
 
         Args:
             db: Database session
             email_data: Parsed email data from EmailParser
+            parsed_email_id: Stored ParsedEmail for the notification, if any
 
         Returns:
             Dict with processing results
@@ -272,13 +156,13 @@ class BouncebackHandler:
                 'message': 'Could not extract failed email address from bounce notification'
             }
 
-        # Remove the email from contacts
-        removal_result = BouncebackHandler.remove_email_from_contact(db, failed_email)
+        # Contacts and the suppression list are updated by the bounce queue
+        enqueue_bounce(db, failed_email, parsed_email_id=parsed_email_id)
 
         return {
             'success': True,
             'is_bounceback': True,
             'failed_email': failed_email,
-            'removal_result': removal_result,
-            'message': f"Processed bounceback for {failed_email}"
+            'queued': True,
+            'message': f"Queued bounceback for {failed_email}"
         }
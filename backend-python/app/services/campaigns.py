@@ -0,0 +1,299 @@
+"""
+Email Campaigns
+
+A campaign's recipients are a segment: one SQL statement over contacts and
+attendee profiles, built from a small filter spec (see segment_query). The
+segment always excludes suppressed addresses and anyone whose profile has
+notifications off or has opted out of the campaign's preference.
+
+Sending materializes the segment as a background job (app.services.job_runner)
+with one item per address, so the job items are the durable send log:
+status, provider message ID or error, and processed_at per recipient. Each
+chunk re-checks its recipients against the segment before sending, sends
+through EmailService.send_bulk (paced by the shared send_throttle) and is
+committed with its item checkpoints. A crashed or stopped send resumes at
+the first unsent chunk; at most one chunk (CAMPAIGN_CHUNK_SIZE) can be sent
+twice if the process dies between the provider call and the commit.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.background_job import BackgroundJob
+from app.models.email_campaign import EmailCampaign
+from app.services.email_service import get_base_template
+from app.services.email_templates import render_template
+from app.services.job_runner import job_runner
+
+logger = logging.getLogger(__name__)
+
+CAMPAIGN_JOB_TYPE = "email_campaign"
+
+AUDIENCES = ("all", "contacts", "members")
+
+# notification_preferences keys a campaign can be gated on
+CAMPAIGN_PREFERENCES = ("conference_announcements", "admin_announcements", "member_directory")
+
+SEGMENT_KEYS = {"audience", "preference", "tags", "roles", "countries", "conference_id", "verified_only"}
+
+# Profiles that must not receive this campaign (matched by login email and
+# by linked contact's email)
+_OPTED_OUT = "(p.notifications_enabled IS FALSE OR p.notification_preferences ->> :preference = 'false')"
+
+
+class CampaignAlreadySent(ValueError):
+    """Raised when a campaign that already has a send job is sent again."""
+
+
+# ============================================
+# SEGMENTS
+# ============================================
+
+def segment_query(segment: Dict[str, Any], emails: Optional[Iterable[str]] = None) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Build the recipient query for a segment spec.
+
+    Spec keys (all optional):
+        audience: "all" (default), "contacts" or "members"
+        preference: notification_preferences key recipients must not have
+            turned off (default "conference_announcements")
+        tags: contacts with any of these tags (members via their linked contact)
+        roles: contacts with one of these roles (members via their linked contact)
+        countries: contacts/members in one of these countries
+        conference_id: registered for this conference
+        verified_only: members with a verified email only
+
+    With `emails`, the query is limited to those normalized addresses.
+
+    Returns:
+        (statement, bind params); rows are (email, first_name, last_name),
+        one per normalized address, ordered by address
+
+    Raises:
+        ValueError: for an unknown key, audience or preference
+    """
+    unknown = set(segment) - SEGMENT_KEYS
+    if unknown:
+        raise ValueError(f"Unknown segment fields: {', '.join(sorted(unknown))}")
+    audience = segment.get("audience") or "all"
+    if audience not in AUDIENCES:
+        raise ValueError(f"Audience must be one of: {', '.join(AUDIENCES)}")
+    preference = segment.get("preference") or "conference_announcements"
+    if preference not in CAMPAIGN_PREFERENCES:
+        raise ValueError(f"Preference must be one of: {', '.join(CAMPAIGN_PREFERENCES)}")
+
+    params: Dict[str, Any] = {"preference": preference}
+    contact_filters = ["c.email_normalized IS NOT NULL", "c.email_status IS DISTINCT FROM 'invalid'"]
+    member_filters = ["COALESCE(p.account_status, 'active') = 'active'"]
+
+    # Contact attributes; members qualify through their linked contact
+    linked = []
+    if segment.get("tags"):
+        params["tags"] = list(segment["tags"])
+        linked.append("c.tags && CAST(:tags AS text[])")
+    if segment.get("roles"):
+        params["roles"] = list(segment["roles"])
+        linked.append("c.role = ANY(:roles)")
+    if linked:
+        contact_filters.extend(linked)
+        member_filters.append(
+            f"EXISTS (SELECT 1 FROM contacts c WHERE c.id = p.contact_id AND {' AND '.join(linked)})"
+        )
+
+    if segment.get("countries"):
+        params["countries"] = list(segment["countries"])
+        contact_filters.append("c.country = ANY(:countries)")
+        member_filters.append("p.country = ANY(:countries)")
+    if segment.get("conference_id"):
+        params["conference_id"] = str(segment["conference_id"])
+        contact_filters.append(
+            "EXISTS (SELECT 1 FROM conference_registrations r "
+            "WHERE r.conference_id = CAST(:conference_id AS uuid) AND r.contact_id = c.id)"
+        )
+        member_filters.append(
+            "EXISTS (SELECT 1 FROM conference_registrations r "
+            "WHERE r.conference_id = CAST(:conference_id AS uuid) AND (r.attendee_id = p.id OR r.contact_id = p.contact_id))"
+        )
+    if segment.get("verified_only"):
+        member_filters.append("p.email_verified IS TRUE")
+
+    if emails is not None:
+        params["emails"] = sorted(set(emails))
+        contact_filters.append("c.email_normalized = ANY(:emails)")
+        member_filters.append("LOWER(BTRIM(p.user_email)) = ANY(:emails)")
+
+    branches = []
+    if audience in ("all", "members"):
+        branches.append(f"""
+            SELECT LOWER(BTRIM(p.user_email)) AS email, p.first_name, p.last_name, 0 AS source_rank
+            FROM attendee_profiles p
+            WHERE {' AND '.join(member_filters)}
+        """)
+    if audience in ("all", "contacts"):
+        branches.append(f"""
+            SELECT c.email_normalized AS email, c.first_name, c.last_name, 1 AS source_rank
+            FROM contacts c
+            WHERE {' AND '.join(contact_filters)}
+        """)
+
+    statement = text(f"""
+        WITH candidates AS (
+            {' UNION ALL '.join(branches)}
+        ),
+        opted_out AS (
+            SELECT LOWER(BTRIM(p.user_email)) AS email
+            FROM attendee_profiles p
+            WHERE {_OPTED_OUT}
+            UNION
+            SELECT c.email_normalized
+            FROM attendee_profiles p
+            JOIN contacts c ON c.id = p.contact_id
+            WHERE {_OPTED_OUT}
+        )
+        SELECT DISTINCT ON (r.email) r.email, r.first_name, r.last_name
+        FROM candidates r
+        WHERE r.email <> ''
+          AND NOT EXISTS (SELECT 1 FROM email_suppressions s WHERE s.email = r.email)
+          AND NOT EXISTS (SELECT 1 FROM opted_out o WHERE o.email = r.email)
+        ORDER BY r.email, r.source_rank
+    """)
+    return statement, params
+
+
+def preview_segment(db: Session, segment: Dict[str, Any], sample_size: int = 20) -> Dict[str, Any]:
+    """Recipient count and the first few recipients of a segment."""
+    statement, params = segment_query(segment)
+    total = db.execute(text(f"SELECT COUNT(*) FROM ({statement.text}) segment"), params).scalar()
+    sample = db.execute(text(f"{statement.text} LIMIT :sample_size"), {**params, "sample_size": sample_size})
+    return {
+        "total": total,
+        "sample": [
+            {"email": row.email, "first_name": row.first_name, "last_name": row.last_name}
+            for row in sample
+        ],
+    }
+
+
+def template_data(first_name: Optional[str], last_name: Optional[str], email: str) -> Dict[str, str]:
+    """Per-recipient placeholder values; blanks are left out so default_data applies."""
+    full_name = " ".join(part for part in (first_name, last_name) if part)
+    data = {"email": email, "first_name": first_name, "last_name": last_name, "full_name": full_name}
+    return {key: value.strip() for key, value in data.items() if value and value.strip()}
+
+
+def eligible_recipients(db: Session, segment: Dict[str, Any], emails: List[str]) -> Dict[str, Dict[str, str]]:
+    """The addresses among `emails` still in the segment, with their template data."""
+    statement, params = segment_query(segment, emails=emails)
+    return {
+        row.email: template_data(row.first_name, row.last_name, row.email)
+        for row in db.execute(statement, params)
+    }
+
+
+# ============================================
+# SENDING
+# ============================================
+
+def campaign_message(campaign: EmailCampaign) -> Tuple[str, str, Optional[str]]:
+    """(subject, html, text) templates as sent, with the body in the branded base template."""
+    return (
+        campaign.subject,
+        get_base_template(campaign.html_template, campaign.preheader or ""),
+        campaign.text_template,
+    )
+
+
+def render_campaign(
+    campaign: EmailCampaign,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    email: str = "recipient@example.org",
+) -> Tuple[str, str, Optional[str]]:
+    """(subject, html, text) as one recipient receives them, via the compiled-template cache."""
+    values = {**(campaign.default_data or {}), **template_data(first_name, last_name, email)}
+    subject, html, text = campaign_message(campaign)
+    return (
+        render_template(subject, values),
+        render_template(html, values, escape=True),
+        render_template(text, values) if text else None,
+    )
+
+
+def start_campaign(db: Session, campaign: EmailCampaign, created_by: Optional[str] = None) -> BackgroundJob:
+    """
+    Snapshot the segment into a send job and queue it.
+
+    The campaign row is locked while the job is created and committed with
+    its job_id, so concurrent sends (a double click, a client retry) queue
+    exactly one job; the others see the campaign as sent.
+
+    Raises:
+        CampaignAlreadySent: if the campaign was already sent
+        ValueError: if its segment is invalid
+    """
+    locked = db.query(EmailCampaign).filter(
+        EmailCampaign.id == campaign.id
+    ).with_for_update().populate_existing().one()
+    if locked.job_id:
+        db.rollback()
+        raise CampaignAlreadySent("Campaign has already been sent")
+
+    try:
+        statement, params = segment_query(locked.segment or {})
+        emails = [row.email for row in db.execute(statement, params)]
+        job = job_runner.add_job(
+            db,
+            CAMPAIGN_JOB_TYPE,
+            emails,
+            params={"campaign_id": str(locked.id), "campaign_name": locked.name},
+            created_by=created_by,
+            chunk_size=settings.CAMPAIGN_CHUNK_SIZE,
+        )
+        locked.job_id = job.id
+        locked.sent_at = datetime.utcnow()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    job_runner.notify()
+    logger.info(f"[Campaigns] Queued '{locked.name}' to {len(emails)} recipients (job {job.id})")
+    return job
+
+
+def campaign_progress(job: Optional[BackgroundJob]) -> Optional[Dict[str, Any]]:
+    """Send progress with throughput and a completion estimate."""
+    if not job:
+        return None
+
+    summary = job.summary or {}
+    progress = {
+        "job_id": str(job.id),
+        "status": job.status,
+        "total": job.total_items,
+        "processed": job.processed_items,
+        "sent": summary.get("sent", 0),
+        "failed": job.failed_items,
+        "skipped": summary.get("left_segment", 0) + summary.get("suppressed", 0),
+        "progress_percent": job.progress_percent,
+        "messages_per_minute": None,
+        "eta_seconds": None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "error": job.error,
+    }
+
+    # Throughput over the time spent sending (heartbeat marks the last chunk)
+    end = job.finished_at or job.heartbeat_at
+    if job.started_at and end and job.processed_items:
+        elapsed = (end - job.started_at).total_seconds()
+        if elapsed > 0:
+            per_second = job.processed_items / elapsed
+            progress["messages_per_minute"] = round(per_second * 60, 1)
+            if job.status in ("queued", "running"):
+                progress["eta_seconds"] = round((job.total_items - job.processed_items) / per_second)
+    return progress
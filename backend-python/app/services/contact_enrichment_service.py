@@ -4,7 +4,6 @@ Auto-creates and enriches Contact/Organization records from parsed email data
 """
 import logging
 import json
-import re
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
@@ -13,6 +12,8 @@ from nameparser import HumanName
 from rapidfuzz import fuzz
 from app.models.contact import Contact, Organization
 from app.models.parsed_email import ParsedEmail
+from app.services.contact_lookup import find_contact_by_email
+from app.utils.normalization import normalize_organization_name, normalize_person_name
 
 logger = logging.getLogger(__name__)
 
@@ -287,11 +288,11 @@ class ContactEnrichmentService:
     ) -> Optional[Contact]:
         """
         Find existing contact using two-phase matching:
-        Phase 1: Email exact match (100% accuracy)
+        Phase 1: Email exact match on primary or alternate emails (100% accuracy)
         Phase 2: Fuzzy name match (85% threshold)
         """
-        # Phase 1: Email exact match (indexed, fast)
-        contact = db.query(Contact).filter(Contact.email == email).first()
+        # Phase 1: Email exact match (GIN-indexed, covers alternate emails)
+        contact = find_contact_by_email(db, email)
         if contact:
             logger.debug(f"[Contact Enrichment] Found exact email match: {email}")
             return contact
@@ -353,10 +354,11 @@ class ContactEnrichmentService:
         best_score = 0
         threshold = 85
 
-        name_normalized = name.lower().strip()
+        name_normalized = normalize_person_name(name)
 
         for candidate in candidates:
-            candidate_name = (candidate.full_name or '').lower().strip()
+            # Use the persisted normalized name rather than re-parsing each candidate
+            candidate_name = candidate.name_normalized
             if not candidate_name:
                 continue
 
@@ -398,10 +400,10 @@ class ContactEnrichmentService:
 
         normalized_name = self._normalize_organization_name(org_name)
 
-        # Try exact match on normalized name (case-insensitive)
+        # Try exact match on normalized name (indexed on name_normalized)
         existing = db.query(Organization).filter(
-            Organization.name.ilike(org_name)
-        ).first()
+            Organization.name_normalized == normalized_name
+        ).first() if normalized_name else None
 
         if existing:
             logger.debug(f"[Contact Enrichment] Found exact organization match: {org_name}")
@@ -449,7 +451,7 @@ class ContactEnrichmentService:
         threshold = 90  # Higher threshold for orgs
 
         for org in all_orgs:
-            org_normalized = self._normalize_organization_name(org.name)
+            org_normalized = org.name_normalized or self._normalize_organization_name(org.name)
 
             # Compare normalized names
             score = fuzz.ratio(normalized_name, org_normalized)
@@ -471,41 +473,10 @@ class ContactEnrichmentService:
         """
         Normalize organization names for consistent matching
 
-        Transformations:
-        - Remove legal suffixes: LLC, Inc., Ltd., Corp, Corporation
-        - Remove punctuation: commas, periods
-        - Remove "The" prefix
-        - Lowercase and strip whitespace
-        - Remove extra spaces
-
-        Examples:
-        "The Microsoft Corporation, Inc." → "microsoft"
-        "NOAA Fisheries" → "noaa fisheries"
+        See app.utils.normalization.normalize_organization_name; the same value
+        is persisted in Organization.name_normalized on write.
         """
-        if not name:
-            return ""
-
-        normalized = name.lower().strip()
-
-        # Remove "The" prefix
-        if normalized.startswith('the '):
-            normalized = normalized[4:]
-
-        # Remove legal suffixes (must be word boundaries)
-        legal_suffixes = [
-            r'\bllc\b', r'\binc\.?\b', r'\bltd\.?\b', r'\bcorp\.?\b',
-            r'\bcorporation\b', r'\bcompany\b', r'\bco\.?\b', r'\blimited\b'
-        ]
-        for suffix in legal_suffixes:
-            normalized = re.sub(suffix, '', normalized)
-
-        # Remove punctuation
-        normalized = re.sub(r'[,.\-()&]', ' ', normalized)
-
-        # Remove extra whitespace
-        normalized = ' '.join(normalized.split())
-
-        return normalized.strip()
+        return normalize_organization_name(name)
 
     @staticmethod
     def _parse_name_intelligently(full_name: str) -> Dict[str, str]:
@@ -0,0 +1,65 @@
+"""
+Shared contact list filters.
+Used by the contacts list, exports and bulk operations so "the contacts
+matching these filters" means the same thing everywhere.
+"""
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import or_
+
+from app.models.contact import Contact
+
+
+def parse_tags(tags: Optional[str]) -> list:
+    """Split a comma-separated tags query parameter."""
+    return [tag.strip() for tag in (tags or "").split(",") if tag.strip()]
+
+
+def apply_contact_filters(
+    query,
+    search: Optional[str] = None,
+    role: Optional[str] = None,
+    country: Optional[str] = None,
+    organization_id: Optional[UUID] = None,
+    tags: Optional[str] = None,
+):
+    """
+    Apply the GET /api/contacts filters to an ORM Query or a select().
+
+    Args:
+        query: Query/Select over Contact
+        search: Substring match on first/last/full name and email
+        role: Substring match on role
+        country: Exact country
+        organization_id: Exact organization
+        tags: Comma-separated; matches contacts with any of the tags
+
+    Returns:
+        The filtered query
+    """
+    if search:
+        search_term = f"%{search}%"
+        query = query.filter(
+            or_(
+                Contact.first_name.ilike(search_term),
+                Contact.last_name.ilike(search_term),
+                Contact.full_name.ilike(search_term),
+                Contact.email.ilike(search_term),
+            )
+        )
+
+    if role:
+        query = query.filter(Contact.role.ilike(f"%{role}%"))
+
+    if country:
+        query = query.filter(Contact.country == country)
+
+    if organization_id:
+        query = query.filter(Contact.organization_id == organization_id)
+
+    tag_list = parse_tags(tags)
+    if tag_list:
+        query = query.filter(Contact.tags.overlap(tag_list))
+
+    return query
@@ -0,0 +1,593 @@
+"""
+Bulk Contact Import Service
+
+Streams a CSV or XLSX file into the contact_import_rows staging table with
+COPY, then validates, de-duplicates and merges the staged rows into
+organizations and contacts with a handful of set-based statements.
+Every staged row ends with an action (created, updated, unchanged,
+duplicate, error) so callers get a per-row report.
+"""
+import csv
+import io
+import logging
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+import pandas as pd
+from nameparser import HumanName
+from openpyxl import load_workbook
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.contact_import import ContactImportRow
+from app.utils.normalization import (
+    EMAIL_PATTERN,
+    EMAIL_STATUS_VALID,
+    normalize_email,
+    normalize_organization_name,
+    normalize_person_name,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows buffered per COPY round trip
+COPY_BATCH_SIZE = 10000
+
+SUPPORTED_EXTENSIONS = ('.csv', '.xlsx')
+
+# Staging columns filled by COPY, in order
+STAGED_COLUMNS = [
+    'import_id', 'row_number', 'email', 'email_normalized', 'alternate_emails',
+    'first_name', 'last_name', 'full_name', 'name_normalized',
+    'organization_name', 'organization_normalized', 'title', 'role', 'phone',
+    'country', 'state_province', 'city', 'tags', 'notes',
+]
+
+# Accepted spellings of each import field (compared after lowercasing and
+# collapsing spaces/dashes to underscores)
+HEADER_ALIASES = {
+    'email': ['email', 'e_mail', 'email_address', 'primary_email'],
+    'alternate_emails': ['alternate_emails', 'alternate_email', 'other_emails', 'secondary_email'],
+    'first_name': ['first_name', 'first', 'given_name', 'firstname'],
+    'last_name': ['last_name', 'last', 'surname', 'family_name', 'lastname'],
+    'full_name': ['full_name', 'name', 'contact_name'],
+    'organization_name': ['organization', 'organization_name', 'organisation', 'org', 'company', 'affiliation', 'institution'],
+    'title': ['title', 'job_title', 'position'],
+    'role': ['role'],
+    'phone': ['phone', 'phone_number', 'telephone'],
+    'country': ['country'],
+    'state_province': ['state_province', 'state', 'province', 'region'],
+    'city': ['city'],
+    'tags': ['tags', 'tag', 'groups'],
+    'notes': ['notes', 'note', 'comments'],
+}
+_HEADER_LOOKUP = {alias: field for field, aliases in HEADER_ALIASES.items() for alias in aliases}
+
+# contacts column limits checked before the merge so one long value can't fail the whole import
+FIELD_LIMITS = {
+    'email': 255,
+    'first_name': 100,
+    'last_name': 100,
+    'full_name': 255,
+    'organization_name': 255,
+    'title': 255,
+    'role': 255,
+    'phone': 50,
+    'country': 100,
+    'state_province': 100,
+    'city': 100,
+}
+
+LIST_SEPARATOR_PATTERN = r'\s*[;,]\s*'
+
+
+def import_upload_dir() -> Path:
+    """Directory holding uploaded import files until their job has run."""
+    path = Path(settings.UPLOAD_DIR) / "contact_imports"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+class ContactImportError(Exception):
+    """Raised when an import file can't be read at all (bad format, no email column)."""
+    pass
+
+
+class ContactImportService:
+    """Stage and merge one contact import file."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._organization_names: Dict[str, str] = {}
+
+    # ------------------------------------------------------------------
+    # Entry point
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        import_id: UUID,
+        path: str,
+        filename: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        update_existing: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Import a file. Does not commit, so the caller decides whether the
+        whole import lands (or rolls back for a dry run).
+
+        Args:
+            import_id: ID grouping the staged rows (the background job ID)
+            path: Local path to the CSV/XLSX file
+            filename: Original filename, used to pick the reader
+            tags: Tags added to every imported contact
+            update_existing: Fill in/merge fields on contacts that already exist
+
+        Returns:
+            Counts per action, e.g. {'rows': 100000, 'created': 99000, 'error': 12, ...}
+        """
+        started = datetime.utcnow()
+        self.purge_expired()
+
+        staged = self.stage_file(import_id, path, filename or path)
+        self._validate(import_id, tags or [])
+        self._resolve_organizations(import_id)
+        self._match_existing(import_id, update_existing)
+        if update_existing:
+            self._update_existing(import_id)
+        self._insert_new(import_id)
+
+        summary = self.summarize(import_id)
+        summary['rows'] = staged
+        summary['seconds'] = round((datetime.utcnow() - started).total_seconds(), 2)
+        logger.info(f"[Contact Import] {import_id}: {summary}")
+        return summary
+
+    # ------------------------------------------------------------------
+    # Staging
+    # ------------------------------------------------------------------
+
+    def stage_file(self, import_id: UUID, path: str, filename: str) -> int:
+        """COPY the file into contact_import_rows in fixed-size batches. Returns rows staged."""
+        self.db.execute(
+            text("DELETE FROM contact_import_rows WHERE import_id = :import_id"),
+            {"import_id": import_id},
+        )
+
+        cursor = self.db.connection().connection.cursor()
+        copy_sql = f"COPY contact_import_rows ({', '.join(STAGED_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+
+        staged = 0
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for record in self.iter_records(path, filename):
+            writer.writerow(self._staged_values(import_id, record))
+            staged += 1
+            if staged % COPY_BATCH_SIZE == 0:
+                buffer.seek(0)
+                cursor.copy_expert(copy_sql, buffer)
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+
+        logger.info(f"[Contact Import] Staged {staged} rows for import {import_id}")
+        return staged
+
+    def iter_records(self, path: str, filename: str) -> Iterator[Dict[str, Any]]:
+        """Yield {field: value, 'row_number': n} for each data row without loading the whole file."""
+        extension = Path(filename).suffix.lower()
+        if extension == '.csv':
+            yield from self._iter_csv(path)
+        elif extension == '.xlsx':
+            yield from self._iter_xlsx(path)
+        else:
+            raise ContactImportError(
+                f"Unsupported file type '{extension}'. Upload one of: {', '.join(SUPPORTED_EXTENSIONS)}"
+            )
+
+    def _iter_csv(self, path: str) -> Iterator[Dict[str, Any]]:
+        reader = pd.read_csv(
+            path,
+            chunksize=COPY_BATCH_SIZE,
+            dtype=str,
+            keep_default_na=False,
+            encoding='utf-8-sig',
+            skip_blank_lines=False,  # Keep row numbers aligned with the file
+        )
+        mapping = None
+        row_number = 1
+        for chunk in reader:
+            if mapping is None:
+                mapping = self._map_headers(list(chunk.columns))
+            for values in chunk.itertuples(index=False, name=None):
+                row_number += 1
+                if any(values):
+                    yield self._record(row_number, values, mapping)
+
+    def _iter_xlsx(self, path: str) -> Iterator[Dict[str, Any]]:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            mapping = None
+            for row_number, values in enumerate(rows, start=1):
+                if mapping is None:
+                    if any(value not in (None, '') for value in values):
+                        mapping = self._map_headers(values)
+                    continue
+                if all(value in (None, '') for value in values):
+                    continue
+                yield self._record(row_number, values, mapping)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _map_headers(headers) -> Dict[int, str]:
+        """Map column positions to import fields; raise if there is no email column."""
+        mapping = {}
+        for position, header in enumerate(headers):
+            if header is None:
+                continue
+            key = re.sub(r'[\s\-]+', '_', str(header).strip().lower())
+            field = _HEADER_LOOKUP.get(key)
+            if field and field not in mapping.values():
+                mapping[position] = field
+
+        if 'email' not in mapping.values():
+            raise ContactImportError("No email column found in the header row")
+        return mapping
+
+    @staticmethod
+    def _record(row_number: int, values, mapping: Dict[int, str]) -> Dict[str, Any]:
+        record = {'row_number': row_number}
+        for position, field in mapping.items():
+            value = values[position] if position < len(values) else None
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)  # Excel stores phone numbers and IDs as floats
+            value = str(value).strip() if value is not None else ''
+            record[field] = value or None
+        return record
+
+    def _staged_values(self, import_id: UUID, record: Dict[str, Any]) -> List[Any]:
+        """Fill derived name/email/org columns in Python, in STAGED_COLUMNS order."""
+        first_name, last_name, full_name = record.get('first_name'), record.get('last_name'), record.get('full_name')
+        if full_name and not (first_name or last_name):
+            parsed = HumanName(full_name)
+            first_name, last_name = parsed.first or None, parsed.last or None
+        elif not full_name and (first_name or last_name):
+            full_name = ' '.join(part for part in (first_name, last_name) if part)
+
+        organization_name = record.get('organization_name')
+        organization_normalized = None
+        if organization_name:
+            organization_normalized = self._organization_names.get(organization_name)
+            if organization_normalized is None:
+                organization_normalized = normalize_organization_name(organization_name)
+                self._organization_names[organization_name] = organization_normalized
+
+        values = {
+            **record,
+            'import_id': import_id,
+            'email_normalized': normalize_email(record.get('email')),
+            'first_name': first_name,
+            'last_name': last_name,
+            'full_name': full_name,
+            'name_normalized': normalize_person_name(full_name, first_name, last_name) or None,
+            'organization_normalized': organization_normalized or None,
+        }
+        return [values.get(column) for column in STAGED_COLUMNS]
+
+    # ------------------------------------------------------------------
+    # Set-based merge
+    # ------------------------------------------------------------------
+
+    def _validate(self, import_id: UUID, tags: List[str]):
+        """Flag invalid and duplicate rows; split list columns."""
+        params = {"import_id": import_id, "email_pattern": EMAIL_PATTERN, "separator": LIST_SEPARATOR_PATTERN}
+
+        length_checks = "\n".join(
+            f"WHEN LENGTH({field}) > {limit} THEN '{field} longer than {limit} characters'"
+            for field, limit in FIELD_LIMITS.items()
+        )
+        self.db.execute(text(f"""
+            UPDATE contact_import_rows
+            SET action = 'error',
+                error = CASE
+                    WHEN email_normalized IS NULL THEN 'Missing email'
+                    WHEN email_normalized !~ :email_pattern THEN 'Invalid email address'
+                    {length_checks}
+                END
+            WHERE import_id = :import_id
+              AND (
+                email_normalized IS NULL
+                OR email_normalized !~ :email_pattern
+                OR {' OR '.join(f'LENGTH({field}) > {limit}' for field, limit in FIELD_LIMITS.items())}
+              )
+        """), params)
+
+        # First occurrence of an email wins; later rows are reported as duplicates
+        self.db.execute(text("""
+            UPDATE contact_import_rows r
+            SET action = 'duplicate',
+                error = 'Duplicate of row ' || f.first_row
+            FROM (
+                SELECT email_normalized, MIN(row_number) AS first_row
+                FROM contact_import_rows
+                WHERE import_id = :import_id AND action IS NULL
+                GROUP BY email_normalized
+                HAVING COUNT(*) > 1
+            ) f
+            WHERE r.import_id = :import_id
+              AND r.action IS NULL
+              AND r.email_normalized = f.email_normalized
+              AND r.row_number > f.first_row
+        """), params)
+
+        self.db.execute(text("""
+            UPDATE contact_import_rows r
+            SET tag_list = (
+                    SELECT ARRAY_AGG(t.value ORDER BY t.first_position)
+                    FROM (
+                        SELECT raw.value, MIN(raw.position) AS first_position
+                        FROM UNNEST(
+                            CAST(:tags AS text[]) || COALESCE(REGEXP_SPLIT_TO_ARRAY(BTRIM(r.tags), :separator), '{}')
+                        ) WITH ORDINALITY AS raw(value, position)
+                        WHERE raw.value <> ''
+                        GROUP BY raw.value
+                    ) t
+                ),
+                alternate_list = (
+                    SELECT ARRAY_AGG(e.value ORDER BY e.first_position)
+                    FROM (
+                        SELECT LOWER(raw.value) AS value, MIN(raw.position) AS first_position
+                        FROM UNNEST(REGEXP_SPLIT_TO_ARRAY(BTRIM(r.alternate_emails), :separator))
+                             WITH ORDINALITY AS raw(value, position)
+                        WHERE raw.value ~ :email_pattern AND LOWER(raw.value) <> r.email_normalized
+                        GROUP BY LOWER(raw.value)
+                    ) e
+                )
+            WHERE r.import_id = :import_id AND r.action IS NULL
+        """), {**params, "tags": tags})
+
+    def _resolve_organizations(self, import_id: UUID):
+        """Create missing organizations and link every staged row to one by normalized name."""
+        params = {"import_id": import_id}
+
+        self.db.execute(text("""
+            INSERT INTO organizations (id, name, name_normalized, created_at, updated_at)
+            SELECT gen_random_uuid(), n.organization_name, n.organization_normalized, NOW(), NOW()
+            FROM (
+                SELECT DISTINCT ON (organization_normalized) organization_name, organization_normalized
+                FROM contact_import_rows
+                WHERE import_id = :import_id AND action IS NULL AND organization_normalized IS NOT NULL
+                ORDER BY organization_normalized, row_number
+            ) n
+            WHERE NOT EXISTS (
+                SELECT 1 FROM organizations o WHERE o.name_normalized = n.organization_normalized
+            )
+            ON CONFLICT (name) DO NOTHING
+        """), params)
+
+        self.db.execute(text("""
+            UPDATE contact_import_rows r
+            SET organization_id = o.id
+            FROM (
+                SELECT DISTINCT ON (name_normalized) id, name_normalized
+                FROM organizations
+                WHERE name_normalized IN (
+                    SELECT DISTINCT organization_normalized
+                    FROM contact_import_rows
+                    WHERE import_id = :import_id AND action IS NULL
+                )
+                ORDER BY name_normalized, created_at
+            ) o
+            WHERE r.import_id = :import_id
+              AND r.action IS NULL
+              AND r.organization_normalized = o.name_normalized
+        """), params)
+
+    def _match_existing(self, import_id: UUID, update_existing: bool):
+        """Match rows to existing contacts by any of their addresses (primary address preferred)."""
+        params = {"import_id": import_id, "matched_action": 'update' if update_existing else 'unchanged'}
+
+        # Hash join against unnested contact addresses; scales with row count
+        # instead of probing the GIN index once per staged row
+        self.db.execute(text("""
+            UPDATE contact_import_rows r
+            SET contact_id = m.contact_id,
+                action = :matched_action
+            FROM (
+                SELECT DISTINCT ON (s.id) s.id AS row_id, c.id AS contact_id
+                FROM contact_import_rows s
+                JOIN (
+                    SELECT id, email_normalized, UNNEST(all_emails_normalized) AS address
+                    FROM contacts
+                ) c ON c.address = s.email_normalized
+                WHERE s.import_id = :import_id AND s.action IS NULL
+                ORDER BY s.id, (c.email_normalized = c.address) DESC
+            ) m
+            WHERE r.id = m.row_id
+        """), params)
+
+        # Two file addresses that resolve to the same contact: only the first row updates it
+        self.db.execute(text("""
+            UPDATE contact_import_rows r
+            SET action = 'duplicate',
+                error = 'Same contact as row ' || f.first_row
+            FROM (
+                SELECT contact_id, MIN(row_number) AS first_row
+                FROM contact_import_rows
+                WHERE import_id = :import_id AND action IN ('update', 'unchanged')
+                GROUP BY contact_id
+                HAVING COUNT(*) > 1
+            ) f
+            WHERE r.import_id = :import_id
+              AND r.contact_id = f.contact_id
+              AND r.row_number > f.first_row
+        """), params)
+
+        self.db.execute(text("""
+            UPDATE contact_import_rows
+            SET contact_id = gen_random_uuid(), action = 'create'
+            WHERE import_id = :import_id AND action IS NULL
+        """), params)
+
+    def _update_existing(self, import_id: UUID):
+        """
+        Fill in blank fields from the file, merging tags and alternate emails.
+
+        Values already on the contact are kept. The file's notes are appended
+        unless the contact's notes already contain them, so re-importing the
+        same file leaves the contact's values as they were.
+        """
+        self.db.execute(text("""
+            UPDATE contacts c
+            SET first_name = COALESCE(NULLIF(c.first_name, ''), r.first_name),
+                last_name = COALESCE(NULLIF(c.last_name, ''), r.last_name),
+                full_name = COALESCE(NULLIF(c.full_name, ''), r.full_name),
+                name_normalized = COALESCE(NULLIF(c.name_normalized, ''), r.name_normalized),
+                organization_id = COALESCE(c.organization_id, r.organization_id),
+                title = COALESCE(NULLIF(c.title, ''), r.title),
+                role = COALESCE(NULLIF(c.role, ''), r.role),
+                phone = COALESCE(NULLIF(c.phone, ''), r.phone),
+                country = COALESCE(NULLIF(c.country, ''), r.country),
+                state_province = COALESCE(NULLIF(c.state_province, ''), r.state_province),
+                city = COALESCE(NULLIF(c.city, ''), r.city),
+                notes = CASE
+                    WHEN NULLIF(r.notes, '') IS NULL THEN c.notes
+                    WHEN NULLIF(c.notes, '') IS NULL THEN r.notes
+                    WHEN STRPOS(c.notes, r.notes) > 0 THEN c.notes
+                    ELSE c.notes || E'\\n' || r.notes
+                END,
+                tags = CASE
+                    WHEN r.tag_list IS NULL THEN c.tags
+                    ELSE ARRAY(
+                        SELECT t.value FROM (
+                            SELECT value, MIN(position) AS first_position
+                            FROM UNNEST(COALESCE(c.tags, '{}') || r.tag_list) WITH ORDINALITY AS u(value, position)
+                            GROUP BY value
+                        ) t ORDER BY t.first_position
+                    )
+                END,
+                alternate_emails = CASE
+                    WHEN r.alternate_list IS NULL THEN c.alternate_emails
+                    ELSE ARRAY(
+                        SELECT e.value FROM (
+                            SELECT value, MIN(position) AS first_position
+                            FROM UNNEST(COALESCE(c.alternate_emails, '{}') || r.alternate_list) WITH ORDINALITY AS u(value, position)
+                            WHERE LOWER(value) IS DISTINCT FROM c.email_normalized
+                            GROUP BY value
+                        ) e ORDER BY e.first_position
+                    )
+                END,
+                all_emails_normalized = CASE
+                    WHEN r.alternate_list IS NULL THEN c.all_emails_normalized
+                    ELSE ARRAY(
+                        SELECT e.value FROM (
+                            SELECT LOWER(BTRIM(value)) AS value, MIN(position) AS first_position
+                            FROM UNNEST(COALESCE(c.all_emails_normalized, ARRAY[c.email_normalized]) || r.alternate_list)
+                                 WITH ORDINALITY AS u(value, position)
+                            WHERE value IS NOT NULL
+                            GROUP BY LOWER(BTRIM(value))
+                        ) e ORDER BY e.first_position
+                    )
+                END,
+                updated_at = NOW()
+            FROM contact_import_rows r
+            WHERE r.import_id = :import_id
+              AND r.action = 'update'
+              AND c.id = r.contact_id
+        """), {"import_id": import_id})
+
+        self.db.execute(text("""
+            UPDATE contact_import_rows SET action = 'updated'
+            WHERE import_id = :import_id AND action = 'update'
+        """), {"import_id": import_id})
+
+    def _insert_new(self, import_id: UUID):
+        """Insert unmatched rows as new contacts."""
+        params = {"import_id": import_id}
+
+        self.db.execute(text("""
+            INSERT INTO contacts (
+                id, email, email_normalized, email_status, alternate_emails, all_emails_normalized,
+                first_name, last_name, full_name, name_normalized, organization_id,
+                role, title, phone, country, state_province, city, tags, notes,
+                created_at, updated_at
+            )
+            SELECT
+                r.contact_id, r.email, r.email_normalized, :email_status, r.alternate_list,
+                ARRAY[r.email_normalized]::varchar[] || COALESCE(r.alternate_list, '{}'),
+                r.first_name, r.last_name, r.full_name, r.name_normalized, r.organization_id,
+                r.role, r.title, r.phone, r.country, r.state_province, r.city, r.tag_list, r.notes,
+                NOW(), NOW()
+            FROM contact_import_rows r
+            WHERE r.import_id = :import_id AND r.action = 'create'
+            ON CONFLICT (email) DO NOTHING
+        """), {**params, "email_status": EMAIL_STATUS_VALID})
+
+        self.db.execute(text("""
+            UPDATE contact_import_rows r
+            SET action = 'created'
+            WHERE r.import_id = :import_id
+              AND r.action = 'create'
+              AND EXISTS (SELECT 1 FROM contacts c WHERE c.id = r.contact_id)
+        """), params)
+
+        # Rows that hit the unique email constraint without matching on a normalized address
+        self.db.execute(text("""
+            UPDATE contact_import_rows
+            SET action = 'error', error = 'Email already exists', contact_id = NULL
+            WHERE import_id = :import_id AND action = 'create'
+        """), params)
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def summarize(self, import_id: UUID) -> Dict[str, int]:
+        rows = self.db.execute(text("""
+            SELECT action, COUNT(*) FROM contact_import_rows
+            WHERE import_id = :import_id GROUP BY action
+        """), {"import_id": import_id}).fetchall()
+        summary = {'created': 0, 'updated': 0, 'unchanged': 0, 'duplicate': 0, 'error': 0}
+        summary.update({action: count for action, count in rows if action})
+        return summary
+
+    def get_rows(
+        self,
+        import_id: UUID,
+        actions: Optional[List[str]] = None,
+        after_row: int = 0,
+        limit: int = 500,
+    ) -> List[ContactImportRow]:
+        """Per-row report, ordered by spreadsheet row (keyset paginated)."""
+        query = self.db.query(ContactImportRow).filter(
+            ContactImportRow.import_id == import_id,
+            ContactImportRow.row_number > after_row,
+        )
+        if actions:
+            query = query.filter(ContactImportRow.action.in_(actions))
+        return query.order_by(ContactImportRow.row_number).limit(limit).all()
+
+    def purge_expired(self):
+        """Drop staged rows and uploaded files older than CONTACT_IMPORT_RETENTION_DAYS."""
+        cutoff = datetime.utcnow() - timedelta(days=settings.CONTACT_IMPORT_RETENTION_DAYS)
+        self.db.execute(
+            text("DELETE FROM contact_import_rows WHERE created_at < :cutoff"),
+            {"cutoff": cutoff},
+        )
+
+        for upload in import_upload_dir().iterdir():
+            try:
+                if datetime.utcfromtimestamp(upload.stat().st_mtime) < cutoff:
+                    os.remove(upload)
+            except OSError as e:
+                logger.warning(f"[Contact Import] Could not remove old upload {upload}: {e}")
@@ -0,0 +1,56 @@
+"""
+Unified email → contact lookup.
+Every matching path (enrichment, bounce handling, approve-contact, contact
+create/update) resolves an address through here so that primary and
+alternate emails are checked with one GIN-indexed query.
+"""
+import logging
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import cast, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from app.models.contact import Contact
+from app.utils.normalization import normalize_email
+
+logger = logging.getLogger(__name__)
+
+
+def email_match_clause(email: str):
+    """
+    Filter clause matching a contact whose primary or alternate email equals `email`.
+
+    Uses array containment (@>) so PostgreSQL can answer it from the GIN index
+    on contacts.all_emails_normalized.
+    """
+    return Contact.all_emails_normalized.contains(
+        cast([normalize_email(email)], ARRAY(String(255)))
+    )
+
+
+def find_contact_by_email(
+    db: Session,
+    email: Optional[str],
+    exclude_contact_id: Optional[UUID] = None,
+) -> Optional[Contact]:
+    """
+    Find the contact owning `email` as either its primary or an alternate address.
+
+    Args:
+        db: Database session
+        email: Address to look up (any case/whitespace)
+        exclude_contact_id: Ignore this contact (used for update duplicate checks)
+
+    Returns:
+        Matching Contact, or None
+    """
+    if not normalize_email(email):
+        return None
+
+    query = db.query(Contact).filter(email_match_clause(email))
+    if exclude_contact_id:
+        query = query.filter(Contact.id != exclude_contact_id)
+
+    return query.first()
@@ -0,0 +1,129 @@
+"""
+Contact activity timeline.
+
+Registrations, abstracts, funding prospects, sponsorships, parsed emails
+and audit log entries for one contact, merged newest first in a single
+UNION ALL. Each branch filters on an indexed contact column and is limited
+on its own, so a page costs at most `limit` rows per source.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, String, cast, func, literal, null, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from app.models.conference import Conference, ConferenceAbstract, ConferenceRegistration, ConferenceSponsor
+from app.models.contact import Contact, Organization
+from app.models.funding import FundingProspect
+from app.models.parsed_email import ParsedEmail
+from app.models.system import AuditLog
+
+TIMELINE_COLUMNS = ("type", "id", "occurred_at", "title", "status", "detail")
+
+
+class InvalidCursor(ValueError):
+    """Raised when a timeline cursor can't be decoded."""
+
+
+def encode_cursor(item: Dict[str, Any]) -> str:
+    payload = json.dumps([item["occurred_at"].isoformat(), item["type"], item["id"]])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str, str]:
+    try:
+        occurred_at, item_type, item_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(occurred_at), item_type, item_id
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid timeline cursor") from e
+
+
+def _branch(item_type: str, item_id, occurred_at, title, status, detail):
+    return select(
+        literal(item_type).label("type"),
+        cast(item_id, String).label("id"),
+        cast(occurred_at, DateTime).label("occurred_at"),
+        cast(title, String).label("title"),
+        cast(status, String).label("status"),
+        cast(detail, String).label("detail"),
+    )
+
+
+def _page(statement, before: Optional[Tuple[datetime, str, str]], limit: int):
+    """Apply the keyset cursor and newest-first order/limit to a select over TIMELINE_COLUMNS."""
+    rows = statement.subquery()
+    paged = select(rows)
+    if before:
+        paged = paged.where(tuple_(rows.c.occurred_at, rows.c.type, rows.c.id) < tuple_(*before))
+    return paged.order_by(rows.c.occurred_at.desc(), rows.c.type.desc(), rows.c.id.desc()).limit(limit)
+
+
+def contact_timeline(
+    db: Session,
+    contact: Contact,
+    before: Optional[Tuple[datetime, str, str]] = None,
+    limit: int = 50,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of a contact's activity, newest first.
+
+    Args:
+        db: Database session
+        contact: Contact whose activity to list
+        before: Decoded cursor; only items older than it are returned
+        limit: Page size
+
+    Returns:
+        (items, next_cursor); next_cursor is None on the last page
+    """
+    emails = contact.all_emails_normalized or [contact.email_normalized or contact.email.lower()]
+
+    branches = [
+        _branch(
+            "registration", ConferenceRegistration.id,
+            func.coalesce(cast(ConferenceRegistration.registration_date, DateTime), ConferenceRegistration.created_at),
+            Conference.name, ConferenceRegistration.payment_status, ConferenceRegistration.registration_type,
+        ).join(Conference, Conference.id == ConferenceRegistration.conference_id)
+        .where(ConferenceRegistration.contact_id == contact.id),
+
+        _branch(
+            "abstract", ConferenceAbstract.id,
+            func.coalesce(cast(ConferenceAbstract.submission_date, DateTime), ConferenceAbstract.created_at),
+            ConferenceAbstract.title, ConferenceAbstract.status, ConferenceAbstract.presentation_type,
+        ).where(ConferenceAbstract.submitter_id == contact.id),
+
+        _branch(
+            "funding", FundingProspect.id, FundingProspect.created_at,
+            func.coalesce(Organization.name, FundingProspect.prospect_type),
+            FundingProspect.status, FundingProspect.amount_target,
+        ).outerjoin(Organization, Organization.id == FundingProspect.organization_id)
+        .where(FundingProspect.contact_id == contact.id),
+
+        _branch(
+            "sponsorship", ConferenceSponsor.id, ConferenceSponsor.created_at,
+            Conference.name, ConferenceSponsor.status, ConferenceSponsor.sponsor_level,
+        ).join(Conference, Conference.id == ConferenceSponsor.conference_id)
+        .where(ConferenceSponsor.contact_person_id == contact.id),
+
+        # Stored as timestamptz; everything else is naive UTC
+        _branch(
+            "email", ParsedEmail.id,
+            func.timezone("UTC", func.coalesce(ParsedEmail.date, ParsedEmail.created_at)),
+            ParsedEmail.subject, ParsedEmail.status, ParsedEmail.from_email,
+        ).where(ParsedEmail.participant_emails.overlap(emails)),
+
+        _branch(
+            "audit", AuditLog.id, AuditLog.created_at,
+            AuditLog.action, null(), AuditLog.changed_by,
+        ).where(AuditLog.record_id == contact.id),
+    ]
+
+    # limit + 1 per branch and overall to know whether another page exists
+    statement = _page(union_all(*[_page(branch, before, limit + 1) for branch in branches]), before, limit + 1)
+    rows = db.execute(statement).all()
+
+    items = [dict(zip(TIMELINE_COLUMNS, row)) for row in rows[:limit]]
+    next_cursor = encode_cursor(items[-1]) if len(rows) > limit else None
+    return items, next_cursor
@@ -0,0 +1,381 @@
+"""
+Dashboard Snapshots
+
+Admin dashboard figures are computed in the background and stored in
+data_quality_metrics, so dashboard page loads read one indexed row instead
+of aggregating the base tables:
+
+- one 'dashboard_snapshot' row per refresh whose details hold the payloads
+  of /api/stats/, /api/stats/contacts and /api/contacts/stats
+- one row per tracked metric per refresh (metric_value), which is the time
+  series behind /api/stats/history
+
+Refreshes run on a fixed schedule and, debounced, shortly after ORM writes
+to the tables the dashboard counts.
+"""
+import calendar
+import logging
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, func, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.conference import Conference
+from app.models.contact import Contact, Organization
+from app.models.funding import FundingProspect
+from app.models.parsed_email import ParsedEmail
+from app.models.system import DataQualityMetric
+from app.services.scheduler import scheduler
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_METRIC = "dashboard_snapshot"
+
+# Time-series metric name -> (snapshot section, key in that section)
+TRACKED_METRICS = {
+    "total_contacts": ("dashboard", "total_contacts"),
+    "total_organizations": ("dashboard", "total_organizations"),
+    "total_conferences": ("dashboard", "total_conferences"),
+    "total_funding_prospects": ("dashboard", "total_funding"),
+    "new_contacts_this_month": ("contacts", "new_this_month"),
+    "unique_tags": ("contacts", "unique_tags"),
+    "emails_parsed": ("contacts", "emails_parsed"),
+    "contacts_with_phone": ("contact_enrichment", "contacts_with_phone"),
+    "contacts_with_title": ("contact_enrichment", "contacts_with_title"),
+    "contacts_needing_enrichment": ("contact_enrichment", "contacts_needing_enrichment"),
+    "enrichment_completion_rate": ("contact_enrichment", "enrichment_completion_rate"),
+}
+
+# Writes to these models make the snapshot stale
+TRACKED_MODELS = (Contact, Organization, Conference, FundingProspect, ParsedEmail)
+
+# pg advisory lock so only one process refreshes at a time
+REFRESH_LOCK_KEY = 0x15A5_0038
+
+HISTORY_BUCKETS = ("hour", "day", "week", "month")
+
+
+# ============================================
+# METRIC QUERIES
+# ============================================
+
+def _percent_change(current: int, previous: int) -> float:
+    if previous > 0:
+        return round(((current - previous) / previous) * 100, 1)
+    return 100.0 if current > 0 else 0.0
+
+
+def compute_dashboard_stats(db: Session) -> Dict[str, Any]:
+    """Totals, recent contacts and active conferences for the dashboard landing cards."""
+    totals = db.execute(text("""
+        SELECT
+            (SELECT COUNT(*) FROM contacts) AS total_contacts,
+            (SELECT COUNT(*) FROM organizations) AS total_organizations,
+            (SELECT COUNT(*) FROM conferences) AS total_conferences,
+            (SELECT COUNT(*) FROM funding_prospects) AS total_funding
+    """)).one()
+
+    recent_contacts = db.execute(text("""
+        SELECT first_name, last_name, email, organization_id, created_at
+        FROM contacts
+        ORDER BY created_at DESC
+        LIMIT 10
+    """))
+
+    # Active conferences (upcoming or recent)
+    active_conferences = db.execute(text("""
+        SELECT id, name, year, location, start_date, end_date
+        FROM conferences
+        WHERE start_date >= CURRENT_DATE - INTERVAL '6 months'
+        ORDER BY start_date DESC
+        LIMIT 5
+    """))
+
+    return {
+        "total_contacts": totals.total_contacts or 0,
+        "total_organizations": totals.total_organizations or 0,
+        "total_conferences": totals.total_conferences or 0,
+        "total_funding": totals.total_funding or 0,
+        "recent_contacts": [
+            {
+                "first_name": row[0],
+                "last_name": row[1],
+                "email": row[2],
+                "organization_id": row[3],
+                "created_at": str(row[4]) if row[4] else None
+            }
+            for row in recent_contacts
+        ],
+        "active_conferences": [
+            {
+                "id": row[0],
+                "name": row[1],
+                "year": row[2],
+                "location": row[3],
+                "start_date": str(row[4]) if row[4] else None,
+                "end_date": str(row[5]) if row[5] else None
+            }
+            for row in active_conferences
+        ],
+    }
+
+
+def compute_contact_statistics(db: Session) -> Dict[str, Any]:
+    """Contact dashboard cards with month-over-month changes."""
+    now = datetime.utcnow()
+    if now.month == 1:
+        prev_month, prev_year = 12, now.year - 1
+    else:
+        prev_month, prev_year = now.month - 1, now.year
+
+    last_day_prev_month = calendar.monthrange(prev_year, prev_month)[1]
+    end_of_prev_month = datetime(prev_year, prev_month, last_day_prev_month, 23, 59, 59)
+    first_day_current_month = datetime(now.year, now.month, 1)
+    first_day_prev_month = datetime(prev_year, prev_month, 1)
+
+    # Unique tags/groups, counted in SQL rather than by loading every tags array
+    tag_values = select(func.unnest(Contact.tags).label("tag")).where(Contact.tags.isnot(None)).subquery()
+    unique_tags_count = select(func.count(func.distinct(tag_values.c.tag))).scalar_subquery()
+
+    email_counts = select(
+        func.count(ParsedEmail.id).label("total"),
+        func.count(ParsedEmail.id).filter(ParsedEmail.date <= end_of_prev_month).label("prev_month"),
+    ).subquery()
+
+    # All counts in one round trip
+    stats = db.execute(
+        select(
+            func.count(Contact.id).label("total_contacts"),
+            # Total contacts last month (for comparison)
+            func.count(Contact.id).filter(Contact.created_at <= end_of_prev_month).label("total_contacts_prev_month"),
+            func.count(Contact.id).filter(Contact.created_at >= first_day_current_month).label("new_this_month"),
+            func.count(Contact.id).filter(
+                Contact.created_at >= first_day_prev_month,
+                Contact.created_at <= end_of_prev_month
+            ).label("new_last_month"),
+            unique_tags_count.label("unique_tags"),
+            select(email_counts.c.total).scalar_subquery().label("emails_parsed"),
+            select(email_counts.c.prev_month).scalar_subquery().label("emails_parsed_prev_month"),
+        ).select_from(Contact)
+    ).one()
+
+    total_contacts = stats.total_contacts or 0
+    new_this_month = stats.new_this_month or 0
+    emails_parsed = stats.emails_parsed or 0
+
+    return {
+        "total_contacts": total_contacts,
+        "total_contacts_change": _percent_change(total_contacts, stats.total_contacts_prev_month or 0),
+        "new_this_month": new_this_month,
+        "new_contacts_change": _percent_change(new_this_month, stats.new_last_month or 0),
+        "unique_tags": stats.unique_tags or 0,
+        "emails_parsed": emails_parsed,
+        "emails_parsed_change": _percent_change(emails_parsed, stats.emails_parsed_prev_month or 0),
+    }
+
+
+def compute_contact_enrichment_stats(db: Session) -> Dict[str, Any]:
+    """Phone/title coverage used for enrichment tracking."""
+    has_phone_and_title = (Contact.phone != None) & (Contact.title != None)
+
+    # One pass over contacts
+    stats = db.query(
+        func.count(Contact.id).label("total_contacts"),
+        func.count(Contact.id).filter(Contact.email != None).label("contacts_with_email"),
+        func.count(Contact.id).filter(Contact.phone != None).label("contacts_with_phone"),
+        func.count(Contact.id).filter(Contact.title != None).label("contacts_with_title"),
+        func.count(Contact.id).filter(has_phone_and_title).label("contacts_with_phone_and_title"),
+        # Have email but missing phone or title
+        func.count(Contact.id).filter(
+            Contact.email != None,
+            or_(Contact.phone == None, Contact.title == None)
+        ).label("contacts_needing_enrichment"),
+    ).one()
+
+    contacts_with_email = stats.contacts_with_email
+    return {
+        "total_contacts": stats.total_contacts,
+        "contacts_with_email": contacts_with_email,
+        "contacts_with_phone": stats.contacts_with_phone,
+        "contacts_with_title": stats.contacts_with_title,
+        "contacts_with_phone_and_title": stats.contacts_with_phone_and_title,
+        "contacts_needing_enrichment": stats.contacts_needing_enrichment,
+        "enrichment_completion_rate": round((stats.contacts_with_phone_and_title / contacts_with_email * 100), 1) if contacts_with_email > 0 else 0
+    }
+
+
+# ============================================
+# SNAPSHOTS
+# ============================================
+
+def compute_snapshot_payload(db: Session) -> Dict[str, Any]:
+    return jsonable_encoder({
+        "dashboard": compute_dashboard_stats(db),
+        "contacts": compute_contact_statistics(db),
+        "contact_enrichment": compute_contact_enrichment_stats(db),
+    })
+
+
+def latest_snapshot(db: Session) -> Optional[DataQualityMetric]:
+    return db.query(DataQualityMetric).filter(
+        DataQualityMetric.metric_name == SNAPSHOT_METRIC
+    ).order_by(DataQualityMetric.measured_at.desc()).first()
+
+
+def refresh_dashboard_snapshot(db: Session, force: bool = False) -> Optional[DataQualityMetric]:
+    """
+    Recompute every dashboard figure and store a new snapshot. Commits.
+
+    Unless forced, a snapshot younger than DASHBOARD_SNAPSHOT_MIN_INTERVAL_SECONDS
+    is returned as-is. If another process holds the refresh lock, returns the
+    latest existing snapshot (None if there is none yet).
+    """
+    acquired = db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REFRESH_LOCK_KEY}).scalar()
+    current = latest_snapshot(db)
+    if not acquired:
+        db.rollback()
+        return current
+
+    now = datetime.utcnow()
+    min_age = timedelta(seconds=settings.DASHBOARD_SNAPSHOT_MIN_INTERVAL_SECONDS)
+    if current and not force and now - current.measured_at < min_age:
+        db.rollback()
+        return current
+
+    # Cleared before computing, so writes made during the refresh trigger the next one
+    _changed.clear()
+    try:
+        payload = compute_snapshot_payload(db)
+
+        snapshot = DataQualityMetric(metric_name=SNAPSHOT_METRIC, details=payload, measured_at=now)
+        db.add(snapshot)
+        for metric_name, (section, key) in TRACKED_METRICS.items():
+            value = payload[section].get(key)
+            if value is not None:
+                db.add(DataQualityMetric(metric_name=metric_name, metric_value=Decimal(str(value)), measured_at=now))
+
+        # Full payloads are only needed for the latest reads; the scalar series is kept
+        db.query(DataQualityMetric).filter(
+            DataQualityMetric.metric_name == SNAPSHOT_METRIC,
+            DataQualityMetric.measured_at < now - timedelta(days=settings.DASHBOARD_SNAPSHOT_PAYLOAD_RETENTION_DAYS),
+        ).delete(synchronize_session=False)
+
+        db.commit()
+    except Exception:
+        _changed.set()
+        raise
+    logger.info(f"[Dashboard] Snapshot refreshed at {now.isoformat()}")
+    return snapshot
+
+
+def get_dashboard_snapshot(db: Session) -> DataQualityMetric:
+    """
+    Latest snapshot, refreshed inline only if there is none or the scheduler
+    has fallen behind (older than two refresh intervals).
+    """
+    snapshot = latest_snapshot(db)
+    max_age = timedelta(minutes=2 * settings.DASHBOARD_SNAPSHOT_INTERVAL_MINUTES)
+    if snapshot is None or datetime.utcnow() - snapshot.measured_at > max_age:
+        snapshot = refresh_dashboard_snapshot(db) or snapshot
+    if snapshot is None:
+        # The first refresh is running in another process; answer live without storing
+        snapshot = DataQualityMetric(
+            metric_name=SNAPSHOT_METRIC,
+            details=compute_snapshot_payload(db),
+            measured_at=datetime.utcnow(),
+        )
+    return snapshot
+
+
+def metric_history(
+    db: Session,
+    metric_names: List[str],
+    since: datetime,
+    bucket: str = "day",
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Stored values of `metric_names` since `since`, one point per `bucket`
+    (the last snapshot in each bucket). Reads the stored series only.
+    """
+    if bucket not in HISTORY_BUCKETS:
+        raise ValueError(f"bucket must be one of {', '.join(HISTORY_BUCKETS)}")
+
+    rows = db.execute(text("""
+        SELECT DISTINCT ON (metric_name, DATE_TRUNC(:bucket, measured_at))
+            metric_name, measured_at, metric_value
+        FROM data_quality_metrics
+        WHERE metric_name = ANY(:metric_names)
+          AND measured_at >= :since
+        ORDER BY metric_name, DATE_TRUNC(:bucket, measured_at), measured_at DESC
+    """), {"bucket": bucket, "metric_names": metric_names, "since": since})
+
+    history: Dict[str, List[Dict[str, Any]]] = {name: [] for name in metric_names}
+    for row in rows:
+        history[row.metric_name].append({
+            "measured_at": row.measured_at.isoformat(),
+            "value": float(row.metric_value) if row.metric_value is not None else None,
+        })
+    return history
+
+
+# ============================================
+# CHANGE TRACKING & SCHEDULING
+# ============================================
+
+_changed = threading.Event()
+
+
+@event.listens_for(Session, "after_flush")
+def _note_dashboard_changes(session, flush_context):
+    """Mark the snapshot stale when tracked rows are inserted, updated or deleted via the ORM."""
+    if _changed.is_set():
+        return
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, TRACKED_MODELS):
+            _changed.set()
+            return
+
+
+def _run_refresh(force: bool):
+    db = SessionLocal()
+    try:
+        refresh_dashboard_snapshot(db, force=force)
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Dashboard] Snapshot refresh failed: {str(e)}", exc_info=True)
+    finally:
+        db.close()
+
+
+def _refresh_if_changed():
+    if _changed.is_set():
+        _run_refresh(force=False)
+
+
+def schedule_dashboard_snapshots():
+    """Register the periodic and on-change snapshot refreshes with the shared scheduler."""
+    scheduler.add_job(
+        _run_refresh,
+        "interval",
+        job_id="dashboard_snapshot",
+        minutes=settings.DASHBOARD_SNAPSHOT_INTERVAL_MINUTES,
+        kwargs={"force": True},
+        next_run_time=datetime.now(),
+    )
+    scheduler.add_job(
+        _refresh_if_changed,
+        "interval",
+        job_id="dashboard_snapshot_on_change",
+        seconds=settings.DASHBOARD_SNAPSHOT_MIN_INTERVAL_SECONDS,
+    )
+    logger.info(
+        f"[Dashboard] Snapshot refresh scheduled "
+        f"(every {settings.DASHBOARD_SNAPSHOT_INTERVAL_MINUTES} min, on change after "
+        f"{settings.DASHBOARD_SNAPSHOT_MIN_INTERVAL_SECONDS}s)"
+    )
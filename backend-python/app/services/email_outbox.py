@@ -0,0 +1,216 @@
+"""
+Transactional Email Outbox
+
+Request handlers queue mail with email_service.queued(db): the message is
+rendered as usual but written to email_outbox in the handler's transaction,
+so it exists exactly when the change it announces was committed, and the
+handler returns without waiting on SMTP/SES.
+
+The dispatcher is an asyncio worker on the API's event loop (it shares the
+SMTP pool, SES client and send throttle with everything else). A commit
+that queued mail wakes it immediately; otherwise it polls. Each batch is
+leased by pushing next_attempt_at forward and committing before sending, so
+several API processes can dispatch side by side and a message whose sender
+died is picked up again when its lease runs out. Failed sends are retried
+with exponential backoff up to OUTBOX_MAX_ATTEMPTS; suppressed recipients
+are settled without sending.
+
+Delivery is at-least-once: a crash between the provider accepting a message
+and its outcome being recorded resends it.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import event, text, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.email_outbox import EmailOutboxMessage
+from app.services.bounce_queue import suppressed_addresses
+from app.utils.normalization import normalize_email
+
+logger = logging.getLogger(__name__)
+
+# Session.info flag set when a transaction queued mail
+_PENDING_FLAG = "email_outbox_pending"
+
+CLAIM_BATCH_SQL = text("""
+    UPDATE email_outbox
+    SET attempts = attempts + 1,
+        next_attempt_at = NOW() + make_interval(secs => :lease_seconds)
+    WHERE id IN (
+        SELECT id FROM email_outbox
+        WHERE status = 'pending' AND next_attempt_at <= NOW()
+        ORDER BY next_attempt_at, id
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, to_email, subject, html_content, text_content, attempts
+""")
+
+
+def enqueue_email(
+    db: Session,
+    to_email: str,
+    subject: str,
+    html_content: str,
+    text_content: Optional[str] = None,
+) -> EmailOutboxMessage:
+    """Queue a rendered email in db's transaction. The caller commits."""
+    message = EmailOutboxMessage(
+        to_email=to_email,
+        subject=subject,
+        html_content=html_content,
+        text_content=text_content,
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.utcnow(),
+    )
+    db.add(message)
+    db.info[_PENDING_FLAG] = True
+    return message
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_dispatcher(session: Session):
+    if session.info.pop(_PENDING_FLAG, False):
+        outbox_dispatcher.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_pending(session: Session):
+    session.info.pop(_PENDING_FLAG, None)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt: base * 2^(attempts - 1), capped at an hour."""
+    return timedelta(seconds=min(settings.OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), 3600))
+
+
+async def dispatch_batch(db: Session, batch_size: int) -> Dict[str, int]:
+    """
+    Lease and deliver up to `batch_size` due messages.
+
+    Returns counts per outcome (empty when nothing is due).
+    """
+    from app.services.email_service import email_service
+
+    claimed = db.execute(CLAIM_BATCH_SQL, {
+        "batch_size": batch_size,
+        "lease_seconds": settings.OUTBOX_LEASE_SECONDS,
+    }).fetchall()
+    db.commit()  # The lease is held from here on
+    if not claimed:
+        return {}
+
+    suppressed = suppressed_addresses(db, [row.to_email for row in claimed])
+
+    async def deliver(row):
+        if normalize_email(row.to_email) in suppressed:
+            return row, "suppressed", None
+        try:
+            sent = await email_service.send_email(row.to_email, row.subject, row.html_content, row.text_content)
+            return row, ("sent" if sent else "retry"), (None if sent else "Provider did not accept the message")
+        except Exception as e:
+            return row, "retry", str(e)
+
+    now = datetime.utcnow()
+    counts: Dict[str, int] = {}
+    outcomes = []
+    for row, outcome, error in await asyncio.gather(*[deliver(row) for row in claimed]):
+        values = {"id": row.id, "last_error": error}
+        if outcome == "sent":
+            values.update(status="sent", sent_at=now)
+        elif outcome == "suppressed":
+            values.update(status="suppressed")
+        elif row.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            outcome = "failed"
+            values.update(status="failed")
+            logger.error(f"[Outbox] Giving up on message {row.id} to {row.to_email} after {row.attempts} attempts: {error}")
+        else:
+            values.update(next_attempt_at=now + retry_delay(row.attempts))
+            logger.warning(f"[Outbox] Message {row.id} to {row.to_email} failed (attempt {row.attempts}): {error}")
+        outcomes.append(values)
+        counts[outcome] = counts.get(outcome, 0) + 1
+
+    db.execute(update(EmailOutboxMessage), outcomes)
+    db.commit()
+    return counts
+
+
+class OutboxDispatcher:
+    """Delivers queued email from the outbox on the API's event loop."""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self):
+        """Start the dispatcher on the running event loop."""
+        if self._task:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("[Outbox] Dispatcher started")
+
+    async def stop(self):
+        """Stop after the batch in flight; leased messages are retried when their lease ends."""
+        if not self._task:
+            return
+        self._stopping = True
+        self._wake.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+        logger.info("[Outbox] Dispatcher stopped")
+
+    def notify(self):
+        """Wake the dispatcher (safe to call from any thread)."""
+        if self._loop and self._wake and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def dispatch_due(self) -> Dict[str, int]:
+        """Deliver everything that is due; returns totals per outcome."""
+        totals: Dict[str, int] = {}
+        db = self.session_factory()
+        try:
+            while not self._stopping:
+                counts = await dispatch_batch(db, settings.OUTBOX_BATCH_SIZE)
+                if not counts:
+                    break
+                for outcome, count in counts.items():
+                    totals[outcome] = totals.get(outcome, 0) + count
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return totals
+
+    async def _run_loop(self):
+        while not self._stopping:
+            try:
+                totals = await self.dispatch_due()
+                if totals:
+                    logger.info(f"[Outbox] Dispatched {sum(totals.values())} messages: {totals}")
+            except Exception as e:
+                logger.error(f"[Outbox] Dispatch failed: {str(e)}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+
+# Process-wide dispatcher, started in main.py
+outbox_dispatcher = OutboxDispatcher()
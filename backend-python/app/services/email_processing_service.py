@@ -12,6 +12,7 @@ from app.services.ai_extraction_service import AIExtractionService
 from app.services.contact_enrichment_service import ContactEnrichmentService
 from app.services.bounceback_handler import BouncebackHandler
 from app.models.parsed_email import ParsedEmail
+from app.services.parsed_email_archive import load_email_body
 from app.models.vote import BoardVote
 from app.models.funding import FundingProspect
 
@@ -71,8 +72,6 @@ class EmailProcessingService:
             # Step 2.5: Check for bounceback and handle it
             if BouncebackHandler.is_bounceback(parsed_email):
                 logger.info(f"[Email Processing] Detected bounceback notification")
-                bounceback_result = BouncebackHandler.process_bounceback(db, parsed_email)
-                logger.info(f"[Email Processing] Bounceback result: {bounceback_result}")
 
                 # Store bounceback email record for audit trail
                 parsed_email_record = ParsedEmail(
@@ -88,13 +87,20 @@ class EmailProcessingService:
                     attachments=parsed_email.get('attachments'),
                     status='bounceback_processed',
                     requires_review=False,
-                    email_metadata={
-                        'source': 'ses_inbound',
-                        'email_type': 'bounceback',
-                        'bounceback_result': bounceback_result
-                    }
                 )
                 db.add(parsed_email_record)
+                db.flush()
+
+                # Queue the failed address; contacts are updated in batches
+                bounceback_result = BouncebackHandler.process_bounceback(
+                    db, parsed_email, parsed_email_id=parsed_email_record.id
+                )
+                logger.info(f"[Email Processing] Bounceback result: {bounceback_result}")
+                parsed_email_record.email_metadata = {
+                    'source': 'ses_inbound',
+                    'email_type': 'bounceback',
+                    'bounceback_result': bounceback_result
+                }
                 db.commit()
                 logger.info(f"[Email Processing] Bounceback processed and logged")
                 return parsed_email_record
@@ -108,26 +114,14 @@ class EmailProcessingService:
 
             # Store email type in metadata
             email_type = extracted_data.get('email_type', 'general')
-            email_metadata = {
-                'source': 'ses_inbound',
-                'from_name': parsed_email.get('from_name'),
-                's3_bucket': self.s3_service.bucket_name,
-                'email_type': email_type
-            }
-
-            # Add specialized extraction data to metadata
-            if extracted_data.get('board_vote'):
-                email_metadata['board_vote'] = extracted_data['board_vote']
-            if extracted_data.get('meeting_info'):
-                email_metadata['meeting_info'] = extracted_data['meeting_info']
-            if extracted_data.get('funding_info'):
-                email_metadata['funding_info'] = extracted_data['funding_info']
-            if extracted_data.get('abstract_info'):
-                email_metadata['abstract_info'] = extracted_data['abstract_info']
-            if extracted_data.get('partnership_info'):
-                email_metadata['partnership_info'] = extracted_data['partnership_info']
-            if extracted_data.get('grant_progress'):
-                email_metadata['grant_progress'] = extracted_data['grant_progress']
+            email_metadata = self._build_email_metadata(
+                {
+                    'source': 'ses_inbound',
+                    'from_name': parsed_email.get('from_name'),
+                    's3_bucket': self.s3_service.bucket_name,
+                },
+                extracted_data
+            )
 
             parsed_email_record = ParsedEmail(
                 message_id=message_id,
@@ -169,6 +163,64 @@ class EmailProcessingService:
             db.rollback()
             return self._create_failed_record(s3_key, message_id, str(e), db)
 
+    async def reprocess_email(self, parsed_email: ParsedEmail, db: Session) -> Dict[str, Any]:
+        """
+        Re-run AI extraction on a stored email and update its extracted fields.
+
+        Uses the stored (or archived) body instead of downloading from S3 again. Specialized
+        records (votes, funding) are not re-created, so reprocessing is safe to
+        repeat. The caller commits.
+
+        Args:
+            parsed_email: Previously stored email
+            db: Database session
+
+        Returns:
+            Dict with the new email_type and overall_confidence
+        """
+        body = load_email_body(parsed_email)
+        extracted_data = await self.ai_service.extract_data({
+            'from_email': parsed_email.from_email,
+            'from_name': (parsed_email.email_metadata or {}).get('from_name'),
+            'to_emails': parsed_email.to_emails or [],
+            'cc_emails': parsed_email.cc_emails or [],
+            'subject': parsed_email.subject,
+            'date': parsed_email.date,
+            'body_text': body['body_text'],
+            'body_html': body['body_html'],
+            'attachments': body['attachments'] or [],
+        })
+
+        confidence = extracted_data.get('overall_confidence', 0)
+        parsed_email.extracted_contacts = extracted_data.get('contacts')
+        parsed_email.action_items = extracted_data.get('action_items')
+        parsed_email.topics = extracted_data.get('topics')
+        parsed_email.overall_confidence = confidence
+        parsed_email.requires_review = confidence < 70
+        parsed_email.status = 'processed'
+        parsed_email.error_message = None
+        parsed_email.email_metadata = self._build_email_metadata(
+            dict(parsed_email.email_metadata or {}),
+            extracted_data
+        )
+        db.flush()
+
+        return {
+            'email_type': extracted_data.get('email_type', 'general'),
+            'overall_confidence': confidence,
+        }
+
+    @staticmethod
+    def _build_email_metadata(email_metadata: Dict[str, Any], extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the email type and specialized extraction data to email metadata"""
+        email_metadata['email_type'] = extracted_data.get('email_type', 'general')
+        for field in ('board_vote', 'meeting_info', 'funding_info', 'abstract_info', 'partnership_info', 'grant_progress'):
+            if extracted_data.get(field):
+                email_metadata[field] = extracted_data[field]
+            else:
+                email_metadata.pop(field, None)
+        return email_metadata
+
     async def _auto_link_specialized_data(
         self,
         parsed_email: ParsedEmail,
@@ -206,10 +258,13 @@ class EmailProcessingService:
                     )
 
                     # Store primary contact in email metadata
+                    # (reassigned, not mutated in place: JSONB columns don't track
+                    # nested changes, and primary_contact_email is generated from it)
                     if enrichment_result.get('primary_contact'):
-                        if not parsed_email.email_metadata:
-                            parsed_email.email_metadata = {}
-                        parsed_email.email_metadata['primary_contact'] = enrichment_result['primary_contact']
+                        parsed_email.email_metadata = {
+                            **(parsed_email.email_metadata or {}),
+                            'primary_contact': enrichment_result['primary_contact'],
+                        }
                         db.commit()
 
                 except Exception as enrichment_error:
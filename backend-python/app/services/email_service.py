@@ -4,14 +4,28 @@ Supports both SMTP (Gmail) and AWS SES.
 
 Branded email templates for ISRS - International Shellfish Restoration Society
 """
+import asyncio
+import copy
 import logging
 import os
-from typing import Optional
+import ssl
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-import aiosmtplib
+
+from sqlalchemy.orm import Session
 
 from app.config import settings
+from app.database import SessionLocal
+from app.services.bounce_queue import is_suppressed, suppressed_addresses
+from app.services.email_outbox import enqueue_email
+from app.services.email_templates import CompiledTemplate, compile_template, render_template
+from app.services.send_throttle import send_throttle
+from app.services.ses_client import send_bulk_templated, ses_call, temporary_template
+from app.services.smtp_pool import SMTPConnectionPool
+from app.utils.normalization import normalize_email
 
 logger = logging.getLogger(__name__)
 
@@ -39,18 +53,11 @@ BRAND_COLORS = {
 # =============================================================================
 # BASE EMAIL TEMPLATE
 # =============================================================================
-def get_base_template(content: str, preheader: str = "") -> str:
-    """
-    Wrap email content in the base ISRS branded template.
-
-    Args:
-        content: The main email body content (HTML)
-        preheader: Preview text shown in email clients (optional)
-
-    Returns:
-        Complete HTML email
-    """
-    return f"""
+@lru_cache(maxsize=4)
+def _base_layout(year: int) -> CompiledTemplate:
+    """The branded layout for `year` (footer), compiled with preheader and content fields."""
+    preheader, content = "{{preheader}}", "{{content}}"
+    return compile_template(f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -131,7 +138,7 @@ def get_base_template(content: str, preheader: str = "") -> str:
                                     </tr>
                                 </table>
                                 <p style="color: {BRAND_COLORS['text_muted']}; font-size: 12px; margin: 15px 0 5px 0; line-height: 1.6; font-family: Georgia, serif;">
-                                    © {__import__('datetime').datetime.now().year} International Shellfish Restoration Society<br>
+                                    © {year} International Shellfish Restoration Society<br>
                                     8070 Georgia Avenue, Silver Spring, MD 20910<br>
                                     Tax ID (EIN): 59-2829151
                                 </p>
@@ -153,7 +160,24 @@ def get_base_template(content: str, preheader: str = "") -> str:
         </table>
     </body>
     </html>
+    """)
+
+
+def get_base_template(content: str, preheader: str = "") -> str:
     """
+    Wrap email content in the base ISRS branded template.
+
+    The static layout is compiled once; each call only joins it with the
+    content and preheader.
+
+    Args:
+        content: The main email body content (HTML)
+        preheader: Preview text shown in email clients (optional)
+
+    Returns:
+        Complete HTML email
+    """
+    return _base_layout(datetime.now().year).render({"content": content, "preheader": preheader})
 
 
 def get_button_html(text: str, url: str, color: str = None) -> str:
@@ -193,6 +217,12 @@ def get_warning_box_html(content: str) -> str:
     return get_info_box_html(content, BRAND_COLORS['warning_yellow'], "#fffbeb")
 
 
+# SES template placeholder, e.g. {{first_name}}
+def render_placeholders(template: str, values: Dict[str, Any], escape: bool = False) -> str:
+    """Fill {{name}} placeholders (missing values render empty); pass escape=True for HTML."""
+    return render_template(template, values, escape)
+
+
 # =============================================================================
 # EMAIL SERVICE CLASS
 # =============================================================================
@@ -210,6 +240,8 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.SMTP_FROM_EMAIL
         self.from_name = settings.SMTP_FROM_NAME
+        self._smtp_pool: Optional[SMTPConnectionPool] = None
+        self._outbox_db: Optional[Session] = None  # Set on queued() views
 
         # AWS SES settings
         self.ses_from_email = settings.SES_FROM_EMAIL or "noreply@shellfish-society.org"
@@ -219,6 +251,19 @@ class EmailService:
         if self.email_service == "ses":
             logger.info(f"Using AWS SES with from_email: {self.ses_from_email}")
 
+    def queued(self, db: Session) -> "EmailService":
+        """
+        A view of this service whose sends are written to the email outbox in
+        db's transaction instead of being delivered inline.
+
+        Every send_* method works on the view and returns True once the
+        message is queued; the outbox dispatcher delivers it after db commits.
+        Usage: await email_service.queued(db).send_magic_link(...); db.commit()
+        """
+        view = copy.copy(self)
+        view._outbox_db = db
+        return view
+
     async def send_email(
         self,
         to_email: str,
@@ -236,13 +281,52 @@ class EmailService:
             text_content: Plain text email body (optional fallback)
 
         Returns:
-            True if sent successfully, False otherwise
+            True if sent successfully (or queued, on a queued() view), False
+            otherwise (including suppressed recipients, which are never sent to)
         """
+        if self._outbox_db is not None:
+            enqueue_email(self._outbox_db, to_email, subject, html_content, text_content)
+            return True
+
+        # Blocking lookup; keep it off the event loop
+        if await asyncio.to_thread(is_suppressed, to_email):
+            logger.info(f"Not sending to suppressed address {to_email}: {subject}")
+            return False
+
+        await send_throttle.acquire()
         if self.email_service == "ses":
             return await self._send_via_ses(to_email, subject, html_content, text_content)
         else:
             return await self._send_via_smtp(to_email, subject, html_content, text_content)
 
+    @property
+    def smtp_pool(self) -> SMTPConnectionPool:
+        """Process-wide pool of authenticated SMTP sessions, created on first send."""
+        if self._smtp_pool is None:
+            # Certificate checks are off, as they were for per-message sends
+            # (development relays); the context is now built once
+            tls_context = ssl.create_default_context()
+            tls_context.check_hostname = False
+            tls_context.verify_mode = ssl.CERT_NONE
+
+            self._smtp_pool = SMTPConnectionPool(
+                hostname=self.smtp_host,
+                port=self.smtp_port,
+                username=self.smtp_user,
+                password=self.smtp_password,
+                start_tls=True,
+                tls_context=tls_context,
+                size=settings.SMTP_POOL_SIZE,
+                max_messages=settings.SMTP_POOL_MAX_MESSAGES_PER_CONNECTION,
+                healthcheck_after=settings.SMTP_POOL_HEALTHCHECK_SECONDS,
+            )
+        return self._smtp_pool
+
+    async def close(self):
+        """Close pooled SMTP sessions (called on application shutdown)."""
+        if self._smtp_pool is not None:
+            await self._smtp_pool.close()
+
     async def _send_via_smtp(
         self,
         to_email: str,
@@ -250,10 +334,8 @@ class EmailService:
         html_content: str,
         text_content: Optional[str] = None,
     ) -> bool:
-        """Send email via SMTP (Gmail)."""
+        """Send email via SMTP (Gmail) on a pooled connection."""
         try:
-            import ssl
-
             # Create message
             message = MIMEMultipart("alternative")
             message["From"] = f"{self.from_name} <{self.from_email}>"
@@ -269,22 +351,7 @@ class EmailService:
             html_part = MIMEText(html_content, "html")
             message.attach(html_part)
 
-            # Create SSL context that doesn't verify certificates (for development)
-            # In production, use proper certificates
-            tls_context = ssl.create_default_context()
-            tls_context.check_hostname = False
-            tls_context.verify_mode = ssl.CERT_NONE
-
-            # Send via SMTP
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_user,
-                password=self.smtp_password,
-                start_tls=True,
-                tls_context=tls_context,
-            )
+            await self.smtp_pool.send_message(message)
 
             logger.info(f"Email sent successfully via SMTP to {to_email}")
             return True
@@ -300,19 +367,10 @@ class EmailService:
         html_content: str,
         text_content: Optional[str] = None,
     ) -> bool:
-        """Send email via AWS SES."""
-        try:
-            import boto3
-            from botocore.exceptions import ClientError
-
-            # Create SES client with explicit credentials
-            ses_client = boto3.client(
-                'ses',
-                region_name=self.aws_region,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
-            )
+        """Send email via AWS SES (shared client, off the event loop)."""
+        from botocore.exceptions import ClientError
 
+        try:
             # Prepare email
             email_message = {
                 'Subject': {'Data': subject, 'Charset': 'UTF-8'},
@@ -326,7 +384,8 @@ class EmailService:
                 email_message['Body']['Text'] = {'Data': text_content, 'Charset': 'UTF-8'}
 
             # Send email
-            response = ses_client.send_email(
+            response = await ses_call(
+                'send_email',
                 Source=f"{self.from_name} <{self.ses_from_email}>",
                 Destination={'ToAddresses': [to_email]},
                 Message=email_message
@@ -342,6 +401,91 @@ class EmailService:
             logger.error(f"Failed to send email via SES to {to_email}: {str(e)}")
             return False
 
+    # =========================================================================
+    # BULK SENDS
+    # =========================================================================
+
+    async def send_bulk(
+        self,
+        subject: str,
+        html_template: str,
+        text_template: Optional[str],
+        recipients: List[Tuple[str, Dict[str, Any]]],
+        default_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Tuple[bool, Optional[str]]]:
+        """
+        Send one template to many recipients.
+
+        Templates use SES placeholders ({{first_name}}). With SES this is
+        SendBulkTemplatedEmail, 50 recipients per API call, on a template
+        that is deleted after the send; with SMTP each message is rendered
+        here (values HTML-escaped in the HTML body, as-is in the subject and
+        text body) and sent over the connection pool. Suppressed recipients
+        are skipped, and every send waits on the shared send_throttle.
+
+        Args:
+            subject: Subject template
+            html_template: HTML body template
+            text_template: Plain text body template (optional)
+            recipients: (email, template data) pairs
+            default_data: Values for placeholders a recipient's data lacks
+
+        Returns:
+            {email: (sent, message_id / error / "suppressed")}
+        """
+        db = SessionLocal()
+        try:
+            suppressed = suppressed_addresses(db, [email for email, _ in recipients])
+        finally:
+            db.close()
+
+        results: Dict[str, Tuple[bool, Optional[str]]] = {}
+        deliverable = []
+        for email, data in recipients:
+            if normalize_email(email) in suppressed:
+                results[email] = (False, "suppressed")
+            else:
+                deliverable.append((email, data))
+        if not deliverable:
+            return results
+
+        if self.email_service == "ses":
+            from botocore.exceptions import ClientError
+
+            try:
+                async with temporary_template(subject, html_template, text_template) as template_name:
+                    results.update(await send_bulk_templated(
+                        f"{self.from_name} <{self.ses_from_email}>", template_name, deliverable, default_data
+                    ))
+            except ClientError as e:
+                # send_bulk_templated reports its own errors per recipient; this is template creation
+                error = e.response['Error']['Message']
+                logger.error(f"AWS SES error creating template for bulk send: {error}")
+                results.update({email: (False, error) for email, _ in deliverable})
+                return results
+        else:
+            # Parsed once; each recipient only fills in the merge fields
+            compiled_subject = compile_template(subject)
+            compiled_html = compile_template(html_template)
+            compiled_text = compile_template(text_template) if text_template else None
+
+            async def send_one(email, data):
+                values = {**(default_data or {}), **(data or {})}
+                await send_throttle.acquire()
+                sent = await self._send_via_smtp(
+                    email,
+                    compiled_subject.render(values),
+                    compiled_html.render(values, escape=True),
+                    compiled_text.render(values) if compiled_text else None,
+                )
+                return email, (sent, None if sent else "SMTP send failed")
+
+            results.update(await asyncio.gather(*[send_one(email, data) for email, data in deliverable]))
+
+        sent = sum(1 for ok, _ in results.values() if ok)
+        logger.info(f"Bulk send '{subject}': {sent}/{len(recipients)} sent via {self.email_service}")
+        return results
+
     # =========================================================================
     # AUTHENTICATION EMAILS
     # =========================================================================
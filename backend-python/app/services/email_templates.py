@@ -0,0 +1,60 @@
+"""
+Compiled email templates.
+
+Templates use SES-style {{field}} placeholders. A template is parsed once
+into its static segments and the merge fields between them; rendering a
+recipient then only joins the static segments with that recipient's
+values. Compiled templates are cached by source, so the branded layout, a
+campaign body or a preview is parsed once per process however many
+messages use it.
+
+Merge values usually come from contact data (imported or AI-extracted), so
+HTML parts are rendered with escape=True, which HTML-escapes every value;
+subjects and plain text parts take the values as they are. A missing or
+None value renders empty.
+"""
+import html
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List
+
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class CompiledTemplate:
+    """A template split into static segments and merge fields."""
+
+    __slots__ = ("source", "fields", "_segments", "_names")
+
+    def __init__(self, source: str):
+        # split() with one capture group alternates segment, field, segment, ...
+        parts = PLACEHOLDER.split(source)
+        self.source = source
+        self._segments: List[str] = parts[0::2]
+        self._names: List[str] = parts[1::2]
+        self.fields: FrozenSet[str] = frozenset(self._names)
+
+    def render(self, values: Dict[str, Any], escape: bool = False) -> str:
+        """Fill the merge fields for one recipient, HTML-escaping the values if `escape`."""
+        if not self._names:
+            return self.source
+        segments = self._segments
+        out = [segments[0]]
+        for position, name in enumerate(self._names, start=1):
+            value = values.get(name)
+            if value is not None:
+                value = value if isinstance(value, str) else str(value)
+                out.append(html.escape(value) if escape else value)
+            out.append(segments[position])
+        return "".join(out)
+
+
+@lru_cache(maxsize=512)
+def compile_template(source: str) -> CompiledTemplate:
+    """The compiled form of `source`, parsed on first use."""
+    return CompiledTemplate(source)
+
+
+def render_template(source: str, values: Dict[str, Any], escape: bool = False) -> str:
+    """Render `source` with `values` through the compiled-template cache."""
+    return compile_template(source).render(values, escape)
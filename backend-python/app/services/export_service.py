@@ -0,0 +1,158 @@
+"""
+Streaming Export Service
+
+Turns a SELECT into CSV, XLSX or NDJSON bytes without materializing the
+result set. Rows come from a server-side cursor (stream_results +
+yield_per), so memory stays flat regardless of table size.
+"""
+import csv
+import io
+import json
+import logging
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List
+from uuid import UUID
+
+from openpyxl import Workbook
+from sqlalchemy.sql import Select
+
+from app.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per server-side cursor round trip (and per chunk written)
+STREAM_BATCH_SIZE = 1000
+
+# Bytes per chunk when streaming a finished XLSX file
+XLSX_READ_CHUNK_SIZE = 64 * 1024
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+def export_media_type(export_format: str) -> str:
+    return EXPORT_FORMATS[export_format][0]
+
+
+def export_filename(name: str, export_format: str) -> str:
+    return f"{name}-{datetime.utcnow():%Y%m%d-%H%M%S}.{EXPORT_FORMATS[export_format][1]}"
+
+
+def stream_export(statement: Select, export_format: str) -> Iterator[bytes]:
+    """
+    Yield the rows of `statement` encoded as `export_format`.
+
+    Opens its own session: the response body is produced after the request's
+    get_db session has already been closed.
+    """
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            statement.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
+        )
+        columns = list(result.keys())
+
+        if export_format == 'csv':
+            yield from _csv_chunks(columns, result)
+        elif export_format == 'ndjson':
+            yield from _ndjson_chunks(columns, result)
+        elif export_format == 'xlsx':
+            yield from _xlsx_chunks(columns, result)
+        else:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+    except Exception as e:
+        # Headers are already sent, so the client just sees a truncated file
+        logger.error(f"[Export] Stream failed: {str(e)}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+# ============================================
+# FORMAT WRITERS
+# ============================================
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return '; '.join(str(item) for item in value if item is not None)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Unserializable value: {type(value).__name__}")
+
+
+def _csv_chunks(columns: List[str], rows: Iterable) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # UTF-8 BOM so Excel opens non-ASCII names correctly
+    writer.writerow(columns)
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8')
+    buffer.seek(0)
+    buffer.truncate()
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([_csv_value(value) for value in row])
+        if count % STREAM_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _ndjson_chunks(columns: List[str], rows: Iterable) -> Iterator[bytes]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(columns, row)), default=_json_value))
+        if len(lines) >= STREAM_BATCH_SIZE:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def _xlsx_value(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return '; '.join(str(item) for item in value if item is not None)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _xlsx_chunks(columns: List[str], rows: Iterable) -> Iterator[bytes]:
+    """
+    XLSX is a zip archive that can only be finalized once every row is
+    known, so rows go through openpyxl's write-only mode (spooled to disk,
+    not held in memory) and the finished file is streamed afterwards.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Export")
+    sheet.append(columns)
+    for row in rows:
+        sheet.append([_xlsx_value(value) for value in row])
+
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while chunk := output.read(XLSX_READ_CHUNK_SIZE):
+            yield chunk
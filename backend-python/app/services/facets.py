@@ -0,0 +1,133 @@
+"""
+Facet counts for filter sidebars.
+
+Counts per value are computed over the same filtered set as the list they
+accompany, in one UNION ALL statement (GROUP BY for scalar columns, unnest
+for array columns). Unfiltered counts are the same for every visitor, so
+they are cached briefly in-process.
+"""
+from typing import Dict, List
+
+from sqlalchemy import String, cast, func, literal, null, select, union_all
+from sqlalchemy.orm import Query, Session
+
+from app.config import settings
+from app.models.contact import Contact, Organization
+from app.models.member_directory import MemberDirectoryEntry
+from app.utils.ttl_cache import TTLCache
+
+DEFAULT_FACET_LIMIT = 20
+
+facet_cache = TTLCache(ttl_seconds=settings.FACET_CACHE_TTL_SECONDS)
+
+
+def _facet(name: str, source, value, label=None, array: bool = False, where=None, join=None, limit: int = DEFAULT_FACET_LIMIT):
+    """Top `limit` values of one column of `source` with their row counts."""
+    if array:
+        # One row per array element, then group like a scalar column
+        elements = select(func.unnest(value).label("value")).select_from(source)
+        if where is not None:
+            elements = elements.where(where)
+        elements = elements.subquery()
+        value, source, where = elements.c.value, elements, None
+
+    statement = select(
+        literal(name).label("facet"),
+        cast(value, String).label("value"),
+        (label if label is not None else null()).label("label"),
+        func.count().label("count"),
+    ).select_from(source)
+    if join is not None:
+        statement = statement.outerjoin(*join)
+    if where is not None:
+        statement = statement.where(where)
+    statement = statement.where(value.isnot(None)).group_by(value)
+    if label is not None:
+        statement = statement.group_by(label)
+
+    return select(
+        statement.order_by(func.count().desc(), value).limit(limit).subquery()
+    )
+
+
+def _run(db: Session, facets: List) -> Dict[str, List[dict]]:
+    results: Dict[str, List[dict]] = {}
+    for row in db.execute(union_all(*facets)):
+        entry = {"value": row.value, "count": row.count}
+        if row.label is not None:
+            entry["label"] = row.label
+        results.setdefault(row.facet, []).append(entry)
+    return results
+
+
+# ============================================
+# CONTACTS
+# ============================================
+
+CONTACT_FACETS = ("country", "role", "organization", "tags")
+
+
+def contact_facets(db: Session, query: Query, filtered: bool, limit: int = DEFAULT_FACET_LIMIT) -> Dict[str, List[dict]]:
+    """
+    Counts per country, role, organization and tag for the contacts in `query`.
+
+    Args:
+        db: Database session
+        query: Filtered ORM query over Contact (the list query, before paging)
+        filtered: Whether any user filter is applied; unfiltered results are cached
+        limit: Values returned per facet, most frequent first
+    """
+    def compute():
+        contacts = query.with_entities(
+            Contact.country, Contact.role, Contact.organization_id, Contact.tags
+        ).order_by(None).subquery()
+
+        counts = _run(db, [
+            _facet("country", contacts, contacts.c.country, limit=limit),
+            _facet("role", contacts, contacts.c.role, limit=limit),
+            _facet(
+                "organization", contacts, contacts.c.organization_id,
+                label=Organization.name,
+                join=(Organization, Organization.id == contacts.c.organization_id),
+                limit=limit,
+            ),
+            _facet("tags", contacts, contacts.c.tags, array=True, limit=limit),
+        ])
+        return {facet: counts.get(facet, []) for facet in CONTACT_FACETS}
+
+    if filtered:
+        return compute()
+    return facet_cache.get_or_set(("contacts", limit), compute)
+
+
+# ============================================
+# MEMBER DIRECTORY
+# ============================================
+
+DIRECTORY_FACETS = ("country", "organization", "expertise")
+
+
+def directory_facets(db: Session, statement, filtered: bool, limit: int = DEFAULT_FACET_LIMIT) -> Dict[str, List[dict]]:
+    """
+    Counts per country, organization and expertise for directory members in `statement`.
+
+    Reads the member_directory projection, where hidden fields are already
+    blank, so the sidebar never reveals a value hidden on the member card.
+    """
+    def compute():
+        members = statement.with_only_columns(
+            MemberDirectoryEntry.country.label("country"),
+            MemberDirectoryEntry.card["organization"].astext.label("organization"),
+            MemberDirectoryEntry.expertise.label("expertise"),
+        ).order_by(None).subquery()
+
+        counts = _run(db, [
+            _facet("country", members, members.c.country, limit=limit),
+            _facet("organization", members, members.c.organization, limit=limit),
+            _facet("expertise", members, members.c.expertise, array=True, limit=limit),
+        ])
+        return {facet: counts.get(facet, []) for facet in DIRECTORY_FACETS}
+
+    if filtered:
+        return compute()
+    return facet_cache.get_or_set(("directory", limit), compute)
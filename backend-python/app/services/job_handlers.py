@@ -0,0 +1,248 @@
+"""
+Handlers for background jobs run by app.services.job_runner.
+Each handler receives one chunk of pending items; the runner commits the chunk.
+"""
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session, undefer_group
+
+from app.models.background_job import BackgroundJob, BackgroundJobItem
+from app.models.contact import Contact
+from app.models.parsed_email import ParsedEmail
+from app.services.apollo_cache import ApolloCache
+from app.services.apollo_service import ApolloService
+from app.services.job_runner import job_runner
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Apollo Enrichment
+# ============================================================================
+
+@job_runner.handler("apollo_bulk_enrich")
+async def apollo_bulk_enrich(db: Session, job: BackgroundJob, items: List[BackgroundJobItem]) -> Dict[str, int]:
+    """Enrich contacts (item_key = contact ID) with one bulk Apollo pass per chunk."""
+    params = job.params or {}
+    contacts = {
+        str(contact.id): contact
+        for contact in db.query(Contact).filter(Contact.id.in_([UUID(item.item_key) for item in items]))
+    }
+    found_items = [item for item in items if item.item_key in contacts]
+
+    apollo = ApolloService(cache=ApolloCache())
+    results = await apollo.bulk_enrich_people([
+        {
+            'email': contacts[item.item_key].email,
+            'first_name': contacts[item.item_key].first_name,
+            'last_name': contacts[item.item_key].last_name,
+        }
+        for item in found_items
+    ], force_refresh=bool(params.get('force_refresh')))
+
+    summary = {'enriched_contacts': 0, 'not_matched': 0}
+    for item in items:
+        if item.item_key not in contacts:
+            item.status = 'skipped'
+            item.error = "Contact not found"
+
+    for item, result in zip(found_items, results):
+        enriched = result['enriched']
+        if not enriched.get('success'):
+            item.status = 'skipped'
+            item.error = enriched.get('error') or "No Apollo match"
+            summary['not_matched'] += 1
+            continue
+
+        enriched_fields = apply_apollo_enrichment(contacts[item.item_key], enriched)
+        item.result = {'enriched_fields': enriched_fields, 'cached': bool(enriched.get('cached'))}
+        if enriched_fields:
+            summary['enriched_contacts'] += 1
+        for field in enriched_fields:
+            summary[f"enriched_{field}"] = summary.get(f"enriched_{field}", 0) + 1
+
+    return summary
+
+
+def apply_apollo_enrichment(contact: Contact, result: dict) -> List[str]:
+    """Fill empty phone/title fields on a contact from an Apollo result."""
+    enriched_fields = []
+    if not result.get('success'):
+        return enriched_fields
+
+    phone_numbers = result.get('phone_numbers') or []
+    phone = phone_numbers[0].get('sanitized_number') if phone_numbers else None
+    if phone and not contact.phone:
+        contact.phone = phone
+        enriched_fields.append('phone')
+
+    if result.get('title') and not contact.title:
+        contact.title = result['title']
+        enriched_fields.append('title')
+
+    return enriched_fields
+
+
+# ============================================================================
+# Contact Import
+# ============================================================================
+
+@job_runner.handler("contact_import")
+async def contact_import(db: Session, job: BackgroundJob, items: List[BackgroundJobItem]) -> Dict[str, int]:
+    """
+    Import an uploaded contact file (item_key = path on disk).
+
+    The whole file lands in the chunk's transaction, so an interrupted import
+    re-stages from scratch on resume. Runs in a worker thread to keep COPY and
+    the merge statements off the event loop.
+    """
+    from app.services.contact_import_service import ContactImportService, ContactImportError
+
+    params = job.params or {}
+    summary: Dict[str, int] = {}
+    for item in items:
+        if not os.path.exists(item.item_key):
+            item.status = 'failed'
+            item.error = "Import file no longer exists"
+            continue
+
+        try:
+            result = await asyncio.to_thread(
+                ContactImportService(db).run,
+                job.id,
+                item.item_key,
+                params.get('filename'),
+                params.get('tags'),
+                params.get('update_existing', True),
+            )
+        except ContactImportError as e:
+            item.status = 'failed'
+            item.error = str(e)
+            continue
+
+        item.result = result
+        for action in ('created', 'updated', 'unchanged', 'duplicate', 'error'):
+            summary[action] = summary.get(action, 0) + result.get(action, 0)
+
+    return summary
+
+
+# ============================================================================
+# Parsed Emails
+# ============================================================================
+
+@job_runner.handler("parsed_email_reprocess")
+async def parsed_email_reprocess(db: Session, job: BackgroundJob, items: List[BackgroundJobItem]) -> Dict[str, int]:
+    """Re-run AI extraction on stored emails (item_key = parsed email ID)."""
+    from app.services.email_processing_service import EmailProcessingService
+
+    service = EmailProcessingService()
+    emails = {
+        str(email.id): email
+        for email in db.query(ParsedEmail).options(
+            undefer_group("body"), undefer_group("extraction")
+        ).filter(ParsedEmail.id.in_([int(item.item_key) for item in items]))
+    }
+
+    summary = {'requires_review': 0}
+    for item in items:
+        email = emails.get(item.item_key)
+        if not email:
+            item.status = 'skipped'
+            item.error = "Email not found"
+            continue
+
+        try:
+            item.result = await service.reprocess_email(email, db)
+            if email.requires_review:
+                summary['requires_review'] += 1
+        except Exception as e:
+            logger.error(f"[Jobs] Reprocessing email {email.id} failed: {str(e)}")
+            item.status = 'failed'
+            item.error = str(e)
+
+    return summary
+
+
+@job_runner.handler("inbound_email_process", chunk_size=1)
+async def inbound_email_process(db: Session, job: BackgroundJob, items: List[BackgroundJobItem]) -> Optional[Dict[str, int]]:
+    """
+    Download, parse and store inbound SES emails (item_key = S3 object key, params carry message IDs).
+
+    process_email commits (and on errors rolls back) the session itself, so
+    this job type always runs one email per chunk: a failure can then only
+    mark the email that failed.
+    """
+    from app.services.email_processing_service import EmailProcessingService
+
+    service = EmailProcessingService()
+    message_ids = (job.params or {}).get('message_ids', {})
+
+    for item in items:
+        message_id = message_ids.get(item.item_key) or item.item_key.rsplit('/', 1)[-1]
+        # process_email is idempotent on message_id, so a retried item isn't stored twice
+        parsed_email = await service.process_email(s3_key=item.item_key, message_id=message_id, db=db)
+
+        if not parsed_email or parsed_email.status == 'failed':
+            item.status = 'failed'
+            item.error = parsed_email.error_message if parsed_email else "Failed to process email"
+        else:
+            item.result = {'email_id': parsed_email.id, 'status': parsed_email.status}
+
+    return None
+
+
+# ============================================================================
+# Email Campaigns
+# ============================================================================
+
+@job_runner.handler("email_campaign")
+async def email_campaign(db: Session, job: BackgroundJob, items: List[BackgroundJobItem]) -> Dict[str, int]:
+    """Send a campaign to one chunk of its recipients (item_key = normalized email)."""
+    from app.models.email_campaign import EmailCampaign
+    from app.services.campaigns import campaign_message, eligible_recipients
+    from app.services.email_service import email_service
+
+    campaign = db.get(EmailCampaign, UUID(job.params['campaign_id']))
+    if not campaign:
+        raise ValueError(f"Campaign {job.params['campaign_id']} not found")
+
+    # Opt-outs and suppressions since the segment was snapshotted still apply
+    recipients = eligible_recipients(db, campaign.segment or {}, [item.item_key for item in items])
+
+    summary = {'sent': 0, 'failed': 0, 'suppressed': 0, 'left_segment': 0}
+    to_send = []
+    for item in items:
+        if item.item_key in recipients:
+            to_send.append(item)
+        else:
+            item.status = 'skipped'
+            item.error = "No longer in segment (opted out or suppressed)"
+            summary['left_segment'] += 1
+
+    if to_send:
+        subject, html, text = campaign_message(campaign)
+        results = await email_service.send_bulk(
+            subject, html, text,
+            [(item.item_key, recipients[item.item_key]) for item in to_send],
+            default_data=campaign.default_data,
+        )
+        for item in to_send:
+            sent, detail = results.get(item.item_key, (False, "No result from provider"))
+            if sent:
+                item.result = {'message_id': detail}
+                summary['sent'] += 1
+            elif detail == 'suppressed':
+                item.status = 'skipped'
+                item.error = "Suppressed"
+                summary['suppressed'] += 1
+            else:
+                item.status = 'failed'
+                item.error = detail
+                summary['failed'] += 1
+
+    return summary
@@ -0,0 +1,491 @@
+"""
+Database-backed background job runner.
+
+Bulk work (Apollo enrichment, contact imports, parsed-email reprocessing) is
+enqueued as a BackgroundJob with one BackgroundJobItem per input. A worker
+loop inside the API process claims queued jobs with SELECT ... FOR UPDATE
+SKIP LOCKED, hands pending items to the registered handler in chunks and
+commits each chunk together with its item checkpoints and job counters.
+
+Because progress is checkpointed per item, a job interrupted by a restart or
+deploy resumes from the first pending item, and cancellation takes effect at
+the next chunk boundary.
+
+While a chunk runs, a heartbeat task refreshes heartbeat_at on its own
+session so long chunks aren't requeued as stale. A chunk is only committed
+if the job still belongs to this worker; if it was requeued and claimed
+elsewhere in the meantime, the chunk is rolled back and the job abandoned.
+"""
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.background_job import BackgroundJob, BackgroundJobItem
+
+logger = logging.getLogger(__name__)
+
+# Handler signature: (db, job, items) -> optional summary counters to add to job.summary.
+# Handlers mark items 'failed' or 'skipped' (with item.error) as needed; items left
+# 'pending' are marked 'succeeded'. Handlers must not commit their own writes; one that
+# can't avoid it registers with chunk_size=1 so a failure never spans committed items.
+JobHandler = Callable[[Session, BackgroundJob, List[BackgroundJobItem]], Awaitable[Optional[Dict[str, int]]]]
+
+ACTIVE_STATUSES = ('queued', 'running')
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+MAX_JOB_ATTEMPTS = 5
+
+
+class JobTakenOver(Exception):
+    """The job was requeued and claimed by another worker while this one ran it."""
+
+
+class JobRunner:
+    """Registry of job handlers plus the polling worker that executes them."""
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+        self.handlers: Dict[str, JobHandler] = {}
+        self.chunk_sizes: Dict[str, int] = {}
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers_loaded = False
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def handler(self, job_type: str, chunk_size: Optional[int] = None):
+        """
+        Decorator registering an async handler for `job_type`.
+
+        A chunk_size here overrides whatever callers pass to enqueue (e.g. 1
+        for handlers whose side effects can't be rolled back with the chunk).
+        """
+        def decorator(func: JobHandler) -> JobHandler:
+            self.handlers[job_type] = func
+            if chunk_size:
+                self.chunk_sizes[job_type] = chunk_size
+            return func
+        return decorator
+
+    def _load_handlers(self):
+        """Import the built-in handlers on first use (they import this module)."""
+        if not self._handlers_loaded:
+            import app.services.job_handlers  # noqa: F401
+            self._handlers_loaded = True
+
+    # ------------------------------------------------------------------
+    # Job control (called from request handlers)
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        db: Session,
+        job_type: str,
+        item_keys: Iterable[Any],
+        params: Optional[Dict[str, Any]] = None,
+        created_by: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ) -> BackgroundJob:
+        """
+        Create a job with one item per key and wake the worker.
+
+        Args:
+            db: Database session (committed by this call)
+            job_type: Name of a registered handler
+            item_keys: Inputs for the handler, stored as strings in processing order
+            params: Handler options stored on the job
+            created_by: Email of the user who started the job
+            chunk_size: Items per committed chunk
+
+        Returns:
+            The queued BackgroundJob
+        """
+        job = self.add_job(db, job_type, item_keys, params, created_by, chunk_size)
+        db.commit()
+        db.refresh(job)
+        self.notify()
+        return job
+
+    def add_job(
+        self,
+        db: Session,
+        job_type: str,
+        item_keys: Iterable[Any],
+        params: Optional[Dict[str, Any]] = None,
+        created_by: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ) -> BackgroundJob:
+        """
+        Like enqueue, but flushed in the caller's transaction instead of committed.
+
+        For callers that must record the job alongside other writes; call
+        notify() after committing so the worker picks it up immediately.
+        """
+        self._load_handlers()
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        keys = [str(key) for key in item_keys]
+        job = BackgroundJob(
+            job_type=job_type,
+            status='queued',
+            params=params or {},
+            chunk_size=self.chunk_sizes.get(job_type) or chunk_size or settings.JOB_DEFAULT_CHUNK_SIZE,
+            total_items=len(keys),
+            processed_items=0,
+            succeeded_items=0,
+            failed_items=0,
+            summary={},
+            created_by=created_by,
+        )
+        db.add(job)
+        db.flush()
+
+        if keys:
+            db.execute(
+                insert(BackgroundJobItem),
+                [
+                    {'job_id': job.id, 'position': position, 'item_key': key, 'status': 'pending'}
+                    for position, key in enumerate(keys)
+                ],
+            )
+
+        logger.info(f"[Jobs] Queued {job_type} job {job.id} with {len(keys)} items")
+        return job
+
+    def cancel(self, db: Session, job: BackgroundJob) -> BackgroundJob:
+        """Cancel a queued job immediately, or ask a running job to stop after its current chunk."""
+        if job.status == 'queued':
+            job.status = 'cancelled'
+            job.finished_at = datetime.utcnow()
+        elif job.status == 'running':
+            job.cancel_requested = True
+        db.commit()
+        db.refresh(job)
+        return job
+
+    def resume(self, db: Session, job: BackgroundJob, retry_failed: bool = False) -> BackgroundJob:
+        """
+        Requeue a finished job so it continues from its first pending item.
+
+        With retry_failed, items that failed are reset to pending and processed again.
+        """
+        if job.status in ACTIVE_STATUSES:
+            return job
+
+        if retry_failed and job.failed_items:
+            reset = db.query(BackgroundJobItem).filter(
+                BackgroundJobItem.job_id == job.id,
+                BackgroundJobItem.status == 'failed',
+            ).update(
+                {
+                    BackgroundJobItem.status: 'pending',
+                    BackgroundJobItem.error: None,
+                    BackgroundJobItem.processed_at: None,
+                },
+                synchronize_session=False,
+            )
+            job.processed_items -= reset
+            job.failed_items -= reset
+
+        job.status = 'queued'
+        job.cancel_requested = False
+        job.error = None
+        job.finished_at = None
+        job.attempts = 0
+        db.commit()
+        db.refresh(job)
+        self.notify()
+        return job
+
+    def notify(self):
+        """Wake the worker loop (safe to call from any thread)."""
+        if self._loop and self._wake and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    # ------------------------------------------------------------------
+    # Worker lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Start the polling worker on the running event loop."""
+        if self._task:
+            return
+        self._load_handlers()
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"[Jobs] Worker {self.worker_id} started ({len(self.handlers)} job types)")
+
+    async def stop(self):
+        """Stop after the current chunk; an unfinished job is requeued for the next worker."""
+        if not self._task:
+            return
+        self._stopping = True
+        self._wake.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+        logger.info(f"[Jobs] Worker {self.worker_id} stopped")
+
+    async def _run_loop(self):
+        while not self._stopping:
+            try:
+                self.requeue_stale_jobs()
+                while not self._stopping and await self.run_next_job():
+                    pass
+            except Exception as e:
+                logger.error(f"[Jobs] Worker loop error: {str(e)}", exc_info=True)
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.JOB_RUNNER_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def requeue_stale_jobs(self) -> int:
+        """Requeue running jobs whose worker stopped heartbeating (crash, killed deploy)."""
+        db = self.session_factory()
+        try:
+            cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_RUNNER_STALE_SECONDS)
+            stale = db.query(BackgroundJob).filter(
+                BackgroundJob.status == 'running',
+                BackgroundJob.heartbeat_at < cutoff,
+            ).with_for_update(skip_locked=True).all()
+
+            for job in stale:
+                if job.attempts >= MAX_JOB_ATTEMPTS:
+                    job.status = 'failed'
+                    job.error = f"Abandoned after {job.attempts} attempts"
+                    job.finished_at = datetime.utcnow()
+                else:
+                    logger.warning(f"[Jobs] Requeuing stale job {job.id} (last heartbeat {job.heartbeat_at})")
+                    job.status = 'queued'
+                job.worker_id = None
+
+            db.commit()
+            return len(stale)
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def run_next_job(self) -> bool:
+        """Claim and run the oldest queued job. Returns False when the queue is empty."""
+        db = self.session_factory()
+        try:
+            job = self._claim_next_job(db)
+            if not job:
+                return False
+
+            try:
+                await self._process_job(db, job)
+            except JobTakenOver:
+                db.rollback()
+                logger.warning(f"[Jobs] Job {job.id} was taken over by another worker; abandoned its current chunk")
+            except Exception as e:
+                logger.error(f"[Jobs] Job {job.id} crashed: {str(e)}", exc_info=True)
+                db.rollback()
+                job.status = 'failed'
+                job.error = str(e)
+                job.finished_at = datetime.utcnow()
+                db.commit()
+            return True
+        finally:
+            db.close()
+
+    def _claim_next_job(self, db: Session) -> Optional[BackgroundJob]:
+        job = db.query(BackgroundJob).filter(
+            BackgroundJob.status == 'queued'
+        ).order_by(
+            BackgroundJob.created_at
+        ).with_for_update(skip_locked=True).first()
+
+        if not job:
+            db.rollback()
+            return None
+
+        now = datetime.utcnow()
+        job.status = 'running'
+        job.worker_id = self.worker_id
+        job.attempts += 1
+        job.started_at = job.started_at or now
+        job.heartbeat_at = now
+        db.commit()
+        logger.info(f"[Jobs] Running {job.job_type} job {job.id} ({job.processed_items}/{job.total_items} done)")
+        return job
+
+    async def _process_job(self, db: Session, job: BackgroundJob):
+        handler = self.handlers.get(job.job_type)
+        if not handler:
+            job.status = 'failed'
+            job.error = f"No handler registered for job type '{job.job_type}'"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            return
+
+        while True:
+            db.refresh(job)  # Pick up cancel requests made from other sessions
+            if job.status != 'running' or job.worker_id != self.worker_id:
+                raise JobTakenOver()
+
+            if job.cancel_requested:
+                job.status = 'cancelled'
+                job.finished_at = datetime.utcnow()
+                db.commit()
+                logger.info(f"[Jobs] Cancelled job {job.id} at {job.processed_items}/{job.total_items}")
+                return
+
+            if self._stopping:
+                job.status = 'queued'
+                job.worker_id = None
+                db.commit()
+                logger.info(f"[Jobs] Released job {job.id} for resume at {job.processed_items}/{job.total_items}")
+                return
+
+            items = db.query(BackgroundJobItem).filter(
+                BackgroundJobItem.job_id == job.id,
+                BackgroundJobItem.status == 'pending',
+            ).order_by(
+                BackgroundJobItem.position
+            ).limit(self.chunk_sizes.get(job.job_type) or job.chunk_size).all()
+
+            if not items:
+                all_failed = job.total_items > 0 and job.failed_items == job.total_items
+                job.status = 'failed' if all_failed else 'completed'
+                if all_failed:
+                    job.error = job.error or "All items failed"
+                job.finished_at = datetime.utcnow()
+                db.commit()
+                logger.info(
+                    f"[Jobs] Finished job {job.id}: {job.succeeded_items} succeeded, "
+                    f"{job.failed_items} failed of {job.total_items}"
+                )
+                return
+
+            await self._process_chunk(db, job, handler, items)
+
+    async def _process_chunk(
+        self,
+        db: Session,
+        job: BackgroundJob,
+        handler: JobHandler,
+        items: List[BackgroundJobItem],
+    ):
+        """
+        Run the handler on one chunk and commit its writes with the item checkpoints.
+
+        Raises JobTakenOver (with nothing committed) if the job no longer
+        belongs to this worker when the chunk finishes.
+        """
+        item_ids = [item.id for item in items]
+        heartbeat = asyncio.create_task(self._heartbeat(job.id))
+        try:
+            try:
+                summary = await handler(db, job, items)
+            finally:
+                heartbeat.cancel()
+
+            now = datetime.utcnow()
+            failed = 0
+            for item in items:
+                if item.status == 'pending':
+                    item.status = 'succeeded'
+                if item.status == 'failed':
+                    failed += 1
+                item.processed_at = item.processed_at or now
+
+            self._check_owner(db, job)
+            self._record_progress(job, len(items), failed, summary)
+            db.commit()
+
+        except JobTakenOver:
+            db.rollback()
+            raise
+
+        except Exception as e:
+            logger.error(f"[Jobs] Chunk failed in job {job.id}: {str(e)}", exc_info=True)
+            db.rollback()
+            db.query(BackgroundJobItem).filter(
+                BackgroundJobItem.id.in_(item_ids)
+            ).update(
+                {
+                    BackgroundJobItem.status: 'failed',
+                    BackgroundJobItem.error: str(e)[:2000],
+                    BackgroundJobItem.processed_at: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+            self._check_owner(db, job)
+            self._record_progress(job, len(item_ids), len(item_ids), None)
+            db.commit()
+
+    def _touch(self, job_id):
+        """Heartbeat update that only matches while this worker owns the job."""
+        return update(BackgroundJob).where(
+            BackgroundJob.id == job_id,
+            BackgroundJob.status == 'running',
+            BackgroundJob.worker_id == self.worker_id,
+        ).values(
+            heartbeat_at=datetime.utcnow()
+        ).execution_options(synchronize_session=False)
+
+    def _check_owner(self, db: Session, job: BackgroundJob):
+        """Lock the job row in the chunk's transaction and make sure this worker still owns it."""
+        if not db.execute(self._touch(job.id)).rowcount:
+            raise JobTakenOver()
+
+    def _send_heartbeat(self, job_id) -> bool:
+        db = self.session_factory()
+        try:
+            owned = db.execute(self._touch(job_id)).rowcount
+            db.commit()
+            return bool(owned)
+        finally:
+            db.close()
+
+    async def _heartbeat(self, job_id):
+        """Refresh heartbeat_at on a separate session until cancelled (or the job is lost)."""
+        while True:
+            await asyncio.sleep(settings.JOB_RUNNER_HEARTBEAT_SECONDS)
+            try:
+                owned = await asyncio.to_thread(self._send_heartbeat, job_id)
+            except Exception as e:
+                logger.warning(f"[Jobs] Heartbeat for job {job_id} failed: {str(e)}")
+                continue
+            if not owned:
+                logger.warning(f"[Jobs] Job {job_id} was requeued while running; its current chunk will be discarded")
+                return
+
+    @staticmethod
+    def _record_progress(job: BackgroundJob, processed: int, failed: int, summary: Optional[Dict[str, int]]):
+        job.processed_items += processed
+        job.failed_items += failed
+        job.succeeded_items += processed - failed
+        job.heartbeat_at = datetime.utcnow()
+
+        if summary:
+            merged = dict(job.summary or {})
+            for key, value in summary.items():
+                merged[key] = merged.get(key, 0) + value
+            job.summary = merged
+
+
+# Process-wide runner; handlers register themselves in app.services.job_handlers
+job_runner = JobRunner()
@@ -0,0 +1,125 @@
+"""
+Member directory reads.
+
+Serves GET /api/auth/directory from the member_directory projection
+(app.models.member_directory): search, country/expertise filters and
+keyset pagination all run against precomputed, visibility-filtered rows, so
+a page is one indexed query and never loads hidden profile fields.
+"""
+import base64
+import hashlib
+import json
+import logging
+import re
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.member_directory import MemberDirectoryEntry, refresh_member_directory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 200
+
+SEARCH_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+class InvalidCursor(ValueError):
+    """Raised when a directory cursor can't be decoded."""
+
+
+def encode_cursor(entry: MemberDirectoryEntry) -> str:
+    payload = json.dumps([entry.sort_key, str(entry.profile_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, UUID]:
+    try:
+        sort_key, profile_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_key, UUID(profile_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid directory cursor") from e
+
+
+def _prefix_query(search: str) -> Optional[str]:
+    """'jane smi' -> 'jane:* & smi:*' so partially typed words still match."""
+    words = SEARCH_WORD.findall(search.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+
+def directory_query(search: Optional[str] = None, country: Optional[str] = None, expertise: Optional[str] = None):
+    """Select over member_directory with the directory filters applied (unordered, unpaged)."""
+    statement = select(MemberDirectoryEntry)
+
+    if search:
+        # Word-prefix match on the weighted tsvector, or substring match on
+        # name/organization (served by a trigram index where pg_trgm exists)
+        conditions = [MemberDirectoryEntry.search_text.contains(search.lower(), autoescape=True)]
+        prefix_query = _prefix_query(search)
+        if prefix_query:
+            conditions.append(
+                MemberDirectoryEntry.search_vector.op("@@")(func.to_tsquery("simple", prefix_query))
+            )
+        statement = statement.where(or_(*conditions))
+
+    if country:
+        statement = statement.where(MemberDirectoryEntry.country == country)
+
+    if expertise:
+        statement = statement.where(MemberDirectoryEntry.expertise.contains([expertise.strip().lower()]))
+
+    return statement
+
+
+def directory_page(db: Session, statement, cursor: Optional[str], limit: int) -> Tuple[List[dict], Optional[str]]:
+    """
+    One page of member cards in last/first name order.
+
+    Returns:
+        (cards, next_cursor); next_cursor is None on the last page
+    """
+    if cursor:
+        statement = statement.where(
+            tuple_(MemberDirectoryEntry.sort_key, MemberDirectoryEntry.profile_id) > tuple_(*decode_cursor(cursor))
+        )
+    entries = db.execute(
+        statement.order_by(MemberDirectoryEntry.sort_key, MemberDirectoryEntry.profile_id).limit(limit + 1)
+    ).scalars().all()
+
+    next_cursor = encode_cursor(entries[limit - 1]) if len(entries) > limit else None
+    return [entry.card for entry in entries[:limit]], next_cursor
+
+
+def directory_count(db: Session, statement) -> int:
+    return db.execute(select(func.count()).select_from(statement.subquery())).scalar()
+
+
+def directory_etag(db: Session, *params) -> str:
+    """
+    Weak validator for a directory response: changes whenever any row is
+    written or removed, or the request parameters differ.
+    """
+    members, last_updated = db.execute(
+        select(func.count(), func.max(MemberDirectoryEntry.updated_at))
+    ).one()
+    digest = hashlib.sha1(repr((members, last_updated, params)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def ensure_member_directory() -> None:
+    """Build the projection on first start (or after it was truncated)."""
+    db = SessionLocal()
+    try:
+        if db.execute(select(MemberDirectoryEntry.profile_id).limit(1)).first() is None:
+            refresh_member_directory(db)
+            db.commit()
+            logger.info("[Directory] Built member directory projection")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Directory] Failed to build member directory projection: {str(e)}")
+    finally:
+        db.close()
@@ -0,0 +1,138 @@
+"""
+Parsed Email Body Archive
+
+Email bodies (text, HTML, attachment metadata) are by far the largest
+columns in parsed_emails and are rarely read once an email is a few months
+old. Bodies older than PARSED_EMAIL_BODY_RETENTION_DAYS are moved to object
+storage as gzipped JSON and the columns are cleared; body_archive_key
+records where they went.
+
+load_email_body() returns the body whether it is inline or archived, so
+the detail endpoint and reprocessing don't need to know which.
+"""
+import gzip
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, load_only
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.parsed_email import ParsedEmail
+from app.services.archive_storage import get_archive_store
+from app.services.scheduler import scheduler
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+BODY_FIELDS = ("body_text", "body_html", "attachments")
+
+# Rows archived per committed batch
+ARCHIVE_BATCH_SIZE = 200
+
+# Recently rehydrated bodies, so paging through an old thread doesn't refetch
+body_cache = TTLCache(ttl_seconds=300, max_entries=64)
+
+_store = None
+
+
+def body_store():
+    """Process-wide archive store (one S3 client, created on first use)."""
+    global _store
+    if _store is None:
+        _store = get_archive_store(
+            settings.PARSED_EMAIL_ARCHIVE_BUCKET,
+            settings.PARSED_EMAIL_ARCHIVE_PREFIX,
+            settings.PARSED_EMAIL_ARCHIVE_DIR,
+        )
+    return _store
+
+
+def archive_key(email: ParsedEmail) -> str:
+    created = email.created_at or datetime.now(timezone.utc)
+    return f"parsed_emails/{created:%Y/%m}/{email.id}.json.gz"
+
+
+def load_email_body(email: ParsedEmail) -> Dict[str, Any]:
+    """
+    body_text, body_html and attachments for `email`, fetched from the
+    archive when they are no longer stored inline.
+    """
+    if not email.body_archive_key:
+        return {field: getattr(email, field) for field in BODY_FIELDS}
+
+    def fetch():
+        return json.loads(gzip.decompress(body_store().get_bytes(email.body_archive_key)))
+
+    return body_cache.get_or_set(email.body_archive_key, fetch)
+
+
+def archive_email_bodies(db: Session, older_than_days: int, batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+    """
+    Move bodies of emails created more than `older_than_days` ago to object
+    storage, committing per batch. Returns the number of emails archived.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    store = body_store()
+    archived = 0
+
+    while True:
+        emails = db.query(ParsedEmail).options(
+            load_only(ParsedEmail.id, ParsedEmail.created_at, ParsedEmail.body_archive_key, *[
+                getattr(ParsedEmail, field) for field in BODY_FIELDS
+            ])
+        ).filter(
+            ParsedEmail.body_archive_key.is_(None),
+            ParsedEmail.created_at < cutoff,
+            or_(ParsedEmail.body_text.isnot(None), ParsedEmail.body_html.isnot(None)),
+        ).order_by(ParsedEmail.created_at).limit(batch_size).with_for_update(skip_locked=True).all()
+
+        if not emails:
+            return archived
+
+        now = datetime.now(timezone.utc)
+        for email in emails:
+            key = archive_key(email)
+            body = {field: getattr(email, field) for field in BODY_FIELDS}
+            store.put_bytes(key, gzip.compress(json.dumps(body).encode("utf-8")))
+
+            email.body_text = None
+            email.body_html = None
+            email.attachments = None
+            email.body_archive_key = key
+            email.body_archived_at = now
+        db.commit()
+
+        archived += len(emails)
+        logger.info(f"[Email Archive] Archived {archived} email bodies so far")
+
+
+def _run_archive():
+    db = SessionLocal()
+    try:
+        archived = archive_email_bodies(db, settings.PARSED_EMAIL_BODY_RETENTION_DAYS)
+        if archived:
+            logger.info(f"[Email Archive] Archived {archived} email bodies")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Email Archive] Body archival failed: {str(e)}", exc_info=True)
+    finally:
+        db.close()
+
+
+def schedule_email_body_archive():
+    """Register daily body archival with the shared scheduler."""
+    scheduler.add_job(
+        _run_archive,
+        "interval",
+        job_id="parsed_email_body_archive",
+        hours=24,
+        next_run_time=datetime.now(),
+    )
+    logger.info(
+        f"[Email Archive] Body archival scheduled "
+        f"(daily, bodies older than {settings.PARSED_EMAIL_BODY_RETENTION_DAYS} days)"
+    )
@@ -0,0 +1,77 @@
+"""
+Parsed email search.
+
+GET /api/parsed-emails matches searches against parsed_emails.search_vector
+(GIN-indexed; subject weighted above sender and body), ranks by ts_rank_cd
+and returns ts_headline snippets for the page. Searches that reduce to no
+lexemes (only stop words or punctuation) fall back to ILIKE.
+"""
+import html
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Query, Session
+
+from app.models.parsed_email import SEARCH_CONFIG, ParsedEmail
+
+# Highlight delimiters; replaced with <mark> after the snippet is escaped
+_START, _STOP = "\x02", "\x03"
+
+HEADLINE_OPTIONS = (
+    f"StartSel={_START}, StopSel={_STOP}, MaxWords=30, MinWords=10, MaxFragments=2, FragmentDelimiter=\" … \""
+)
+
+# Body prefix used for snippets; keeps ts_headline cheap on very long emails
+SNIPPET_BODY_CHARS = 20_000
+
+
+def search_tsquery(search: str):
+    return func.websearch_to_tsquery(SEARCH_CONFIG, search)
+
+
+def apply_search(db: Session, query: Query, search: str) -> tuple:
+    """
+    Filter `query` by `search` and order it by relevance.
+
+    Returns:
+        (query, tsquery); tsquery is None when the ILIKE fallback was used
+    """
+    tsquery = search_tsquery(search)
+    if db.execute(select(func.numnode(tsquery))).scalar():
+        rank = func.ts_rank_cd(ParsedEmail.search_vector, tsquery)
+        query = query.filter(ParsedEmail.search_vector.op("@@")(tsquery))
+        return query.order_by(rank.desc(), ParsedEmail.created_at.desc()), tsquery
+
+    search_term = f"%{search}%"
+    query = query.filter(
+        or_(
+            ParsedEmail.from_email.ilike(search_term),
+            ParsedEmail.subject.ilike(search_term),
+            ParsedEmail.body_text.ilike(search_term)
+        )
+    )
+    return query.order_by(ParsedEmail.created_at.desc()), None
+
+
+def search_snippets(db: Session, email_ids: Iterable[int], tsquery) -> Dict[int, Optional[str]]:
+    """
+    Highlighted snippets for the given emails, as HTML-escaped text with
+    matches wrapped in <mark>. Archived emails fall back to the subject.
+    """
+    email_ids = list(email_ids)
+    if not email_ids:
+        return {}
+
+    document = func.coalesce(func.left(ParsedEmail.body_text, SNIPPET_BODY_CHARS), ParsedEmail.subject, "")
+    rows = db.execute(
+        select(ParsedEmail.id, func.ts_headline(SEARCH_CONFIG, document, tsquery, HEADLINE_OPTIONS))
+        .where(ParsedEmail.id.in_(email_ids))
+    ).all()
+
+    snippets = {}
+    for email_id, headline in rows:
+        if headline:
+            escaped = html.escape(" ".join(headline.split()))
+            headline = escaped.replace(_START, "<mark>").replace(_STOP, "</mark>")
+        snippets[email_id] = headline or None
+    return snippets
@@ -0,0 +1,51 @@
+"""
+Shared background scheduler for periodic maintenance.
+
+Services register their jobs here at startup (dashboard snapshots, audit log
+maintenance, email body archival, the bounce queue); main.py starts and
+stops one APScheduler BackgroundScheduler, so every periodic job shares a
+single thread pool.
+"""
+import logging
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """Collects job registrations and runs them on one BackgroundScheduler."""
+
+    def __init__(self):
+        self._jobs: Dict[str, Tuple[Callable, str, Dict[str, Any]]] = {}
+        self._scheduler = None
+
+    def add_job(self, func: Callable, trigger: str, job_id: str, **options):
+        """
+        Register (or replace) a job; arguments are passed to APScheduler's add_job.
+
+        Jobs default to coalesce=True and max_instances=1, so a run that is
+        still going when the next one is due isn't started twice.
+        """
+        options = {"coalesce": True, "max_instances": 1, **options}
+        self._jobs[job_id] = (func, trigger, options)
+        if self._scheduler:
+            self._scheduler.add_job(func, trigger, id=job_id, replace_existing=True, **options)
+
+    def start(self):
+        from apscheduler.schedulers.background import BackgroundScheduler
+
+        if self._scheduler or not self._jobs:
+            return
+        self._scheduler = BackgroundScheduler(daemon=True)
+        for job_id, (func, trigger, options) in self._jobs.items():
+            self._scheduler.add_job(func, trigger, id=job_id, **options)
+        self._scheduler.start()
+        logger.info(f"[Scheduler] Started with {len(self._jobs)} jobs: {', '.join(self._jobs)}")
+
+    def stop(self):
+        if self._scheduler:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+
+
+scheduler = Scheduler()
@@ -0,0 +1,49 @@
+"""
+Outbound email rate limit.
+
+Providers cap messages per second per account (SES: the account's maximum
+send rate; every recipient of a bulk call counts). All sends in the process
+reserve slots from one throttle, so a campaign and transactional mail share
+the budget instead of each sleeping on its own schedule.
+
+The throttle books time rather than holding tokens: acquire(n) appends
+n / rate seconds to the schedule and sleeps while the schedule runs more
+than `burst` messages ahead of now. State is guarded by a thread lock, so
+callers on different event loops or threads share one schedule.
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from app.config import settings
+
+
+class SendThrottle:
+    """Process-wide messages-per-second limit for outbound email."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._next_free = 0.0  # Monotonic time when the booked schedule ends
+        self._lock = threading.Lock()
+
+    def reserve(self, count: int = 1) -> float:
+        """Book `count` sends; returns how long the caller must wait before sending."""
+        if self.rate <= 0 or count <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next_free, now)
+            self._next_free = start + count / self.rate
+            # Up to `burst` messages may go ahead of the schedule
+            return max(0.0, self._next_free - now - self.burst / self.rate)
+
+    async def acquire(self, count: int = 1):
+        """Wait until `count` messages may be sent."""
+        delay = self.reserve(count)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+send_throttle = SendThrottle(settings.EMAIL_SEND_RATE_PER_SECOND)
@@ -0,0 +1,170 @@
+"""
+Shared AWS SES client.
+
+One boto3 client per process (boto3 clients are thread-safe and keep their
+own HTTPS connection pool), with every call run on a small dedicated thread
+pool so the blocking SDK never runs on the event loop. The pool size also
+bounds concurrent SES requests. Throttling responses are retried by
+botocore's standard retry mode.
+
+Bulk sends use SendBulkTemplatedEmail, 50 destinations per API call, paced
+by the shared send_throttle. Each bulk send creates its own stored template
+and deletes it when the send finishes, so templates never pile up toward
+the account's template quota.
+"""
+import asyncio
+import functools
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.send_throttle import send_throttle
+
+logger = logging.getLogger(__name__)
+
+# SendBulkTemplatedEmail accepts at most 50 destinations per call
+BULK_DESTINATIONS_PER_CALL = 50
+
+_client = None
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_ses_client():
+    """Process-wide SES client, created on first use."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                import boto3
+                from botocore.config import Config
+
+                _client = boto3.client(
+                    'ses',
+                    region_name=settings.AWS_SES_REGION or settings.AWS_REGION,
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    config=Config(
+                        max_pool_connections=settings.SES_MAX_CONCURRENCY,
+                        retries={'max_attempts': 5, 'mode': 'standard'},
+                    ),
+                )
+    return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.SES_MAX_CONCURRENCY, thread_name_prefix="ses")
+    return _executor
+
+
+async def ses_call(operation: str, **kwargs) -> Dict[str, Any]:
+    """Run one SES API operation (e.g. "send_email") on the SES thread pool."""
+    method = getattr(get_ses_client(), operation)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(method, **kwargs))
+
+
+def shutdown():
+    """Stop the SES thread pool (called on application shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+# ============================================
+# TEMPLATED BULK SENDS
+# ============================================
+
+@asynccontextmanager
+async def temporary_template(subject: str, html: str, text: Optional[str] = None):
+    """
+    Create a stored SES template for one bulk send and delete it afterwards.
+
+    Yields the template name. Creation errors (ClientError) propagate; a
+    failed delete is only logged.
+    """
+    from botocore.exceptions import ClientError
+
+    name = f"isrs-bulk-{uuid.uuid4().hex}"
+    template = {'TemplateName': name, 'SubjectPart': subject, 'HtmlPart': html}
+    if text:
+        template['TextPart'] = text
+    await ses_call('create_template', Template=template)
+    try:
+        yield name
+    finally:
+        try:
+            await ses_call('delete_template', TemplateName=name)
+        except ClientError as e:
+            logger.warning(f"[SES] Failed to delete template {name}: {e.response['Error']['Message']}")
+
+
+async def send_bulk_templated(
+    source: str,
+    template_name: str,
+    destinations: List[Tuple[str, Dict[str, Any]]],
+    default_data: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """
+    Send a stored template to many recipients, 50 per API call, with the
+    calls running concurrently on the SES thread pool.
+
+    Args:
+        source: From address ("Name <address>")
+        template_name: Template from temporary_template()
+        destinations: (email, template data) pairs
+        default_data: Template data used where a destination's is missing
+
+    Returns:
+        {email: (sent, message_id or error)}
+    """
+    from botocore.exceptions import ClientError
+
+    async def send_chunk(chunk):
+        # Each destination counts against the account's send rate
+        await send_throttle.acquire(len(chunk))
+        try:
+            response = await ses_call(
+                'send_bulk_templated_email',
+                Source=source,
+                Template=template_name,
+                DefaultTemplateData=json.dumps(default_data or {}),
+                Destinations=[
+                    {
+                        'Destination': {'ToAddresses': [email]},
+                        'ReplacementTemplateData': json.dumps(data or {}),
+                    }
+                    for email, data in chunk
+                ],
+            )
+        except ClientError as e:
+            error = e.response['Error']['Message']
+            logger.error(f"[SES] Bulk send of {len(chunk)} failed: {error}")
+            return {email: (False, error) for email, _ in chunk}
+
+        results = {}
+        for (email, _), status in zip(chunk, response['Status']):
+            if status['Status'] == 'Success':
+                results[email] = (True, status.get('MessageId'))
+            else:
+                results[email] = (False, f"{status['Status']}: {status.get('Error', '')}".strip(': '))
+        return results
+
+    chunks = [
+        destinations[start:start + BULK_DESTINATIONS_PER_CALL]
+        for start in range(0, len(destinations), BULK_DESTINATIONS_PER_CALL)
+    ]
+    results: Dict[str, Tuple[bool, Optional[str]]] = {}
+    for chunk_results in await asyncio.gather(*[send_chunk(chunk) for chunk in chunks]):
+        results.update(chunk_results)
+    return results
@@ -0,0 +1,182 @@
+"""
+Pooled SMTP connections.
+
+Opening an SMTP session costs a TCP connect, STARTTLS handshake and AUTH
+before the first message; for campaigns that dominates send time. The pool
+keeps up to `size` authenticated sessions open and hands them out one
+message at a time:
+
+- an idle session is NOOP-checked before reuse once it has been idle for
+  `healthcheck_after` seconds, and replaced if the check fails
+- a session is retired (QUIT) after `max_messages` messages, since most
+  providers cap messages per connection
+- a send that fails because the server dropped a reused session is retried
+  once on a fresh one; any other error discards the session and is raised
+
+Sessions belong to the event loop that opened them; if the pool is used
+from a different loop (e.g. a script calling asyncio.run twice) the old
+sessions are dropped and new ones opened.
+"""
+import asyncio
+import logging
+import ssl
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import List, Optional
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the session is gone rather than the message being refused
+_DISCONNECT_ERRORS = (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, ConnectionError)
+
+
+@dataclass
+class _Session:
+    smtp: aiosmtplib.SMTP
+    messages_sent: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def _abandon(session: _Session):
+    """Close a session from another event loop without QUIT."""
+    try:
+        session.smtp.close()
+    except RuntimeError:
+        # Its loop is already closed; the transport can't be touched
+        pass
+
+
+class SMTPConnectionPool:
+    """Bounded pool of authenticated SMTP sessions for one server/account."""
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: Optional[bool] = True,
+        tls_context: Optional[ssl.SSLContext] = None,
+        size: int = 4,
+        max_messages: int = 100,
+        healthcheck_after: float = 30.0,
+        timeout: float = 60.0,
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.tls_context = tls_context
+        self.size = size
+        self.max_messages = max_messages
+        self.healthcheck_after = healthcheck_after
+        self.timeout = timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._idle: List[_Session] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # Sessions opened over the pool's lifetime (for logs and benchmarks)
+        self.connections_opened = 0
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Sessions from another (possibly closed) loop can't be reused
+            for session in self._idle:
+                _abandon(session)
+            self._idle = []
+            self._slots = asyncio.Semaphore(self.size)
+            self._loop = loop
+
+    async def _open(self) -> _Session:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            tls_context=self.tls_context,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        self.connections_opened += 1
+        logger.debug(f"[SMTP Pool] Opened session to {self.hostname}:{self.port}")
+        return _Session(smtp=smtp)
+
+    async def _healthy(self, session: _Session) -> bool:
+        if not session.smtp.is_connected:
+            return False
+        if time.monotonic() - session.last_used < self.healthcheck_after:
+            return True
+        try:
+            await session.smtp.noop()
+            return True
+        except (aiosmtplib.SMTPException, ConnectionError, asyncio.TimeoutError):
+            return False
+
+    async def _retire(self, session: _Session):
+        try:
+            if session.smtp.is_connected:
+                await session.smtp.quit()
+        except (aiosmtplib.SMTPException, ConnectionError, asyncio.TimeoutError):
+            session.smtp.close()
+
+    async def _checkout(self) -> _Session:
+        while self._idle:
+            session = self._idle.pop()
+            if await self._healthy(session):
+                return session
+            session.smtp.close()
+        return await self._open()
+
+    def _checkin(self, session: _Session):
+        session.last_used = time.monotonic()
+        self._idle.append(session)
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        Borrow one session for a single message.
+
+        The session goes back to the pool on success, is retired once it
+        reaches max_messages, and is discarded on any error.
+        """
+        self._bind_loop()
+        async with self._slots:
+            session = await self._checkout()
+            try:
+                yield session
+            except BaseException:
+                session.smtp.close()
+                raise
+            session.messages_sent += 1
+            if session.messages_sent >= self.max_messages:
+                await self._retire(session)
+            else:
+                self._checkin(session)
+
+    async def send_message(self, message: Message):
+        """Send one message on a pooled session, retrying once on a dropped connection."""
+        try:
+            async with self.session() as session:
+                return await session.smtp.send_message(message)
+        except _DISCONNECT_ERRORS as e:
+            logger.info(f"[SMTP Pool] Session dropped ({str(e)}); retrying on a new session")
+            async with self.session() as session:
+                return await session.smtp.send_message(message)
+
+    async def close(self):
+        """QUIT every idle session (called on shutdown)."""
+        idle, self._idle = self._idle, []
+        same_loop = self._loop is asyncio.get_running_loop()
+        for session in idle:
+            if same_loop:
+                await self._retire(session)
+            else:
+                _abandon(session)
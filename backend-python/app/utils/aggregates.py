@@ -0,0 +1,21 @@
+"""
+Building blocks for single-statement statistics queries.
+"""
+from sqlalchemy import func, literal_column, select
+
+
+def counts_by(column, *criteria):
+    """
+    Scalar subquery returning {value: row count} for `column` as a JSON object.
+
+    NULL values are skipped; no rows gives {}. Embed it in the endpoint's
+    aggregate SELECT so grouped counts come back in the same round trip.
+    """
+    grouped = select(
+        column.label("key"),
+        func.count().label("count"),
+    ).where(column.isnot(None), *criteria).group_by(column).subquery()
+
+    return select(
+        func.coalesce(func.json_object_agg(grouped.c.key, grouped.c.count), literal_column("'{}'::json"))
+    ).scalar_subquery()
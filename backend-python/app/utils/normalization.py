@@ -0,0 +1,133 @@
+"""
+Normalization helpers for contact and organization matching.
+Values produced here are persisted on write so lookups can hit an index.
+"""
+import logging
+import re
+from typing import List, Optional
+
+from nameparser import HumanName
+
+logger = logging.getLogger(__name__)
+
+# Legal suffixes stripped from organization names (must be word boundaries)
+ORGANIZATION_LEGAL_SUFFIXES = [
+    r'\bllc\b', r'\binc\.?\b', r'\bltd\.?\b', r'\bcorp\.?\b',
+    r'\bcorporation\b', r'\bcompany\b', r'\bco\.?\b', r'\blimited\b'
+]
+
+# Shape check for stored email addresses. Shared by the contacts.email_status
+# column (listener + backfill) and contact import validation.
+EMAIL_PATTERN = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+EMAIL_STATUS_VALID = 'valid'
+EMAIL_STATUS_INVALID = 'invalid'
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """
+    Normalize an email address for case-insensitive matching.
+
+    Examples:
+    "  Jane.Doe@NOAA.gov " → "jane.doe@noaa.gov"
+    """
+    if not email:
+        return None
+
+    normalized = email.strip().lower()
+    return normalized or None
+
+
+def email_status(email: Optional[str]) -> str:
+    """
+    Classify an email address as 'valid' or 'invalid' by shape.
+
+    Legacy rows hold values like "n/a" or "Jane Doe"; list endpoints
+    filter on the persisted status instead of checking each row.
+    """
+    normalized = normalize_email(email)
+    if normalized and re.match(EMAIL_PATTERN, normalized):
+        return EMAIL_STATUS_VALID
+    return EMAIL_STATUS_INVALID
+
+
+def normalize_email_list(primary: Optional[str], alternates: Optional[List[str]] = None) -> List[str]:
+    """
+    Normalize a contact's primary and alternate emails into one de-duplicated list.
+
+    The primary email always comes first; blank entries are dropped.
+    """
+    normalized = []
+    for email in [primary, *(alternates or [])]:
+        value = normalize_email(email)
+        if value and value not in normalized:
+            normalized.append(value)
+    return normalized
+
+
+def normalize_organization_name(name: Optional[str]) -> str:
+    """
+    Normalize organization names for consistent matching
+
+    Transformations:
+    - Remove legal suffixes: LLC, Inc., Ltd., Corp, Corporation
+    - Remove punctuation: commas, periods
+    - Remove "The" prefix
+    - Lowercase and strip whitespace
+    - Remove extra spaces
+
+    Examples:
+    "The Microsoft Corporation, Inc." → "microsoft"
+    "NOAA Fisheries" → "noaa fisheries"
+    """
+    if not name:
+        return ""
+
+    normalized = name.lower().strip()
+
+    # Remove "The" prefix
+    if normalized.startswith('the '):
+        normalized = normalized[4:]
+
+    for suffix in ORGANIZATION_LEGAL_SUFFIXES:
+        normalized = re.sub(suffix, '', normalized)
+
+    # Remove punctuation
+    normalized = re.sub(r'[,.\-()&]', ' ', normalized)
+
+    # Remove extra whitespace
+    normalized = ' '.join(normalized.split())
+
+    return normalized.strip()
+
+
+def normalize_person_name(
+    full_name: Optional[str] = None,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+) -> str:
+    """
+    Normalize a person's name to "first middle last" in lowercase.
+
+    Titles, suffixes and nicknames are dropped so that "Dr. John P. O'Brien Jr."
+    and "john p o'brien" compare equal. Falls back to first/last name when no
+    full name is available.
+    """
+    raw = (full_name or '').strip()
+    if not raw:
+        raw = ' '.join(part for part in (first_name, last_name) if part).strip()
+    if not raw:
+        return ""
+
+    try:
+        parsed = HumanName(raw)
+        parts = [parsed.first, parsed.middle, parsed.last]
+    except Exception as e:
+        logger.warning(f"Name normalization failed for '{raw}': {str(e)}")
+        parts = raw.split()
+
+    normalized = ' '.join(part for part in parts if part).lower()
+
+    # Drop punctuation that is not part of a name (keep apostrophes and hyphens)
+    normalized = re.sub(r"[^\w\s'\-]", '', normalized)
+
+    return ' '.join(normalized.split())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Archive old audit log months and create upcoming partitions.
+
+Same job the API runs daily: months older than the retention window are
+written as gzipped JSONL to AUDIT_LOG_ARCHIVE_BUCKET (or
+AUDIT_LOG_ARCHIVE_DIR when no bucket is set), then their partition is
+dropped (or rows deleted from the default partition).
+
+Usage:
+    python scripts/archive_audit_log.py --dry-run
+    python scripts/archive_audit_log.py --retention-months 12
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from app.config import settings
+from app.services.audit_log_maintenance import AuditArchiveError, run_audit_log_maintenance
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--retention-months', type=int, default=settings.AUDIT_LOG_RETENTION_MONTHS)
+    parser.add_argument('--dry-run', action='store_true', help="List the months that would be archived")
+    args = parser.parse_args()
+
+    try:
+        summary = run_audit_log_maintenance(retention_months=args.retention_months, dry_run=args.dry_run)
+    except AuditArchiveError as e:
+        print(f"Archive aborted: {e}")
+        sys.exit(1)
+
+    if summary["skipped"]:
+        print("Another process is running audit log maintenance; nothing done")
+        return
+
+    print("=" * 60)
+    print(f"Cutoff:              {summary['cutoff']}{' (dry run)' if args.dry_run else ''}")
+    print(f"Partitions created:  {', '.join(summary['created_partitions']) or '-'}")
+    print(f"Months to archive:   {', '.join(summary['months']) or '-'}")
+    for archived in summary["archived"]:
+        print(f"  {archived['month']}: {archived['rows']} rows -> {archived['location'] or '(empty)'}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
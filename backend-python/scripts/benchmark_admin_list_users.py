@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark the admin user list (GET /api/admin/users).
+
+Seeds synthetic members with role assignments inside a transaction, then
+compares the legacy path (one page query, a separate count and one
+user_roles query per user on the page) with the current list_users (one
+statement with json_agg roles and a window count). Everything is rolled
+back at the end.
+
+Usage:
+    python scripts/benchmark_admin_list_users.py --members 5000 --page-size 100
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import text
+
+import app.models  # noqa: F401  (register mappers referenced by relationships)
+import app.models.abstract_review  # noqa: F401
+import app.models.conference_event  # noqa: F401
+from app.database import SessionLocal
+from app.routers.admin import list_users
+
+BENCH_ROLES = ['bench_member', 'bench_board_member', 'bench_reviewer', 'bench_committee']
+
+
+def seed(db, members: int, roles_per_member: int):
+    role_ids = []
+    for name in BENCH_ROLES:
+        role_id = uuid.uuid4()
+        db.execute(
+            text("INSERT INTO roles (id, name, display_name) VALUES (:id, :name, :display_name)"),
+            {"id": role_id, "name": name, "display_name": name.replace('_', ' ').title()},
+        )
+        role_ids.append(role_id)
+
+    db.execute(text("""
+        INSERT INTO attendee_profiles (id, user_email, first_name, last_name, organization_name, country, created_at, updated_at)
+        SELECT gen_random_uuid(), 'bench-member-' || n || '@example.org', 'Bench', 'Member ' || n,
+               'Bench Org ' || (n % 50), 'USA', NOW() - n * INTERVAL '1 minute', NOW()
+        FROM generate_series(1, :members) AS n
+    """), {"members": members})
+
+    db.execute(text("""
+        INSERT INTO user_roles (user_id, role_id, is_active, created_at)
+        SELECT ap.id, (CAST(:role_ids AS uuid[]))[k], true, NOW()
+        FROM attendee_profiles ap
+        CROSS JOIN generate_series(1, :roles_per_member) AS k
+        WHERE ap.user_email LIKE 'bench-member-%'
+    """), {"role_ids": [str(role_id) for role_id in role_ids], "roles_per_member": roles_per_member})
+    db.execute(text("ANALYZE attendee_profiles"))
+    db.execute(text("ANALYZE user_roles"))
+
+
+def legacy_list_users(db, page: int, page_size: int, search, role):
+    """Pre-rework behavior: DISTINCT page query, separate count, roles per user."""
+    params = {
+        "limit": page_size,
+        "offset": (page - 1) * page_size,
+        "search": f"%{search}%" if search else None,
+        "role": role,
+    }
+    joins = filters = ""
+    if role:
+        joins = " JOIN user_roles ur ON ap.id = ur.user_id JOIN roles r ON ur.role_id = r.id"
+        filters += " AND r.name = :role AND ur.is_active = true AND ur.revoked_at IS NULL"
+    if search:
+        filters += " AND (ap.user_email ILIKE :search OR ap.first_name ILIKE :search OR ap.last_name ILIKE :search)"
+
+    total = db.execute(text(f"SELECT COUNT(DISTINCT ap.id) FROM attendee_profiles ap{joins} WHERE 1=1{filters}"), params).scalar()
+    rows = db.execute(text(f"""
+        SELECT DISTINCT ap.id, ap.user_email, ap.first_name, ap.last_name, ap.created_at
+        FROM attendee_profiles ap{joins} WHERE 1=1{filters}
+        ORDER BY ap.created_at DESC LIMIT :limit OFFSET :offset
+    """), params).fetchall()
+    users = []
+    for row in rows:
+        roles = db.execute(text("""
+            SELECT r.id, r.name, r.display_name, ur.created_at, ur.is_active, ur.active_from, ur.active_until
+            FROM user_roles ur JOIN roles r ON ur.role_id = r.id
+            WHERE ur.user_id = :user_id AND ur.revoked_at IS NULL
+            ORDER BY r.name
+        """), {"user_id": row.id}).fetchall()
+        users.append((row, roles))
+    return total, users
+
+
+def current_list_users(db, page: int, page_size: int, search, role):
+    response = asyncio.run(list_users(
+        page=page, page_size=page_size, search=search, role=role, current_admin=None, db=db,
+    ))
+    return response.total, response.data
+
+
+def timed(fn, repeats: int):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--members', type=int, default=5000)
+    parser.add_argument('--roles-per-member', type=int, default=2, choices=range(1, len(BENCH_ROLES) + 1))
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeats', type=int, default=10)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        seed(db, args.members, args.roles_per_member)
+        last_page = max(1, -(-args.members // args.page_size))
+        scenarios = [
+            ("first page", dict(page=1, search=None, role=None)),
+            ("last page", dict(page=last_page, search=None, role=None)),
+            ("role filter", dict(page=1, search=None, role='bench_board_member')),
+            ("search", dict(page=1, search='Member 1', role=None)),
+        ]
+
+        print("=" * 60)
+        print(f"Members: {args.members}  roles/member: {args.roles_per_member}  page size: {args.page_size}")
+        print(f"{'scenario':<14}{'legacy ms':>12}{'single ms':>12}{'speedup':>10}")
+        for label, params in scenarios:
+            legacy_total, _ = legacy_list_users(db, page_size=args.page_size, **params)
+            total, _ = current_list_users(db, page_size=args.page_size, **params)
+            assert total == legacy_total, f"{label}: totals differ ({legacy_total} vs {total})"
+
+            legacy_ms = timed(lambda: legacy_list_users(db, page_size=args.page_size, **params), args.repeats)
+            single_ms = timed(lambda: current_list_users(db, page_size=args.page_size, **params), args.repeats)
+            print(f"{label:<14}{legacy_ms:>12.1f}{single_ms:>12.1f}{legacy_ms / single_ms:>9.1f}x")
+        print("=" * 60)
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk Apollo enrichment against a local mock Apollo server.
+
+Compares the legacy path (one /people/match per contact, a new HTTP client
+per call, strictly sequential) with ApolloService.bulk_enrich_people
+(pooled client, bounded concurrency, /people/bulk_match, rate limiting).
+
+Usage:
+    python scripts/benchmark_apollo_bulk_enrich.py --contacts 200 --latency-ms 150
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.services.apollo_service import ApolloService, ApolloRateLimiter
+
+
+def build_mock_apollo(latency_seconds: float, rate_limit_per_minute: int) -> FastAPI:
+    """Mock Apollo API with fixed latency and per-minute rate limit headers."""
+    mock = FastAPI()
+    window = {'started_at': time.monotonic(), 'count': 0}
+
+    def rate_limit_headers():
+        now = time.monotonic()
+        if now - window['started_at'] >= 60:
+            window['started_at'], window['count'] = now, 0
+        window['count'] += 1
+        remaining = max(rate_limit_per_minute - window['count'], 0)
+        return window['count'] > rate_limit_per_minute, {
+            'x-rate-limit-minute': str(rate_limit_per_minute),
+            'x-minute-requests-left': str(remaining),
+        }
+
+    def fake_person(detail):
+        email = detail.get('email') or 'unknown@example.org'
+        return {
+            'email': email,
+            'first_name': detail.get('first_name'),
+            'last_name': detail.get('last_name'),
+            'title': 'Restoration Scientist',
+            'phone_numbers': [{'sanitized_number': '+15555550100'}],
+            'organization': {'name': 'Mock Org'},
+        }
+
+    @mock.post("/v1/people/match")
+    async def people_match(request: Request):
+        limited, headers = rate_limit_headers()
+        if limited:
+            return JSONResponse({'error': 'rate limited'}, status_code=429, headers={**headers, 'retry-after': '1'})
+        await asyncio.sleep(latency_seconds)
+        return JSONResponse({'person': fake_person(await request.json())}, headers=headers)
+
+    @mock.post("/v1/people/bulk_match")
+    async def people_bulk_match(request: Request):
+        limited, headers = rate_limit_headers()
+        if limited:
+            return JSONResponse({'error': 'rate limited'}, status_code=429, headers={**headers, 'retry-after': '1'})
+        await asyncio.sleep(latency_seconds)
+        details = (await request.json()).get('details', [])
+        return JSONResponse({'matches': [fake_person(d) for d in details]}, headers=headers)
+
+    return mock
+
+
+async def legacy_bulk_enrich(base_url: str, contacts):
+    """Pre-rework behavior: sequential calls, fresh client (new connection) each time."""
+    results = []
+    for contact in contacts:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{base_url}/people/match",
+                json={'email': contact['email']},
+                params={'api_key': 'mock'},
+                timeout=30.0,
+            )
+            results.append(response.status_code == 200)
+    return results
+
+
+async def run_benchmark(args):
+    port = args.port
+    base_url = f"http://127.0.0.1:{port}/v1"
+
+    config = uvicorn.Config(
+        build_mock_apollo(args.latency_ms / 1000.0, args.rate_limit),
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    contacts = [
+        {'email': f"member{i}@example.org", 'first_name': 'Member', 'last_name': str(i)}
+        for i in range(args.contacts)
+    ]
+
+    try:
+        started = time.perf_counter()
+        legacy = await legacy_bulk_enrich(base_url, contacts)
+        legacy_seconds = time.perf_counter() - started
+
+        service = ApolloService(
+            api_key='mock',
+            base_url=base_url,
+            max_concurrency=args.concurrency,
+            rate_limiter=ApolloRateLimiter(rate_per_minute=args.rate_limit, capacity=args.concurrency),
+        )
+        started = time.perf_counter()
+        pooled = await service.bulk_enrich_people(contacts)
+        pooled_seconds = time.perf_counter() - started
+        await service.client.aclose()
+    finally:
+        server.should_exit = True
+        thread.join()
+
+    print("=" * 60)
+    print(f"Contacts:            {args.contacts}")
+    print(f"Mock latency:        {args.latency_ms} ms/request")
+    print(f"Legacy sequential:   {legacy_seconds:7.2f}s  ({sum(legacy)} ok, {args.contacts / legacy_seconds:7.1f} contacts/s)")
+    print(f"Pooled bulk_match:   {pooled_seconds:7.2f}s  "
+          f"({sum(1 for r in pooled if r['enriched'].get('success'))} ok, "
+          f"{args.contacts / pooled_seconds:7.1f} contacts/s)")
+    print(f"Speedup:             {legacy_seconds / pooled_seconds:7.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--contacts', type=int, default=200)
+    parser.add_argument('--latency-ms', type=int, default=150)
+    parser.add_argument('--concurrency', type=int, default=5)
+    parser.add_argument('--rate-limit', type=int, default=600, help="Mock per-minute request limit")
+    parser.add_argument('--port', type=int, default=8765)
+    asyncio.run(run_benchmark(parser.parse_args()))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-recipient email rendering.
+
+Renders a campaign-sized message (branded layout plus a body with merge
+fields) for N recipients three ways:
+
+- regex: re-scan the whole message for {{placeholders}} per recipient
+  (how bulk SMTP sends rendered before templates were compiled)
+- compiled: parse once with compile_template, then fill merge fields
+- compiled + wrap: also wrap the body in get_base_template per recipient,
+  as transactional sends do
+
+Checks that the regex and compiled outputs are identical.
+
+Usage:
+    python scripts/benchmark_email_render.py --recipients 20000
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from app.services.email_service import get_base_template, get_button_html
+from app.services.email_templates import PLACEHOLDER, compile_template
+
+BODY = """
+<h2 style="color: #2c5f2d;">Save the Date, {{first_name}}</h2>
+<p>Dear {{full_name}},</p>
+<p>The International Conference on Shellfish Restoration returns October 4-8, 2026.</p>
+""" + "<p>Programme details, venue, travel and registration information.</p>\n" * 40 + get_button_html(
+    "Register", "https://www.shellfish-society.org/icsr2026.html?ref={{email}}"
+) + """
+<p>We look forward to seeing you, {{first_name}}.</p>
+"""
+
+
+def regex_render(template: str, values: dict) -> str:
+    return PLACEHOLDER.sub(lambda match: str(values.get(match.group(1), "")), template)
+
+
+def recipients(count: int):
+    return [
+        {"first_name": f"Member{n}", "full_name": f"Member{n} Example", "email": f"member{n}@example.org"}
+        for n in range(count)
+    ]
+
+
+def run(label: str, render, people) -> float:
+    started = time.perf_counter()
+    for values in people:
+        render(values)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}{elapsed * 1000:>10.0f}{len(people) / elapsed:>14.0f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--recipients', type=int, default=20000)
+    args = parser.parse_args()
+
+    people = recipients(args.recipients)
+    message = get_base_template(BODY, "ICSR 2026 - Save the Date")
+    compiled = compile_template(message)
+    compiled_body = compile_template(BODY)
+
+    for values in people[:100]:
+        assert compiled.render(values) == regex_render(message, values), "compiled output differs from regex"
+
+    print("=" * 60)
+    print(f"Recipients: {args.recipients}  message size: {len(message):,} chars  merge fields: {sorted(compiled.fields)}")
+    print(f"{'path':<28}{'total ms':>10}{'renders/s':>14}")
+    regex = run("regex (per recipient)", lambda values: regex_render(message, values), people)
+    fast = run("compiled", compiled.render, people)
+    wrapped = run("compiled + wrap", lambda values: get_base_template(compiled_body.render(values)), people)
+    print(f"Speedup: {regex / fast:.1f}x compiled, {regex / wrapped:.1f}x compiled + wrap")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark pooled SMTP sending against a local aiosmtpd server.
+
+The server requires STARTTLS (self-signed certificate) and AUTH, like the
+production relay. Compares the legacy path (aiosmtplib.send per message:
+connect, STARTTLS, AUTH, send, QUIT, with a fresh SSL context each time)
+with SMTPConnectionPool, sequentially and with concurrent senders.
+
+Requires aiosmtpd (requirements-dev.txt).
+
+Usage:
+    python scripts/benchmark_smtp_pool.py --messages 300 --pool-size 4
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import datetime
+import logging
+import socket
+import ssl
+import tempfile
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult, LoginPassword
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from app.services.smtp_pool import SMTPConnectionPool
+
+USERNAME, PASSWORD = "bench", "bench-password"
+
+# aiosmtpd logs a deprecation warning on every AUTH
+logging.getLogger("mail.log").setLevel(logging.ERROR)
+
+
+class CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+def authenticator(server, session, envelope, mechanism, auth_data):
+    if isinstance(auth_data, LoginPassword) and auth_data.login.decode() == USERNAME \
+            and auth_data.password.decode() == PASSWORD:
+        return AuthResult(success=True)
+    return AuthResult(success=False, handled=False)
+
+
+def self_signed_context(workdir: str) -> ssl.SSLContext:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder().subject_name(name).issuer_name(name)
+        .public_key(key.public_key()).serial_number(x509.random_serial_number())
+        .not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = os.path.join(workdir, "cert.pem"), os.path.join(workdir, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL, serialization.NoEncryption()
+        ))
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def client_tls_context() -> ssl.SSLContext:
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def build_message(n: int) -> MIMEMultipart:
+    message = MIMEMultipart("alternative")
+    message["From"] = "ISRS <noreply@example.org>"
+    message["To"] = f"member-{n}@example.org"
+    message["Subject"] = f"Benchmark message {n}"
+    message.attach(MIMEText("Plain text body " * 20, "plain"))
+    message.attach(MIMEText("<p>HTML body</p>" * 50, "html"))
+    return message
+
+
+async def legacy_send(port: int, n: int):
+    """Pre-pool behavior of EmailService._send_via_smtp."""
+    await aiosmtplib.send(
+        build_message(n),
+        hostname="127.0.0.1",
+        port=port,
+        username=USERNAME,
+        password=PASSWORD,
+        start_tls=True,
+        tls_context=client_tls_context(),
+    )
+
+
+async def run(label, send, messages: int, concurrency: int):
+    queue = list(range(messages))
+
+    async def worker():
+        while queue:
+            await send(queue.pop())
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28}{elapsed * 1000:>10.0f}{messages / elapsed:>12.1f}")
+    return elapsed
+
+
+async def benchmark(args, port: int):
+    print(f"{'path':<28}{'total ms':>10}{'msgs/s':>12}")
+    legacy = await run("legacy (sequential)", lambda n: legacy_send(port, n), args.messages, 1)
+
+    pool = SMTPConnectionPool(
+        hostname="127.0.0.1", port=port, username=USERNAME, password=PASSWORD,
+        start_tls=True, tls_context=client_tls_context(),
+        size=args.pool_size, max_messages=args.max_messages,
+    )
+    pooled = await run("pool (sequential)", lambda n: pool.send_message(build_message(n)), args.messages, 1)
+    concurrent = await run(
+        f"pool ({args.pool_size} concurrent)", lambda n: pool.send_message(build_message(n)),
+        args.messages, args.pool_size,
+    )
+    await pool.close()
+
+    print(f"Sessions opened by the pool: {pool.connections_opened} (legacy: {args.messages})")
+    print(f"Speedup: {legacy / pooled:.1f}x sequential, {legacy / concurrent:.1f}x concurrent")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--messages', type=int, default=300)
+    parser.add_argument('--pool-size', type=int, default=4)
+    parser.add_argument('--max-messages', type=int, default=100, help='Messages per pooled session')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        handler = CountingHandler()
+        port = free_port()
+        controller = Controller(
+            handler,
+            hostname="127.0.0.1",
+            port=port,
+            tls_context=self_signed_context(workdir),
+            require_starttls=True,
+            authenticator=authenticator,
+            auth_require_tls=True,
+        )
+        controller.start()
+        try:
+            print("=" * 60)
+            print(f"Messages: {args.messages}  pool size: {args.pool_size}  per-session limit: {args.max_messages}")
+            asyncio.run(benchmark(args, port))
+            print(f"Messages received by server: {handler.received}")
+            print("=" * 60)
+        finally:
+            controller.stop()
+
+
+if __name__ == "__main__":
+    main()
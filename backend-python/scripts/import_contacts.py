@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Bulk import contacts from a CSV or XLSX file.
+
+Streams the file into the contact_import_rows staging table with COPY, then
+de-duplicates and upserts into contacts/organizations with set-based SQL.
+Same code path as POST /api/contacts/import, but runs synchronously.
+
+Usage:
+    python scripts/import_contacts.py contacts.xlsx --tags ICSR2026 "Planning Committee"
+    python scripts/import_contacts.py contacts.csv --dry-run --report rejected.csv
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import csv
+import uuid
+
+import app.models  # noqa: F401  (register mappers referenced by relationships)
+import app.models.abstract_review  # noqa: F401
+import app.models.conference_event  # noqa: F401
+from app.database import SessionLocal
+from app.services.contact_import_service import ContactImportService, ContactImportError
+
+NOT_IMPORTED = ['error', 'duplicate']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help="CSV or XLSX file")
+    parser.add_argument('--tags', nargs='*', default=[], help="Tags added to every imported contact")
+    parser.add_argument('--no-update', action='store_true', help="Leave existing contacts untouched")
+    parser.add_argument('--dry-run', action='store_true', help="Report what would happen, then roll back")
+    parser.add_argument('--report', help="Write rows that were not imported to this CSV file")
+    args = parser.parse_args()
+
+    import_id = uuid.uuid4()
+    db = SessionLocal()
+    try:
+        service = ContactImportService(db)
+        summary = service.run(
+            import_id,
+            args.path,
+            tags=args.tags,
+            update_existing=not args.no_update,
+        )
+
+        print("=" * 60)
+        print(f"Import {import_id}{' (dry run)' if args.dry_run else ''}")
+        for key, value in summary.items():
+            print(f"  {key:<12} {value}")
+        print("=" * 60)
+
+        rejected = 0
+        writer = None
+        report = open(args.report, 'w', newline='') if args.report else None
+        if report:
+            writer = csv.writer(report)
+            writer.writerow(['row_number', 'email', 'action', 'error'])
+
+        after_row = 0
+        while True:
+            rows = service.get_rows(import_id, actions=NOT_IMPORTED, after_row=after_row, limit=5000)
+            if not rows:
+                break
+            for row in rows:
+                rejected += 1
+                if writer:
+                    writer.writerow([row.row_number, row.email, row.action, row.error])
+                elif rejected <= 20:
+                    print(f"  row {row.row_number}: {row.email or '(no email)'} - {row.error}")
+            after_row = rows[-1].row_number
+
+        if report:
+            report.close()
+            print(f"Wrote {rejected} rejected rows to {args.report}")
+        elif rejected > 20:
+            print(f"  ... and {rejected - 20} more (use --report to save them all)")
+
+        if args.dry_run:
+            db.rollback()
+            print("Dry run: rolled back")
+        else:
+            db.commit()
+
+    except ContactImportError as e:
+        db.rollback()
+        print(f"Import failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
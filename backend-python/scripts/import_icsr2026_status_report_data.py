@@ -16,6 +16,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from sqlalchemy import text
 from app.database import SessionLocal
+from app.utils.normalization import normalize_person_name
 
 # Planning Committee Members from Status Report
 PLANNING_COMMITTEE = [
@@ -335,10 +336,10 @@ async def import_contacts_and_organizations(db):
             db.execute(
                 text("""
                     INSERT INTO contacts (
-                        id, email, first_name, last_name, organization_id,
+                        id, email, first_name, last_name, name_normalized, organization_id,
                         title, tags, created_at, updated_at
                     ) VALUES (
-                        :id, :email, :first_name, :last_name, :org_id,
+                        :id, :email, :first_name, :last_name, :name_normalized, :org_id,
                         :title, CAST(:tags AS text[]), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
                     )
                 """),
@@ -347,6 +348,8 @@ async def import_contacts_and_organizations(db):
                     "email": email,
                     "first_name": person['first_name'],
                     "last_name": person['last_name'],
+                    # Email columns are derived by the contacts trigger; the parsed name isn't
+                    "name_normalized": normalize_person_name(first_name=person['first_name'], last_name=person['last_name']) or None,
                     "org_id": org_id,
                     "title": person.get('title'),
                     "tags": tags_array
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Create and send an email campaign from the command line.
+
+Replaces the one-off send scripts: the body is an HTML file (wrapped in the
+branded base template, {{first_name}}-style placeholders allowed), the
+recipients are a segment over contacts and members, and the send runs as a
+resumable background job paced to EMAIL_SEND_RATE_PER_SECOND.
+
+Without --send the segment is only previewed. --test-to sends one copy to a
+single address instead. With --send the job is queued for the API's job
+worker; add --work to process it in this process and print progress.
+
+Usage:
+    python scripts/send_campaign.py --name "ICSR2026 Save the Date" \\
+        --subject "ICSR 2026 - Save the Date" --html save_the_date.html \\
+        --tag ICSR2026 --preference conference_announcements
+    python scripts/send_campaign.py ... --test-to someone@example.org
+    python scripts/send_campaign.py ... --send --work
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+
+from app.database import SessionLocal
+import app.models  # noqa: F401  (register all mappers)
+import app.models.abstract_review  # noqa: F401
+import app.models.conference_event  # noqa: F401
+from app.models.background_job import BackgroundJob
+from app.models.email_campaign import EmailCampaign
+from app.services.campaigns import campaign_progress, preview_segment, render_campaign, start_campaign
+from app.services.email_service import email_service
+from app.services.job_runner import job_runner
+
+
+def build_segment(args) -> dict:
+    segment = {"audience": args.audience, "preference": args.preference}
+    if args.tag:
+        segment["tags"] = args.tag
+    if args.role:
+        segment["roles"] = args.role
+    if args.country:
+        segment["countries"] = args.country
+    if args.conference_id:
+        segment["conference_id"] = args.conference_id
+    if args.verified_only:
+        segment["verified_only"] = True
+    return segment
+
+
+async def send_test(campaign: EmailCampaign, to_email: str) -> bool:
+    subject, html, text = render_campaign(campaign, "Test", "Recipient", to_email)
+    return await email_service.send_email(
+        to_email=to_email,
+        subject=f"[TEST] {subject}",
+        html_content=html,
+        text_content=text,
+    )
+
+
+async def work(db, job_id):
+    """Run queued jobs here until the campaign's job finishes."""
+    while True:
+        job = db.get(BackgroundJob, job_id)
+        db.refresh(job)
+        if job.status not in ("queued", "running"):
+            return job
+        if not await job_runner.run_next_job():
+            await asyncio.sleep(1)  # Claimed by another worker; wait for it to finish
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--name', required=True)
+    parser.add_argument('--subject', required=True)
+    parser.add_argument('--html', required=True, help='HTML body file')
+    parser.add_argument('--text', help='Plain text body file')
+    parser.add_argument('--preheader', default='')
+    parser.add_argument('--default-first-name', default='colleague', help='Used where a recipient has no first name')
+    parser.add_argument('--audience', choices=['all', 'contacts', 'members'], default='all')
+    parser.add_argument('--preference', default='conference_announcements', help='notification_preferences key to honor')
+    parser.add_argument('--tag', action='append', help='Contact tag (repeatable)')
+    parser.add_argument('--role', action='append', help='Contact role (repeatable)')
+    parser.add_argument('--country', action='append', help='Country (repeatable)')
+    parser.add_argument('--conference-id', help='Only people registered for this conference')
+    parser.add_argument('--verified-only', action='store_true', help='Members with a verified email only')
+    parser.add_argument('--test-to', help='Send one test copy to this address and stop')
+    parser.add_argument('--send', action='store_true', help='Create the campaign and queue the send')
+    parser.add_argument('--work', action='store_true', help='With --send, process the send job in this process')
+    args = parser.parse_args()
+
+    with open(args.html) as f:
+        html_template = f.read()
+    text_template = None
+    if args.text:
+        with open(args.text) as f:
+            text_template = f.read()
+    segment = build_segment(args)
+
+    db = SessionLocal()
+    try:
+        print("=" * 60)
+        preview = preview_segment(db, segment, sample_size=5)
+        print(f"Campaign: {args.name}")
+        print(f"Segment: {segment}")
+        print(f"Recipients: {preview['total']}")
+        for recipient in preview['sample']:
+            print(f"  {recipient['email']} ({recipient['first_name'] or '-'} {recipient['last_name'] or ''})")
+
+        campaign = EmailCampaign(
+            name=args.name,
+            subject=args.subject,
+            html_template=html_template,
+            text_template=text_template,
+            preheader=args.preheader,
+            segment=segment,
+            default_data={"first_name": args.default_first_name},
+            created_by="scripts/send_campaign.py",
+        )
+
+        if args.test_to:
+            sent = asyncio.run(send_test(campaign, args.test_to))
+            print(f"Test to {args.test_to}: {'sent' if sent else 'FAILED'}")
+        elif args.send:
+            db.add(campaign)
+            db.commit()
+            job = start_campaign(db, campaign, created_by=campaign.created_by)
+            print(f"Queued campaign {campaign.id} (job {job.id}, {job.total_items} recipients)")
+            if args.work:
+                job = asyncio.run(work(db, job.id))
+                progress = campaign_progress(job)
+                print(f"Status: {progress['status']}")
+                print(f"Sent: {progress['sent']}  Failed: {progress['failed']}  Skipped: {progress['skipped']}")
+                print(f"Throughput: {progress['messages_per_minute']} messages/minute")
+        else:
+            print("Preview only; pass --test-to or --send")
+        print("=" * 60)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
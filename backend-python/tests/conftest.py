@@ -0,0 +1,73 @@
+"""
+Shared pytest setup.
+
+Run from backend-python/: python -m pytest tests
+
+Tests that need the API or the database are skipped unless DATABASE_URL
+(and the other required settings) point at a migrated Postgres database.
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class _Admin:
+    """Stand-in for the authenticated AttendeeProfile."""
+    id = None
+    user_email = "admin@example.org"
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not os.environ.get("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set")
+    from sqlalchemy import text
+    import app.main  # noqa: F401 - imports every model so the ORM mappers configure
+    from app.database import sync_engine
+
+    try:
+        with sync_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except Exception as e:
+        pytest.skip(f"Database unavailable: {e}")
+    return sync_engine
+
+
+@pytest.fixture(scope="session")
+def client(engine):
+    """API client signed in as an admin (lifespan tasks are not started)."""
+    from fastapi.testclient import TestClient
+
+    from app.dependencies.permissions import get_current_admin
+    from app.main import app
+    from app.routers.auth import get_current_user
+
+    app.dependency_overrides[get_current_admin] = lambda: _Admin()
+    app.dependency_overrides[get_current_user] = lambda: _Admin()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def count_queries(engine):
+    """Context manager collecting the SQL statements sent to the database."""
+    from sqlalchemy import event
+
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return counter
@@ -0,0 +1,124 @@
+"""
+Bounce batches against the database: how APPLY_BOUNCES_SQL rewrites, keeps
+or deletes contacts. Each test runs in a transaction that is rolled back.
+"""
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.contact import Contact
+from app.models.email_bounce import EmailBounce
+from app.services.bounce_queue import enqueue_bounce, process_bounce_batch
+
+
+@pytest.fixture
+def db(engine):
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    # Keep bounces queued outside this test out of its batches
+    session.execute(text("UPDATE email_bounces SET processed_at = NOW() WHERE processed_at IS NULL"))
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def address():
+    """Unique addresses per test, e.g. address("old") -> old-1a2b3c4d@bounce-test.example."""
+    tag = uuid.uuid4().hex[:8]
+    return lambda name: f"{name}-{tag}@bounce-test.example"
+
+
+def add_contact(db: Session, email: str, *alternates: str) -> Contact:
+    contact = Contact(email=email, alternate_emails=list(alternates) or None)
+    db.add(contact)
+    db.commit()
+    return contact
+
+
+def bounce(db: Session, *emails: str):
+    for email in emails:
+        enqueue_bounce(db, email)
+    db.commit()
+    return process_bounce_batch(db, batch_size=100)
+
+
+def outcome(db: Session, email: str):
+    return db.query(EmailBounce.action, EmailBounce.contact_id).filter(EmailBounce.email == email).one()
+
+
+def reload(db: Session, contact: Contact):
+    db.expire_all()
+    return db.get(Contact, contact.id)
+
+
+def test_bounced_alternate_is_pruned(db, address):
+    contact = add_contact(db, address("primary"), address("gone"), address("kept"))
+
+    assert bounce(db, address("gone")) == {'removed_alternate': 1}
+
+    contact = reload(db, contact)
+    assert contact.email == address("primary")
+    assert contact.alternate_emails == [address("kept")]
+    assert contact.all_emails_normalized == [address("primary"), address("kept")]
+    assert outcome(db, address("gone")) == ('removed_alternate', contact.id)
+
+
+def test_bounced_primary_promotes_first_alternate(db, address):
+    contact = add_contact(db, address("primary"), "  ", address("next"), address("last"))
+
+    assert bounce(db, address("primary")) == {'promoted_alternate': 1}
+
+    contact = reload(db, contact)
+    assert contact.email == address("next")
+    assert contact.email_normalized == address("next")
+    assert contact.email_status == 'valid'
+    assert contact.alternate_emails == [address("last")]
+    assert contact.all_emails_normalized == [address("next"), address("last")]
+    assert db.execute(
+        text("SELECT bounce_count FROM email_suppressions WHERE email = :email"), {"email": address("primary")}
+    ).scalar() == 1
+
+
+def test_promotion_into_address_held_by_another_contact_is_a_conflict(db, address):
+    contact = add_contact(db, address("primary"), address("shared"))
+    add_contact(db, address("shared"))
+
+    assert bounce(db, address("primary")) == {'promotion_conflict': 1}
+
+    contact = reload(db, contact)
+    assert contact.email == address("primary")
+    assert contact.alternate_emails == [address("shared")]
+    assert outcome(db, address("primary")) == ('promotion_conflict', contact.id)
+
+
+def test_contacts_promoting_the_same_alternate_in_one_batch(db, address):
+    first = add_contact(db, address("first"), address("shared"))
+    second = add_contact(db, address("second"), address("shared"))
+    winner, loser = sorted((first, second), key=lambda contact: str(contact.id))
+
+    assert bounce(db, address("first"), address("second")) == {'promoted_alternate': 1, 'promotion_conflict': 1}
+
+    assert reload(db, winner).email == address("shared")
+    assert reload(db, loser).email in (address("first"), address("second"))
+    assert outcome(db, reload(db, loser).email) == ('promotion_conflict', loser.id)
+
+    # The queue drained: nothing is left for the next batch
+    assert process_bounce_batch(db, batch_size=100) == {}
+
+
+def test_contact_without_deliverable_address_is_deleted(db, address):
+    contact = add_contact(db, address("primary"), address("alternate"))
+    contact_id = contact.id
+
+    assert bounce(db, address("primary"), address("alternate")) == {'deleted_contact': 1, 'removed_alternate': 1}
+
+    db.expire_all()
+    assert db.get(Contact, contact_id) is None
+    assert outcome(db, address("primary")) == ('deleted_contact', contact_id)
@@ -0,0 +1,86 @@
+"""
+Job runner ownership: long chunks keep heartbeating, and a chunk is never
+committed once another worker has taken the job over.
+"""
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.models.background_job import BackgroundJob, BackgroundJobItem
+from app.services.job_runner import JobRunner, JobTakenOver
+
+
+@pytest.fixture
+def runner(engine):
+    from app.database import SessionLocal
+
+    runner = JobRunner(SessionLocal)
+    runner._handlers_loaded = True
+    created = []
+
+    def start(handler, keys=("a", "b")):
+        runner.handlers["test_job"] = handler
+        db = SessionLocal()
+        job = runner.add_job(db, "test_job", keys, chunk_size=len(keys))
+        job.status = 'running'
+        job.worker_id = runner.worker_id
+        db.commit()
+        created.append(job.id)
+        return db, job
+
+    runner.start_job = start
+    yield runner
+
+    db = SessionLocal()
+    db.query(BackgroundJob).filter(BackgroundJob.id.in_(created)).delete(synchronize_session=False)
+    db.commit()
+    db.close()
+
+
+def _steal(runner, job_id):
+    db = runner.session_factory()
+    db.query(BackgroundJob).filter(BackgroundJob.id == job_id).update({BackgroundJob.worker_id: "other-host:1"})
+    db.commit()
+    db.close()
+
+
+def test_chunk_is_discarded_when_job_is_taken_over(runner):
+    async def handler(db, job, items):
+        items[0].result = {'written': True}
+        _steal(runner, job.id)
+        return {'handled': len(items)}
+
+    db, job = runner.start_job(handler)
+    job_id = job.id
+    with pytest.raises(JobTakenOver):
+        asyncio.run(runner._process_job(db, job))
+    db.close()
+
+    db = runner.session_factory()
+    job = db.get(BackgroundJob, job_id)
+    statuses = [item.status for item in db.query(BackgroundJobItem).filter(BackgroundJobItem.job_id == job_id)]
+    assert statuses == ['pending', 'pending']
+    assert job.processed_items == 0 and not job.summary
+    assert job.worker_id == "other-host:1"
+    db.close()
+
+
+def test_heartbeat_runs_while_handler_works(runner, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RUNNER_HEARTBEAT_SECONDS", 0.05)
+    beats = []
+
+    async def handler(db, job, items):
+        for _ in range(3):
+            await asyncio.sleep(0.2)
+            check = runner.session_factory()
+            beats.append(check.get(BackgroundJob, job.id).heartbeat_at)
+            check.close()
+        return None
+
+    db, job = runner.start_job(handler)
+    asyncio.run(runner._process_job(db, job))
+    assert job.status == 'completed' and job.succeeded_items == 2
+    db.close()
+
+    assert beats[0] < beats[1] < beats[2]
@@ -0,0 +1,72 @@
+"""SMTPConnectionPool against a local aiosmtpd server."""
+import asyncio
+import socket
+from email.message import EmailMessage
+
+import pytest
+
+pytest.importorskip("aiosmtpd")
+from aiosmtpd.controller import Controller  # noqa: E402
+
+from app.services.smtp_pool import SMTPConnectionPool  # noqa: E402
+
+
+class CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    handler = CountingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    yield handler, port
+    controller.stop()
+
+
+def make_message(n: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "sender@example.org"
+    message["To"] = f"recipient{n}@example.org"
+    message["Subject"] = f"Message {n}"
+    message.set_content("Hello")
+    return message
+
+
+def test_sessions_are_reused(smtp_server):
+    handler, port = smtp_server
+    pool = SMTPConnectionPool("127.0.0.1", port, start_tls=False, size=2)
+
+    async def send_all():
+        for n in range(5):
+            await pool.send_message(make_message(n))
+        await pool.close()
+
+    asyncio.run(send_all())
+    assert handler.received == 5
+    assert pool.connections_opened == 1
+
+
+def test_pool_survives_event_loop_switch(smtp_server):
+    """A second asyncio.run() drops the first loop's sessions and opens new ones."""
+    handler, port = smtp_server
+    pool = SMTPConnectionPool("127.0.0.1", port, start_tls=False)
+
+    async def send(n):
+        await pool.send_message(make_message(n))
+
+    # No close() between runs: the idle session belongs to a closed loop
+    asyncio.run(send(1))
+    asyncio.run(send(2))
+    asyncio.run(pool.close())
+
+    assert handler.received == 2
+    assert pool.connections_opened == 2
@@ -0,0 +1,47 @@
+"""Each statistics endpoint answers in a single database round-trip."""
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def dashboard_snapshot(engine):
+    """Dashboard stats read the latest snapshot; make sure a fresh one exists."""
+    from app.database import SessionLocal
+    from app.services.dashboard_snapshots import get_dashboard_snapshot
+
+    session = SessionLocal()
+    try:
+        get_dashboard_snapshot(session)
+        session.commit()
+    finally:
+        session.close()
+
+
+def assert_single_query(client, count_queries, url):
+    with count_queries() as statements:
+        response = client.get(url)
+    assert response.status_code == 200, response.text
+    assert len(statements) == 1, statements
+
+
+def test_contact_stats(client, count_queries):
+    assert_single_query(client, count_queries, "/api/contacts/stats")
+
+
+def test_dashboard_contact_stats(client, count_queries):
+    assert_single_query(client, count_queries, "/api/stats/contacts")
+
+
+def test_funding_statistics(client, count_queries):
+    assert_single_query(client, count_queries, "/api/funding/statistics")
+
+
+def test_vote_statistics(client, count_queries):
+    assert_single_query(client, count_queries, "/api/votes/statistics")
+
+
+def test_conference_statistics(client, count_queries):
+    assert_single_query(client, count_queries, "/api/conferences/statistics")
+
+
+def test_abstract_statistics(client, count_queries):
+    assert_single_query(client, count_queries, "/api/conferences/abstracts/statistics")
@@ -153,6 +153,7 @@ function renderEmailsTable(emails) {
         <a href="#" onclick="viewEmail(${email.id}); return false;" class="admin-link">
           ${escapeHtml(email.subject || '(No Subject)')}
         </a>
+        ${email.snippet_html ? `<div class="email-snippet">${email.snippet_html}</div>` : ''}
       </td>
       <td class="col-date">${formatDate(email.date)}</td>
       <td class="col-confidence">
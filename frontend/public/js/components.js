@@ -1206,6 +1206,9 @@ const translations = {
     allCountries: 'All Countries',
     conferenceYearLabel: 'Conference Year',
     allYears: 'All Years',
+    expertiseFilterLabel: 'Expertise',
+    allExpertise: 'All Expertise',
+    loadMoreBtn: 'Load More',
     clearFiltersBtn: 'Clear Filters',
     loadingMembers: 'Loading members...',
     noMembersFound: 'No Members Found',
@@ -2910,6 +2913,9 @@ const translations = {
     allCountries: 'Todos los Países',
     conferenceYearLabel: 'Año de Conferencia',
     allYears: 'Todos los Años',
+    expertiseFilterLabel: 'Especialidad',
+    allExpertise: 'Todas las Especialidades',
+    loadMoreBtn: 'Cargar Más',
     clearFiltersBtn: 'Limpiar Filtros',
     loadingMembers: 'Cargando miembros...',
     noMembersFound: 'No se Encontraron Miembros',
@@ -4614,6 +4620,9 @@ const translations = {
     allCountries: 'Tous les Pays',
     conferenceYearLabel: 'Année de Conférence',
     allYears: 'Toutes les Années',
+    expertiseFilterLabel: 'Expertise',
+    allExpertise: 'Toutes les Expertises',
+    loadMoreBtn: 'Charger Plus',
     clearFiltersBtn: 'Effacer les Filtres',
     loadingMembers: 'Chargement des membres...',
     noMembersFound: 'Aucun Membre Trouvé',
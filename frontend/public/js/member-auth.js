@@ -220,6 +220,9 @@ const MemberAuth = (() => {
     if (filters.country) params.append('country', filters.country);
     if (filters.expertise) params.append('expertise', filters.expertise);
     if (filters.conference) params.append('conference', filters.conference);
+    if (filters.cursor) params.append('cursor', filters.cursor);
+    if (filters.limit) params.append('limit', filters.limit);
+    if (filters.facets) params.append('facets', 'true');
 
     const queryString = params.toString();
     const endpoint = queryString ? `/directory?${queryString}` : '/directory';